@@ -0,0 +1,72 @@
+"""
+Benchmarks for the (partial) text filters, which can be backed by trigram and
+full-text search indexes (created with ``manage.py create_search_indexes``).
+
+All generated documents have the titel "some titel" and auteur "some auteur".
+"""
+
+import pytest
+import requests
+from test_zaken_list import BASE_URL, HEADERS
+
+DOCUMENTEN_URL = BASE_URL.copy().set(path="/documenten/api/v1/")
+
+
+def list_documenten(params: dict) -> requests.Response:
+    return requests.get(
+        (DOCUMENTEN_URL / "enkelvoudiginformatieobjecten").set(params),
+        headers=HEADERS,
+    )
+
+
+@pytest.mark.parametrize(
+    "params,count",
+    [
+        ({"titel": "TITEL"}, 3500),
+        ({"titel": "no such titel"}, 0),
+        ({"auteur": "auteur"}, 3500),
+        ({"beschrijving": "no such beschrijving"}, 0),
+    ],
+)
+@pytest.mark.benchmark(max_time=60, min_rounds=5, group="documenten-icontains")
+def test_documenten_list_icontains(benchmark, benchmark_assertions, params, count):
+    result = benchmark(list_documenten, {"pageSize": 100, **params})
+
+    assert result.status_code == 200
+    assert result.json()["count"] == count
+
+    benchmark_assertions(mean=1, median=1)
+
+
+@pytest.mark.parametrize(
+    "search,count",
+    [
+        ("titel", 3500),
+        ('"some auteur" -titel', 0),
+        ("no such document", 0),
+    ],
+)
+@pytest.mark.benchmark(max_time=60, min_rounds=5, group="documenten-search")
+def test_documenten_list_search(benchmark, benchmark_assertions, search, count):
+    result = benchmark(list_documenten, {"pageSize": 100, "search": search})
+
+    assert result.status_code == 200
+    assert result.json()["count"] == count
+
+    benchmark_assertions(mean=1, median=1)
+
+
+@pytest.mark.benchmark(max_time=60, min_rounds=5)
+def test_zaken_list_omschrijving(benchmark, benchmark_assertions):
+    def make_request():
+        return requests.get(
+            (BASE_URL / "zaken").set({"omschrijving": "no such omschrijving"}),
+            headers=HEADERS,
+        )
+
+    result = benchmark(make_request)
+
+    assert result.status_code == 200
+    assert result.json()["count"] == 0
+
+    benchmark_assertions(mean=1, median=1)
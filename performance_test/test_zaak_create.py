@@ -0,0 +1,93 @@
+"""
+Concurrency benchmark for creating zaken without identificatie, which generates
+the identificatie of the zaak.
+
+Every round creates the same amount of zaken, divided over a number of concurrent
+workers, so a shorter round means a higher throughput. Each worker uses its own
+bronorganisatie.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import pytest
+import requests
+from test_zaken_list import BASE_URL, HEADERS
+
+CATALOGI_URL = BASE_URL.copy().set(path="/catalogi/api/v1/")
+
+ZAKEN_PER_ROUND = 64
+
+WRITE_HEADERS = {**HEADERS, "Content-Crs": "EPSG:4326"}
+
+
+def generate_rsin(seed: int) -> str:
+    """
+    Generate a valid RSIN (passing the 11-proef) for the seed.
+    """
+    while True:
+        digits = [int(digit) for digit in f"{seed:08d}"]
+        check_digit = sum(d * w for d, w in zip(digits, range(9, 1, -1))) % 11
+        if check_digit < 10:
+            return f"{seed:08d}{check_digit}"
+        seed += 1
+
+
+@pytest.fixture(scope="module")
+def zaaktype_url():
+    response = requests.get(
+        (CATALOGI_URL / "zaaktypen").set({"status": "definitief"}), headers=HEADERS
+    )
+    assert response.status_code == 200
+    return response.json()["results"][0]["url"]
+
+
+@pytest.fixture
+def created_zaken():
+    """
+    Keep track of the created zaken and delete them afterwards, since other
+    benchmarks depend on the amount of zaken.
+    """
+    urls = []
+    yield urls
+
+    with requests.Session() as session:
+        for url in urls:
+            session.delete(url, headers=HEADERS)
+
+
+@pytest.mark.parametrize("workers", [1, 4, 16])
+@pytest.mark.benchmark(group="zaak-create-concurrent")
+def test_zaak_create_concurrent(
+    benchmark, benchmark_assertions, zaaktype_url, created_zaken, workers
+):
+    def create_zaken(bronorganisatie: str) -> list[requests.Response]:
+        body = {
+            "zaaktype": zaaktype_url,
+            "bronorganisatie": bronorganisatie,
+            "verantwoordelijkeOrganisatie": bronorganisatie,
+            "vertrouwelijkheidaanduiding": "openbaar",
+            "startdatum": date.today().isoformat(),
+        }
+        with requests.Session() as session:
+            return [
+                session.post(BASE_URL / "zaken", json=body, headers=WRITE_HEADERS)
+                for _ in range(ZAKEN_PER_ROUND // workers)
+            ]
+
+    def make_requests():
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(create_zaken, map(generate_rsin, range(workers)))
+            responses = [response for responses in results for response in responses]
+
+        created_zaken.extend(
+            response.json()["url"] for response in responses if response.ok
+        )
+        return responses
+
+    result = benchmark.pedantic(make_requests, rounds=5, warmup_rounds=0)
+
+    assert len(result) == ZAKEN_PER_ROUND
+    assert all(response.status_code == 201 for response in result)
+
+    benchmark_assertions(mean=ZAKEN_PER_ROUND * 0.1, median=ZAKEN_PER_ROUND * 0.1)
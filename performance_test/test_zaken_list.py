@@ -94,3 +94,99 @@ def test_zaken_list_non_superuser_many_authorized_types(
     assert len(data["results"]) == 100
 
     benchmark_assertions(mean=1, median=1)
+
+
+def get_cursor_url(depth: int, headers: dict) -> str:
+    """
+    Follow the ``next`` links in cursor pagination mode to get the URL of the page
+    at the given depth
+    """
+    url = (BASE_URL / "zaken").set({"pageSize": 100, "cursor": ""}).url
+    for _ in range(depth - 1):
+        response = requests.get(url, headers=headers)
+        assert response.status_code == 200
+        url = response.json()["next"]
+    return url
+
+
+@pytest.mark.parametrize("depth", [1, 17, 34])
+@pytest.mark.benchmark(max_time=60, min_rounds=5, group="zaken-list-cursor")
+def test_zaken_list_cursor_deep_page(benchmark, benchmark_assertions, depth):
+    """
+    The response time of cursor pagination should be the same for every page,
+    regardless of its depth
+    """
+    url = get_cursor_url(depth, HEADERS)
+
+    def make_request():
+        return requests.get(url, headers=HEADERS)
+
+    result = benchmark(make_request)
+
+    assert result.status_code == 200
+    data = result.json()
+    assert data["count"] is None
+    assert len(data["results"]) == 100
+
+    benchmark_assertions(mean=1, median=1)
+
+
+@pytest.mark.parametrize("depth", [1, 29])
+@pytest.mark.benchmark(
+    max_time=60, min_rounds=5, group="zaken-list-cursor-non-superuser-many-types"
+)
+def test_zaken_list_cursor_deep_page_non_superuser_many_authorized_types(
+    benchmark, benchmark_assertions, depth
+):
+    url = get_cursor_url(depth, HEADERS_NON_SUPERUSER_MANY_TYPES)
+
+    def make_request():
+        return requests.get(url, headers=HEADERS_NON_SUPERUSER_MANY_TYPES)
+
+    result = benchmark(make_request)
+
+    assert result.status_code == 200
+    data = result.json()
+    assert data["count"] is None
+    assert len(data["results"]) == 100
+
+    benchmark_assertions(mean=1, median=1)
+
+
+@pytest.mark.benchmark(max_time=60, min_rounds=5)
+def test_zaken_list_expand_multiple_levels(benchmark, benchmark_assertions):
+    """
+    Expanding many (nested) resources for a full page, which adds thousands of nodes
+    to the inclusion tree
+    """
+    params = {
+        "pageSize": 100,
+        "page": 34,
+        "expand": ",".join(
+            [
+                "zaaktype",
+                "status",
+                "status.statustype",
+                "resultaat",
+                "resultaat.resultaattype",
+                "rollen",
+                "rollen.roltype",
+                "eigenschappen",
+                "eigenschappen.eigenschap",
+                "zaakinformatieobjecten",
+                "zaakobjecten",
+            ]
+        ),
+    }
+
+    def make_request():
+        return requests.get((BASE_URL / "zaken").set(params), headers=HEADERS)
+
+    result = benchmark(make_request)
+
+    assert result.status_code == 200
+    data = result.json()
+    assert len(data["results"]) == 100
+    assert all("status" in zaak["_expand"] for zaak in data["results"])
+
+    benchmark_assertions(mean=3, median=3)
@@ -1,8 +1,12 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
-from typing import List, Union
+import hashlib
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Union
 from urllib.parse import urlparse
 
+from django.conf import settings
 from django.db import models
 
 from django_loose_fk.loaders import get_loader_class
@@ -11,16 +15,87 @@ from vng_api_common.authorizations.middleware import (
     AuthMiddleware as _AuthMiddleware,
     JWTAuth as _JWTAuth,
 )
-from vng_api_common.authorizations.models import Autorisatie
+from vng_api_common.authorizations.models import Applicatie, Autorisatie
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
 
 from openzaak.components.autorisaties.models import CatalogusAutorisatie
+from openzaak.utils.cache import VersionedLocalCache
 from openzaak.utils.constants import COMPONENT_MAPPING
 
 loader = get_loader_class()()
 
+jwt_auth_cache = VersionedLocalCache("jwt-auth", maxsize=1024)
+
+
+@dataclass
+class VerifiedToken:
+    """
+    The verified payload of a JWT, with the applicaties and autorisaties of the
+    client, shared by all requests with the same token.
+    """
+
+    payload: Dict[str, Any]
+    # timestamp after which the token must be verified again
+    expires: float
+    applicaties: List[Applicatie]
+    # evaluated per component, on first use
+    _resolved: Dict[tuple, list] = field(default_factory=dict)
+
+    @property
+    def is_expired(self) -> bool:
+        return time.time() >= self.expires
+
+    def resolve(self, key: tuple, queryset: models.QuerySet) -> list:
+        if key not in self._resolved:
+            self._resolved[key] = list(queryset)
+        return self._resolved[key]
+
+
+def invalidate_jwt_auth_cache() -> None:
+    """
+    Discard the verified tokens of all processes.
+
+    Must be called whenever applicaties, their autorisaties or the client credentials
+    change.
+    """
+    jwt_auth_cache.invalidate()
+
 
 class JWTAuth(_JWTAuth):
     component = None
+    verified_token: Optional[VerifiedToken] = None
+
+    @property
+    def payload(self) -> Optional[Dict[str, Any]]:
+        if (
+            settings.JWT_AUTH_CACHE_ENABLED
+            and self.encoded is not None
+            and not hasattr(self, "_payload")
+        ):
+            self.verified_token = self._get_verified_token()
+            self._payload = self.verified_token.payload
+            self._applicaties_qs = self.verified_token.applicaties
+        return super().payload
+
+    def _get_verified_token(self) -> VerifiedToken:
+        key = hashlib.sha256(self.encoded.encode()).hexdigest()
+        verified_token = jwt_auth_cache.get_or_set(key, self._verify)
+        if verified_token.is_expired:
+            # verify again, which raises the expected error
+            jwt_auth_cache.delete(key)
+            verified_token = jwt_auth_cache.get_or_set(key, self._verify)
+        return verified_token
+
+    def _verify(self) -> VerifiedToken:
+        payload = super().payload
+        expires = int(payload["iat"]) + settings.JWT_EXPIRY
+        if "exp" in payload:
+            expires = min(expires, int(payload["exp"]))
+        return VerifiedToken(
+            payload=payload,
+            expires=expires + settings.TIME_LEEWAY,
+            applicaties=list(self.applicaties),
+        )
 
     @property
     def applicaties(self) -> Union[models.QuerySet, List, None]:
@@ -32,23 +107,32 @@ class JWTAuth(_JWTAuth):
     def _request_auth(self) -> list:
         return []
 
-    def get_autorisaties(self, init_component: str) -> models.QuerySet:
+    def get_autorisaties(self, init_component: str) -> Union[models.QuerySet, List]:
         """
         Retrieve all authorizations relevant to this component.
+
+        If the token is cached, the evaluated authorizations are returned instead.
         """
         if not self.applicaties:
             return Autorisatie.objects.none()
 
         component = COMPONENT_MAPPING.get(init_component, init_component)
         app_ids = [app.id for app in self.applicaties]
-        return Autorisatie.objects.filter(
+        queryset = Autorisatie.objects.filter(
             applicatie_id__in=app_ids, component=component
         )
+        if self.verified_token:
+            return self.verified_token.resolve(("autorisaties", component), queryset)
+        return queryset
 
-    def get_catalogus_autorisaties(self, init_component: str) -> models.QuerySet:
+    def get_catalogus_autorisaties(
+        self, init_component: str
+    ) -> Union[models.QuerySet, List]:
         """
         Retrieve all CatalogusAutorisaties relevant to this component.
         Cache per component to avoid duplicate queries.
+
+        If the token is cached, the evaluated authorizations are returned instead.
         """
         if not self.applicaties:
             return CatalogusAutorisatie.objects.none()
@@ -71,6 +155,10 @@ class JWTAuth(_JWTAuth):
                     "catalogus__besluittype_set",
                 )
             )
+            if self.verified_token:
+                qs = self.verified_token.resolve(
+                    ("catalogus_autorisaties", component), qs
+                )
             self._catalogus_cache[init_component] = qs
 
         return self._catalogus_cache[init_component]
@@ -93,7 +181,11 @@ class JWTAuth(_JWTAuth):
 
         autorisaties = self.get_autorisaties(component)
         catalogus_autorisaties = self.get_catalogus_autorisaties(component)
-        has_catalogus_autorisaties = catalogus_autorisaties.exists()
+        has_catalogus_autorisaties = (
+            bool(catalogus_autorisaties)
+            if isinstance(catalogus_autorisaties, list)
+            else catalogus_autorisaties.exists()
+        )
         scopes_provided = set()
 
         # filter on all additional components
@@ -128,6 +220,40 @@ class JWTAuth(_JWTAuth):
 
         return scopes.is_contained_in(list(scopes_provided))
 
+    def filter_vertrouwelijkheidaanduiding(
+        self, base: Union[models.QuerySet, List], value
+    ) -> Union[models.QuerySet, List]:
+        if not isinstance(base, list):
+            return super().filter_vertrouwelijkheidaanduiding(base, value)
+
+        # the authorizations of a cached token are filtered in memory
+        if value is None:
+            return base
+        order_provided = VertrouwelijkheidsAanduiding.get_choice_order(value)
+        return [
+            autorisatie
+            for autorisatie in base
+            if (
+                order := VertrouwelijkheidsAanduiding.get_choice_order(
+                    autorisatie.max_vertrouwelijkheidaanduiding
+                )
+            )
+            is not None
+            and order >= order_provided
+        ]
+
+    def filter_default(
+        self, base: Union[models.QuerySet, List], name, value
+    ) -> Union[models.QuerySet, List]:
+        if not isinstance(base, list):
+            return super().filter_default(base, name, value)
+
+        if value is None:
+            return base
+        return [
+            autorisatie for autorisatie in base if getattr(autorisatie, name) == value
+        ]
+
     @property
     def has_alle_autorisaties(self) -> bool:
         if not self.applicaties:
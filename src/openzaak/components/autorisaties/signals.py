@@ -0,0 +1,97 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2025 Dimpact
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from vng_api_common.authorizations.models import Applicatie, Autorisatie
+from vng_api_common.models import JWTSecret
+
+from openzaak.components.catalogi.models import (
+    BesluitType,
+    InformatieObjectType,
+    ZaakType,
+)
+from openzaak.utils.query import invalidate_authorizations_filter_cache
+
+from .middleware import invalidate_jwt_auth_cache
+from .models import CatalogusAutorisatie
+
+
+@receiver(
+    [post_save, post_delete],
+    sender=Autorisatie,
+    dispatch_uid="autorisaties.invalidate_authorizations_filter_cache_autorisatie",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=CatalogusAutorisatie,
+    dispatch_uid="autorisaties.invalidate_authorizations_filter_cache_catalogusautorisatie",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=ZaakType,
+    dispatch_uid="autorisaties.invalidate_authorizations_filter_cache_zaaktype",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=InformatieObjectType,
+    dispatch_uid="autorisaties.invalidate_authorizations_filter_cache_informatieobjecttype",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=BesluitType,
+    dispatch_uid="autorisaties.invalidate_authorizations_filter_cache_besluittype",
+)
+def invalidate_authorizations_filter(sender, **kwargs) -> None:
+    """
+    Drop the cached, resolved authorizations used to filter list endpoints.
+
+    Catalogus authorizations expand to the zaak-, informatieobject- and
+    besluittypen in the catalogus, so changes to those types invalidate as well.
+    """
+    invalidate_authorizations_filter_cache()
+
+
+@receiver(
+    [post_save, post_delete],
+    sender=Applicatie,
+    dispatch_uid="autorisaties.invalidate_jwt_auth_cache_applicatie",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=Autorisatie,
+    dispatch_uid="autorisaties.invalidate_jwt_auth_cache_autorisatie",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=CatalogusAutorisatie,
+    dispatch_uid="autorisaties.invalidate_jwt_auth_cache_catalogusautorisatie",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=JWTSecret,
+    dispatch_uid="autorisaties.invalidate_jwt_auth_cache_jwtsecret",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=ZaakType,
+    dispatch_uid="autorisaties.invalidate_jwt_auth_cache_zaaktype",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=InformatieObjectType,
+    dispatch_uid="autorisaties.invalidate_jwt_auth_cache_informatieobjecttype",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=BesluitType,
+    dispatch_uid="autorisaties.invalidate_jwt_auth_cache_besluittype",
+)
+def invalidate_jwt_auth(sender, **kwargs) -> None:
+    """
+    Drop the cached, verified tokens with their applicaties and autorisaties.
+
+    The catalogus authorizations are cached with the types in the catalogus, so
+    changes to those types invalidate as well.
+    """
+    invalidate_jwt_auth_cache()
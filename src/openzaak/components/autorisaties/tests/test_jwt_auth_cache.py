@@ -0,0 +1,142 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from django.test import TestCase, override_settings
+
+from freezegun import freeze_time
+from rest_framework.exceptions import PermissionDenied
+from vng_api_common.authorizations.models import Applicatie, Autorisatie
+from vng_api_common.authorizations.utils import generate_jwt
+from vng_api_common.constants import ComponentTypes, VertrouwelijkheidsAanduiding
+from vng_api_common.models import JWTSecret
+
+from openzaak.components.zaken.api.scopes import (
+    SCOPE_ZAKEN_ALLES_LEZEN,
+    SCOPE_ZAKEN_BIJWERKEN,
+)
+from openzaak.tests.utils import ClearCachesMixin
+
+from ..middleware import JWTAuth
+
+ZAAKTYPE = "http://testserver/catalogi/api/v1/zaaktypen/1"
+
+
+@override_settings(JWT_AUTH_CACHE_ENABLED=True, JWT_EXPIRY=60 * 60)
+class JWTAuthCacheTests(ClearCachesMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.jwt_secret = JWTSecret.objects.create(identifier="test", secret="secret")
+        cls.applicatie = Applicatie.objects.create(client_ids=["test"], label="Test")
+        cls.autorisatie = Autorisatie.objects.create(
+            applicatie=cls.applicatie,
+            component=ComponentTypes.zrc,
+            scopes=[SCOPE_ZAKEN_ALLES_LEZEN.label],
+            zaaktype=ZAAKTYPE,
+            max_vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+
+    def _get_token(self) -> str:
+        return generate_jwt("test", "secret", "user", "User").split(" ")[1]
+
+    def test_verified_token_is_cached(self):
+        token = self._get_token()
+        JWTAuth(token).get_autorisaties("zaken")
+
+        jwt_auth = JWTAuth(token)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(jwt_auth.client_id, "test")
+            self.assertEqual(jwt_auth.applicaties, [self.applicatie])
+            self.assertEqual(jwt_auth.get_autorisaties("zaken"), [self.autorisatie])
+            self.assertFalse(jwt_auth.has_alle_autorisaties)
+
+    def test_has_auth(self):
+        token = self._get_token()
+
+        for fields, expected in [
+            (
+                {
+                    "zaaktype": ZAAKTYPE,
+                    "vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding.openbaar,
+                },
+                True,
+            ),
+            (
+                {
+                    "zaaktype": ZAAKTYPE,
+                    "vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding.geheim,
+                },
+                False,
+            ),
+            (
+                {
+                    "zaaktype": "http://testserver/catalogi/api/v1/zaaktypen/2",
+                    "vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding.openbaar,
+                },
+                False,
+            ),
+        ]:
+            # the same result with the authorizations filtered in the database and
+            # in memory
+            for enabled in (False, True):
+                with (
+                    self.subTest(fields=fields, enabled=enabled),
+                    override_settings(JWT_AUTH_CACHE_ENABLED=enabled),
+                ):
+                    jwt_auth = JWTAuth(token)
+
+                    self.assertEqual(
+                        jwt_auth.has_auth(SCOPE_ZAKEN_ALLES_LEZEN, "zaken", **fields),
+                        expected,
+                    )
+                    self.assertFalse(
+                        jwt_auth.has_auth(SCOPE_ZAKEN_BIJWERKEN, "zaken", **fields)
+                    )
+
+    def test_invalidated_on_autorisatie_change(self):
+        token = self._get_token()
+        self.assertTrue(JWTAuth(token).has_auth(SCOPE_ZAKEN_ALLES_LEZEN, "zaken"))
+
+        self.autorisatie.delete()
+
+        self.assertFalse(JWTAuth(token).has_auth(SCOPE_ZAKEN_ALLES_LEZEN, "zaken"))
+
+    def test_invalidated_on_secret_change(self):
+        token = self._get_token()
+        JWTAuth(token).payload
+
+        self.jwt_secret.secret = "other"
+        self.jwt_secret.save()
+
+        with self.assertRaises(PermissionDenied):
+            JWTAuth(token).payload
+
+    def test_expired_token(self):
+        with freeze_time("2026-01-01T12:00:00"):
+            token = self._get_token()
+            JWTAuth(token).payload
+
+        with freeze_time("2026-01-01T13:00:00"):
+            with self.assertRaises(PermissionDenied) as exc_context:
+                JWTAuth(token).payload
+
+        self.assertEqual(exc_context.exception.detail.code, "jwt-expired")
+
+    def test_invalid_token_is_not_cached(self):
+        token = generate_jwt("test", "other", "user", "User").split(" ")[1]
+
+        for _ in range(2):
+            with self.assertRaises(PermissionDenied):
+                JWTAuth(token).payload
+
+    @override_settings(JWT_AUTH_CACHE_ENABLED=False)
+    def test_disabled(self):
+        token = self._get_token()
+        JWTAuth(token).payload
+
+        jwt_auth = JWTAuth(token)
+
+        with self.assertNumQueries(1):
+            jwt_auth.payload
+        self.assertIsNone(jwt_auth.verified_token)
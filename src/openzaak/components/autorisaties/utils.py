@@ -20,8 +20,10 @@ from openzaak.components.catalogi.models import (
     ZaakType,
 )
 from openzaak.utils import build_absolute_url
+from openzaak.utils.query import invalidate_authorizations_filter_cache
 
 from .api.viewsets import ApplicatieViewSet
+from .middleware import invalidate_jwt_auth_cache
 
 RelatedTypeObject = Union[ZaakType, InformatieObjectType, BesluitType]
 
@@ -101,6 +103,11 @@ def send_applicatie_changed_notification(
 ):
     from openzaak.utils import build_fake_request
 
+    # changes that bypass the model signals (like bulk creating autorisaties) are
+    # always followed by this notification
+    invalidate_jwt_auth_cache()
+    invalidate_authorizations_filter_cache()
+
     viewset = ApplicatieViewSet()
     viewset.action = "update"
     if new_version is None:
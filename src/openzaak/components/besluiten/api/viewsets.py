@@ -11,11 +11,6 @@ from drf_spectacular.utils import (
     extend_schema,
     extend_schema_view,
 )
-from notifications_api_common.viewsets import (
-    NotificationCreateMixin,
-    NotificationDestroyMixin,
-    NotificationViewSetMixin,
-)
 from rest_framework import mixins, status, viewsets
 from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
@@ -26,14 +21,19 @@ from vng_api_common.audittrails.viewsets import (
     AuditTrailMixin,
     AuditTrailViewsetMixin,
 )
-from vng_api_common.caching import conditional_retrieve
 from vng_api_common.constants import CommonResourceAction
 from vng_api_common.viewsets import CheckQueryParamsMixin
 
 from openzaak.components.zaken.api.mixins import ClosedZaakMixin
 from openzaak.components.zaken.api.utils import delete_remote_zaakbesluit
-from openzaak.notifications.viewsets import MultipleNotificationMixin
+from openzaak.notifications.viewsets import (
+    MultipleNotificationMixin,
+    NotificationCreateMixin,
+    NotificationDestroyMixin,
+    NotificationViewSetMixin,
+)
 from openzaak.utils.api import delete_remote_oio
+from openzaak.utils.caching import conditional_retrieve
 from openzaak.utils.cloudevents import get_url, process_cloudevent
 from openzaak.utils.data_filtering import ListFilterByAuthorizationsMixin
 from openzaak.utils.help_text import mark_experimental
@@ -257,11 +257,9 @@ class BesluitInformatieObjectViewSet(
 ):
     """Opvragen en bewerken van BESLUIT-INFORMATIEOBJECT relaties."""
 
-    queryset = (
-        BesluitInformatieObject.objects.select_related("besluit", "_informatieobject")
-        .prefetch_related("_informatieobject__enkelvoudiginformatieobject_set")
-        .all()
-    )
+    queryset = BesluitInformatieObject.objects.select_related(
+        "besluit", "_informatieobject__latest_version"
+    ).all()
     serializer_class = BesluitInformatieObjectSerializer
     filterset_class = BesluitInformatieObjectFilter
     lookup_field = "uuid"
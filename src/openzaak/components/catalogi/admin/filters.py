@@ -1,10 +1,11 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2022 Dimpact
 from django.contrib import admin
-from django.db import models
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+from ..query import filter_geldig_op
+
 
 class GeldigheidFilter(admin.SimpleListFilter):
     title = _("geldigheid")
@@ -25,11 +26,7 @@ class GeldigheidFilter(admin.SimpleListFilter):
 
         today = timezone.now().date()
         if value == "currently":
-            return queryset.filter(
-                models.Q(datum_einde_geldigheid__isnull=True)
-                | models.Q(datum_einde_geldigheid__gte=today),
-                datum_begin_geldigheid__lte=today,
-            )
+            return filter_geldig_op(queryset, today)
 
         if value == "past":
             return queryset.filter(datum_einde_geldigheid__lt=today)
@@ -28,6 +28,7 @@ from ..models import (
     ZaakType,
     ZaakTypeInformatieObjectType,
 )
+from ..query import filter_geldig_op
 
 # custom filter to show concept and non-concepts
 STATUS_HELP_TEXT = _("""filter objects depending on their concept status:
@@ -69,10 +70,7 @@ def m2m_filter(queryset, name, value):
 
 def geldigheid_filter(queryset, name, value):
     """return objects which have geldigheid dates between certain date"""
-    return queryset.filter(datum_begin_geldigheid__lte=value).filter(
-        models.Q(datum_einde_geldigheid__gte=value)
-        | models.Q(datum_einde_geldigheid__isnull=True)
-    )
+    return filter_geldig_op(queryset, value)
 
 
 class RolTypeFilter(FilterSet):
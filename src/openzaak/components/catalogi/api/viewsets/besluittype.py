@@ -4,12 +4,12 @@ from django.db import DatabaseError, transaction
 
 import structlog
 from drf_spectacular.utils import extend_schema, extend_schema_view
-from notifications_api_common.viewsets import NotificationViewSetMixin
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
-from vng_api_common.caching import conditional_retrieve
 from vng_api_common.viewsets import CheckQueryParamsMixin
 
+from openzaak.notifications.viewsets import NotificationViewSetMixin
+from openzaak.utils.caching import conditional_retrieve
 from openzaak.utils.mixins import CacheQuerysetMixin
 from openzaak.utils.pagination import OptimizedPagination
 from openzaak.utils.permissions import AuthRequired
@@ -87,7 +87,6 @@ class BesluitTypeViewSet(
         BesluitType.objects.all()
         .select_related("catalogus")
         .prefetch_related("informatieobjecttypen", "zaaktypen", "resultaattype_set")
-        .with_dates()
         .order_by("-pk")
     )
     serializer_class = BesluitTypeSerializer
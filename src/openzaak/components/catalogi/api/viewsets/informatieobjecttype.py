@@ -9,13 +9,13 @@ from drf_spectacular.utils import (
     extend_schema,
     extend_schema_view,
 )
-from notifications_api_common.viewsets import NotificationViewSetMixin
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
-from vng_api_common.caching import conditional_retrieve
 from vng_api_common.utils import get_help_text
 from vng_api_common.viewsets import CheckQueryParamsMixin
 
+from openzaak.notifications.viewsets import NotificationViewSetMixin
+from openzaak.utils.caching import conditional_retrieve
 from openzaak.utils.help_text import mark_experimental
 from openzaak.utils.mixins import CacheQuerysetMixin
 from openzaak.utils.pagination import OptimizedPagination
@@ -115,7 +115,6 @@ class InformatieObjectTypeViewSet(
         InformatieObjectType.objects.all()
         .select_related("catalogus")
         .prefetch_related("zaaktypen", "besluittypen")
-        .with_dates()
         .order_by("-pk")
     )
     serializer_class = InformatieObjectTypeSerializer
@@ -2,12 +2,12 @@
 # Copyright (C) 2019 - 2020 Dimpact
 import structlog
 from drf_spectacular.utils import extend_schema, extend_schema_view
-from notifications_api_common.viewsets import NotificationViewSetMixin
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
-from vng_api_common.caching import conditional_retrieve
 from vng_api_common.viewsets import CheckQueryParamsMixin
 
+from openzaak.notifications.viewsets import NotificationViewSetMixin
+from openzaak.utils.caching import conditional_retrieve
 from openzaak.utils.mixins import CacheQuerysetMixin
 from openzaak.utils.pagination import OptimizedPagination
 from openzaak.utils.permissions import AuthRequired
@@ -97,22 +97,18 @@ class ZaakTypeViewSet(
     zaken van eenzelfde soort.
     """
 
-    queryset = (
-        ZaakType.objects.prefetch_related(
-            "catalogus",
-            "statustypen",
-            "zaaktypenrelaties",
-            "informatieobjecttypen",
-            "resultaattypen",
-            "eigenschap_set",
-            "roltype_set",
-            "deelzaaktypen",
-            "besluittypen",
-            "zaakobjecttype_set",
-        )
-        .with_dates("identificatie")
-        .order_by("-pk")
-    )
+    queryset = ZaakType.objects.prefetch_related(
+        "catalogus",
+        "statustypen",
+        "zaaktypenrelaties",
+        "informatieobjecttypen",
+        "resultaattypen",
+        "eigenschap_set",
+        "roltype_set",
+        "deelzaaktypen",
+        "besluittypen",
+        "zaakobjecttype_set",
+    ).order_by("-pk")
     serializer_class = ZaakTypeSerializer
     publish_serializer = ZaakTypePublishSerializer
     lookup_field = "uuid"
@@ -0,0 +1,72 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+# Generated by Django 5.2.8 on 2026-10-18 17:05
+
+from django.db import migrations, models
+
+ID_FIELDS = {
+    "zaaktype": "identificatie",
+    "informatieobjecttype": "omschrijving",
+    "besluittype": "omschrijving",
+}
+
+
+def update_object_dates(apps, _):
+    # the same dates as ``GeldigheidQuerySet.update_object_dates``
+    for model_name, id_field in ID_FIELDS.items():
+        model = apps.get_model("catalogi", model_name)
+        versions = model.objects.filter(
+            catalogus=models.OuterRef("catalogus"),
+            **{id_field: models.OuterRef(id_field)},
+        )
+        model.objects.update(
+            datum_begin_object=models.Subquery(
+                versions.order_by("datum_begin_geldigheid").values(
+                    "datum_begin_geldigheid"
+                )[:1]
+            ),
+            datum_einde_object=models.Subquery(
+                versions.order_by("-datum_begin_geldigheid").values(
+                    "datum_einde_geldigheid"
+                )[:1]
+            ),
+        )
+
+
+def _date_fields(model_name: str) -> list:
+    return [
+        migrations.AddField(
+            model_name=model_name,
+            name="datum_begin_object",
+            field=models.DateField(
+                editable=False,
+                help_text="De datum begin geldigheid van de eerste versie.",
+                null=True,
+                verbose_name="datum begin object",
+            ),
+        ),
+        migrations.AddField(
+            model_name=model_name,
+            name="datum_einde_object",
+            field=models.DateField(
+                editable=False,
+                help_text="De datum einde geldigheid van de laatste versie.",
+                null=True,
+                verbose_name="datum einde object",
+            ),
+        ),
+    ]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("catalogi", "0025_alter_besluittype_options"),
+    ]
+
+    operations = [
+        *_date_fields("besluittype"),
+        *_date_fields("informatieobjecttype"),
+        *_date_fields("zaaktype"),
+        migrations.RunPython(update_object_dates, migrations.RunPython.noop),
+    ]
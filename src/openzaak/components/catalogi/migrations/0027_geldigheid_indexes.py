@@ -0,0 +1,47 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+# Generated by Django 5.2.8 on 2026-10-18 17:05
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.comparison
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+import openzaak.components.catalogi.query
+
+
+def _geldigheid_index(name: str):
+    return django.contrib.postgres.indexes.GistIndex(
+        openzaak.components.catalogi.query.DateRange(
+            django.db.models.functions.comparison.Least(
+                "datum_begin_geldigheid", "datum_einde_geldigheid"
+            ),
+            "datum_einde_geldigheid",
+            models.Value("[]"),
+        ),
+        name=name,
+    )
+
+
+class Migration(migrations.Migration):
+    # the indexes are created concurrently, so the tables stay writable
+    atomic = False
+
+    dependencies = [
+        ("catalogi", "0026_geldigheid_object_dates"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="besluittype",
+            index=_geldigheid_index("besluittype_geldigheid_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="informatieobjecttype",
+            index=_geldigheid_index("iotype_geldigheid_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="zaaktype",
+            index=_geldigheid_index("zaaktype_geldigheid_idx"),
+        ),
+    ]
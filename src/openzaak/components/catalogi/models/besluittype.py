@@ -3,6 +3,7 @@
 import uuid as _uuid
 from functools import partial
 
+from django.contrib.postgres.indexes import GistIndex
 from django.db import models, transaction
 from django.utils.translation import gettext_lazy as _
 
@@ -13,7 +14,7 @@ from openzaak.utils.fields import DurationField
 from openzaak.utils.mixins import APIMixin
 
 from ..managers import SyncAutorisatieManager
-from ..query import GeldigheidQuerySet
+from ..query import GeldigheidQuerySet, geldigheid_range
 from .mixins import ConceptMixin, GeldigheidMixin
 
 
@@ -136,6 +137,7 @@ class BesluitType(ETagMixin, APIMixin, GeldigheidMixin, ConceptMixin, models.Mod
         verbose_name = _("besluittype")
         verbose_name_plural = _("besluittypen")
         ordering = ("pk",)
+        indexes = [GistIndex(geldigheid_range(), name="besluittype_geldigheid_idx")]
 
     def __str__(self):
         representation = (
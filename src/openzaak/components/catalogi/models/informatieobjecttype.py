@@ -4,6 +4,7 @@ import uuid as _uuid
 from functools import partial
 
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GistIndex
 from django.db import models, transaction
 from django.utils.translation import gettext_lazy as _
 
@@ -14,7 +15,7 @@ from openzaak.components.autorisaties.models import CatalogusAutorisatie
 from openzaak.utils.mixins import APIMixin
 
 from ..managers import SyncAutorisatieManager
-from ..query import GeldigheidQuerySet
+from ..query import GeldigheidQuerySet, geldigheid_range
 from .mixins import ConceptMixin, GeldigheidMixin
 
 
@@ -120,6 +121,7 @@ class InformatieObjectType(
     class Meta:
         verbose_name = _("Informatieobjecttype")
         verbose_name_plural = _("Informatieobjecttypen")
+        indexes = [GistIndex(geldigheid_range(), name="iotype_geldigheid_idx")]
 
     def __str__(self):
         representation = f"{self.omschrijving} {self.datum_begin_geldigheid}"
@@ -19,12 +19,40 @@ class GeldigheidMixin(models.Model):
         null=True,
         help_text=_("De datum waarop het is opgeheven."),
     )
+    # kept up to date with all the versions, see
+    # ``GeldigheidQuerySet.update_object_dates``
+    datum_begin_object = models.DateField(
+        _("datum begin object"),
+        null=True,
+        editable=False,
+        help_text=_("De datum begin geldigheid van de eerste versie."),
+    )
+    datum_einde_object = models.DateField(
+        _("datum einde object"),
+        null=True,
+        editable=False,
+        help_text=_("De datum einde geldigheid van de laatste versie."),
+    )
 
     omschrijving_field = "omschrijving"
 
     class Meta:
         abstract = True
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # the versions the instance belonged to, to update their dates after saving
+        instance._loaded_versions = instance.versions_key
+        return instance
+
+    @property
+    def versions_key(self) -> tuple:
+        return (
+            self.__dict__.get("catalogus_id"),
+            self.__dict__.get(self.omschrijving_field),
+        )
+
     def clean(self):
         """
         Validate the rule
@@ -115,36 +143,12 @@ class GeldigheidMixin(models.Model):
                 )
 
     @property
-    def begin_object(self) -> date:
-        # annotated in the queryset
-        if hasattr(self, "datum_begin_object"):
-            return self.datum_begin_object
-
-        # for inclusions we don't have annotated queryset
-        return (
-            self._meta.default_manager.filter(
-                **{self.omschrijving_field: getattr(self, self.omschrijving_field)}
-            )
-            .order_by("datum_begin_geldigheid")
-            .first()
-            .datum_begin_geldigheid
-        )
+    def begin_object(self) -> Optional[date]:
+        return self.datum_begin_object
 
     @property
     def einde_object(self) -> Optional[date]:
-        # annotated in the queryset
-        if hasattr(self, "datum_einde_object"):
-            return self.datum_einde_object
-
-        # for inclusions we don't have annotated queryset
-        return (
-            self._meta.default_manager.filter(
-                **{self.omschrijving_field: getattr(self, self.omschrijving_field)}
-            )
-            .order_by("-datum_begin_geldigheid")
-            .first()
-            .datum_einde_geldigheid
-        )
+        return self.datum_einde_object
 
 
 class OptionalGeldigheidMixin(models.Model):
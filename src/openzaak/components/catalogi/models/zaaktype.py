@@ -3,6 +3,7 @@
 import uuid
 from functools import partial
 
+from django.contrib.postgres.indexes import GistIndex
 from django.core.exceptions import ValidationError
 from django.db import models, transaction
 from django.utils.translation import gettext_lazy as _
@@ -21,7 +22,7 @@ from openzaak.utils.mixins import APIMixin
 
 from ..constants import InternExtern
 from ..managers import SyncAutorisatieManager
-from ..query import GeldigheidQuerySet
+from ..query import GeldigheidQuerySet, geldigheid_range
 from .mixins import ConceptMixin, GeldigheidMixin
 from .validators import validate_uppercase
 
@@ -360,6 +361,7 @@ class ZaakType(ETagMixin, APIMixin, ConceptMixin, GeldigheidMixin, models.Model)
     class Meta:
         verbose_name = _("Zaaktype")
         verbose_name_plural = _("Zaaktypen")
+        indexes = [GistIndex(geldigheid_range(), name="zaaktype_geldigheid_idx")]
 
     def __str__(self):
         return "{} ({})".format(
@@ -1,26 +1,87 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2023 Dimpact
-from django.db import models
+import operator
+from datetime import date
+from functools import reduce
+from typing import Iterable, Optional
+
+from django.contrib.postgres.fields import DateRangeField
+from django.db import models, transaction
+from django.db.models.functions import Least
+
+
+class DateRange(models.Func):
+    function = "DATERANGE"
+    output_field = DateRangeField()
+
+
+def geldigheid_range() -> DateRange:
+    """
+    Return the (inclusive) range of the geldigheid dates, as used by the GiST indexes.
+
+    A missing einde geldigheid means the range is unbounded. ``LEAST`` prevents
+    errors for invalid dates (einde before begin).
+    """
+    return DateRange(
+        Least("datum_begin_geldigheid", "datum_einde_geldigheid"),
+        "datum_einde_geldigheid",
+        models.Value("[]"),
+    )
+
+
+def filter_geldig_op(queryset: models.QuerySet, datum: date) -> models.QuerySet:
+    """
+    Filter the objects which are valid on the date.
+    """
+    return queryset.alias(geldigheid=geldigheid_range()).filter(
+        # the begin of the sub-resources of zaaktypen is optional
+        datum_begin_geldigheid__isnull=False,
+        geldigheid__contains=datum,
+    )
 
 
 class GeldigheidQuerySet(models.QuerySet):
-    def with_dates(self, id_field="omschrijving"):
+    @transaction.atomic
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = super().bulk_create(objs, *args, **kwargs)
+        self.filter_versions(obj.versions_key for obj in objs).update_object_dates()
+        return objs
+
+    def filter_versions(self, versions: Iterable[tuple]) -> "GeldigheidQuerySet":
+        """
+        Filter the versions by their ``(catalogus_id, omschrijving)`` keys.
+        """
+        id_field = self.model.omschrijving_field
+        return self.filter(
+            reduce(
+                operator.or_,
+                (
+                    models.Q(catalogus=catalogus_id, **{id_field: value})
+                    for catalogus_id, value in versions
+                ),
+                models.Q(pk__in=[]),
+            )
+        )
+
+    def update_object_dates(self, id_field: Optional[str] = None) -> int:
         """
-        annotate queryset with begin_object and einde_object
+        Store the begin of the first version and the einde of the last version on
+        every version of the objects.
         """
-        qs = self.filter(
+        id_field = id_field or self.model.omschrijving_field
+        versions = self.model._base_manager.filter(
             catalogus=models.OuterRef("catalogus"),
             **{id_field: models.OuterRef(id_field)},
         )
-        return self.annotate(
+        return self.update(
             datum_begin_object=models.Subquery(
-                qs.order_by("datum_begin_geldigheid").values("datum_begin_geldigheid")[
-                    :1
-                ]
+                versions.order_by("datum_begin_geldigheid").values(
+                    "datum_begin_geldigheid"
+                )[:1]
             ),
             datum_einde_object=models.Subquery(
-                qs.order_by("-datum_begin_geldigheid").values("datum_einde_geldigheid")[
-                    :1
-                ]
+                versions.order_by("-datum_begin_geldigheid").values(
+                    "datum_einde_geldigheid"
+                )[:1]
             ),
         )
@@ -3,7 +3,7 @@
 from typing import Union
 
 from django.db.models.base import ModelBase
-from django.db.models.signals import ModelSignal, post_delete
+from django.db.models.signals import ModelSignal, post_delete, post_save
 from django.dispatch import receiver
 
 import structlog
@@ -11,7 +11,18 @@ from vng_api_common.authorizations.models import Applicatie, Autorisatie
 
 from openzaak.utils import build_absolute_url
 
-from .models import BesluitType, InformatieObjectType, ZaakType
+from .models import (
+    BesluitType,
+    Catalogus,
+    Eigenschap,
+    EigenschapSpecificatie,
+    InformatieObjectType,
+    ResultaatType,
+    RolType,
+    StatusType,
+    ZaakType,
+)
+from .snapshot import invalidate_catalogi_snapshot
 
 logger = structlog.stdlib.get_logger(__name__)
 
@@ -83,3 +94,89 @@ def sync_autorisaties(
         apps_to_delete=app_ids_to_delete,
     )
     apps_to_delete.delete()
+
+
+@receiver(
+    [post_save, post_delete],
+    sender=ZaakType,
+    dispatch_uid="catalogi.update_object_dates_zaaktype",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=InformatieObjectType,
+    dispatch_uid="catalogi.update_object_dates_informatieobjecttype",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=BesluitType,
+    dispatch_uid="catalogi.update_object_dates_besluittype",
+)
+def update_object_dates(
+    sender: ModelBase,
+    signal: ModelSignal,
+    instance: Union[ZaakType, InformatieObjectType, BesluitType],
+    **kwargs,
+) -> None:
+    """
+    Update the begin and einde object of all versions of the saved or deleted object.
+
+    If the catalogus or the omschrijving changed, the versions it belonged to are
+    updated as well.
+    """
+    versions = {instance.versions_key, getattr(instance, "_loaded_versions", None)}
+    versions.discard(None)
+    sender.objects.filter_versions(versions).update_object_dates()
+
+    if signal is post_save:
+        instance._loaded_versions = instance.versions_key
+        instance.refresh_from_db(fields=["datum_begin_object", "datum_einde_object"])
+
+
+@receiver(
+    [post_save, post_delete],
+    sender=Catalogus,
+    dispatch_uid="catalogi.invalidate_snapshot_catalogus",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=ZaakType,
+    dispatch_uid="catalogi.invalidate_snapshot_zaaktype",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=StatusType,
+    dispatch_uid="catalogi.invalidate_snapshot_statustype",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=RolType,
+    dispatch_uid="catalogi.invalidate_snapshot_roltype",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=ResultaatType,
+    dispatch_uid="catalogi.invalidate_snapshot_resultaattype",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=Eigenschap,
+    dispatch_uid="catalogi.invalidate_snapshot_eigenschap",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=EigenschapSpecificatie,
+    dispatch_uid="catalogi.invalidate_snapshot_eigenschapspecificatie",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=InformatieObjectType,
+    dispatch_uid="catalogi.invalidate_snapshot_informatieobjecttype",
+)
+def invalidate_snapshot(sender: ModelBase, **kwargs) -> None:
+    """
+    Discard the catalogi snapshot in all processes.
+
+    Concepts are not part of the snapshot, but they count for the geldigheid of the
+    published versions, and publishing is a save as well.
+    """
+    invalidate_catalogi_snapshot()
@@ -0,0 +1,133 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+"""
+Per-process snapshot of the published catalogi objects.
+
+Published zaaktypen and informatieobjecttypen (and the statustypen, roltypen,
+resultaattypen and eigenschappen of published zaaktypen) hardly ever change, but
+they are looked up over and over again when zaken and documenten are written. The
+snapshot holds all of them in memory, indexed by primary key and UUID, so these
+lookups don't need a database query.
+
+The snapshot is built lazily and discarded in all processes as soon as a catalogi
+object is saved or deleted (see :mod:`openzaak.components.catalogi.signals`).
+Enabled with the ``CATALOGI_SNAPSHOT_ENABLED`` setting.
+"""
+
+import copy
+from typing import Dict, Optional, Tuple, Type, TypeVar
+from uuid import UUID
+
+from django.conf import settings
+from django.db import models
+from django.urls import Resolver404, get_script_prefix, resolve
+
+from openzaak.utils.cache import VersionedLocalCache
+
+from .models import (
+    Eigenschap,
+    InformatieObjectType,
+    ResultaatType,
+    RolType,
+    StatusType,
+    ZaakType,
+)
+
+M = TypeVar("M", bound=models.Model)
+
+# sub-resources of zaaktypen, which are published together with their zaaktype
+ZAAKTYPE_RESOURCES = (StatusType, RolType, ResultaatType, Eigenschap)
+
+SNAPSHOT_MODELS = (ZaakType, InformatieObjectType) + ZAAKTYPE_RESOURCES
+
+catalogi_snapshot_cache = VersionedLocalCache("catalogi-snapshot", maxsize=1)
+
+
+class CatalogiSnapshot:
+    """
+    Read-only index of the published catalogi objects.
+
+    The lookups return copies of the objects, so callers can't change the instances
+    shared by all requests of the process.
+    """
+
+    def __init__(self):
+        self._by_pk: Dict[Tuple[Type[models.Model], int], models.Model] = {}
+        self._by_uuid: Dict[Tuple[Type[models.Model], UUID], models.Model] = {}
+
+        for model in (ZaakType, InformatieObjectType):
+            for obj in model.objects.filter(concept=False).select_related("catalogus"):
+                self._add(obj)
+
+        zaaktype_field = StatusType._meta.get_field("zaaktype")
+        for model in ZAAKTYPE_RESOURCES:
+            queryset = model.objects.filter(zaaktype__concept=False)
+            if model is Eigenschap:
+                queryset = queryset.select_related("specificatie_van_eigenschap")
+            for obj in queryset:
+                # the zaaktype can be published in between the queries
+                if (zaaktype := self._by_pk.get((ZaakType, obj.zaaktype_id))) is None:
+                    continue
+                zaaktype_field.set_cached_value(obj, zaaktype)
+                self._add(obj)
+
+    def _add(self, obj: models.Model) -> None:
+        self._by_pk[(type(obj), obj.pk)] = obj
+        self._by_uuid[(type(obj), obj.uuid)] = obj
+
+    def get(
+        self,
+        model: Type[M],
+        *,
+        pk: Optional[int] = None,
+        uuid: Optional[UUID] = None,
+    ) -> Optional[M]:
+        """
+        Return a copy of the published object, or ``None`` if it's not in the snapshot.
+        """
+        if pk is not None:
+            obj = self._by_pk.get((model, pk))
+        else:
+            try:
+                obj = self._by_uuid.get((model, UUID(str(uuid))))
+            except ValueError:
+                return None
+        return copy.copy(obj) if obj is not None else None
+
+    def get_for_path(self, path: str) -> Optional[models.Model]:
+        """
+        Return a copy of the published object of an API detail path, like
+        :func:`django_loose_fk.utils.get_resource_for_path`.
+        """
+        if settings.FORCE_SCRIPT_NAME and path.startswith(settings.FORCE_SCRIPT_NAME):
+            path = path[len(settings.FORCE_SCRIPT_NAME) :]
+        path = path.replace(get_script_prefix(), "/", 1)
+
+        try:
+            match = resolve(path)
+        except Resolver404:
+            return None
+
+        viewset = getattr(match.func, "cls", None)
+        if viewset is None or "uuid" not in match.kwargs:
+            return None
+        model = viewset.queryset.model
+        if model not in SNAPSHOT_MODELS:
+            return None
+        return self.get(model, uuid=match.kwargs["uuid"])
+
+
+def get_catalogi_snapshot() -> Optional[CatalogiSnapshot]:
+    """
+    Return the snapshot of the current catalogi generation, if it's enabled.
+    """
+    if not settings.CATALOGI_SNAPSHOT_ENABLED:
+        return None
+    return catalogi_snapshot_cache.get_or_set("snapshot", CatalogiSnapshot)
+
+
+def invalidate_catalogi_snapshot() -> None:
+    """
+    Discard the snapshot in all processes.
+    """
+    catalogi_snapshot_cache.invalidate()
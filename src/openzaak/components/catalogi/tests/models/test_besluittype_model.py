@@ -43,7 +43,7 @@ class BesluitTypeDatesTests(TestCase):
             datum_einde_geldigheid=date(2021, 12, 11),
         )
 
-        besluittypen = BesluitType.objects.with_dates().order_by("pk").all()
+        besluittypen = BesluitType.objects.order_by("pk")
 
         for besluittype in besluittypen[:3]:
             with self.subTest(besluittype.pk):
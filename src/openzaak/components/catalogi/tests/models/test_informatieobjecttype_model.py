@@ -43,7 +43,7 @@ class InformatieObjectTypeDatesTests(TestCase):
             datum_einde_geldigheid=date(2021, 12, 11),
         )
 
-        iotypen = InformatieObjectType.objects.with_dates().order_by("pk").all()
+        iotypen = InformatieObjectType.objects.order_by("pk")
 
         for iotype in iotypen[:3]:
             with self.subTest(iotype.pk):
@@ -43,9 +43,7 @@ class ZaakTypeDatesTests(TestCase):
             datum_einde_geldigheid=date(2021, 12, 11),
         )
 
-        zaaktypen = (
-            ZaakType.objects.with_dates(id_field="identificatie").order_by("pk").all()
-        )
+        zaaktypen = ZaakType.objects.order_by("pk")
 
         for zaaktype in zaaktypen[:3]:
             with self.subTest(zaaktype.pk):
@@ -56,3 +54,85 @@ class ZaakTypeDatesTests(TestCase):
             with self.subTest(zaaktype.pk):
                 self.assertEqual(zaaktype.begin_object, date(2021, 10, 1))
                 self.assertEqual(zaaktype.einde_object, date(2021, 12, 11))
+
+    def test_object_dates_updated_on_new_version(self):
+        zaaktype = ZaakTypeFactory.create(
+            identificatie="ZAAK1",
+            datum_begin_geldigheid=date(2020, 1, 1),
+            datum_einde_geldigheid=date(2020, 2, 1),
+        )
+        new_version = ZaakTypeFactory.create(
+            catalogus=zaaktype.catalogus,
+            identificatie="ZAAK1",
+            datum_begin_geldigheid=date(2020, 2, 1),
+        )
+
+        self.assertEqual(new_version.begin_object, date(2020, 1, 1))
+        self.assertIsNone(new_version.einde_object)
+        zaaktype.refresh_from_db()
+        self.assertEqual(zaaktype.begin_object, date(2020, 1, 1))
+        self.assertIsNone(zaaktype.einde_object)
+
+    def test_object_dates_updated_on_delete(self):
+        zaaktype = ZaakTypeFactory.create(
+            identificatie="ZAAK1",
+            datum_begin_geldigheid=date(2020, 1, 1),
+            datum_einde_geldigheid=date(2020, 2, 1),
+        )
+        new_version = ZaakTypeFactory.create(
+            catalogus=zaaktype.catalogus,
+            identificatie="ZAAK1",
+            datum_begin_geldigheid=date(2020, 2, 1),
+        )
+
+        new_version.delete()
+
+        zaaktype.refresh_from_db()
+        self.assertEqual(zaaktype.begin_object, date(2020, 1, 1))
+        self.assertEqual(zaaktype.einde_object, date(2020, 2, 1))
+
+    def test_object_dates_updated_on_identificatie_change(self):
+        zaaktype = ZaakTypeFactory.create(
+            identificatie="ZAAK1",
+            datum_begin_geldigheid=date(2020, 1, 1),
+            datum_einde_geldigheid=date(2020, 2, 1),
+        )
+        new_version = ZaakTypeFactory.create(
+            catalogus=zaaktype.catalogus,
+            identificatie="ZAAK1",
+            datum_begin_geldigheid=date(2020, 2, 1),
+        )
+        new_version = ZaakType.objects.get(pk=new_version.pk)
+
+        new_version.identificatie = "ZAAK2"
+        new_version.save()
+
+        self.assertEqual(new_version.begin_object, date(2020, 2, 1))
+        self.assertIsNone(new_version.einde_object)
+        zaaktype.refresh_from_db()
+        self.assertEqual(zaaktype.begin_object, date(2020, 1, 1))
+        self.assertEqual(zaaktype.einde_object, date(2020, 2, 1))
+
+    def test_object_dates_bulk_create(self):
+        catalogus = CatalogusFactory.create()
+        ZaakType.objects.bulk_create(
+            [
+                ZaakTypeFactory.build(
+                    catalogus=catalogus,
+                    identificatie="ZAAK1",
+                    datum_begin_geldigheid=date(2020, 1, 1),
+                    datum_einde_geldigheid=date(2020, 2, 1),
+                ),
+                ZaakTypeFactory.build(
+                    catalogus=catalogus,
+                    identificatie="ZAAK1",
+                    datum_begin_geldigheid=date(2020, 2, 1),
+                    datum_einde_geldigheid=date(2020, 3, 1),
+                ),
+            ]
+        )
+
+        for zaaktype in ZaakType.objects.all():
+            with self.subTest(zaaktype.pk):
+                self.assertEqual(zaaktype.begin_object, date(2020, 1, 1))
+                self.assertEqual(zaaktype.einde_object, date(2020, 3, 1))
@@ -0,0 +1,144 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from datetime import date
+
+from django.test import TestCase, override_settings
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
+from vng_api_common.tests import reverse
+
+from openzaak.components.zaken.api.kanalen import KANAAL_ZAKEN
+from openzaak.components.zaken.models import Zaak
+from openzaak.components.zaken.tests.factories import ZaakFactory
+from openzaak.components.zaken.tests.utils import (
+    ZAAK_WRITE_KWARGS,
+    get_operation_url,
+)
+from openzaak.tests.utils import ClearCachesMixin, JWTAuthMixin
+
+from ..models import StatusType, ZaakType
+from ..snapshot import get_catalogi_snapshot
+from .factories import StatusTypeFactory, ZaakTypeFactory
+
+
+@override_settings(CATALOGI_SNAPSHOT_ENABLED=True)
+class CatalogiSnapshotTests(ClearCachesMixin, TestCase):
+    def test_lookups(self):
+        zaaktype = ZaakTypeFactory.create(concept=False)
+        statustype = StatusTypeFactory.create(zaaktype=zaaktype)
+        snapshot = get_catalogi_snapshot()
+
+        with self.assertNumQueries(0):
+            by_pk = snapshot.get(ZaakType, pk=zaaktype.pk)
+            by_uuid = snapshot.get(ZaakType, uuid=zaaktype.uuid)
+            by_path = snapshot.get_for_path(reverse(statustype))
+
+            self.assertEqual(by_pk, zaaktype)
+            self.assertEqual(by_pk.catalogus, zaaktype.catalogus)
+            self.assertEqual(by_uuid, zaaktype)
+            self.assertIsNot(by_uuid, by_pk)
+            self.assertEqual(by_path, statustype)
+            self.assertEqual(by_path.zaaktype, zaaktype)
+
+    def test_concepts_are_not_included(self):
+        zaaktype = ZaakTypeFactory.create(concept=True)
+        statustype = StatusTypeFactory.create(zaaktype=zaaktype)
+
+        snapshot = get_catalogi_snapshot()
+
+        self.assertIsNone(snapshot.get(ZaakType, pk=zaaktype.pk))
+        self.assertIsNone(snapshot.get(StatusType, pk=statustype.pk))
+        self.assertIsNone(snapshot.get_for_path(reverse(statustype)))
+
+    def test_invalidated_on_publish(self):
+        zaaktype = ZaakTypeFactory.create(concept=True)
+        self.assertIsNone(get_catalogi_snapshot().get(ZaakType, pk=zaaktype.pk))
+
+        zaaktype.concept = False
+        zaaktype.save()
+
+        self.assertEqual(
+            get_catalogi_snapshot().get(ZaakType, pk=zaaktype.pk), zaaktype
+        )
+
+    def test_invalidated_on_delete(self):
+        zaaktype = ZaakTypeFactory.create(concept=False)
+        self.assertIsNotNone(get_catalogi_snapshot().get(ZaakType, pk=zaaktype.pk))
+        pk = zaaktype.pk
+
+        zaaktype.delete()
+
+        self.assertIsNone(get_catalogi_snapshot().get(ZaakType, pk=pk))
+
+    def test_geldigheid(self):
+        zaaktype = ZaakTypeFactory.create(
+            concept=False,
+            identificatie="ZAAKTYPE-1",
+            datum_begin_geldigheid=date(2020, 1, 1),
+            datum_einde_geldigheid=date(2020, 12, 31),
+        )
+        ZaakTypeFactory.create(
+            catalogus=zaaktype.catalogus,
+            concept=True,
+            identificatie="ZAAKTYPE-1",
+            datum_begin_geldigheid=date(2021, 1, 1),
+        )
+        snapshot = get_catalogi_snapshot()
+
+        with self.assertNumQueries(0):
+            zaaktype = snapshot.get(ZaakType, pk=zaaktype.pk)
+
+            # the stored dates over all versions, including concepts
+            self.assertEqual(zaaktype.begin_object, date(2020, 1, 1))
+            self.assertIsNone(zaaktype.einde_object)
+
+    def test_kenmerken(self):
+        zaaktype = ZaakTypeFactory.create(concept=False)
+        zaak = Zaak.objects.get(pk=ZaakFactory.create(zaaktype=zaaktype).pk)
+        get_catalogi_snapshot()
+
+        with self.assertNumQueries(0):
+            kenmerken = KANAAL_ZAKEN.get_kenmerken(zaak)
+
+        self.assertEqual(kenmerken["zaaktype"], reverse(zaaktype))
+        self.assertEqual(kenmerken["zaaktype.catalogus"], reverse(zaaktype.catalogus))
+
+    @override_settings(CATALOGI_SNAPSHOT_ENABLED=False)
+    def test_disabled(self):
+        self.assertIsNone(get_catalogi_snapshot())
+
+
+@override_settings(CATALOGI_SNAPSHOT_ENABLED=True)
+class CatalogiSnapshotValidationTests(ClearCachesMixin, JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def _create_zaak(self, zaaktype):
+        data = {
+            "zaaktype": f"http://testserver{reverse(zaaktype)}",
+            "vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding.openbaar,
+            "bronorganisatie": "517439943",
+            "verantwoordelijkeOrganisatie": "517439943",
+            "registratiedatum": "2018-06-11",
+            "startdatum": "2018-06-11",
+        }
+        return self.client.post(
+            get_operation_url("zaak_create"), data, **ZAAK_WRITE_KWARGS
+        )
+
+    def test_create_zaak(self):
+        zaaktype = ZaakTypeFactory.create(concept=False)
+
+        response = self._create_zaak(zaaktype)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        self.assertEqual(Zaak.objects.get().zaaktype, zaaktype)
+
+    def test_create_zaak_concept_zaaktype(self):
+        zaaktype = ZaakTypeFactory.create(concept=True)
+
+        response = self._create_zaak(zaaktype)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Zaak.objects.exists())
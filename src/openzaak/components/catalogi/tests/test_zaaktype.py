@@ -2037,6 +2037,31 @@ class ZaakTypeFilterAPITests(APITestCase):
         self.assertEqual(len(data), 1)
         self.assertEqual(data[0]["url"], f"http://testserver{reverse(zaaktype)}")
 
+    def test_filter_geldigheid_bounds(self):
+        zaaktype1 = ZaakTypeFactory.create(
+            datum_begin_geldigheid=date(2020, 1, 1),
+            datum_einde_geldigheid=date(2020, 2, 1),
+            concept=False,
+        )
+        zaaktype2 = ZaakTypeFactory.create(
+            datum_begin_geldigheid=date(2020, 2, 1), concept=False
+        )
+
+        for datum, expected in [
+            ("2019-12-31", []),
+            ("2020-01-01", [zaaktype1]),
+            ("2020-02-01", [zaaktype2, zaaktype1]),
+            ("2030-01-01", [zaaktype2]),
+        ]:
+            with self.subTest(datum):
+                response = self.client.get(self.url, {"datumGeldigheid": datum})
+
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(
+                    [zaaktype["url"] for zaaktype in response.json()["results"]],
+                    [f"http://testserver{reverse(zaaktype)}" for zaaktype in expected],
+                )
+
 
 class ZaakTypePaginationTestCase(APITestCase):
     maxDiff = None
@@ -11,7 +11,7 @@ from vng_api_common.filtersets import FilterSet
 from vng_api_common.utils import get_help_text
 
 from openzaak.components.documenten.constants import ObjectInformatieObjectTypes
-from openzaak.utils.filters import CharArrayFilter, ExpandFilter
+from openzaak.utils.filters import CharArrayFilter, CursorFilter, ExpandFilter
 from openzaak.utils.filterset import OrderingFilter
 from openzaak.utils.help_text import mark_experimental
 
@@ -22,6 +22,7 @@ from ..models import (
     ObjectInformatieObject,
     Verzending,
 )
+from ..search import search_documenten
 from .serializers import (
     EnkelvoudigInformatieObjectSerializer,
     GebruiksrechtenSerializer,
@@ -103,6 +104,15 @@ class EnkelvoudigInformatieObjectListFilter(FilterSet):
         ),
         lookup_expr="icontains",
     )
+    search = filters.CharFilter(
+        help_text=mark_experimental(
+            "Zoek in de titel, auteur en beschrijving van het informatie object. "
+            "Ondersteunt zoektermen, zinnen tussen aanhalingstekens, `or` en "
+            "uitsluiting met `-`. De resultaten worden gesorteerd op relevantie, "
+            "tenzij `ordering` of `cursor` is opgegeven."
+        ),
+        method="search_filter",
+    )
     trefwoorden = CharArrayFilter(
         help_text=_("Een lijst van trefwoorden gescheiden door comma's."),
         field_name="trefwoorden",
@@ -161,6 +171,8 @@ class EnkelvoudigInformatieObjectListFilter(FilterSet):
 
     expand = ExpandFilter(serializer_class=EnkelvoudigInformatieObjectSerializer)
 
+    cursor = CursorFilter()
+
     class Meta:
         model = EnkelvoudigInformatieObject
         fields = (
@@ -173,6 +185,7 @@ class EnkelvoudigInformatieObjectListFilter(FilterSet):
             "informatieobjecttype",
             "locked",
             "ordering",
+            "search",
             "titel",
             "trefwoorden",
             "trefwoorden__overlap",
@@ -186,6 +199,12 @@ class EnkelvoudigInformatieObjectListFilter(FilterSet):
             return queryset.exclude(canonical__lock__exact="")
         return queryset.filter(canonical__lock__exact="")
 
+    def search_filter(self, queryset, name, value):
+        # the ordering filter is applied before this filter, ranking would replace the
+        # requested order. Cursor pagination can only order on model fields
+        rank = "ordering" not in self.data and "cursor" not in self.data
+        return search_documenten(queryset, value, rank=rank)
+
 
 class EnkelvoudigInformatieObjectDetailFilter(FilterSet):
     versie = filters.NumberFilter(field_name="versie")
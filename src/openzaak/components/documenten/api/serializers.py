@@ -8,12 +8,11 @@ import binascii
 import math
 import uuid
 from base64 import b64decode
-from pathlib import Path
 from typing import Optional
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
-from django.core.files.base import ContentFile, File
+from django.core.files.base import ContentFile
 from django.db import transaction
 from django.utils.http import urlencode
 from django.utils.translation import gettext_lazy as _
@@ -69,8 +68,9 @@ from ..models import (
     ReservedDocument,
     Verzending,
 )
+from ..storage import documenten_storage
 from .fields import OnlyRemoteOrFKOrURLField
-from .utils import create_filename, merge_files
+from .utils import create_filename
 from .validators import (
     InformatieObjectUniqueValidator,
     StatusValidator,
@@ -278,6 +278,22 @@ class BestandsDeelSerializer(serializers.HyperlinkedModelSerializer):
 
         return valid_attrs
 
+    def update(self, instance, validated_data):
+        canonical = instance.informatieobject
+        inhoud = validated_data.get("inhoud")
+        if inhoud and canonical.upload_name:
+            # send the part to the document storage directly instead of storing it
+            # until the upload is complete
+            del validated_data["inhoud"]
+            instance.upload_part_id = documenten_storage.save_part(
+                canonical.upload_name,
+                canonical.upload_id,
+                instance.volgnummer,
+                inhoud,
+            )
+            instance._voltooid = True
+        return super().update(instance, validated_data)
+
 
 class EnkelvoudigInformatieObjectSerializer(serializers.HyperlinkedModelSerializer):
     """
@@ -528,6 +544,14 @@ class EnkelvoudigInformatieObjectSerializer(serializers.HyperlinkedModelSerializ
             BestandsDeel.objects.create(omvang=chunk_size, volgnummer=i + 1, **kwargs)
             full_size -= chunk_size
 
+    def _start_parts_upload(self, instance: EnkelvoudigInformatieObject):
+        file_field = instance._meta.get_field("inhoud")
+        name = create_filename(instance.bestandsnaam)
+        instance.canonical.start_parts_upload(
+            file_field.generate_filename(instance, name),
+            max_length=file_field.max_length,
+        )
+
     @transaction.atomic
     def create(self, validated_data):
         """
@@ -570,6 +594,7 @@ class EnkelvoudigInformatieObjectSerializer(serializers.HyperlinkedModelSerializ
             self._create_bestandsdeel(
                 validated_data["bestandsomvang"], **create_bestandsdeel_kwargs
             )
+            self._start_parts_upload(eio)
 
         return eio
 
@@ -634,6 +659,7 @@ class EnkelvoudigInformatieObjectSerializer(serializers.HyperlinkedModelSerializ
 
         bestandsdelen = instance.canonical.bestandsdelen.all()
 
+        instance.canonical.abort_parts_upload()
         bestandsdelen.wipe()
 
         create_bestandsdeel_kwargs = {"canonical": instance.canonical}
@@ -647,6 +673,7 @@ class EnkelvoudigInformatieObjectSerializer(serializers.HyperlinkedModelSerializ
             self._create_bestandsdeel(
                 instance.bestandsomvang, **create_bestandsdeel_kwargs
             )
+            self._start_parts_upload(instance)
 
         # create empty file if size == 0
         if instance.bestandsomvang == 0 and not instance.inhoud:
@@ -837,24 +864,23 @@ class UnlockEnkelvoudigInformatieObjectSerializer(serializers.ModelSerializer):
         if empty_bestandsdelen:
             return self.instance
 
-        if complete_upload:
-            part_files = [p.inhoud.file for p in bestandsdelen]
+        if complete_upload and self.instance.canonical.upload_name:
+            # the parts were uploaded into the document storage as they arrived
+            self.instance.inhoud = self.instance.canonical.complete_parts_upload()
+            self.instance.save()
+        elif complete_upload:
+            parts = [p.inhoud for p in bestandsdelen]
             # create the name of target file using the storage backend to the serializer
             name = create_filename(self.instance.bestandsnaam)
             file_field = self.instance._meta.get_field("inhoud")
             rel_path = file_field.generate_filename(self.instance, name)
-            file_name = Path(rel_path).name
-            # merge files
-            file_dir = Path(settings.PRIVATE_MEDIA_ROOT)
-            target_file = merge_files(part_files, file_dir, file_name)
-            # save full file to the instance FileField
-            with open(target_file, "rb") as file_obj:
-                self.instance.inhoud = File(file_obj, name=file_name)
-                self.instance.save()
-
-            # Remove the merged file
-            target_file.unlink()
+            # assemble the parts directly in the storage of the full file
+            self.instance.inhoud = file_field.storage.save_parts(
+                rel_path, parts, max_length=file_field.max_length
+            )
+            self.instance.save()
         else:
+            self.instance.canonical.abort_parts_upload()
             self.instance.bestandsomvang = None
             self.instance.save()
 
@@ -1,27 +1,14 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2022 Dimpact
 import re
-import shutil
 import uuid
 from datetime import date
-from pathlib import Path, PurePath
+from pathlib import PurePath
 from urllib.parse import urlparse
 
 from django.conf import settings
-from django.db.models import Max
 
-
-def merge_files(part_files, file_dir, file_name) -> str:
-    file_dir_path = Path(file_dir)
-    file_dir_path.mkdir(exist_ok=True)
-    file_path = file_dir_path / file_name
-    with open(file_path, "wb") as output:
-        for file in part_files:
-            with file.open("rb") as fileobj:
-                shutil.copyfileobj(
-                    fileobj, output, settings.DOCUMENTEN_UPLOAD_READ_CHUNK
-                )
-    return file_path
+from openzaak.utils.identification import format_identificatie
 
 
 def create_filename(name):
@@ -53,39 +40,24 @@ def check_path(url, resource):
 def generate_document_identificatie(
     bronorganisatie: str, date_value: date, aantal: int = 1
 ):
-    from openzaak.components.documenten.models import (
-        EnkelvoudigInformatieObject,
-        ReservedDocument,
-    )
+    """
+    Reserve ``aantal`` consecutive identificaties from the counter of the
+    bronorganisatie and the year of ``date_value``.
 
-    model_name = "DOCUMENT"
+    Inside a transaction, the counter of the bronorganisatie and year stays locked
+    until the transaction exits.
+    """
+    from openzaak.components.documenten.models import DocumentIdentificatieCounter
 
+    model_name = DocumentIdentificatieCounter.IDENTIFICATIE_PREFIX
     year = date_value.year
-    prefix = f"{model_name}-{year}"
-    pattern = prefix + r"-\d{10}"
-
-    issued_max = EnkelvoudigInformatieObject._default_manager.filter(
-        identificatie__startswith=prefix,
-        identificatie__regex=pattern,
-    ).aggregate(Max("identificatie"))["identificatie__max"]
-
-    reserved_max = ReservedDocument.objects.filter(
-        bronorganisatie=bronorganisatie,
-        identificatie__startswith=prefix,
-        identificatie__regex=pattern,
-    ).aggregate(Max("identificatie"))["identificatie__max"]
-
-    def extract_number(identificatie):
-        if identificatie is None:
-            return 0
-        return int(identificatie.split("-")[-1])
-
-    max_number = max(extract_number(issued_max), extract_number(reserved_max))
-    start_number = max_number + 1
 
+    last_number = DocumentIdentificatieCounter.objects.reserve(
+        bronorganisatie, year, aantal
+    )
     identificaties = [
-        f"{prefix}-{str(i).zfill(10)}"
-        for i in range(start_number, start_number + aantal)
+        format_identificatie(model_name, year, number)
+        for number in range(last_number - aantal + 1, last_number + 1)
     ]
 
     return identificaties[0] if aantal == 1 else identificaties
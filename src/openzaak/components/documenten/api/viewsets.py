@@ -5,7 +5,8 @@ from pathlib import Path
 
 from django.conf import settings
 from django.db import transaction
-from django.http import FileResponse
+from django.db.models import F
+from django.http import HttpResponseRedirect
 from django.utils.translation import gettext_lazy as _
 
 import structlog
@@ -19,7 +20,6 @@ from drf_spectacular.utils import (
     extend_schema,
     extend_schema_view,
 )
-from notifications_api_common.viewsets import NotificationViewSetMixin
 from rest_framework import mixins, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.parsers import FormParser, MultiPartParser
@@ -30,7 +30,6 @@ from vng_api_common.audittrails.viewsets import (
     AuditTrailMixin,
     AuditTrailViewsetMixin,
 )
-from vng_api_common.caching import conditional_retrieve
 from vng_api_common.constants import CommonResourceAction
 from vng_api_common.filters_backend import Backend
 from vng_api_common.search import SearchMixin
@@ -50,7 +49,9 @@ from openzaak.import_data.views import (
 )
 from openzaak.notifications.viewsets import (
     MultipleNotificationMixin,
+    NotificationViewSetMixin,
 )
+from openzaak.utils.caching import conditional_retrieve
 from openzaak.utils.cloudevents import get_url, process_cloudevent
 from openzaak.utils.data_filtering import ListFilterByAuthorizationsMixin
 from openzaak.utils.help_text import mark_experimental
@@ -58,7 +59,7 @@ from openzaak.utils.mixins import (
     CacheQuerysetMixin,
     ExpandMixin,
 )
-from openzaak.utils.pagination import OptimizedPagination
+from openzaak.utils.pagination import OptimizedCursorPagination, OptimizedPagination
 from openzaak.utils.permissions import AuthRequired
 from openzaak.utils.schema import (
     COMMON_ERROR_RESPONSES,
@@ -76,6 +77,7 @@ from ...zaken.api.scopes import (
     SCOPE_ZAKEN_GEFORCEERD_BIJWERKEN,
 )
 from ...zaken.models import ZaakInformatieObject
+from ..download import get_inhoud_etag, stream_inhoud
 from ..models import (
     BestandsDeel,
     EnkelvoudigInformatieObject,
@@ -251,14 +253,9 @@ class EnkelvoudigInformatieObjectViewSet(
     Opvragen en bewerken van (ENKELVOUDIG) INFORMATIEOBJECTen (documenten).
     """
 
-    queryset = (
-        EnkelvoudigInformatieObject.objects.select_related(
-            "canonical", "_informatieobjecttype"
-        )
-        .prefetch_related("canonical__bestandsdelen")
-        .order_by("canonical", "-versie")
-        .distinct("canonical")
-    )
+    queryset = EnkelvoudigInformatieObject.objects.select_related(
+        "canonical", "_informatieobjecttype"
+    ).prefetch_related("canonical__bestandsdelen")
     lookup_field = "uuid"
     serializer_class = EnkelvoudigInformatieObjectSerializer
     search_input_serializer_class = EIOZoekSerializer
@@ -279,6 +276,17 @@ class EnkelvoudigInformatieObjectViewSet(
     notifications_kanaal = KANAAL_DOCUMENTEN
     audit = AUDIT_DRC
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.detail:
+            # other versions can be requested with the versie and registratieOp
+            # query parameters
+            return queryset.order_by("canonical", "-versie").distinct("canonical")
+
+        # ⚡️ join the latest version instead of DISTINCT ON over all versions,
+        # which combines with the ordering and authorization filters
+        return queryset.filter(canonical__latest_version=F("pk"))
+
     def get_renderers(self):
         if self.action == "download":
             return [BinaryFileRenderer]
@@ -330,18 +338,48 @@ class EnkelvoudigInformatieObjectViewSet(
 
     @property
     def pagination_class(self):
-        return OptimizedPagination
+        return OptimizedCursorPagination
 
     @extend_schema(
         "enkelvoudiginformatieobject_download",
         summary="Download de binaire data van het (ENKELVOUDIG) INFORMATIEOBJECT.",
         description="Download de binaire data van het (ENKELVOUDIG) INFORMATIEOBJECT.",
-        parameters=[VERSIE_QUERY_PARAM, REGISTRATIE_QUERY_PARAM],
+        parameters=[
+            VERSIE_QUERY_PARAM,
+            REGISTRATIE_QUERY_PARAM,
+            OpenApiParameter(
+                name="Range",
+                location=OpenApiParameter.HEADER,
+                description=mark_experimental(
+                    "Een enkel bereik van bytes van de bestandsinhoud om op te halen, "
+                    "bijvoorbeeld `bytes=0-1023`."
+                ),
+                type=OpenApiTypes.STR,
+            ),
+            OpenApiParameter(
+                name="If-Range",
+                location=OpenApiParameter.HEADER,
+                description=mark_experimental(
+                    "De `ETag` van een eerder opgehaald deel van de bestandsinhoud. "
+                    "Als de bestandsinhoud sindsdien gewijzigd is, wordt de volledige "
+                    "bestandsinhoud teruggegeven in plaats van het gevraagde bereik."
+                ),
+                type=OpenApiTypes.STR,
+            ),
+        ],
         responses={
             (status.HTTP_200_OK, "application/octet-stream"): OpenApiResponse(
                 description="De binaire bestandsinhoud",
                 response=OpenApiTypes.BINARY,
             ),
+            (status.HTTP_206_PARTIAL_CONTENT, "application/octet-stream"): (
+                OpenApiResponse(
+                    description=mark_experimental(
+                        "Het gevraagde bereik van de binaire bestandsinhoud"
+                    ),
+                    response=OpenApiTypes.BINARY,
+                )
+            ),
             **COMMON_ERROR_RESPONSES,
         },
     )
@@ -357,14 +395,36 @@ class EnkelvoudigInformatieObjectViewSet(
                 DocumentenBackendTypes.azure_blob_storage
                 | DocumentenBackendTypes.s3_storage
             ):
-                return FileResponse(eio.inhoud.file, as_attachment=True)
+                if settings.DOCUMENTEN_DOWNLOAD_REDIRECT:
+                    return HttpResponseRedirect(
+                        eio.inhoud.storage.download_url(
+                            eio.inhoud.name, Path(eio.inhoud.name).name
+                        )
+                    )
+                return stream_inhoud(request, eio)
             case DocumentenBackendTypes.filesystem:
-                return sendfile(
+                # nginx handles range requests (and their ETag) for the files it
+                # sends itself
+                if settings.SENDFILE_BACKEND == "django_sendfile.backends.nginx":
+                    return sendfile(
+                        request,
+                        eio.inhoud.path,
+                        attachment=True,
+                        mimetype="application/octet-stream",
+                    )
+
+                if "Range" in request.headers:
+                    return stream_inhoud(request, eio)
+                response = sendfile(
                     request,
                     eio.inhoud.path,
                     attachment=True,
                     mimetype="application/octet-stream",
                 )
+                # the same validator as the range responses, so the ETag of a full
+                # download can be used to resume it with If-Range
+                response["ETag"] = get_inhoud_etag(eio, eio.inhoud.size)
+                return response
             case _:
                 logger.error("not_implemented_document_api_backend")
                 raise DocumentBackendNotImplementedError(
@@ -703,11 +763,9 @@ class GebruiksrechtenViewSet(
     Opvragen en bewerken van GEBRUIKSRECHTen bij een INFORMATIEOBJECT.
     """
 
-    queryset = (
-        Gebruiksrechten.objects.select_related("informatieobject")
-        .prefetch_related("informatieobject__enkelvoudiginformatieobject_set")
-        .all()
-    )
+    queryset = Gebruiksrechten.objects.select_related(
+        "informatieobject__latest_version"
+    ).all()
     serializer_class = GebruiksrechtenSerializer
     lookup_field = "uuid"
     notifications_kanaal = KANAAL_DOCUMENTEN
@@ -843,13 +901,9 @@ class ObjectInformatieObjectViewSet(
     ZAAK in de Zaken API, en een INFORMATIEOBJECT.
     """
 
-    queryset = (
-        ObjectInformatieObject.objects.select_related(
-            "_zaak", "_besluit", "informatieobject"
-        )
-        .prefetch_related("informatieobject__enkelvoudiginformatieobject_set")
-        .all()
-    )
+    queryset = ObjectInformatieObject.objects.select_related(
+        "_zaak", "_besluit", "informatieobject__latest_version"
+    ).all()
     serializer_class = ObjectInformatieObjectSerializer
     filterset_class = ObjectInformatieObjectFilter
     lookup_field = "uuid"
@@ -1088,6 +1142,7 @@ class ReservedDocumentViewSet(viewsets.ViewSet):
             ),
         ],
     )
+    @transaction.atomic
     def create(self, request, *args, **kwargs):
         serializer = self.serializer_class(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -8,11 +8,12 @@ from django.db import models
 from vng_api_common.caching.etags import calculate_etag
 
 
+def _get_cache_key(model: type[models.Model], uuid, versie: int = 1) -> str:
+    return f"{model._meta.model_name}-{uuid}-{versie}"
+
+
 def get_etag_cache_key(obj: models.Model) -> str:
-    resource = obj._meta.model_name
-    uuid = obj.uuid
-    versie = getattr(obj, "versie", 1)
-    return f"{resource}-{uuid}-{versie}"
+    return _get_cache_key(type(obj), obj.uuid, getattr(obj, "versie", 1))
 
 
 def set_etag(key: str, etag_value: str) -> None:
@@ -31,6 +32,18 @@ class DocumentETagMixin:
     we store them in the cache.
     """
 
+    @classmethod
+    def get_stored_etag(cls, queryset: models.QuerySet) -> Optional[str]:
+        """
+        Return the cached ETag value of the first object in ``queryset``, without
+        loading the object.
+        """
+        fields = ("uuid", "versie") if hasattr(cls, "versie") else ("uuid",)
+        values = queryset.values(*fields).first()
+        if values is None:
+            return None
+        return get_etag(_get_cache_key(cls, **values))
+
     @property
     def _etag(self):
         return get_etag(get_etag_cache_key(self))
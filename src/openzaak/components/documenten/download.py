@@ -0,0 +1,143 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2025 Dimpact
+"""
+Stream the inhoud of ENKELVOUDIGINFORMATIEOBJECTen with support for (single) byte
+ranges, see :rfc:`9110#section-14`.
+"""
+
+import hashlib
+import mimetypes
+import os
+import re
+from typing import Iterator, Optional, Tuple
+
+from django.core.files.storage import Storage
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
+from django.utils.http import content_disposition_header
+
+from .models import EnkelvoudigInformatieObject
+
+DOWNLOAD_CHUNK_SIZE = 2**16
+
+BYTE_RANGE_RE = re.compile(r"^bytes=(?P<start>\d*)-(?P<end>\d*)$")
+
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+
+def get_inhoud_etag(eio: EnkelvoudigInformatieObject, size: int) -> str:
+    """
+    Strong validator of the inhoud, derived from the size and modification time of
+    the file so that it changes whenever the file is written.
+    """
+    modified = eio.inhoud.storage.get_modified_time(eio.inhoud.name)
+    value = f"{eio.inhoud.name}:{size}:{modified.isoformat()}".encode()
+    return f'"{hashlib.md5(value, usedforsecurity=False).hexdigest()}"'
+
+
+def parse_byte_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Return the first and last byte position of a single byte range.
+
+    Multiple ranges and invalid headers are ignored (``None``), which results in the
+    full content being returned. Ranges outside of the content raise
+    :class:`RangeNotSatisfiable`.
+    """
+    match = BYTE_RANGE_RE.match(header.strip())
+    if not match or not (match["start"] or match["end"]):
+        return None
+
+    if not match["start"]:
+        # suffix range - the last N bytes
+        length = int(match["end"])
+        if length == 0:
+            raise RangeNotSatisfiable
+        return max(size - length, 0), size - 1
+
+    start = int(match["start"])
+    end = int(match["end"]) if match["end"] else size - 1
+    if end < start:
+        return None
+    if start >= size:
+        raise RangeNotSatisfiable
+    return start, min(end, size - 1)
+
+
+def get_byte_range(
+    request: HttpRequest, size: int, etag: str
+) -> Optional[Tuple[int, int]]:
+    range_header = request.headers.get("Range")
+    # ranges of empty files are never satisfiable, so just return the (empty) file
+    if not range_header or not size:
+        return None
+
+    # only return the range if the client still has the same content, dates are not
+    # supported as validator
+    if_range = request.headers.get("If-Range")
+    if if_range is not None and if_range.strip() != etag:
+        return None
+
+    return parse_byte_range(range_header, size)
+
+
+def iter_file_range(
+    storage: Storage, name: str, start: int, end: int, chunk_size: int
+) -> Iterator[bytes]:
+    with storage.open(name, "rb") as file:
+        file.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = file.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def stream_inhoud(
+    request: HttpRequest, eio: EnkelvoudigInformatieObject
+) -> HttpResponse | StreamingHttpResponse:
+    """
+    Stream (a byte range of) the inhoud, without loading the whole file first.
+
+    Storages can provide an ``iter_range`` method to read a range from the object
+    store, otherwise the file is opened and read from the start of the range.
+    """
+    storage = eio.inhoud.storage
+    name = eio.inhoud.name
+    size = storage.size(name)
+    etag = get_inhoud_etag(eio, size)
+
+    try:
+        byte_range = get_byte_range(request, size, etag)
+    except RangeNotSatisfiable:
+        response = HttpResponse(status=416)
+        response["Content-Range"] = f"bytes */{size}"
+        return response
+
+    start, end = byte_range or (0, size - 1)
+    iter_range = getattr(storage, "iter_range", None)
+    if not size:
+        chunks = iter(())
+    elif iter_range is not None:
+        chunks = iter_range(name, start, end, DOWNLOAD_CHUNK_SIZE)
+    else:
+        chunks = iter_file_range(storage, name, start, end, DOWNLOAD_CHUNK_SIZE)
+
+    filename = os.path.basename(name)
+    content_type, _ = mimetypes.guess_type(filename)
+    response = StreamingHttpResponse(
+        chunks,
+        status=206 if byte_range else 200,
+        content_type=content_type or "application/octet-stream",
+    )
+    response["Content-Length"] = str(end - start + 1 if size else 0)
+    response["Content-Disposition"] = content_disposition_header(
+        as_attachment=True, filename=filename
+    )
+    response["Accept-Ranges"] = "bytes"
+    response["ETag"] = etag
+    if byte_range:
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+    return response
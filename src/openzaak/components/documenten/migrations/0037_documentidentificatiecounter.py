@@ -0,0 +1,79 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+# Generated by Django 5.2.8 on 2026-10-18 13:02
+
+import vng_api_common.fields
+from django.db import migrations, models
+
+SEED_SQL = """
+INSERT INTO documenten_documentidentificatiecounter (bronorganisatie, jaar, last_number)
+SELECT
+    bronorganisatie,
+    substring(identificatie from 10 for 4)::smallint,
+    max(substring(identificatie from 15)::bigint)
+FROM (
+    SELECT bronorganisatie, identificatie
+    FROM documenten_enkelvoudiginformatieobject
+    UNION ALL
+    SELECT bronorganisatie, identificatie
+    FROM documenten_reserveddocument
+) AS documents
+WHERE identificatie ~ '^DOCUMENT-[0-9]{4}-[0-9]{1,18}$'
+GROUP BY 1, 2
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("documenten", "0036_reserveddocument"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DocumentIdentificatieCounter",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "bronorganisatie",
+                    vng_api_common.fields.RSINField(
+                        help_text="Het RSIN van de organisatie waarvoor de nummers worden uitgegeven.",
+                        max_length=9,
+                    ),
+                ),
+                (
+                    "jaar",
+                    models.PositiveSmallIntegerField(
+                        help_text="Het jaar waarvoor de nummers worden uitgegeven.",
+                        verbose_name="year",
+                    ),
+                ),
+                (
+                    "last_number",
+                    models.PositiveBigIntegerField(
+                        help_text="Het laatst uitgegeven volgnummer.",
+                        verbose_name="last number",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "document identificatie teller",
+                "verbose_name_plural": "document identificatie tellers",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("bronorganisatie", "jaar"),
+                        name="unique_document_counter_bronorganisatie_jaar",
+                    )
+                ],
+            },
+        ),
+        migrations.RunSQL(SEED_SQL, reverse_sql=migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,41 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+# Generated by Django 5.2.8 on 2026-10-18 15:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+BACKFILL_SQL = """
+UPDATE documenten_enkelvoudiginformatieobjectcanonical AS canonical
+SET latest_version_id = latest.id
+FROM (
+    SELECT DISTINCT ON (canonical_id) canonical_id, id
+    FROM documenten_enkelvoudiginformatieobject
+    ORDER BY canonical_id, versie DESC
+) AS latest
+WHERE latest.canonical_id = canonical.id
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("documenten", "0037_documentidentificatiecounter"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="enkelvoudiginformatieobjectcanonical",
+            name="latest_version",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                help_text="De laatste versie van het document.",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="documenten.enkelvoudiginformatieobject",
+            ),
+        ),
+        migrations.RunSQL(BACKFILL_SQL, reverse_sql=migrations.RunSQL.noop),
+    ]
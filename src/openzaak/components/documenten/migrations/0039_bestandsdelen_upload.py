@@ -0,0 +1,42 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+# Generated by Django 5.2.8 on 2026-10-18 22:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("documenten", "0038_enkelvoudiginformatieobjectcanonical_latest_version"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="bestandsdeel",
+            name="upload_part_id",
+            field=models.CharField(blank=True, editable=False, max_length=255),
+        ),
+        migrations.AddField(
+            model_name="enkelvoudiginformatieobjectcanonical",
+            name="upload_id",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="Het ID van de multipart upload van de bestandsdelen (S3).",
+                max_length=1024,
+                verbose_name="upload id",
+            ),
+        ),
+        migrations.AddField(
+            model_name="enkelvoudiginformatieobjectcanonical",
+            name="upload_name",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="Naam van het bestand waarin de bestandsdelen worden geupload.",
+                max_length=255,
+                verbose_name="upload name",
+            ),
+        ),
+    ]
@@ -23,6 +23,10 @@ from openzaak.utils.fields import (
     RelativeURLField,
     ServiceFkField,
 )
+from openzaak.utils.identification import (
+    IdentificatieCounter,
+    IdentificatieCounterManager,
+)
 from openzaak.utils.mixins import APIMixin, AuditTrailMixin
 
 from ..besluiten.models import BesluitInformatieObject
@@ -44,6 +48,7 @@ from .managers import (
 )
 from .query.django import (
     BestandsDeelQuerySet,
+    EnkelvoudigInformatieObjectCanonicalQuerySet,
     InformatieobjectQuerySet,
     InformatieobjectRelatedQuerySet,
 )
@@ -229,6 +234,7 @@ class InformatieObject(models.Model):
 
     @transaction.atomic
     def save(self, *args, **kwargs):
+        adding = self._state.adding
         is_new_instance = self.pk is None
         if is_new_instance:
             if not getattr(self, "identificatie", None):
@@ -236,13 +242,42 @@ class InformatieObject(models.Model):
                     bronorganisatie=self.bronorganisatie,
                     date_value=self.creatiedatum,
                 )
-            else:
+            elif not self._is_existing_identificatie():
                 ReservedDocument.objects.filter(
                     identificatie=self.identificatie,
                     bronorganisatie=self.bronorganisatie,
                 ).delete()
+                DocumentIdentificatieCounter.objects.register(
+                    [(self.bronorganisatie, self.identificatie)]
+                )
         super().save(*args, **kwargs)
 
+        if adding:
+            self._after_create()
+
+    def _after_create(self) -> None:
+        """
+        Hook for subclasses to update related data in the transaction of the insert.
+        """
+
+    def _is_existing_identificatie(self) -> bool:
+        """
+        Check if this is a new version of a document that already has the
+        identificatie, which doesn't need to be registered again.
+        """
+        canonical_id = getattr(self, "canonical_id", None)
+        if canonical_id is None:
+            return False
+        return (
+            type(self)
+            ._default_manager.filter(
+                canonical=canonical_id,
+                bronorganisatie=self.bronorganisatie,
+                identificatie=self.identificatie,
+            )
+            .exists()
+        )
+
     def clean(self):
         super().clean()
         validate_status(
@@ -268,15 +303,49 @@ class EnkelvoudigInformatieObjectCanonical(models.Model):
         max_length=100,
         help_text="Hash string, wordt gebruikt als ID voor de lock",
     )
+    # ⚡️ materialized, so the latest version can be joined instead of selecting it
+    # from all versions
+    latest_version = models.ForeignKey(
+        "EnkelvoudigInformatieObject",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="+",
+        help_text=_("De laatste versie van het document."),
+    )
+    # pending upload of the bestandsdelen into the document storage, the parts are
+    # sent to the storage as they arrive and the file is assembled when unlocking
+    upload_name = models.CharField(
+        _("upload name"),
+        max_length=255,
+        blank=True,
+        editable=False,
+        help_text=_("Naam van het bestand waarin de bestandsdelen worden geupload."),
+    )
+    upload_id = models.CharField(
+        _("upload id"),
+        max_length=1024,
+        blank=True,
+        editable=False,
+        help_text=_("Het ID van de multipart upload van de bestandsdelen (S3)."),
+    )
+
+    objects = EnkelvoudigInformatieObjectCanonicalQuerySet.as_manager()
 
     def __str__(self):
         return str(self.latest_version)
 
-    @property
-    def latest_version(self):
-        # there is implicit sorting by versie desc in EnkelvoudigInformatieObject.Meta.ordering
-        versies = self.enkelvoudiginformatieobject_set.all()
-        return versies.first()
+    def save(self, *args, **kwargs):
+        # latest_version is maintained by EnkelvoudigInformatieObject.save, don't
+        # overwrite it with a value that might be outdated
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != "latest_version"
+            ]
+        super().save(*args, **kwargs)
 
     def lock_document(self, doc_uuid: str) -> None:
         lock = _uuid.uuid4().hex
@@ -285,6 +354,41 @@ class EnkelvoudigInformatieObjectCanonical(models.Model):
     def unlock_document(self, doc_uuid, lock, force_unlock=False):
         self.lock = ""
 
+    def start_parts_upload(self, name: str, max_length: int | None = None) -> None:
+        """
+        Start the upload of the bestandsdelen into the document storage, if the
+        storage supports uploading the parts as they arrive.
+        """
+        sizes = list(
+            self.bestandsdelen.order_by("volgnummer").values_list("omvang", flat=True)
+        )
+        upload = documenten_storage.start_parts(name, sizes, max_length=max_length)
+        if upload is None:
+            return
+        self.upload_name, self.upload_id = upload
+        self.save(update_fields=["upload_name", "upload_id"])
+
+    def complete_parts_upload(self) -> str:
+        """
+        Assemble the uploaded bestandsdelen and return the name of the file.
+        """
+        part_ids = self.bestandsdelen.order_by("volgnummer").values_list(
+            "upload_part_id", flat=True
+        )
+        name = documenten_storage.commit_parts(
+            self.upload_name, self.upload_id, list(part_ids)
+        )
+        self.upload_name = self.upload_id = ""
+        self.save(update_fields=["upload_name", "upload_id"])
+        return name
+
+    def abort_parts_upload(self) -> None:
+        if not self.upload_name:
+            return
+        documenten_storage.abort_parts(self.upload_name, self.upload_id)
+        self.upload_name = self.upload_id = ""
+        self.save(update_fields=["upload_name", "upload_id"])
+
 
 class EnkelvoudigInformatieObject(
     DocumentETagMixin, AuditTrailMixin, APIMixin, InformatieObject
@@ -425,6 +529,23 @@ class EnkelvoudigInformatieObject(
         kwargs.pop("_request", None)  # see hacky workaround in EIOSerializer.create
         super().__init__(*args, **kwargs)
 
+    def _after_create(self) -> None:
+        if not self.canonical_id:
+            return
+
+        # only move the pointer forward, a single query without reading the
+        # other versions
+        updated = (
+            EnkelvoudigInformatieObjectCanonical.objects.filter(pk=self.canonical_id)
+            .filter(
+                Q(latest_version__isnull=True)
+                | Q(latest_version__versie__lte=self.versie)
+            )
+            .update(latest_version=self)
+        )
+        if updated and type(self).canonical.is_cached(self):
+            self.canonical.latest_version = self
+
     # Since canonicals are not stored in the database for CMIS, the BestandsDelen must
     # be retrieved by using the UUID
     def get_bestandsdelen(self):
@@ -498,6 +619,9 @@ class BestandsDeel(models.Model):
         help_text=_("De (binaire) bestandsinhoud van dit specifieke bestandsdeel."),
     )
     _voltooid = models.BooleanField(default=False)
+    # the ETag (S3) or block id (Azure) of the part, if it was uploaded directly
+    # into the document storage instead of stored in ``inhoud``
+    upload_part_id = models.CharField(max_length=255, blank=True, editable=False)
     datetime_created = models.DateTimeField(_("datetime created"), auto_now_add=True)
 
     objects = BestandsDeelQuerySet.as_manager()
@@ -1133,3 +1257,20 @@ class ReservedDocument(models.Model):
 
     def __str__(self):
         return f"{self.bronorganisatie} - {self.identificatie}"
+
+
+class DocumentIdentificatieCounter(IdentificatieCounter):
+    objects = IdentificatieCounterManager(
+        "documenten.EnkelvoudigInformatieObject", "documenten.ReservedDocument"
+    )
+    IDENTIFICATIE_PREFIX = InformatieObject.IDENTIFICATIE_PREFIX
+
+    class Meta:
+        verbose_name = _("document identificatie teller")
+        verbose_name_plural = _("document identificatie tellers")
+        constraints = [
+            models.UniqueConstraint(
+                fields=("bronorganisatie", "jaar"),
+                name="unique_document_counter_bronorganisatie_jaar",
+            ),
+        ]
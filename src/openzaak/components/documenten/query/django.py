@@ -137,12 +137,27 @@ class BestandsDeelQuerySet(models.QuerySet):
             part.inhoud.delete()
             part.delete()
 
+    # parts that were uploaded directly into the document storage have no inhoud,
+    # so the completeness is checked with the voltooid flag
+
     @property
     def complete_upload(self) -> bool:
-        empty_parts = self.filter(inhoud="")
+        empty_parts = self.filter(_voltooid=False)
         return not empty_parts.exists()
 
     @property
     def empty_bestandsdelen(self) -> bool:
-        empty_parts = self.filter(inhoud="")
-        return empty_parts.count() == self.count()
+        return not self.filter(_voltooid=True).exists()
+
+
+class EnkelvoudigInformatieObjectCanonicalQuerySet(models.QuerySet):
+    def update_latest_version(self) -> int:
+        """
+        Point ``latest_version`` to the version with the highest ``versie``, for
+        versions that were created or deleted without the model methods.
+        """
+        model = apps.get_model("documenten", "EnkelvoudigInformatieObject")
+        versions = model.objects.filter(canonical=models.OuterRef("pk")).order_by(
+            "-versie"
+        )
+        return self.update(latest_version=models.Subquery(versions.values("pk")[:1]))
@@ -0,0 +1,35 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+"""
+Full-text search on documents.
+
+The search vector is also the expression of the optional GIN index created by the
+``create_search_indexes`` management command, the index is only used if the query
+uses exactly the same expression.
+"""
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db.models import F, QuerySet
+
+SEARCH_CONFIG = "dutch"
+
+SEARCH_VECTOR = (
+    SearchVector("titel", weight="A", config=SEARCH_CONFIG)
+    + SearchVector("auteur", weight="B", config=SEARCH_CONFIG)
+    + SearchVector("beschrijving", weight="C", config=SEARCH_CONFIG)
+)
+
+
+def search_documenten(queryset: QuerySet, value: str, rank: bool = True) -> QuerySet:
+    """
+    Filter the documents matching the websearch query ``value`` and order them by
+    relevance if ``rank`` is set.
+    """
+    query = SearchQuery(value, search_type="websearch", config=SEARCH_CONFIG)
+    queryset = queryset.alias(search_vector=SEARCH_VECTOR).filter(search_vector=query)
+    if not rank:
+        return queryset
+
+    return queryset.annotate(
+        search_rank=SearchRank(F("search_vector"), query)
+    ).order_by("-search_rank", "pk")
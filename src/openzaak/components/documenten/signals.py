@@ -7,7 +7,11 @@ from django.dispatch import receiver
 from openzaak.components.besluiten.models import BesluitInformatieObject
 from openzaak.components.zaken.models import ZaakInformatieObject
 
-from .models import EnkelvoudigInformatieObject, ObjectInformatieObject
+from .models import (
+    EnkelvoudigInformatieObject,
+    EnkelvoudigInformatieObjectCanonical,
+    ObjectInformatieObject,
+)
 from .typing import IORelation
 
 
@@ -56,3 +60,19 @@ def sync_oio(
 def delete_eio_file(sender, instance, **kwargs):
     if instance.inhoud:
         instance.inhoud.delete(save=False)
+
+
+@receiver(
+    post_delete,
+    sender=EnkelvoudigInformatieObject,
+    dispatch_uid="documenten.update_latest_version",
+)
+def update_latest_version(sender, instance, **kwargs):
+    """
+    Point the canonical to the previous version if the latest version was deleted.
+
+    The pointer itself is cleared by ``on_delete=SET_NULL``.
+    """
+    EnkelvoudigInformatieObjectCanonical.objects.filter(
+        pk=instance.canonical_id, latest_version__isnull=True
+    ).update_latest_version()
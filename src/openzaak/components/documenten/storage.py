@@ -1,19 +1,28 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2020 Dimpact
-
-from typing import cast
+import base64
+import contextlib
+import errno
+import io
+import os
+import shutil
+import tempfile
+from typing import Iterator, Sequence, cast
 
 from django.conf import settings
+from django.core.files import File
 from django.core.files.storage import Storage
 from django.utils.functional import LazyObject
+from django.utils.http import content_disposition_header
 
 import structlog
 from azure.core.exceptions import AzureError
 from azure.identity import ClientSecretCredential
-from azure.storage.blob import BlobServiceClient
+from azure.storage.blob import BlobBlock, BlobServiceClient, ContentSettings
 from privates.storages import PrivateMediaFileSystemStorage
 from storages.backends.azure_storage import AzureStorage as _AzureStorage
 from storages.backends.s3 import S3Storage as _S3Storage
+from storages.utils import clean_name
 
 from openzaak.components.documenten.constants import DocumentenBackendTypes
 
@@ -21,6 +30,134 @@ from .exceptions import DocumentBackendNotImplementedError
 
 logger = structlog.stdlib.get_logger(__name__)
 
+# limits of S3 multipart uploads, all parts except the last must be at least 5 MiB
+S3_MIN_PART_SIZE = 5 * 2**20
+S3_MAX_PART_SIZE = 5 * 2**30
+S3_MAX_PARTS = 10_000
+
+# files up to this size are uploaded to Azure in a single request, same as the default
+# ``max_single_put_size`` of the Azure SDK
+AZURE_MAX_SINGLE_PUT_SIZE = 64 * 2**20
+# limits of the blocks of a single blob
+AZURE_MAX_BLOCK_SIZE = 4000 * 2**20
+AZURE_MAX_BLOCKS = 50_000
+
+
+class PartsReader(io.RawIOBase):
+    """
+    Read the contents of multiple files as if it were a single file.
+    """
+
+    def __init__(self, parts: Sequence[File]):
+        self._parts = iter(parts)
+        self._current = None
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while True:
+            if self._current is None:
+                part = next(self._parts, None)
+                if part is None:
+                    return 0
+                self._current = part.open("rb")
+
+            if read := self._current.readinto(buffer):
+                return read
+
+            self._current.close()
+            self._current = None
+
+    def close(self):
+        if self._current is not None:
+            self._current.close()
+            self._current = None
+        super().close()
+
+
+def open_parts(name: str, parts: Sequence[File]) -> File:
+    reader = io.BufferedReader(
+        PartsReader(parts), buffer_size=settings.DOCUMENTEN_UPLOAD_READ_CHUNK
+    )
+    file = File(reader, name=name)
+    file.size = sum(part.size for part in parts)
+    return file
+
+
+def copy_file_range(source: File, target: io.BufferedWriter) -> bool:
+    """
+    Copy the remainder of ``source`` to ``target`` within the kernel.
+
+    Returns ``False`` if the file system (or platform) does not support it, in which
+    case nothing was copied.
+    """
+    remaining = os.fstat(source.fileno()).st_size - source.tell()
+    copied_any = False
+    while remaining > 0:
+        try:
+            copied = os.copy_file_range(source.fileno(), target.fileno(), remaining)
+        except OSError as exc:
+            unsupported = (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP)
+            if copied_any or exc.errno not in unsupported:
+                raise
+            return False
+        if not copied:
+            break
+        copied_any = True
+        remaining -= copied
+    return True
+
+
+class AssembledFile(File):
+    """
+    A file that was assembled on disk, which the storage can move into place.
+    """
+
+    def temporary_file_path(self) -> str:
+        return self.file.name
+
+
+class FileSystemStorage(PrivateMediaFileSystemStorage):
+    def start_parts(
+        self, name: str, sizes: Sequence[int], max_length: int | None = None
+    ) -> None:
+        """
+        The parts are stored on the file system already, so they are not uploaded
+        separately but assembled with :meth:`save_parts`.
+        """
+        return None
+
+    def save_parts(
+        self, name: str, parts: Sequence[File], max_length: int | None = None
+    ) -> str:
+        """
+        Concatenate the parts into a temporary file within the kernel (if possible),
+        which is then moved into place by the regular save.
+
+        The temporary file is created in the storage location, so moving it is a
+        rename on the same file system.
+        """
+        os.makedirs(self.location, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(suffix=".upload", dir=self.location)
+        try:
+            with open(fd, "wb") as output:
+                in_kernel = hasattr(os, "copy_file_range")
+                for part in parts:
+                    with part.open("rb") as source:
+                        in_kernel = in_kernel and copy_file_range(source, output)
+                        if not in_kernel:
+                            shutil.copyfileobj(
+                                source, output, settings.DOCUMENTEN_UPLOAD_READ_CHUNK
+                            )
+
+            with open(temp_path, "rb") as content:
+                return self.save(name, AssembledFile(content), max_length=max_length)
+        finally:
+            # the file is gone if it was moved into place
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(temp_path)
+
 
 class S3Storage(_S3Storage):
     def connection_check(self) -> bool:
@@ -37,6 +174,125 @@ class S3Storage(_S3Storage):
     def path(self, name: str) -> str:
         return self.get_available_name(name)
 
+    def start_parts(
+        self, name: str, sizes: Sequence[int], max_length: int | None = None
+    ) -> tuple[str, str] | None:
+        """
+        Start a multipart upload for a file that is uploaded in parts of ``sizes``.
+
+        Returns the name of the file and the id of the upload, or ``None`` if the
+        file is too small (or has parts of a size not supported by S3), in which case
+        the parts must be assembled with :meth:`save_parts`.
+        """
+        use_multipart = (
+            not self.gzip
+            and sum(sizes) >= self.transfer_config.multipart_threshold
+            and len(sizes) <= S3_MAX_PARTS
+            and all(size >= S3_MIN_PART_SIZE for size in sizes[:-1])
+            and all(size <= S3_MAX_PART_SIZE for size in sizes)
+        )
+        if not use_multipart:
+            return None
+
+        name = self.get_available_name(name, max_length=max_length)
+        key = self._normalize_name(clean_name(name))
+        upload = self.connection.meta.client.create_multipart_upload(
+            Bucket=self.bucket_name, Key=key, **self._get_write_parameters(key)
+        )
+        return name, upload["UploadId"]
+
+    def _get_upload_kwargs(self, name: str, upload_id: str) -> dict:
+        return {
+            "Bucket": self.bucket_name,
+            "Key": self._normalize_name(clean_name(name)),
+            "UploadId": upload_id,
+        }
+
+    def save_part(self, name: str, upload_id: str, number: int, part: File) -> str:
+        """
+        Upload part ``number`` (starting at 1) and return its ETag.
+        """
+        with part.open("rb") as body:
+            response = self.connection.meta.client.upload_part(
+                Body=body.file,
+                ContentLength=part.size,
+                PartNumber=number,
+                **self._get_upload_kwargs(name, upload_id),
+            )
+        return response["ETag"]
+
+    def commit_parts(self, name: str, upload_id: str, part_ids: Sequence[str]) -> str:
+        """
+        Complete the multipart upload, which makes S3 assemble the object.
+        """
+        parts = [
+            {"ETag": etag, "PartNumber": number}
+            for number, etag in enumerate(part_ids, start=1)
+        ]
+        self.connection.meta.client.complete_multipart_upload(
+            MultipartUpload={"Parts": parts}, **self._get_upload_kwargs(name, upload_id)
+        )
+        return clean_name(name)
+
+    def abort_parts(self, name: str, upload_id: str) -> None:
+        self.connection.meta.client.abort_multipart_upload(
+            **self._get_upload_kwargs(name, upload_id)
+        )
+
+    def save_parts(
+        self, name: str, parts: Sequence[File], max_length: int | None = None
+    ) -> str:
+        """
+        Upload the parts as a single object.
+
+        Large files are uploaded with a multipart upload with a part for every
+        (local) file, which S3 assembles when the upload is completed. Files that are
+        too small (or have parts of a size not supported by S3) are uploaded
+        as a regular file.
+        """
+        upload = self.start_parts(
+            name, [part.size for part in parts], max_length=max_length
+        )
+        if upload is None:
+            return self.save(name, open_parts(name, parts), max_length=max_length)
+
+        name, upload_id = upload
+        try:
+            part_ids = [
+                self.save_part(name, upload_id, number, part)
+                for number, part in enumerate(parts, start=1)
+            ]
+            return self.commit_parts(name, upload_id, part_ids)
+        except Exception:
+            self.abort_parts(name, upload_id)
+            raise
+
+    def iter_range(
+        self, name: str, start: int, end: int, chunk_size: int
+    ) -> Iterator[bytes]:
+        """
+        Stream the bytes ``start`` up to and including ``end`` of the file.
+        """
+        obj = self.bucket.Object(self._normalize_name(clean_name(name)))
+        body = obj.get(Range=f"bytes={start}-{end}")["Body"]
+        try:
+            yield from body.iter_chunks(chunk_size)
+        finally:
+            body.close()
+
+    def download_url(self, name: str, filename: str) -> str:
+        """
+        Return a short-lived pre-signed URL to download the file directly.
+        """
+        return self.url(
+            name,
+            parameters={
+                "ResponseContentDisposition": content_disposition_header(
+                    as_attachment=True, filename=filename
+                )
+            },
+        )
+
 
 class AzureStorage(_AzureStorage):
     def get_default_settings(self):
@@ -79,6 +335,132 @@ class AzureStorage(_AzureStorage):
     def path(self, name: str) -> str:
         return self._get_valid_path(name)
 
+    def start_parts(
+        self, name: str, sizes: Sequence[int], max_length: int | None = None
+    ) -> tuple[str, str] | None:
+        """
+        Start an upload of a file that is uploaded in parts of ``sizes``, which are
+        staged as a block each.
+
+        Returns the name of the blob and an (empty) upload id, or ``None`` if the
+        file is small enough to be uploaded in a single request (or has parts that
+        are too large for a block), in which case the parts must be assembled with
+        :meth:`save_parts`.
+        """
+        use_blocks = (
+            sum(sizes) > AZURE_MAX_SINGLE_PUT_SIZE
+            and len(sizes) <= AZURE_MAX_BLOCKS
+            and all(size <= AZURE_MAX_BLOCK_SIZE for size in sizes)
+        )
+        if not use_blocks:
+            return None
+
+        # staged blocks are tied to the name of the blob, there is no upload id
+        return self.get_available_name(name, max_length=max_length), ""
+
+    def save_part(self, name: str, upload_id: str, number: int, part: File) -> str:
+        """
+        Stage part ``number`` as a block and return the block id.
+        """
+        # block IDs of a blob must all have the same length
+        block_id = base64.b64encode(f"{number:08d}".encode()).decode()
+        blob_client = self.client.get_blob_client(self._get_valid_path(name))
+        with part.open("rb") as source:
+            blob_client.stage_block(
+                block_id, source.file, length=part.size, timeout=self.timeout
+            )
+        return block_id
+
+    def commit_parts(self, name: str, upload_id: str, part_ids: Sequence[str]) -> str:
+        """
+        Commit the staged blocks as the contents of the blob.
+        """
+        path = self._get_valid_path(name)
+        content_settings = ContentSettings(
+            **self._get_content_settings_parameters(path)
+        )
+        self.client.get_blob_client(path).commit_block_list(
+            [BlobBlock(block_id=block_id) for block_id in part_ids],
+            content_settings=content_settings,
+            timeout=self.timeout,
+        )
+        return clean_name(name)
+
+    def abort_parts(self, name: str, upload_id: str) -> None:
+        # uncommitted blocks can't be deleted, Azure discards them after a week
+        pass
+
+    def save_parts(
+        self, name: str, parts: Sequence[File], max_length: int | None = None
+    ) -> str:
+        """
+        Upload the parts as a single blob.
+
+        Large files are staged as blocks which are committed in a single request
+        when all parts are uploaded.
+        """
+        name = self.get_available_name(name, max_length=max_length)
+        cleaned_name = clean_name(name)
+        path = self._get_valid_path(name)
+        content_settings = ContentSettings(
+            **self._get_content_settings_parameters(path)
+        )
+        size = sum(part.size for part in parts)
+
+        if size <= AZURE_MAX_SINGLE_PUT_SIZE:
+            with open_parts(name, parts) as content:
+                self.client.upload_blob(
+                    path,
+                    content.file,
+                    length=size,
+                    content_settings=content_settings,
+                    max_concurrency=self.upload_max_conn,
+                    timeout=self.timeout,
+                    overwrite=self.overwrite_files,
+                )
+            return cleaned_name
+
+        blob_client = self.client.get_blob_client(path)
+        blocks = []
+        for part in parts:
+            with part.open("rb") as source:
+                while chunk := source.read(settings.DOCUMENTEN_UPLOAD_READ_CHUNK):
+                    # block IDs of a blob must all have the same length
+                    block_id = base64.b64encode(f"{len(blocks):08d}".encode()).decode()
+                    blob_client.stage_block(
+                        block_id, chunk, length=len(chunk), timeout=self.timeout
+                    )
+                    blocks.append(BlobBlock(block_id=block_id))
+        blob_client.commit_block_list(
+            blocks, content_settings=content_settings, timeout=self.timeout
+        )
+        return cleaned_name
+
+    def iter_range(
+        self, name: str, start: int, end: int, chunk_size: int
+    ) -> Iterator[bytes]:
+        """
+        Stream the bytes ``start`` up to and including ``end`` of the file.
+        """
+        blob_client = self.client.get_blob_client(self._get_valid_path(name))
+        downloader = blob_client.download_blob(
+            offset=start, length=end - start + 1, max_concurrency=1
+        )
+        yield from downloader.chunks()
+
+    def download_url(self, name: str, filename: str) -> str:
+        """
+        Return a short-lived SAS URL to download the file directly.
+        """
+        return self.url(
+            name,
+            parameters={
+                "content_disposition": content_disposition_header(
+                    as_attachment=True, filename=filename
+                )
+            },
+        )
+
     def connection_check(self) -> bool:
         """
         Method to validate that connection can be made with Azure blob storage
@@ -99,7 +481,7 @@ class DocumentenStorage(LazyObject):
             case DocumentenBackendTypes.s3_storage:
                 self._wrapped = S3Storage()
             case DocumentenBackendTypes.filesystem:
-                self._wrapped = PrivateMediaFileSystemStorage()
+                self._wrapped = FileSystemStorage()
             case _:
                 raise DocumentBackendNotImplementedError(
                     settings.DOCUMENTEN_API_BACKEND
@@ -108,7 +490,7 @@ class DocumentenStorage(LazyObject):
     def connection_check(self):
         if hasattr(self._wrapped, "connection_check"):
             return self._wrapped.connection_check()
-        return True  # PrivateMediaFileSystemStorage
+        return True  # FileSystemStorage
 
 
 documenten_storage = cast(Storage, DocumentenStorage())
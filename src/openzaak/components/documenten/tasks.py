@@ -1,7 +1,10 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2024 Dimpact
 import shutil
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextvars import copy_context
 from pathlib import Path
+from typing import Container, Iterable, Iterator
 from uuid import UUID, uuid4
 
 from django.conf import settings
@@ -22,6 +25,7 @@ from openzaak.components.documenten.api.serializers import (
 from openzaak.components.documenten.constants import DocumentenBackendTypes
 from openzaak.components.documenten.import_utils import DocumentRow
 from openzaak.components.documenten.models import (
+    DocumentIdentificatieCounter,
     EnkelvoudigInformatieObject,
     EnkelvoudigInformatieObjectCanonical,
 )
@@ -32,7 +36,9 @@ from openzaak.import_data.utils import (
     finish_import,
     get_csv_generator,
     get_total_count,
+    save_batch_progress,
     task_locker,
+    write_batch_report,
 )
 from openzaak.utils.fields import get_default_path
 
@@ -54,14 +60,11 @@ def copy_file_to_storage(src: Path, dst: Path) -> str:
         different from `dst` because characters can be appended to make the filename unique
     :rtype: str
     """
-    default_dir = get_default_path(EnkelvoudigInformatieObject.inhoud.field)
     storage = EnkelvoudigInformatieObject.inhoud.field.storage
 
-    if (
-        DocumentenBackendTypes.filesystem == settings.DOCUMENTEN_API_BACKEND
-        and not default_dir.exists()
-    ):
-        default_dir.mkdir(parents=True)
+    if DocumentenBackendTypes.filesystem == settings.DOCUMENTEN_API_BACKEND:
+        # files are copied concurrently, so the directory may be created in between
+        dst.parent.mkdir(parents=True, exist_ok=True)
 
     match settings.DOCUMENTEN_API_BACKEND:
         case (
@@ -85,10 +88,33 @@ def _import_document_row(
     row: list[str],
     row_index: int,
     identifier: str,
-    existing_uuids: list[str],
+    existing_uuids: Container[str],
     zaak_uuids: dict[str, int],
     request: HttpRequest,
 ) -> DocumentRow:
+    document_row = _validate_document_row(
+        row, row_index, identifier, existing_uuids, zaak_uuids, request
+    )
+
+    if document_row.instance is None:
+        return document_row
+
+    default_dir = get_default_path(EnkelvoudigInformatieObject.inhoud.field)
+    return _copy_document_file(document_row, default_dir)
+
+
+def _validate_document_row(
+    row: list[str],
+    row_index: int,
+    identifier: str,
+    existing_uuids: Container[str],
+    zaak_uuids: dict[str, int],
+    request: HttpRequest,
+) -> DocumentRow:
+    """
+    Parse and validate the row. If the row is valid, the (unsaved) instance is set on
+    the returned row, but the file is not copied yet.
+    """
     expected_column_count = len(DocumentRow.import_headers)
 
     if len(row) < expected_column_count:
@@ -271,27 +297,37 @@ def _import_document_row(
 
         return document_row
 
-    default_dir = get_default_path(EnkelvoudigInformatieObject.inhoud.field)
+    document_row.instance = instance
+    return document_row
+
+
+def _copy_document_file(document_row: DocumentRow, default_dir: Path) -> DocumentRow:
+    """
+    Copy the file of a validated row to the storage. Files are copied in worker
+    threads, so this should not touch the database.
+    """
+    path = Path(settings.IMPORT_DOCUMENTEN_BASE_DIR) / Path(document_row.bestandspad)
     import_path = default_dir / path.name
 
     try:
         actual_import_path = copy_file_to_storage(path, import_path)
     except Exception as e:
-        error_message = f"Unable to copy file for row {row_index}: \n {str(e)}"
+        error_message = (
+            f"Unable to copy file for row {document_row.row_index}: \n {str(e)}"
+        )
 
         logger.warning(
             "unable_to_copy_file",
-            row_index=row_index,
+            row_index=document_row.row_index,
             error=str(e),
         )
         document_row.comment = error_message
         document_row.processed = True
+        document_row.instance = None
 
         return document_row
 
-    instance.inhoud.name = actual_import_path
-
-    document_row.instance = instance
+    document_row.instance.inhoud.name = actual_import_path
     return document_row
 
 
@@ -319,19 +355,26 @@ def _batch_create_eios(batch: list[DocumentRow], zaak_uuids: dict[str, int]) ->
 
         raise e
 
+    # bulk_create doesn't call EnkelvoudigInformatieObject.save
+    for eio in eios:
+        eio.canonical.latest_version = eio
+    EnkelvoudigInformatieObjectCanonical.objects.bulk_update(
+        [eio.canonical for eio in eios], ["latest_version"]
+    )
+
+    # the identifiers are not generated per bronorganisatie, make sure the counters
+    # don't hand them out again
+    DocumentIdentificatieCounter.objects.register(
+        (eio.bronorganisatie, eio.identificatie) for eio in eios
+    )
+
     # reuse created instances
+    eios_by_uuid = {str(eio.uuid): eio for eio in eios}
     for row in batch:
         if row.failed:
             continue
 
-        instance = next(
-            (
-                eio
-                for eio in eios
-                if row.instance and str(eio.uuid) == str(row.instance.uuid)
-            ),
-            None,
-        )
+        instance = row.instance and eios_by_uuid.get(str(row.instance.uuid))
 
         row.instance = instance
 
@@ -391,6 +434,17 @@ def _get_identifiers(size: int) -> list[str]:
     return [first_identifier, *identifiers]
 
 
+def _rollback_batch(batch: list[DocumentRow], error: DatabaseError) -> None:
+    """
+    Mark the rows which were created before the transaction of the batch was rolled
+    back as not imported.
+    """
+    for row in batch:
+        if row.succeeded:
+            row.succeeded = False
+            row.comment = f"Unable to load row due to batch error: {str(error)}"
+
+
 def _reconstruct_request(headers: dict) -> HttpRequest:
     """
     Reconstructs the HTTP request headers from the request the task originally was
@@ -404,10 +458,114 @@ def _reconstruct_request(headers: dict) -> HttpRequest:
     return request
 
 
+def _parse_uuids(values: Iterable[str]) -> set[UUID]:
+    uuids = set()
+    for value in values:
+        try:
+            uuids.add(UUID(value))
+        except ValueError:
+            continue
+    return uuids
+
+
+def _get_column_values(rows: list[tuple[int, list[str]]], header: str) -> Iterator[str]:
+    index = DocumentRow.import_headers.index(header)
+    return (row[index] for _row_index, row in rows if len(row) > index)
+
+
+def _get_existing_uuids(rows: list[tuple[int, list[str]]]) -> set[str]:
+    """
+    Return the UUIDs given in the rows which are already used by an existing
+    EnkelvoudigInformatieObject.
+    """
+    uuids = _parse_uuids(_get_column_values(rows, "uuid"))
+    if not uuids:
+        return set()
+
+    existing = EnkelvoudigInformatieObject.objects.filter(uuid__in=uuids)
+    return {str(uuid) for uuid in existing.values_list("uuid", flat=True)}
+
+
+def _get_zaak_ids(rows: list[tuple[int, list[str]]]) -> dict[str, int]:
+    uuids = _parse_uuids(_get_column_values(rows, "zaakUuid"))
+    if not uuids:
+        return {}
+
+    zaken = Zaak.objects.filter(uuid__in=uuids)
+    return {str(uuid): pk for uuid, pk in zaken.values_list("uuid", "pk")}
+
+
+def _get_row_batches(
+    file_path: str, batch_size: int, start_after: int = 0
+) -> Iterator[list[tuple[int, list[str]]]]:
+    batch = []
+
+    for row_index, row in get_csv_generator(file_path):
+        # skip the header row and the rows of an earlier (interrupted) run
+        if row_index == 1 or row_index <= start_after:
+            continue
+
+        batch.append((row_index, row))
+
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
+
+
+def _prepare_batch(
+    rows: list[tuple[int, list[str]]],
+    identifiers: list[str],
+    zaak_uuids: dict[str, int],
+    request: HttpRequest,
+    default_dir: Path,
+    executor: Executor,
+) -> list[DocumentRow]:
+    """
+    Validate the rows of a batch, while the files of the valid rows are copied to the
+    storage concurrently.
+    """
+    existing_uuids = _get_existing_uuids(rows)
+
+    batch: list[DocumentRow] = []
+    copies = []
+
+    for row_index, row in rows:
+        document_row = _validate_document_row(
+            row, row_index, identifiers.pop(), existing_uuids, zaak_uuids, request
+        )
+        batch.append(document_row)
+
+        if document_row.instance is None:
+            continue
+
+        # the same UUID could be given multiple times in the batch
+        existing_uuids.add(str(document_row.instance.uuid))
+        copies.append(
+            executor.submit(
+                copy_context().run, _copy_document_file, document_row, default_dir
+            )
+        )
+
+    for copy in copies:
+        copy.result()
+
+    return batch
+
+
 # TODO: make this more generic?
 @celery_app.task(bind=True)
 @task_locker
 def import_documents(self, import_pk: int, request_headers: dict) -> None:
+    """
+    Import the documents of the metadata file in batches. Every batch is validated
+    while the files are copied by a pool of workers, after which the batch is
+    created in a single transaction together with the progress of the import.
+
+    An import which was interrupted is resumed after the last committed batch.
+    """
     import_instance = Import.objects.get(pk=import_pk)
 
     request = _reconstruct_request(request_headers)
@@ -416,94 +574,97 @@ def import_documents(self, import_pk: int, request_headers: dict) -> None:
 
     bind_contextvars(import_id=import_pk, file_path=file_path)
 
-    import_instance.total = get_total_count(file_path)
-    import_instance.started_on = timezone.now()
-    import_instance.status = ImportStatusChoices.active
-    import_instance.save(update_fields=["total", "started_on", "status"])
-
-    batch: list[DocumentRow] = []
-    batch_size = settings.IMPORT_DOCUMENTEN_BATCH_SIZE
+    start_after = import_instance.last_processed_row
 
-    zaak_uuids = {str(uuid): id for uuid, id in Zaak.objects.values_list("uuid", "id")}
-    eio_uuids = [
-        str(uuid) for uuid in EnkelvoudigInformatieObject.objects.values_list("uuid")
-    ]
+    if start_after:
+        logger.info("resuming_import", last_processed_row=start_after)
 
-    identifiers = []
+        import_instance.status = ImportStatusChoices.active
+        import_instance.finished_on = None
+        import_instance.save(update_fields=["status", "finished_on"])
+    else:
+        import_instance.total = get_total_count(file_path)
+        import_instance.started_on = timezone.now()
+        import_instance.status = ImportStatusChoices.active
+        import_instance.save(update_fields=["total", "started_on", "status"])
 
-    for row_index, row in get_csv_generator(file_path):
-        if row_index == 1:  # skip the header row
-            continue
+    batch_size = settings.IMPORT_DOCUMENTEN_BATCH_SIZE
+    default_dir = get_default_path(EnkelvoudigInformatieObject.inhoud.field)
 
-        if len(batch) % batch_size == 0:
+    with ThreadPoolExecutor(
+        max_workers=settings.IMPORT_DOCUMENTEN_MAX_WORKERS
+    ) as executor:
+        for rows in _get_row_batches(file_path, batch_size, start_after):
             logger.info(
                 "starting_batch",
                 batch_number=import_instance.get_batch_number(batch_size),
             )
 
-            identifiers = _get_identifiers(batch_size)
+            zaak_uuids = _get_zaak_ids(rows)
+            batch = _prepare_batch(
+                rows,
+                _get_identifiers(batch_size),
+                zaak_uuids,
+                request,
+                default_dir,
+                executor,
+            )
 
-        document_row = _import_document_row(
-            row, row_index, identifiers.pop(), eio_uuids, zaak_uuids, request
-        )
+            try:
+                logger.debug(
+                    "creating_eios_and_zios_for_batch",
+                    batch_number=import_instance.get_batch_number(batch_size),
+                )
+                with transaction.atomic():
+                    _batch_create_eios(batch, zaak_uuids)
+                    save_batch_progress(import_instance, batch)
+            except IntegrityError as e:
+                error_message = (
+                    "An Integrity error occured during batch "
+                    f"{import_instance.get_batch_number(batch_size)}: \n {str(e)}"
+                )
 
-        if document_row.instance and document_row.instance.uuid:
-            eio_uuids.append(str(document_row.instance.uuid))
+                import_instance.comment += f"\n\n {error_message}"
+                import_instance.save(update_fields=["comment"])
 
-        batch.append(document_row)
+                _rollback_batch(batch, e)
 
-        processed = import_instance.processed + len(batch)
-        is_finished = bool(import_instance.total == processed)
+                logger.warning(
+                    "integrity_error_during_batch",
+                    batch_number=import_instance.get_batch_number(batch_size),
+                    error=str(e),
+                    next_batch=import_instance.get_batch_number(batch_size) + 1,
+                )
 
-        if len(batch) % batch_size != 0 and not is_finished:
-            continue
+                finish_batch(import_instance, batch, DocumentRow.export_headers)
 
-        try:
-            logger.debug(
-                "creating_eios_and_zios_for_batch",
-                batch_number=import_instance.get_batch_number(batch_size),
-            )
-            _batch_create_eios(batch, zaak_uuids)
-        except IntegrityError as e:
-            error_message = (
-                "An Integrity error occured during batch "
-                f"{import_instance.get_batch_number(batch_size)}: \n {str(e)}"
-            )
+            except DatabaseError as e:
+                logger.critical(
+                    "critical_error_during_batch_finishing_import",
+                    batch_number=import_instance.get_batch_number(batch_size),
+                    error=str(e),
+                )
+                logger.info("trying_to_stop_import_process_gracefully")
+
+                _rollback_batch(batch, e)
+                # the progress is only saved together with a committed batch, so
+                # a resumed import starts again with the rows of this batch
+                write_batch_report(import_instance, batch, DocumentRow.export_headers)
+                finish_import(
+                    import_instance,
+                    status=ImportStatusChoices.error,
+                    comment=str(e),
+                )
 
-            import_instance.comment += f"\n\n {error_message}"
-            import_instance.save(update_fields=["comment"])
+                return
 
-            logger.warning(
-                "integrity_error_during_batch",
-                batch_number=import_instance.get_batch_number(batch_size),
-                error=str(e),
-                next_batch=import_instance.get_batch_number(batch_size) + 1,
-            )
-
-        except DatabaseError as e:
-            logger.critical(
-                "critical_error_during_batch_finishing_import",
-                batch_number=import_instance.get_batch_number(batch_size),
-                error=str(e),
-            )
-            logger.info("trying_to_stop_import_process_gracefully")
+            else:
+                write_batch_report(import_instance, batch, DocumentRow.export_headers)
 
-            finish_batch(import_instance, batch, DocumentRow.export_headers)
-            finish_import(
-                import_instance,
-                status=ImportStatusChoices.error,
-                comment=str(e),
+            remaining_batches = import_instance.get_remaining_batches(batch_size)
+            logger.info(
+                "batches_remaining",
+                remaining_batches=remaining_batches,
             )
 
-            return
-
-        finish_batch(import_instance, batch, DocumentRow.export_headers)
-
-        remaining_batches = import_instance.get_remaining_batches(batch_size)
-        logger.info(
-            "batches_remaining",
-            remaining_batches=remaining_batches,
-        )
-        batch.clear()
-
     finish_import(import_instance, ImportStatusChoices.finished)
@@ -12,6 +12,7 @@ from privates.test import temp_private_root
 from zgw_consumers.constants import APITypes
 from zgw_consumers.test.factories import ServiceFactory
 
+from openzaak.components.documenten import tasks
 from openzaak.components.documenten.exceptions import DocumentBackendNotImplementedError
 from openzaak.components.documenten.import_utils import DocumentRow
 from openzaak.components.documenten.models import EnkelvoudigInformatieObject
@@ -144,6 +145,107 @@ class ImportDocumentTestCase(ImportTestMixin, MockSchemasMixin, TestCase):
         # no comments on all the rows
         self.assertTrue(all((row[-2] == "") for row in rows[1:]))
 
+    def test_resume_interrupted_import(self):
+        ZaakFactory(uuid="43f1d8f4-c689-46eb-ae6e-c64d892d5341")
+        ZaakFactory(uuid="b02ee3eb-8e94-4cd9-93e7-f8d1b16a1952")
+
+        import_file_path = self.test_data_path / "import.csv"
+
+        # the first batch (rows 2 and 3) was committed before the import crashed
+        with open(import_file_path) as import_file:
+            import_instance = self.create_import(
+                import_type=ImportTypeChoices.documents,
+                status=ImportStatusChoices.active,
+                import_file__data=import_file.read(),
+                total=4,
+                processed=2,
+                processed_successfully=2,
+                last_processed_row=3,
+                report_file=None,
+            )
+
+        import_documents(import_instance.pk, self.request_headers)
+
+        import_instance.refresh_from_db()
+
+        eios = EnkelvoudigInformatieObject.objects.all()
+
+        self.assertEqual(
+            set(eios.values_list("titel", flat=True)), {"Document 3", "Document 4"}
+        )
+        self.assertEqual(import_instance.total, 4)
+        self.assertEqual(import_instance.processed, 4)
+        self.assertEqual(import_instance.processed_invalid, 0)
+        self.assertEqual(import_instance.processed_successfully, 4)
+        self.assertEqual(import_instance.last_processed_row, 5)
+        self.assertEqual(import_instance.status, ImportStatusChoices.finished)
+
+        report_path = Path(import_instance.report_file.path)
+
+        with open(str(report_path)) as report_file:
+            csv_reader = csv.reader(report_file, delimiter=",", quotechar='"')
+            rows = [row for row in csv_reader]
+
+        self.addCleanup(report_path.unlink)
+
+        self.assertEqual(len(rows), 3)
+        self.assertEqual([row[4] for row in rows[1:]], ["Document 3", "Document 4"])
+
+    def test_resume_import_after_database_error(self):
+        ZaakFactory(uuid="43f1d8f4-c689-46eb-ae6e-c64d892d5341")
+        ZaakFactory(uuid="b02ee3eb-8e94-4cd9-93e7-f8d1b16a1952")
+
+        import_file_path = self.test_data_path / "import.csv"
+
+        with open(import_file_path) as import_file:
+            import_instance = self.create_import(
+                import_type=ImportTypeChoices.documents,
+                status=ImportStatusChoices.pending,
+                import_file__data=import_file.read(),
+                total=0,
+                report_file=None,
+            )
+
+        batch_create_eios = tasks._batch_create_eios
+        calls = []
+
+        def fail_second_batch(*args):
+            calls.append(args)
+            if len(calls) == 2:
+                raise OperationalError("connection lost")
+            return batch_create_eios(*args)
+
+        with patch(
+            "openzaak.components.documenten.tasks._batch_create_eios",
+            side_effect=fail_second_batch,
+        ):
+            import_documents(import_instance.pk, self.request_headers)
+
+        import_instance.refresh_from_db()
+
+        self.assertEqual(import_instance.status, ImportStatusChoices.error)
+        self.assertEqual(import_instance.last_processed_row, 3)
+        self.assertEqual(
+            set(EnkelvoudigInformatieObject.objects.values_list("titel", flat=True)),
+            {"Document 1", "Document 2"},
+        )
+
+        import_documents(import_instance.pk, self.request_headers)
+
+        import_instance.refresh_from_db()
+
+        self.assertEqual(
+            set(EnkelvoudigInformatieObject.objects.values_list("titel", flat=True)),
+            {"Document 1", "Document 2", "Document 3", "Document 4"},
+        )
+        self.assertEqual(import_instance.processed, 4)
+        self.assertEqual(import_instance.processed_invalid, 0)
+        self.assertEqual(import_instance.processed_successfully, 4)
+        self.assertEqual(import_instance.last_processed_row, 5)
+        self.assertEqual(import_instance.status, ImportStatusChoices.finished)
+
+        self.addCleanup(Path(import_instance.report_file.path).unlink)
+
     @override_settings(DOCUMENTEN_API_BACKEND="test")
     def test_simple_import_not_implemented_documenten_api_backend(self):
         ZaakFactory(uuid="43f1d8f4-c689-46eb-ae6e-c64d892d5341")
@@ -423,9 +525,11 @@ class ImportDocumentTestCase(ImportTestMixin, MockSchemasMixin, TestCase):
         self.assertTrue(len(identifiers) == len(set(identifiers)))
 
         self.assertEqual(import_instance.total, 4)
-        self.assertEqual(import_instance.processed, 4)
-        self.assertEqual(import_instance.processed_invalid, 2)
+        # only the progress of the committed batch is saved
+        self.assertEqual(import_instance.processed, 2)
+        self.assertEqual(import_instance.processed_invalid, 0)
         self.assertEqual(import_instance.processed_successfully, 2)
+        self.assertEqual(import_instance.last_processed_row, 3)
         self.assertEqual(import_instance.status, ImportStatusChoices.error)
 
         report_path = Path(import_instance.report_file.path)
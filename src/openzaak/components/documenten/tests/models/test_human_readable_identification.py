@@ -2,8 +2,11 @@
 # Copyright (C) 2019 - 2020 Dimpact
 from datetime import date
 
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
+from ...models import DocumentIdentificatieCounter
 from ..factories import EnkelvoudigInformatieObjectFactory
 
 
@@ -17,11 +20,112 @@ class EIOTests(TestCase):
 
     def test_default_human_readable_existing_data(self):
         EnkelvoudigInformatieObjectFactory.create(
-            creatiedatum=date(2019, 7, 1), identificatie="DOCUMENT-2019-0000000015"
+            creatiedatum=date(2019, 7, 1),
+            identificatie="DOCUMENT-2019-0000000015",
+            bronorganisatie="517439943",
         )
 
         eio2 = EnkelvoudigInformatieObjectFactory.create(
-            identificatie="", creatiedatum=date(2019, 9, 15)
+            identificatie="",
+            creatiedatum=date(2019, 9, 15),
+            bronorganisatie="517439943",
         )
 
         self.assertEqual(eio2.identificatie, "DOCUMENT-2019-0000000016")
+
+    def test_human_readable_per_bronorganisatie(self):
+        eio1 = EnkelvoudigInformatieObjectFactory.create(
+            identificatie="", creatiedatum=date(2019, 7, 1), bronorganisatie="517439943"
+        )
+        eio2 = EnkelvoudigInformatieObjectFactory.create(
+            identificatie="", creatiedatum=date(2019, 7, 1), bronorganisatie="000000000"
+        )
+        eio3 = EnkelvoudigInformatieObjectFactory.create(
+            identificatie="", creatiedatum=date(2019, 7, 1), bronorganisatie="517439943"
+        )
+
+        self.assertEqual(eio1.identificatie, "DOCUMENT-2019-0000000001")
+        self.assertEqual(eio2.identificatie, "DOCUMENT-2019-0000000001")
+        self.assertEqual(eio3.identificatie, "DOCUMENT-2019-0000000002")
+        self.assertEqual(
+            DocumentIdentificatieCounter.objects.get(
+                bronorganisatie="517439943", jaar=2019
+            ).last_number,
+            2,
+        )
+
+    def test_client_supplied_identificatie_moves_counter(self):
+        EnkelvoudigInformatieObjectFactory.create(
+            identificatie="", creatiedatum=date(2019, 7, 1), bronorganisatie="517439943"
+        )
+        EnkelvoudigInformatieObjectFactory.create(
+            identificatie="DOCUMENT-2019-0000000007",
+            creatiedatum=date(2019, 7, 1),
+            bronorganisatie="517439943",
+        )
+
+        eio = EnkelvoudigInformatieObjectFactory.create(
+            identificatie="", creatiedatum=date(2019, 7, 1), bronorganisatie="517439943"
+        )
+
+        self.assertEqual(eio.identificatie, "DOCUMENT-2019-0000000008")
+
+    def test_client_supplied_identificatie_creates_counter(self):
+        EnkelvoudigInformatieObjectFactory.create(
+            creatiedatum=date(2019, 7, 1),
+            identificatie="DOCUMENT-2019-0000000015",
+            bronorganisatie="517439943",
+        )
+
+        self.assertEqual(
+            DocumentIdentificatieCounter.objects.get(
+                bronorganisatie="517439943", jaar=2019
+            ).last_number,
+            15,
+        )
+
+    def test_new_version_does_not_register_identificatie(self):
+        eio = EnkelvoudigInformatieObjectFactory.create(
+            creatiedatum=date(2019, 7, 1),
+            identificatie="DOCUMENT-2019-0000000015",
+            bronorganisatie="517439943",
+        )
+        table = DocumentIdentificatieCounter._meta.db_table
+
+        with CaptureQueriesContext(connection) as context:
+            EnkelvoudigInformatieObjectFactory.create(
+                canonical=eio.canonical,
+                versie=2,
+                creatiedatum=date(2019, 7, 1),
+                identificatie="DOCUMENT-2019-0000000015",
+                bronorganisatie="517439943",
+            )
+
+        self.assertFalse(
+            any(table in query["sql"] for query in context.captured_queries)
+        )
+
+    def test_client_supplied_identificatie_behind_counter_does_not_lock(self):
+        DocumentIdentificatieCounter.objects.create(
+            bronorganisatie="517439943", jaar=2019, last_number=20
+        )
+        table = DocumentIdentificatieCounter._meta.db_table
+
+        with CaptureQueriesContext(connection) as context:
+            EnkelvoudigInformatieObjectFactory.create(
+                creatiedatum=date(2019, 7, 1),
+                identificatie="DOCUMENT-2019-0000000015",
+                bronorganisatie="517439943",
+            )
+
+        counter_queries = [
+            query["sql"] for query in context.captured_queries if table in query["sql"]
+        ]
+        self.assertEqual(len(counter_queries), 1)
+        self.assertTrue(counter_queries[0].startswith("SELECT"))
+        self.assertEqual(
+            DocumentIdentificatieCounter.objects.get(
+                bronorganisatie="517439943", jaar=2019
+            ).last_number,
+            20,
+        )
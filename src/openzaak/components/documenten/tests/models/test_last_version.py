@@ -4,6 +4,7 @@ from django.test import TestCase
 
 from privates.test import temp_private_root
 
+from ...models import EnkelvoudigInformatieObjectCanonical
 from ..factories import (
     EnkelvoudigInformatieObjectCanonicalFactory,
     EnkelvoudigInformatieObjectFactory,
@@ -19,3 +20,45 @@ class LastVersionTests(TestCase):
         eio3 = EnkelvoudigInformatieObjectFactory.create(canonical=canonical, versie=3)
 
         self.assertEqual(canonical.latest_version, eio3)
+
+    def test_older_version_created_later(self):
+        canonical = EnkelvoudigInformatieObjectCanonicalFactory(latest_version=None)
+        eio2 = EnkelvoudigInformatieObjectFactory.create(canonical=canonical, versie=2)
+        EnkelvoudigInformatieObjectFactory.create(canonical=canonical, versie=1)
+
+        canonical.refresh_from_db()
+        self.assertEqual(canonical.latest_version, eio2)
+
+    def test_latest_version_deleted(self):
+        canonical = EnkelvoudigInformatieObjectCanonicalFactory(latest_version=None)
+        eio1 = EnkelvoudigInformatieObjectFactory.create(canonical=canonical, versie=1)
+        eio2 = EnkelvoudigInformatieObjectFactory.create(canonical=canonical, versie=2)
+
+        eio2.delete()
+
+        canonical.refresh_from_db()
+        self.assertEqual(canonical.latest_version, eio1)
+
+    def test_stale_canonical_does_not_overwrite_latest_version(self):
+        canonical = EnkelvoudigInformatieObjectCanonicalFactory(latest_version=None)
+        EnkelvoudigInformatieObjectFactory.create(canonical=canonical, versie=1)
+        stale = EnkelvoudigInformatieObjectCanonical.objects.get(pk=canonical.pk)
+        eio2 = EnkelvoudigInformatieObjectFactory.create(canonical=canonical, versie=2)
+
+        stale.lock = "lock"
+        stale.save()
+
+        canonical.refresh_from_db()
+        self.assertEqual(canonical.latest_version, eio2)
+        self.assertEqual(canonical.lock, "lock")
+
+    def test_update_latest_version(self):
+        canonical = EnkelvoudigInformatieObjectCanonicalFactory(latest_version=None)
+        EnkelvoudigInformatieObjectFactory.create(canonical=canonical, versie=1)
+        eio2 = EnkelvoudigInformatieObjectFactory.create(canonical=canonical, versie=2)
+        EnkelvoudigInformatieObjectCanonical.objects.update(latest_version=None)
+
+        EnkelvoudigInformatieObjectCanonical.objects.update_latest_version()
+
+        canonical.refresh_from_db()
+        self.assertEqual(canonical.latest_version, eio2)
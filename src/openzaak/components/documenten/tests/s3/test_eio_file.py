@@ -13,7 +13,7 @@ from urllib.parse import urlparse
 from uuid import UUID
 
 from django.core.files import File
-from django.test import tag
+from django.test import override_settings, tag
 
 from maykin_common.vcr import VCRMixin
 from privates.test import temp_private_root
@@ -134,6 +134,23 @@ class EnkelvoudigInformatieObjectFileS3StorageTests(
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.getvalue().decode("utf-8"), "some data")
 
+    @override_settings(DOCUMENTEN_DOWNLOAD_REDIRECT=True)
+    def test_read_detail_file_redirect(self):
+        # generating the pre-signed URL does not require a request to the storage
+        eio = EnkelvoudigInformatieObjectFactory.create(
+            inhoud="uploads/test/some-file.bin"
+        )
+        file_url = get_operation_url(
+            "enkelvoudiginformatieobject_download", uuid=eio.uuid
+        )
+
+        response = self.client.get(file_url)
+
+        self.assertEqual(response.status_code, status.HTTP_302_FOUND)
+        location = urlparse(response["Location"])
+        self.assertTrue(location.path.endswith("uploads/test/some-file.bin"))
+        self.assertIn("response-content-disposition=attachment", location.query)
+
     def test_list_file(self):
         eio = EnkelvoudigInformatieObjectFactory.create(
             inhoud__filename="test_list_file.bin"
@@ -6,11 +6,14 @@ Test that the caching mechanisms are in place.
 
 from rest_framework import status
 from rest_framework.test import APITestCase, APITransactionTestCase
+from vng_api_common.constants import ComponentTypes, VertrouwelijkheidsAanduiding
 from vng_api_common.tests import CacheMixin, JWTAuthMixin, reverse
 
+from openzaak.components.catalogi.tests.factories import InformatieObjectTypeFactory
 from openzaak.components.zaken.tests.factories import ZaakInformatieObjectFactory
-from openzaak.tests.utils import get_spec
+from openzaak.tests.utils import JWTAuthMixin as AutorisatieJWTAuthMixin, get_spec
 
+from ..api.scopes import SCOPE_DOCUMENTEN_ALLES_LEZEN
 from ..caching import get_etag_cache_key, set_etag
 from ..models import ObjectInformatieObject
 from ..tests.factories import EnkelvoudigInformatieObjectFactory, GebruiksrechtenFactory
@@ -195,3 +198,50 @@ class EnkelvoudigInformatieObjectCacheTransactionTests(
 
         response = self.client.get(reverse(eio), headers={"if-none-match": f"{_etag}"})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class EnkelvoudigInformatieObjectConditionalFastPathTests(
+    AutorisatieJWTAuthMixin, APITestCase
+):
+    scopes = [SCOPE_DOCUMENTEN_ALLES_LEZEN]
+    max_vertrouwelijkheidaanduiding = VertrouwelijkheidsAanduiding.openbaar
+    component = ComponentTypes.drc
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.informatieobjecttype = InformatieObjectTypeFactory.create()
+        super().setUpTestData()
+
+    def test_not_modified(self):
+        eio = EnkelvoudigInformatieObjectFactory.create(
+            informatieobjecttype=self.informatieobjecttype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        _etag = eio.calculate_etag_value()
+
+        response = self.client.get(
+            reverse(eio), headers={"if-none-match": f'"{_etag}"'}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_latest_version_not_authorized(self):
+        eio = EnkelvoudigInformatieObjectFactory.create(
+            informatieobjecttype=self.informatieobjecttype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        _etag = eio.calculate_etag_value()
+        # the vertrouwelijkheidaanduiding of the new version is raised
+        EnkelvoudigInformatieObjectFactory.create(
+            canonical=eio.canonical,
+            uuid=eio.uuid,
+            versie=2,
+            informatieobjecttype=self.informatieobjecttype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.geheim,
+        )
+
+        response = self.client.get(
+            reverse(eio), headers={"if-none-match": f'"{_etag}"'}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -82,6 +82,113 @@ class US39TestCase(JWTAuthMixin, APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.getvalue().decode("utf-8"), "some data")
 
+    def test_read_detail_file_range(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        file_url = get_operation_url(
+            "enkelvoudiginformatieobject_download", uuid=eio.uuid
+        )
+
+        response = self.client.get(file_url, headers={"Range": "bytes=0-3"})
+
+        self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        self.assertEqual(response.getvalue(), b"some")
+        self.assertEqual(response["Content-Range"], "bytes 0-3/9")
+        self.assertEqual(response["Content-Length"], "4")
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+
+    def test_read_detail_file_suffix_range(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        file_url = get_operation_url(
+            "enkelvoudiginformatieobject_download", uuid=eio.uuid
+        )
+
+        response = self.client.get(file_url, headers={"Range": "bytes=-4"})
+
+        self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        self.assertEqual(response.getvalue(), b"data")
+        self.assertEqual(response["Content-Range"], "bytes 5-8/9")
+
+    def test_read_detail_file_range_not_satisfiable(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        file_url = get_operation_url(
+            "enkelvoudiginformatieobject_download", uuid=eio.uuid
+        )
+
+        response = self.client.get(file_url, headers={"Range": "bytes=20-"})
+
+        self.assertEqual(
+            response.status_code, status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+        )
+        self.assertEqual(response["Content-Range"], "bytes */9")
+
+    def test_read_detail_file_multiple_ranges_returns_full_content(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        file_url = get_operation_url(
+            "enkelvoudiginformatieobject_download", uuid=eio.uuid
+        )
+
+        response = self.client.get(file_url, headers={"Range": "bytes=0-1,4-5"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.getvalue(), b"some data")
+
+    def test_read_detail_file_if_range(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        file_url = get_operation_url(
+            "enkelvoudiginformatieobject_download", uuid=eio.uuid
+        )
+        etag = self.client.get(file_url, headers={"Range": "bytes=0-3"})["ETag"]
+
+        with self.subTest("same content"):
+            response = self.client.get(
+                file_url, headers={"Range": "bytes=5-", "If-Range": etag}
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+            self.assertEqual(response.getvalue(), b"data")
+
+        with self.subTest("changed content"):
+            response = self.client.get(
+                file_url, headers={"Range": "bytes=5-", "If-Range": '"other"'}
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.getvalue(), b"some data")
+
+    def test_read_detail_file_etag_changes_with_content(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        file_url = get_operation_url(
+            "enkelvoudiginformatieobject_download", uuid=eio.uuid
+        )
+        etag = self.client.get(file_url, headers={"Range": "bytes=0-3"})["ETag"]
+
+        # the file is replaced without changing its name
+        with open(eio.inhoud.path, "wb") as file:
+            file.write(b"other data")
+
+        response = self.client.get(
+            file_url, headers={"Range": "bytes=6-", "If-Range": etag}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.getvalue(), b"other data")
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_read_detail_file_resume_full_download(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        file_url = get_operation_url(
+            "enkelvoudiginformatieobject_download", uuid=eio.uuid
+        )
+        etag = self.client.get(file_url)["ETag"]
+
+        response = self.client.get(
+            file_url, headers={"Range": "bytes=5-", "If-Range": etag}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        self.assertEqual(response.getvalue(), b"data")
+        self.assertEqual(response["ETag"], etag)
+
     @override_settings(DOCUMENTEN_API_BACKEND="test")
     def test_read_detail_file_not_implemented_documenten_api_backend(self):
         eio = EnkelvoudigInformatieObjectFactory.create()
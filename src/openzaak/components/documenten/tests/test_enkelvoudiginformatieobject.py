@@ -42,6 +42,24 @@ class EnkelvoudigInformatieObjectAPITests(JWTAuthMixin, APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
         self.assertEqual(len(response.data["results"]), 4)
 
+    def test_list_only_latest_versions(self):
+        eio1 = EnkelvoudigInformatieObjectFactory.create(versie=1, titel="b")
+        eio2 = EnkelvoudigInformatieObjectFactory.create(
+            canonical=eio1.canonical, uuid=eio1.uuid, versie=2, titel="c"
+        )
+        eio3 = EnkelvoudigInformatieObjectFactory.create(versie=1, titel="a")
+
+        response = self.client.get(self.list_url, {"ordering": "titel"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(
+            [result["url"] for result in response.json()["results"]],
+            [
+                f"http://testserver{reverse(eio3)}",
+                f"http://testserver{reverse(eio2)}",
+            ],
+        )
+
     def test_create(self):
         informatieobjecttype = InformatieObjectTypeFactory.create(concept=False)
         informatieobjecttype_url = reverse(informatieobjecttype)
@@ -1040,6 +1058,30 @@ class EnkelvoudigInformatieObjectPaginationAPITests(JWTAuthMixin, APITestCase):
             data["next"], f"http://testserver{self.list_url}?page=2&pageSize=5"
         )
 
+    def test_cursor_pagination_latest_versions(self):
+        eio1 = EnkelvoudigInformatieObjectFactory.create(titel="eio1")
+        eio2 = EnkelvoudigInformatieObjectFactory.create(titel="eio2")
+        EnkelvoudigInformatieObjectFactory.create(titel="eio3")
+        # add a second version, only the latest version is listed
+        EnkelvoudigInformatieObjectFactory.create(
+            canonical=eio2.canonical, versie=2, titel="eio2 versie 2"
+        )
+
+        titels = []
+        response = self.client.get(self.list_url, {"cursor": "", "pageSize": 2})
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+            data = response.json()
+            self.assertIsNone(data["count"])
+            titels += [eio["titel"] for eio in data["results"]]
+
+            if not data["next"]:
+                break
+            response = self.client.get(data["next"])
+
+        self.assertEqual(titels, [eio1.titel, "eio2 versie 2", "eio3"])
+
 
 @tag("external-urls")
 @temp_private_root()
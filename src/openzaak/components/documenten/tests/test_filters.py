@@ -154,6 +154,53 @@ class EnkelvoudigInformatieObjectFilterTests(JWTAuthMixin, APITestCase):
             self.assertEqual(data["results"][0]["titel"], "Lorem")
             self.assertEqual(data["results"][1]["titel"], "Lorem Ipsum")
 
+    def test_search(self):
+        EnkelvoudigInformatieObjectFactory.create(
+            titel="Besluit", beschrijving="Besluit op de aanvraag"
+        )
+        EnkelvoudigInformatieObjectFactory.create(titel="Aanvraag vergunning")
+        EnkelvoudigInformatieObjectFactory.create(titel="Foto", auteur="Fotograaf")
+
+        with self.subTest("ranked"):
+            response = self.client.get(
+                reverse(EnkelvoudigInformatieObject), {"search": "aanvraag"}
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            data = response.json()
+            self.assertEqual(
+                [result["titel"] for result in data["results"]],
+                ["Aanvraag vergunning", "Besluit"],
+            )
+
+        with self.subTest("websearch syntax"):
+            response = self.client.get(
+                reverse(EnkelvoudigInformatieObject), {"search": "aanvraag -besluit"}
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            data = response.json()
+            self.assertEqual(data["count"], 1)
+            self.assertEqual(data["results"][0]["titel"], "Aanvraag vergunning")
+
+        with self.subTest("ordering"):
+            response = self.client.get(
+                reverse(EnkelvoudigInformatieObject),
+                {"search": "aanvraag", "ordering": "-titel"},
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            data = response.json()
+            self.assertEqual(
+                [result["titel"] for result in data["results"]],
+                ["Besluit", "Aanvraag vergunning"],
+            )
+
+        with self.subTest("cursor"):
+            response = self.client.get(
+                reverse(EnkelvoudigInformatieObject),
+                {"search": "aanvraag", "cursor": ""},
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(len(response.json()["results"]), 2)
+
     def test_vertrouwelijkheidaanduiding(self):
         choice_names = VertrouwelijkheidsAanduiding.names
         for choice in choice_names:
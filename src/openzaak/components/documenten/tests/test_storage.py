@@ -1,15 +1,22 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2026 Dimpact
+import errno
 import os
+import tempfile
 from importlib import reload
+from pathlib import Path
+from unittest import skipUnless
 from unittest.mock import patch
 
+from django.core.files import File
 from django.test import SimpleTestCase, override_settings
 
+from privates.test import temp_private_root
+
 import openzaak.conf.includes.base
 from openzaak.components.documenten.exceptions import DocumentBackendNotImplementedError
 
-from ..storage import documenten_storage
+from ..storage import FileSystemStorage, documenten_storage
 
 
 class DocumentenAPIStorageTestCase(SimpleTestCase):
@@ -26,3 +33,65 @@ class DocumentenAPIStorageTestCase(SimpleTestCase):
     def test_not_implemented_documenten_api_backend(self):
         with self.assertRaises(DocumentBackendNotImplementedError):
             documenten_storage._setup()
+
+
+@temp_private_root()
+class FileSystemStorageSavePartsTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.parts = []
+        for index, content in enumerate([b"some ", b"file ", b"content"]):
+            path = Path(tmpdir.name) / f"part-{index}"
+            path.write_bytes(content)
+            self.parts.append(File(None, name=str(path)))
+
+    def test_save_parts(self):
+        storage = FileSystemStorage()
+
+        name = storage.save_parts("uploads/test/file.bin", self.parts)
+
+        self.assertEqual(name, "uploads/test/file.bin")
+        with storage.open(name) as file:
+            self.assertEqual(file.read(), b"some file content")
+
+    def test_save_parts_existing_file(self):
+        storage = FileSystemStorage()
+        storage.save_parts("uploads/test/file.bin", self.parts)
+
+        name = storage.save_parts("uploads/test/file.bin", self.parts)
+
+        self.assertNotEqual(name, "uploads/test/file.bin")
+        with storage.open(name) as file:
+            self.assertEqual(file.read(), b"some file content")
+
+    def test_save_parts_copy_file_range_not_supported(self):
+        storage = FileSystemStorage()
+
+        with patch(
+            "openzaak.components.documenten.storage.os.copy_file_range",
+            side_effect=OSError(errno.EXDEV, "Invalid cross-device link"),
+        ) as mock_copy_file_range:
+            name = storage.save_parts("uploads/test/file.bin", self.parts)
+
+        # falls back to copying in Python after the first failure
+        mock_copy_file_range.assert_called_once()
+        with storage.open(name) as file:
+            self.assertEqual(file.read(), b"some file content")
+
+    @skipUnless(hasattr(os, "copy_file_range"), "requires os.copy_file_range")
+    def test_save_parts_copies_in_kernel(self):
+        storage = FileSystemStorage()
+
+        with patch(
+            "openzaak.components.documenten.storage.shutil.copyfileobj"
+        ) as mock_copyfileobj:
+            name = storage.save_parts("uploads/test/file.bin", self.parts)
+
+        mock_copyfileobj.assert_not_called()
+        with storage.open(name) as file:
+            self.assertEqual(file.read(), b"some file content")
+        # no temporary files are left behind
+        self.assertEqual(os.listdir(storage.location), ["uploads"])
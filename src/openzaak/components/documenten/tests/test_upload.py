@@ -2,6 +2,7 @@
 # Copyright (C) 2022 Dimpact
 import uuid
 from base64 import b64encode
+from unittest.mock import patch
 
 from django.conf import settings
 from django.core.files.uploadedfile import SimpleUploadedFile
@@ -25,6 +26,7 @@ from ..api.scopes import (
     SCOPE_DOCUMENTEN_LOCK,
 )
 from ..models import EnkelvoudigInformatieObject
+from ..storage import FileSystemStorage
 from .factories import EnkelvoudigInformatieObjectFactory
 from .utils import get_operation_url, split_file
 
@@ -1103,3 +1105,133 @@ class LargeFileAPITests(JWTAuthMixin, APITestCase):
         self.assertEqual(new_version.bestandsomvang, None)
         self.assertEqual(self.canonical.bestandsdelen.count(), 0)
         self.assertEqual(data["inhoud"], None)
+
+
+@temp_private_root()
+@override_settings(DOCUMENTEN_UPLOAD_CHUNK_SIZE=10)
+class PartsUploadedToStorageTests(JWTAuthMixin, APITestCase):
+    """
+    Bestandsdelen are sent to storages that support it (S3, Azure) as they arrive.
+    """
+
+    component = ComponentTypes.drc
+    scopes = [
+        SCOPE_DOCUMENTEN_LOCK,
+        SCOPE_DOCUMENTEN_AANMAKEN,
+        SCOPE_DOCUMENTEN_ALLES_LEZEN,
+        SCOPE_DOCUMENTEN_BIJWERKEN,
+        SCOPE_DOCUMENTEN_GEFORCEERD_UNLOCK,
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.informatieobjecttype = InformatieObjectTypeFactory.create(concept=False)
+        cls.informatieobjecttype_url = (
+            f"http://testserver{reverse(cls.informatieobjecttype)}"
+        )
+
+        super().setUpTestData()
+
+    def setUp(self):
+        super().setUp()
+
+        self.storage_methods = {}
+        for method, kwargs in [
+            ("start_parts", {"return_value": ("uploads/file.txt", "upload-id")}),
+            ("save_part", {"side_effect": lambda name, id, number, part: f"p{number}"}),
+            ("commit_parts", {"return_value": "uploads/file.txt"}),
+            ("abort_parts", {}),
+        ]:
+            patcher = patch.object(FileSystemStorage, method, **kwargs)
+            self.storage_methods[method] = patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.file_content = SimpleUploadedFile("file.txt", b"filecontentstring")
+        response = self.client.post(
+            reverse(EnkelvoudigInformatieObject),
+            {
+                "bronorganisatie": "159351741",
+                "creatiedatum": "2018-06-27",
+                "titel": "detailed summary",
+                "auteur": "test_auteur",
+                "taal": "eng",
+                "bestandsnaam": "file.txt",
+                "bestandsomvang": self.file_content.size,
+                "informatieobjecttype": self.informatieobjecttype_url,
+                "vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding.openbaar,
+            },
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+
+        self.eio = EnkelvoudigInformatieObject.objects.get(
+            uuid=response.data["url"].split("/")[-1]
+        )
+        self.canonical = self.eio.canonical
+        self.bestandsdelen = list(self.canonical.bestandsdelen.order_by("volgnummer"))
+
+    def _upload_part(self, part, part_file):
+        response = self.client.put(
+            get_operation_url("bestandsdeel_update", uuid=part.uuid),
+            {"inhoud": part_file, "lock": self.canonical.lock},
+            format="multipart",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+
+    def test_upload_started_on_create(self):
+        self.storage_methods["start_parts"].assert_called_once()
+        args, kwargs = self.storage_methods["start_parts"].call_args
+        self.assertEqual(args[1], [10, 7])
+        self.assertEqual(self.canonical.upload_name, "uploads/file.txt")
+        self.assertEqual(self.canonical.upload_id, "upload-id")
+
+    def test_upload_parts_and_unlock(self):
+        part_files = split_file(
+            self.file_content, settings.DOCUMENTEN_UPLOAD_CHUNK_SIZE
+        )
+
+        for part, part_file in zip(self.bestandsdelen, part_files):
+            self._upload_part(part, part_file)
+
+            part.refresh_from_db()
+            # not stored locally
+            self.assertEqual(part.inhoud, "")
+            self.assertEqual(part.voltooid, True)
+            self.assertEqual(part.upload_part_id, f"p{part.volgnummer}")
+
+        response = self.client.post(
+            get_operation_url("enkelvoudiginformatieobject_unlock", uuid=self.eio.uuid),
+            {"lock": self.canonical.lock},
+        )
+
+        self.assertEqual(
+            response.status_code, status.HTTP_204_NO_CONTENT, response.data
+        )
+        self.storage_methods["commit_parts"].assert_called_once_with(
+            "uploads/file.txt", "upload-id", ["p1", "p2"]
+        )
+        self.canonical.refresh_from_db()
+        self.eio.refresh_from_db()
+        self.assertEqual(self.eio.inhoud.name, "uploads/file.txt")
+        self.assertEqual(self.canonical.upload_name, "")
+        self.assertEqual(self.canonical.upload_id, "")
+        self.assertEqual(self.canonical.bestandsdelen.count(), 0)
+
+    def test_force_unlock_incomplete_upload_aborts(self):
+        part_file = split_file(
+            self.file_content, settings.DOCUMENTEN_UPLOAD_CHUNK_SIZE
+        )[0]
+        self._upload_part(self.bestandsdelen[0], part_file)
+
+        response = self.client.post(
+            get_operation_url("enkelvoudiginformatieobject_unlock", uuid=self.eio.uuid)
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.storage_methods["abort_parts"].assert_called_once_with(
+            "uploads/file.txt", "upload-id"
+        )
+        self.storage_methods["commit_parts"].assert_not_called()
+        self.canonical.refresh_from_db()
+        self.assertEqual(self.canonical.upload_name, "")
@@ -2,7 +2,7 @@
 # Copyright (C) 2022 Open Zaak maintainers
 from django.contrib import admin
 
-from ..models import ZaakIdentificatie
+from ..models import ZaakIdentificatie, ZaakIdentificatieCounter
 
 
 @admin.register(ZaakIdentificatie)
@@ -10,3 +10,11 @@ class ZaakIdentificatieAdmin(admin.ModelAdmin):
     list_display = ("identificatie", "bronorganisatie")
     search_fields = ("identificatie",)
     list_filter = ("bronorganisatie",)
+
+
+@admin.register(ZaakIdentificatieCounter)
+class ZaakIdentificatieCounterAdmin(admin.ModelAdmin):
+    list_display = ("bronorganisatie", "jaar", "last_number")
+    list_filter = ("jaar",)
+    search_fields = ("bronorganisatie",)
+    readonly_fields = ("bronorganisatie", "jaar")
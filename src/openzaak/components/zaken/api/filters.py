@@ -5,7 +5,6 @@ from urllib.parse import urlparse
 from django.core.exceptions import ObjectDoesNotExist
 from django.core.validators import URLValidator
 from django.db import models
-from django.db.models import OuterRef, Subquery
 from django.urls.exceptions import Resolver404
 from django.utils.translation import gettext_lazy as _
 
@@ -17,6 +16,7 @@ from vng_api_common.utils import get_field_attribute, get_help_text
 
 from openzaak.components.zaken.api.serializers.zaken import ZaakSerializer
 from openzaak.utils.filters import (
+    CursorFilter,
     ExpandFilter,
     KeyValueFilter,
     MaximaleVertrouwelijkheidaanduidingFilter,
@@ -308,6 +308,8 @@ class ZaakFilter(FilterSetWithGroups):
 
     expand = ExpandFilter(serializer_class=ZaakSerializer)
 
+    cursor = CursorFilter()
+
     class Meta:
         model = Zaak
         fields = {
@@ -335,17 +337,7 @@ class ZaakFilter(FilterSetWithGroups):
         except (ObjectDoesNotExist, Resolver404):
             return queryset.none()
 
-        statustype_id = resource.id
-
-        latest_status_subquery = (
-            Status.objects.filter(zaak=OuterRef("pk"))
-            .order_by("-datum_status_gezet", "-pk")
-            .values("_statustype_id")[:1]
-        )
-
-        return queryset.annotate(
-            latest_statustype_id=Subquery(latest_status_subquery)
-        ).filter(latest_statustype_id=statustype_id)
+        return queryset.filter(_current_statustype_id=resource.id)
 
     def filter_resultaattype_url(self, queryset, name, value):
         parsed = urlparse(value)
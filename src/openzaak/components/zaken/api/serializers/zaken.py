@@ -5,6 +5,8 @@ from typing import Optional
 from uuid import UUID
 
 from django.conf import settings
+from django.contrib.gis.db import models as gis_models
+from django.contrib.gis.geos import Polygon
 from django.db import transaction
 from django.db.models import (
     CharField,
@@ -17,6 +19,7 @@ from django.db.models import (
     Value,
 )
 from django.db.models.functions import Cast
+from django.db.models.signals import post_save
 from django.utils import timezone
 from django.utils.dateparse import parse_datetime
 from django.utils.encoding import force_str
@@ -55,7 +58,10 @@ from vng_api_common.utils import get_help_text
 from vng_api_common.validators import IsImmutableValidator, UntilNowValidator
 
 from openzaak.components.documenten.api.fields import EnkelvoudigInformatieObjectField
-from openzaak.components.zaken.archiving import calculate_archiving_data
+from openzaak.components.zaken.archiving import (
+    calculate_archiving_data,
+    try_calculate_archiving,
+)
 from openzaak.components.zaken.validators import CorrectZaaktypeValidator
 from openzaak.contrib.verzoeken.validators import verzoek_validator
 from openzaak.utils.api import (
@@ -65,8 +71,12 @@ from openzaak.utils.api import (
 )
 from openzaak.utils.auth import get_auth
 from openzaak.utils.exceptions import DetermineProcessEndDateException
+from openzaak.utils.gis import MAX_ZOOM_LEVEL
 from openzaak.utils.help_text import mark_experimental
-from openzaak.utils.serializer_fields import FKOrServiceUrlField
+from openzaak.utils.serializer_fields import (
+    FKOrServiceUrlField,
+    SimplifiedGeometryField,
+)
 from openzaak.utils.serializers import (
     ConvenienceSerializer,
     ReadOnlyMixin,
@@ -306,6 +316,11 @@ class ZaakSerializer(
     NestedUpdateMixin,
     serializers.HyperlinkedModelSerializer,
 ):
+    serializer_field_mapping = {
+        **serializers.HyperlinkedModelSerializer.serializer_field_mapping,
+        gis_models.GeometryField: SimplifiedGeometryField,
+    }
+
     url = CachedHyperlinkedIdentityField(view_name="zaak-detail", lookup_field="uuid")
     eigenschappen = CachedNestedHyperlinkedRelatedField(
         many=True,
@@ -773,11 +788,64 @@ class ZaakZoekSerializer(serializers.Serializer):
         required=False,
         help_text=mark_experimental("Array van zaaktypen."),
     )
+    zoomniveau = serializers.IntegerField(
+        required=False,
+        min_value=0,
+        max_value=MAX_ZOOM_LEVEL,
+        help_text=mark_experimental(
+            "Vereenvoudig de `zaakgeometrie` van de resultaten voor weergave op een "
+            "kaart met dit zoomniveau. Details kleiner dan een pixel op dit zoomniveau "
+            "worden weggelaten. Zonder zoomniveau wordt de volledige geometrie "
+            "teruggegeven."
+        ),
+    )
 
     class Meta:
         model = Zaak
 
 
+class ZaakClusterZoekSerializer(ZaakZoekSerializer):
+    zoomniveau = None
+    bbox = serializers.ListField(
+        child=serializers.FloatField(),
+        min_length=4,
+        max_length=4,
+        help_text=_(
+            "Het gebied waarvoor de ZAAKen geteld worden, als "
+            "`[min lengtegraad, min breedtegraad, max lengtegraad, max breedtegraad]`."
+        ),
+    )
+    raster = serializers.IntegerField(
+        default=16,
+        min_value=1,
+        max_value=64,
+        help_text=_(
+            "Het aantal cellen per zijde van het raster waarin het gebied wordt "
+            "verdeeld."
+        ),
+    )
+
+    def validate_bbox(self, value: list[float]) -> Polygon:
+        xmin, ymin, xmax, ymax = value
+        if not (-180 <= xmin < xmax <= 180 and -90 <= ymin < ymax <= 90):
+            raise serializers.ValidationError(
+                _("The bounding box is not a valid area in EPSG:4326."),
+                code="invalid-bbox",
+            )
+        bbox = Polygon.from_bbox(value)
+        bbox.srid = 4326
+        return bbox
+
+
+class ZaakClusterSerializer(serializers.Serializer):
+    punt = GeometryField(
+        help_text=_("Het midden van de rastercel, in GeoJSON."),
+    )
+    aantal = serializers.IntegerField(
+        help_text=_("Het aantal ZAAKen in de rastercel."),
+    )
+
+
 POSTPONABLE_AFLEIDINGSWIJZES = {
     Afleidingswijze.vervaldatum_besluit,
     Afleidingswijze.eigenschap,
@@ -1298,6 +1366,14 @@ class ZaakEigenschapSerializer(NestedHyperlinkedModelSerializer):
         return attrs
 
 
+class ZaakEigenschapSubSerializer(SubSerializerMixin, ZaakEigenschapSerializer):
+    zaak = CachedHyperlinkedRelatedField(
+        view_name="zaak-detail",
+        lookup_field="uuid",
+        read_only=True,
+    )
+
+
 class KlantContactSerializer(serializers.HyperlinkedModelSerializer):
     class Meta:
         model = KlantContact
@@ -2020,3 +2096,150 @@ class ZaakVerlengenSerializer(ConvenienceSerializer):
             "zaak": zaak,
             "status": status,
         }
+
+
+class ZaakAanvullenSerializer(ConvenienceSerializer):
+    rollen = RolSubSerializer(many=True, required=False)
+    zaakobjecten = ZaakObjectSubSerializer(many=True, required=False)
+    zaakeigenschappen = ZaakEigenschapSubSerializer(many=True, required=False)
+    statussen = StatusSubSerializer(many=True, required=False)
+
+    def to_internal_value(self, data):
+        """
+        Only check that every field is a list of objects.
+
+        The resources themselves are validated once, by the full serializers when
+        they are created (see :meth:`update`), the nested fields are only used for
+        the documentation and the response.
+        """
+        if not isinstance(data, dict):
+            self.fail("invalid", datatype=type(data).__name__)
+
+        attrs, errors = {}, {}
+        for field_name, field in self.fields.items():
+            value = data.get(field_name)
+            if value is None:
+                continue
+            if not isinstance(value, list):
+                errors[field_name] = [
+                    ErrorDetail(
+                        field.error_messages["not_a_list"].format(
+                            input_type=type(value).__name__
+                        ),
+                        code="not_a_list",
+                    )
+                ]
+                continue
+            for i, item in enumerate(value):
+                if not isinstance(item, dict):
+                    errors[f"{field_name}.{i}"] = [
+                        ErrorDetail(
+                            field.child.error_messages["invalid"].format(
+                                datatype=type(item).__name__
+                            ),
+                            code="invalid",
+                        )
+                    ]
+            attrs[field_name] = value
+
+        if errors:
+            raise serializers.ValidationError(errors)
+        return attrs
+
+    def validate(self, attrs):
+        if not any(attrs.get(field) for field in self.fields):
+            raise serializers.ValidationError(
+                _("Er moet minimaal één resource aangemaakt worden."),
+                code="empty-batch",
+            )
+        return attrs
+
+    def _save_all(self, serializer_class, field: str, zaak_data: dict) -> list:
+        """
+        Validate and create the resources of ``field`` one by one, in the given order.
+
+        The resources are saved directly after validation, so validators that look
+        at the existing resources of the zaak (e.g. the maximum amount of
+        initiators) take the earlier resources of the request into account. The
+        errors of all resources of ``field`` are reported at once.
+        """
+        instances, errors = [], {}
+        for i, data in enumerate(self.initial_data.get(field) or []):
+            serializer = serializer_class(data=data | zaak_data, context=self.context)
+            if not serializer.is_valid():
+                errors |= {f"{field}.{i}.{k}": v for k, v in serializer.errors.items()}
+                continue
+            instances.append(self._save(field, serializer))
+
+        if errors:
+            raise serializers.ValidationError(errors)
+        return instances
+
+    def _save(self, field: str, serializer: serializers.Serializer):
+        if field == "statussen":
+            self.context["view"].check_status_permissions(
+                serializer.validated_data["zaak"]
+            )
+        return serializer.save()
+
+    def _create_zaakeigenschappen(self, zaak: Zaak, zaak_data: dict) -> list:
+        """
+        Validate all zaakeigenschappen and insert them with a single query.
+        """
+        instances, errors = [], {}
+        for i, data in enumerate(self.initial_data.get("zaakeigenschappen") or []):
+            serializer = ZaakEigenschapSerializer(
+                data=data | zaak_data, context=self.context
+            )
+            if not serializer.is_valid():
+                errors |= {
+                    f"zaakeigenschappen.{i}.{k}": v
+                    for k, v in serializer.errors.items()
+                }
+                continue
+            instances.append(ZaakEigenschap(**serializer.validated_data))
+
+        if errors:
+            raise serializers.ValidationError(errors)
+        if not instances:
+            return []
+
+        ZaakEigenschap.objects.bulk_create(instances)
+        # bulk_create doesn't send signals, which mark the ETags as outdated
+        for instance in instances:
+            post_save.send(
+                sender=ZaakEigenschap,
+                instance=instance,
+                created=True,
+                update_fields=None,
+                raw=False,
+                using=ZaakEigenschap.objects.db,
+            )
+
+        # see ZaakEigenschap.save
+        if zaak.einddatum and any(instance.waarde for instance in instances):
+            try_calculate_archiving(zaak, force=True)
+
+        return instances
+
+    @transaction.atomic
+    def update(self, instance, validated_data):
+        """
+        instance is zaak only
+        """
+        zaak_data = {
+            "zaak": instance.get_absolute_api_url(request=self.context["request"])
+        }
+
+        rollen = self._save_all(RolSerializer, "rollen", zaak_data)
+        zaakobjecten = self._save_all(ZaakObjectSerializer, "zaakobjecten", zaak_data)
+        zaakeigenschappen = self._create_zaakeigenschappen(instance, zaak_data)
+        # statussen last, since the eindstatus closes the zaak
+        statussen = self._save_all(StatusSerializer, "statussen", zaak_data)
+
+        return {
+            "rollen": rollen,
+            "zaakobjecten": zaakobjecten,
+            "zaakeigenschappen": zaakeigenschappen,
+            "statussen": statussen,
+        }
@@ -21,6 +21,7 @@ from .viewsets import (
     RolViewSet,
     StatusViewSet,
     SubStatusViewSet,
+    ZaakAanvullenViewSet,
     ZaakAfsluitenViewSet,
     ZaakAuditTrailViewSet,
     ZaakBesluitViewSet,
@@ -70,6 +71,7 @@ zaakopschorten_view = ZaakOpschortenViewset.as_view({"post": "post"})
 zaakafsluiten_view = ZaakAfsluitenViewSet.as_view({"post": "post"})
 zaakbijwerken_view = ZaakBijwerkenViewset.as_view({"post": "post"})
 zaakverlengen_view = ZaakVerlengenViewset.as_view({"post": "post"})
+zaakaanvullen_view = ZaakAanvullenViewSet.as_view({"post": "post"})
 
 
 urlpatterns = [
@@ -135,6 +137,11 @@ urlpatterns = [
                     zaakverlengen_view,
                     name="zaakverlengen",
                 ),
+                path(
+                    "zaak_aanvullen/<uuid:uuid>",
+                    zaakaanvullen_view,
+                    name="zaakaanvullen",
+                ),
                 path("", include("vng_api_common.notifications.api.urls")),
             ]
         ),
@@ -3,7 +3,8 @@
 import json
 import re
 from datetime import date, datetime, timedelta
-from typing import Iterable, Optional
+from functools import partial
+from typing import Callable, Iterable, Optional
 
 from django.conf import settings
 from django.db import models
@@ -29,6 +30,8 @@ from openzaak.components.documenten.models import (
     EnkelvoudigInformatieObjectCanonical,
 )
 from openzaak.utils.auth import get_auth
+from openzaak.utils.cache import LocalLRUCache, RemoteObjectsCache
+from openzaak.utils.metrics import remote_objects_cache_counter
 from openzaak.utils.serializers import get_from_serializer_data_or_instance
 
 from ...catalogi.models import StatusType
@@ -37,6 +40,16 @@ from ..models import Status, Zaak
 
 logger = structlog.stdlib.get_logger(__name__)
 
+# compiled jq programs, by expression
+jq_programs = LocalLRUCache("jq_programs")
+# JSON schema validators for object types, by object type URL, version and schema
+# expression
+object_type_schema_validators = LocalLRUCache("object_type_schema_validators")
+
+
+def compile_jq(expression: str):
+    return jq_programs.get_or_set(expression, lambda: jq.compile(expression))
+
 
 class RolOccurenceValidator:
     """
@@ -469,7 +482,7 @@ class JQExpressionValidator:
 
     def __call__(self, value: str):
         try:
-            jq.compile(value)
+            compile_jq(value)
         except ValueError:
             raise serializers.ValidationError(self.message, code=self.code)
 
@@ -505,21 +518,11 @@ class ObjectTypeOverigeDefinitieValidator:
         # now validate the schema
         url_validator = URLValidator(get_auth=get_auth)
 
-        response = url_validator(object_type_overige_definitie["url"])
-        try:
-            object_type = response.json()
-        except json.JSONDecodeError:
-            raise serializers.ValidationError(
-                {
-                    "objectTypeOverigeDefinitie.url": _(
-                        "The endpoint did not return valid JSON."
-                    )
-                },
-                code="invalid",
-            )
+        object_type_url = object_type_overige_definitie["url"]
+        object_type = self._fetch_object_type(url_validator, object_type_url)
 
-        schema_jq = jq.compile(object_type_overige_definitie["schema"])
-        record_data_jq = jq.compile(object_type_overige_definitie["object_data"])
+        schema_jq = compile_jq(object_type_overige_definitie["schema"])
+        record_data_jq = compile_jq(object_type_overige_definitie["object_data"])
 
         try:
             json_schema_definition = schema_jq.input(object_type).first()
@@ -560,14 +563,59 @@ class ObjectTypeOverigeDefinitieValidator:
             )
 
         # validate the schema
+        schema_validator = self._get_schema_validator(
+            (
+                object_type_url,
+                object_type.get("version") if isinstance(object_type, dict) else None,
+                object_type_overige_definitie["schema"],
+            ),
+            json_schema_definition,
+        )
         try:
-            jsonschema.validate(instance=object_data, schema=json_schema_definition)
+            schema_validator.validate(object_data)
         except jsonschema.ValidationError:
             raise serializers.ValidationError(
                 {"object": _("The object data does not match the specified schema.")},
                 code="invalid-schema",
             )
 
+    @staticmethod
+    def _fetch_object_type(url_validator: URLValidator, url: str):
+        cache = RemoteObjectsCache.for_url(url)
+        cached = cache.get(url) if cache else None
+        if cached and cache.is_fresh(cached):
+            remote_objects_cache_counter.add(1, {"result": "hit"})
+            return cached["data"]
+
+        response = url_validator(url)
+        try:
+            object_type = response.json()
+        except json.JSONDecodeError:
+            raise serializers.ValidationError(
+                {
+                    "objectTypeOverigeDefinitie.url": _(
+                        "The endpoint did not return valid JSON."
+                    )
+                },
+                code="invalid",
+            )
+
+        if cache:
+            remote_objects_cache_counter.add(1, {"result": "miss"})
+            cache.set(url, object_type, response)
+        return object_type
+
+    @staticmethod
+    def _get_schema_validator(key: tuple, schema: dict):
+        validator = object_type_schema_validators.get(key)
+        # draft object type versions can still be changed
+        if validator is None or validator.schema != schema:
+            validator_class = jsonschema.validators.validator_for(schema)
+            validator_class.check_schema(schema)
+            validator = validator_class(schema)
+            object_type_schema_validators.set(key, validator)
+        return validator
+
 
 class StatusRolValidator:
     code = "zaak-mismatch"
@@ -601,17 +649,29 @@ class ZaakArchiefStatusValidator:
             raise serializers.ValidationError(self.message, code=self.code)
 
 
-def match_eigenschap_specificatie(spec, value: str) -> bool:
+def _matches_datetime_format(value: str, format: str) -> bool:
+    try:
+        datetime.strptime(value, format)
+    except ValueError:
+        return False
+    else:
+        return True
+
+
+def compile_eigenschap_specificatie(spec) -> Callable[[str], bool]:
     """
-    validate value against eigenschap.specificatie
-    moved to the separate function to reuse for admin validation
+    Return a function which validates values against eigenschap.specificatie.
+
+    The rules are derived from the specificatie once, so the returned function can
+    be used to validate many values.
     """
     # enum
     if spec.waardenverzameling:
-        return value in spec.waardenverzameling
+        return frozenset(spec.waardenverzameling).__contains__
 
     if spec.formaat == FormaatChoices.tekst:
-        return len(value) <= int(spec.lengte)
+        max_length = int(spec.lengte)
+        return lambda value: len(value) <= max_length
 
     if spec.formaat == FormaatChoices.getal:
         whole_length = spec.lengte.split(",")[0]
@@ -620,28 +680,26 @@ def match_eigenschap_specificatie(spec, value: str) -> bool:
             fractional_length = spec.lengte.split(",")[-1]
             regex += rf",?\d{{0,{fractional_length}}}"
 
-        match = re.fullmatch(regex, value)
-        return bool(match)
+        pattern = re.compile(regex)
+        return lambda value: pattern.fullmatch(value) is not None
 
     if spec.formaat == FormaatChoices.datum:
         # according ZGW standard datum should be in 'jjjjmmdd' format
-        try:
-            datetime.strptime(value, "%Y%m%d")
-        except ValueError:
-            return False
-        else:
-            return True
+        return partial(_matches_datetime_format, format="%Y%m%d")
 
     if spec.formaat == FormaatChoices.datum_tijd:
         # according ZGW standard datum/tijd should be in 'jjjjmmdduummss' format
-        try:
-            datetime.strptime(value, "%Y%m%d%H%M%S")
-        except ValueError:
-            return False
-        else:
-            return True
+        return partial(_matches_datetime_format, format="%Y%m%d%H%M%S")
+
+    return lambda value: True
 
-    return True
+
+def match_eigenschap_specificatie(spec, value: str) -> bool:
+    """
+    validate value against eigenschap.specificatie
+    moved to the separate function to reuse for admin validation
+    """
+    return compile_eigenschap_specificatie(spec)(value)
 
 
 class ZaakEigenschapValueValidator:
@@ -6,7 +6,9 @@ from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 from django.db import models, transaction
 from django.db.models import Q
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils.http import content_disposition_header
 from django.utils.translation import gettext_lazy as _
 
 import structlog
@@ -20,11 +22,6 @@ from drf_spectacular.utils import (
     extend_schema,
     extend_schema_view,
 )
-from notifications_api_common.tasks import send_notification
-from notifications_api_common.viewsets import (
-    NotificationCreateMixin,
-    NotificationViewSetMixin,
-)
 from rest_framework import mixins, serializers, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.exceptions import PermissionDenied, ValidationError
@@ -38,9 +35,8 @@ from vng_api_common.audittrails.viewsets import (
     AuditTrailMixin,
     AuditTrailViewsetMixin,
 )
-from vng_api_common.caching import conditional_retrieve
 from vng_api_common.client import to_internal_data
-from vng_api_common.constants import CommonResourceAction
+from vng_api_common.constants import CommonResourceAction, ComponentTypes
 from vng_api_common.filters_backend import Backend
 from vng_api_common.geo import GeoMixin
 from vng_api_common.notes.api.viewsets import NotitieViewSetMixin
@@ -54,29 +50,41 @@ from openzaak.components.zaken.metrics import (
     zaken_delete_counter,
     zaken_update_counter,
 )
-from openzaak.notifications.viewsets import MultipleNotificationMixin
+from openzaak.notifications.outbox import (
+    send_notification_on_commit,
+    send_notifications_on_commit,
+)
+from openzaak.notifications.viewsets import (
+    MultipleNotificationMixin,
+    NotificationCreateMixin,
+    NotificationViewSetMixin,
+)
 from openzaak.utils import get_loose_fk_object_url
 from openzaak.utils.api import (
     delete_remote_objectcontactmoment,
     delete_remote_objectverzoek,
     delete_remote_oio,
 )
+from openzaak.utils.caching import conditional_retrieve
 from openzaak.utils.cloudevents import get_url, process_cloudevent
 from openzaak.utils.data_filtering import ListFilterByAuthorizationsMixin
+from openzaak.utils.gis import simplify
 from openzaak.utils.help_text import mark_experimental
 from openzaak.utils.mixins import (
     CacheQuerysetMixin,
     ExpandMixin,
 )
-from openzaak.utils.pagination import OptimizedPagination
+from openzaak.utils.pagination import OptimizedCursorPagination, OptimizedPagination
 from openzaak.utils.permissions import AuthRequired
+from openzaak.utils.renderers import CSVRenderer, NDJSONRenderer
 from openzaak.utils.schema import (
     COMMON_ERROR_RESPONSES,
     PRECONDITION_ERROR_RESPONSES,
     VALIDATION_ERROR_RESPONSES,
 )
-from openzaak.utils.views import AuditTrailViewSet
+from openzaak.utils.views import AuditTrailViewSet, BulkAuditTrailMixin
 
+from ..export import export_zaken
 from ..models import (
     KlantContact,
     RelevanteZaakRelatie,
@@ -99,6 +107,7 @@ from .audits import AUDIT_ZRC
 from .cloudevents import (
     ZAAK_AFGESLOTEN,
     ZAAK_BIJGEWERKT,
+    ZAAK_GEMUTEERD,
     ZAAK_GEOPEND,
     ZAAK_GEREGISTREERD,
     ZAAK_OPGESCHORT,
@@ -143,9 +152,12 @@ from .serializers import (
     RolSerializer,
     StatusSerializer,
     SubStatusSerializer,
+    ZaakAanvullenSerializer,
     ZaakAfsluitenSerializer,
     ZaakBesluitSerializer,
     ZaakBijwerkenSerializer,
+    ZaakClusterSerializer,
+    ZaakClusterZoekSerializer,
     ZaakContactMomentSerializer,
     ZaakEigenschapSerializer,
     ZaakInformatieObjectSerializer,
@@ -314,14 +326,8 @@ class ZaakViewSet(
             "zaakkenmerk_set",
             "resultaat",
             "zaakeigenschap_set",
-            models.Prefetch(
-                "status_set",
-                queryset=Status.objects.order_by("-datum_status_gezet"),
-                # explicitly store result on this attribute, that way we can retrieve
-                # the first status by simple list indexing, which is faster than calling
-                # `.first()`, because the latter instantiates a new queryset
-                to_attr="prefetched_statuses",
-            ),
+            # ⚡️ only the (denormalized) current status is needed, not the history
+            "_current_status",
             "rol_set",
             "zaakinformatieobject_set",
             "zaakobject_set",
@@ -333,13 +339,16 @@ class ZaakViewSet(
     search_input_serializer_class = ZaakZoekSerializer
     filter_backends = (Backend,)
     lookup_field = "uuid"
-    pagination_class = OptimizedPagination
+    pagination_class = OptimizedCursorPagination
+    filter_by_authorizations_actions = ("list", "_clusters", "_export")
 
     permission_classes = (ZaakAuthRequired,)
     required_scopes = {
         "list": SCOPE_ZAKEN_ALLES_LEZEN,
         "retrieve": SCOPE_ZAKEN_ALLES_LEZEN,
         "_zoek": SCOPE_ZAKEN_ALLES_LEZEN,
+        "_clusters": SCOPE_ZAKEN_ALLES_LEZEN,
+        "_export": SCOPE_ZAKEN_ALLES_LEZEN,
         "create": SCOPE_ZAKEN_CREATE,
         "update": SCOPE_ZAKEN_BIJWERKEN | SCOPE_ZAKEN_GEFORCEERD_BIJWERKEN,
         "partial_update": SCOPE_ZAKEN_BIJWERKEN | SCOPE_ZAKEN_GEFORCEERD_BIJWERKEN,
@@ -361,7 +370,7 @@ class ZaakViewSet(
             # of queries will be the same.
             qs = qs.prefetch_related(None)
 
-        if action not in ["list", "detail", "_zoek"]:
+        if action not in ["list", "detail", "_zoek", "_clusters", "_export"]:
             # Catalogus is only relevant for notifications (to include the `zaaktype.catalogus`)
             # kenmerk. The read operations are slightly slower if we include this `select_related`
             # on the base queryset, because it adds an extra join
@@ -401,17 +410,112 @@ class ZaakViewSet(
             raise serializers.ValidationError({api_settings.NON_FIELD_ERRORS_KEY: err})
 
         search_input = self.get_search_input()
-        queryset = self.filter_queryset(self.get_queryset())
+        zoomniveau = search_input.pop("zoomniveau", None)
+        queryset = self._filter_search_input(
+            self.filter_queryset(self.get_queryset()), search_input
+        )
 
+        if zoomniveau is not None:
+            queryset = simplify(queryset, "zaakgeometrie", zoomniveau)
+
+        return self.get_search_output(queryset)
+
+    _zoek.is_search_action = True
+
+    @staticmethod
+    def _filter_search_input(queryset, search_input: dict):
         for name, value in search_input.items():
             if name == "zaakgeometrie":
                 queryset = queryset.filter(zaakgeometrie__within=value["within"])
             else:
                 queryset = queryset.filter(**{name: value})
+        return queryset
 
-        return self.get_search_output(queryset)
+    @extend_schema(
+        "zaak__clusters",
+        summary="Tel de ZAAKen per rastercel binnen een gebied.",
+        description=mark_experimental(
+            "Verdeel het gebied (`bbox`) in een raster van `raster` x `raster` cellen "
+            "en tel per cel het aantal ZAAKen met een `zaakgeometrie` in die cel. "
+            "Alleen cellen met ZAAKen worden teruggegeven. Hiermee kunnen kaarten "
+            "markeringen tonen zonder alle ZAAKen op te vragen. De filters van de "
+            "`_zoek` operatie, behalve `zoomniveau`, kunnen ook hier gebruikt "
+            "worden."
+        ),
+        responses={
+            status.HTTP_200_OK: ZaakClusterSerializer(many=True),
+            **VALIDATION_ERROR_RESPONSES,
+            **COMMON_ERROR_RESPONSES,
+            **PRECONDITION_ERROR_RESPONSES,
+        },
+    )
+    @action(methods=("post",), detail=False, name="zaak__clusters")
+    def _clusters(self, request, *args, **kwargs):
+        search_input = self.get_search_input()
+        bbox = search_input.pop("bbox")
+        raster = search_input.pop("raster")
+        queryset = self._filter_search_input(
+            self.filter_queryset(self.get_queryset()), search_input
+        )
 
-    _zoek.is_search_action = True
+        clusters = queryset.clusters(bbox, raster)
+        serializer = ZaakClusterSerializer(clusters, many=True)
+        return Response(serializer.data)
+
+    _clusters.is_search_action = True
+
+    def get_search_input_serializer_class(self):
+        if self.action == "_clusters":
+            return ZaakClusterZoekSerializer
+        return super().get_search_input_serializer_class()
+
+    @extend_schema(
+        "zaak_export",
+        summary="Alle ZAAKen exporteren.",
+        description=mark_experimental(
+            "Exporteer alle ZAAKen in één keer, zonder paginering, als NDJSON "
+            "(`Accept: application/x-ndjson`) of CSV (`Accept: text/csv`). Hiervoor "
+            "kunnen dezelfde query parameters gebruikt worden als bij het opvragen "
+            "van alle ZAAKen. Per ZAAK wordt een beperkte set attributen "
+            "geëxporteerd."
+        ),
+        responses={
+            (status.HTTP_200_OK, NDJSONRenderer.media_type): OpenApiResponse(
+                description="Eén ZAAK per regel, als JSON",
+                response=OpenApiTypes.STR,
+            ),
+            (status.HTTP_200_OK, CSVRenderer.media_type): OpenApiResponse(
+                description="Eén ZAAK per regel, na een regel met de kolomnamen",
+                response=OpenApiTypes.STR,
+            ),
+            **VALIDATION_ERROR_RESPONSES,
+            **COMMON_ERROR_RESPONSES,
+            **PRECONDITION_ERROR_RESPONSES,
+        },
+    )
+    @action(methods=("get",), detail=False, name="zaak_export")
+    def _export(self, request, *args, **kwargs):
+        self._check_query_params(request)
+        # ⚡️ start from the plain zaken instead of the queryset of the list, which
+        # can't be streamed because of the ``DISTINCT`` and the prefetches
+        queryset = self.filter_queryset(
+            self.filter_by_authorizations(Zaak.objects.all())
+        )
+
+        renderer = request.accepted_renderer
+        response = StreamingHttpResponse(
+            export_zaken(queryset, renderer.format, request),
+            content_type=f"{renderer.media_type}; charset=utf-8",
+        )
+        response["Content-Disposition"] = content_disposition_header(
+            as_attachment=True, filename=f"zaken.{renderer.format}"
+        )
+        return response
+
+    def get_renderers(self):
+        if self.action == "_export":
+            return [NDJSONRenderer(), CSVRenderer()]
+        return super().get_renderers()
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
@@ -940,11 +1044,9 @@ class ZaakInformatieObjectViewSet(
     Opvragen en bewerken van ZAAK-INFORMATIEOBJECT relaties.
     """
 
-    queryset = (
-        ZaakInformatieObject.objects.select_related("zaak", "_informatieobject")
-        .prefetch_related("_informatieobject__enkelvoudiginformatieobject_set")
-        .order_by("-pk")
-    )
+    queryset = ZaakInformatieObject.objects.select_related(
+        "zaak", "_informatieobject__latest_version"
+    ).order_by("-pk")
     filterset_class = ZaakInformatieObjectFilter
     serializer_class = ZaakInformatieObjectSerializer
     lookup_field = "uuid"
@@ -2457,7 +2559,7 @@ class ZaakBijwerkenViewset(
                 model=config["model"],
                 action=action,
             )
-            transaction.on_commit(lambda msg=message: send_notification.delay(msg))
+            send_notification_on_commit(message)
 
         config = self.notification_fields["rollen"]
 
@@ -2548,3 +2650,204 @@ class ZaakAfsluitenViewSet(ZaakUpdateActionViewSet):
             basename="resultaat",
             main_object=serializer.data["zaak"]["url"],
         )
+
+
+@extend_schema_view(
+    post=extend_schema(
+        "zaakaanvullen",
+        summary="Vul een zaak aan",
+        description=mark_experimental(
+            "Maak in één keer meerdere rollen, zaakobjecten, zaakeigenschappen en "
+            "statussen aan bij een zaak. Alle resources worden in één transactie "
+            "aangemaakt: als één van de resources ongeldig is, wordt er niets "
+            "aangemaakt."
+            "\n\n"
+            "De resources worden op dezelfde manier gevalideerd als bij het "
+            "afzonderlijk aanmaken, in de volgorde rollen, zaakobjecten, "
+            "zaakeigenschappen en statussen. Het attribuut ``zaak`` hoeft niet "
+            "meegegeven te worden."
+        ),
+        responses={
+            status.HTTP_201_CREATED: ZaakAanvullenSerializer,
+            **VALIDATION_ERROR_RESPONSES,
+            **COMMON_ERROR_RESPONSES,
+        },
+    )
+)
+class ZaakAanvullenViewSet(
+    MultipleNotificationMixin, BulkAuditTrailMixin, ClosedZaakMixin, viewsets.ViewSet
+):
+    """
+    Create many sub-resources of a zaak with a single request.
+
+    Compared to separate requests, the zaak is only loaded and authorized once, the
+    zaakeigenschappen are inserted with a single query and the audit trails and
+    notifications are written at once.
+    """
+
+    serializer_class = ZaakAanvullenSerializer
+    permission_classes = (ZaakActionAuthRequired,)
+    required_scopes = {"post": SCOPE_ZAKEN_BIJWERKEN | SCOPE_ZAKEN_GEFORCEERD_BIJWERKEN}
+
+    viewset_classes = {
+        "zaak": "openzaak.components.zaken.api.viewsets.ZaakViewSet",
+    }
+    actions = {"zaak": "partial_update"}
+
+    notification_fields = {
+        "rollen": {
+            "notifications_kanaal": KANAAL_ZAKEN,
+            "model": Rol,
+            "action": "create",
+        },
+        "zaakobjecten": {
+            "notifications_kanaal": KANAAL_ZAKEN,
+            "model": ZaakObject,
+            "action": "create",
+        },
+        "zaakeigenschappen": {
+            "notifications_kanaal": KANAAL_ZAKEN,
+            "model": ZaakEigenschap,
+            "action": "create",
+        },
+        "statussen": {
+            "notifications_kanaal": KANAAL_ZAKEN,
+            "model": Status,
+            "action": "create",
+        },
+    }
+
+    def get_object(self, uuid):
+        obj = get_object_or_404(Zaak.objects.select_related("_zaaktype"), uuid=uuid)
+
+        self.check_object_permissions(self.request, obj)
+
+        return obj
+
+    def _has_status_auth(self, scopes) -> bool:
+        return self.request.jwt_auth.has_auth(
+            scopes=scopes,
+            zaaktype=self._zaak_data["zaaktype"],
+            vertrouwelijkheidaanduiding=self._zaak_data["vertrouwelijkheidaanduiding"],
+            component=ComponentTypes.zrc,
+        )
+
+    def _pre_post(self, instance: Zaak, validated_data: dict) -> None:
+        self._zaak_data = ZaakSerializer(
+            instance, context={"request": self.request}
+        ).data
+
+        if any(
+            validated_data.get(field)
+            for field in ("rollen", "zaakobjecten", "zaakeigenschappen")
+        ):
+            self._check_zaak_closed(instance)
+
+        if validated_data.get("statussen") and not self._has_status_auth(
+            StatusViewSet.required_scopes["create"]
+        ):
+            raise PermissionDenied()
+
+    def check_status_permissions(self, zaak: Zaak) -> None:
+        """
+        Check the scopes to create a status, see :meth:`StatusViewSet.perform_create`.
+
+        Called before every status is created, since earlier statussen of the same
+        request can close the zaak.
+        """
+        if not self._has_status_auth(
+            SCOPE_STATUSSEN_TOEVOEGEN | SCOPEN_ZAKEN_HEROPENEN
+        ):
+            if zaak.status_set.exists():
+                msg = _("Met de '{}' scope mag je slechts 1 status zetten").format(
+                    SCOPE_ZAKEN_CREATE
+                )
+                raise PermissionDenied(detail=msg)
+
+        if zaak.is_closed and not self._has_status_auth(SCOPEN_ZAKEN_HEROPENEN):
+            msg = _(
+                "Het heropenen van een gesloten zaak is niet toegestaan zonder de scope {}"
+            ).format(SCOPEN_ZAKEN_HEROPENEN)
+            raise PermissionDenied(detail=msg)
+
+    @transaction.atomic
+    def post(self, request, uuid=None, *args, **kwargs):
+        instance = self.get_object(uuid)
+
+        serializer = self.serializer_class(
+            data=request.data,
+            context={"request": request, "view": self},
+            instance=instance,
+        )
+        serializer.is_valid(raise_exception=True)
+
+        self._pre_post(instance, serializer.validated_data)
+        self.perform_post(serializer)
+
+        response = Response(serializer.data, status=status.HTTP_201_CREATED)
+
+        self._create_audit_logs(response, serializer)
+        self.notify(response.status_code, response.data)
+        return response
+
+    def perform_post(self, serializer):
+        data = serializer.save()
+        zaak = serializer.instance
+
+        logger.info(
+            "zaak_aangevuld",
+            zaak_url=self._zaak_data["url"],
+            rollen=len(data["rollen"]),
+            zaakobjecten=len(data["zaakobjecten"]),
+            zaakeigenschappen=len(data["zaakeigenschappen"]),
+            statussen=len(data["statussen"]),
+        )
+
+        if data["statussen"]:
+            send_zaak_cloudevent(ZAAK_GEMUTEERD, zaak, self.request)
+
+    def _create_audit_logs(self, response, serializer):
+        for field, config in self.notification_fields.items():
+            versions = [
+                (None, data, instance.unique_representation())
+                for data, instance in zip(
+                    serializer.data[field], serializer.instance[field]
+                )
+            ]
+            if not versions:
+                continue
+
+            self.create_audittrails(
+                response.status_code,
+                CommonResourceAction.create,
+                versions,
+                audit=AUDIT_ZRC,
+                basename=config["model"]._meta.model_name,
+                main_object=self._zaak_data["url"],
+            )
+
+    def _message(self, data, instance=None):
+        """
+        Construct the notifications of all created resources.
+
+        All resources belong to the same zaak, so the main object and the kenmerken
+        are only determined once.
+        """
+        messages = []
+        for field, config in self.notification_fields.items():
+            for resource in data[field]:
+                if not messages:
+                    message = self.construct_message(
+                        resource,
+                        kanaal=config["notifications_kanaal"],
+                        model=config["model"],
+                        action=config["action"],
+                    )
+                else:
+                    message = messages[0] | {
+                        "resource": config["model"]._meta.model_name,
+                        "resourceUrl": resource["url"],
+                    }
+                messages.append(message)
+
+        send_notifications_on_commit(messages)
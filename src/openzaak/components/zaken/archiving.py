@@ -1,10 +1,23 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
+from collections.abc import Iterator
+from dataclasses import dataclass
 from datetime import date, datetime, time
 
-from openzaak.components.zaken.models import Zaak
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models, transaction
+
+from vng_api_common.caching.etags import EtagUpdate
+from vng_api_common.constants import (
+    BrondatumArchiefprocedureAfleidingswijze as Afleidingswijze,
+)
+
+from openzaak.components.catalogi.models import ResultaatType
+from openzaak.components.zaken.models import Zaak, ZaakEigenschap, ZaakObject
 from openzaak.utils.exceptions import DetermineProcessEndDateException
 
+ARCHIVING_FIELDS = ("archiefactiedatum", "startdatum_bewaartermijn", "archiefnominatie")
+
 
 def calculate_archiving_data(
     zaak: Zaak,
@@ -50,3 +63,115 @@ def try_calculate_archiving(zaak, *, force=False):
         setattr(zaak, field, value)
 
     zaak.save(update_fields=list(data.keys()))
+
+
+@dataclass
+class ArchivingChange:
+    zaak: Zaak
+    old: dict[str, str | date | None]
+    new: dict[str, str | date | None]
+
+
+def get_archiving_prefetches(resultaattype: ResultaatType) -> list:
+    """
+    Return the prefetches of the data that is used to determine the brondatum of the
+    zaken of the resultaattype, see :func:`openzaak.components.zaken.brondatum.get_brondatum`.
+    """
+    procedure = resultaattype.brondatum_archiefprocedure
+    afleidingswijze = procedure["afleidingswijze"]
+
+    if afleidingswijze == Afleidingswijze.eigenschap:
+        eigenschappen = ZaakEigenschap.objects.filter(
+            _naam=procedure["datumkenmerk"]
+        ).order_by("pk")
+        return [models.Prefetch("zaakeigenschap_set", queryset=eigenschappen)]
+
+    if afleidingswijze == Afleidingswijze.zaakobject:
+        objecttype = procedure["objecttype"]
+        zaakobjecten = ZaakObject.objects.filter(object_type=objecttype)
+        try:
+            local_object = ZaakObject._meta.get_field(objecttype.replace("_", ""))
+        except FieldDoesNotExist:
+            pass
+        else:
+            zaakobjecten = zaakobjecten.select_related(local_object.name)
+        return [models.Prefetch("zaakobject_set", queryset=zaakobjecten)]
+
+    if afleidingswijze in (
+        Afleidingswijze.ingangsdatum_besluit,
+        Afleidingswijze.vervaldatum_besluit,
+    ):
+        return ["besluit_set"]
+
+    return []
+
+
+def recalculate_archiving(
+    zaken: models.QuerySet,
+    *,
+    force: bool = False,
+    dry_run: bool = False,
+    chunk_size: int = 500,
+) -> Iterator[ArchivingChange]:
+    """
+    Recalculate the archiving data of closed zaken, for example after the archiving
+    rules of their resultaattypen or the procestermijn changed.
+
+    The zaken are processed per resultaattype, so the data required for its
+    afleidingswijze is prefetched for a chunk of zaken at once. The changed zaken of
+    a chunk are written with a single query, unless ``dry_run`` is set.
+
+    Zaken with a resultaattype from an external Catalogi API are skipped.
+
+    :return: the changes, per chunk after they have been written.
+    """
+    zaken = zaken.filter(
+        einddatum__isnull=False, resultaat___resultaattype__isnull=False
+    )
+    resultaattypen = ResultaatType.objects.filter(
+        pk__in=zaken.values("resultaat___resultaattype")
+    ).order_by("pk")
+
+    for resultaattype in resultaattypen:
+        pks = (
+            zaken.filter(resultaat___resultaattype=resultaattype)
+            .order_by("pk")
+            .values_list("pk", flat=True)
+        )
+        queryset = (
+            Zaak.objects.select_related("hoofdzaak", "resultaat")
+            .prefetch_related(*get_archiving_prefetches(resultaattype))
+            .order_by("pk")
+        )
+
+        last_pk = 0
+        while batch := list(pks.filter(pk__gt=last_pk)[:chunk_size]):
+            last_pk = batch[-1]
+
+            changes = []
+            for zaak in queryset.filter(pk__in=batch):
+                # the resultaattype is the same for all zaken
+                zaak.resultaat._resultaattype = resultaattype
+
+                data = calculate_archiving_data(zaak, force=force)
+                old = {field: getattr(zaak, field) for field in data}
+                if data != old:
+                    changes.append(ArchivingChange(zaak=zaak, old=old, new=data))
+
+            if changes and not dry_run:
+                _save_changes(changes)
+            yield from changes
+
+
+@transaction.atomic
+def _save_changes(changes: list[ArchivingChange]) -> None:
+    for change in changes:
+        for field, value in change.new.items():
+            setattr(change.zaak, field, value)
+
+    zaken = [change.zaak for change in changes]
+    Zaak.objects.bulk_update(zaken, ARCHIVING_FIELDS)
+
+    # bulk_update doesn't send the signals which mark the ETags as outdated
+    for zaak in zaken:
+        EtagUpdate.mark_affected(zaak)
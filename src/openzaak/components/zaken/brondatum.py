@@ -107,7 +107,13 @@ def get_brondatum(
                 )
             )
 
-        eigenschap = zaak.zaakeigenschap_set.filter(_naam=datum_kenmerk).first()
+        eigenschappen = _get_prefetched(zaak, "zaakeigenschap_set")
+        if eigenschappen is not None:
+            eigenschap = next(
+                (e for e in eigenschappen if e._naam == datum_kenmerk), None
+            )
+        else:
+            eigenschap = zaak.zaakeigenschap_set.filter(_naam=datum_kenmerk).first()
 
         if not eigenschap or not eigenschap.waarde:
             return None
@@ -143,8 +149,14 @@ def get_brondatum(
 
         # Nested `datumkenmerk` can be specified with `/`
         datum_kenmerk_path = Path(*datum_kenmerk.split("/"))
+        zaak_objects = _get_prefetched(zaak, "zaakobject_set")
+        if zaak_objects is not None:
+            zaak_objects = [zo for zo in zaak_objects if zo.object_type == objecttype]
+        else:
+            zaak_objects = zaak.zaakobject_set.filter(object_type=objecttype)
+
         dates = []
-        for zaak_object in zaak.zaakobject_set.filter(object_type=objecttype):
+        for zaak_object in zaak_objects:
             if zaak_object.object:
                 remote_object = zaak_object._get_object()
                 value = glom(remote_object, datum_kenmerk_path, default=None)
@@ -232,6 +244,9 @@ def get_brondatum(
                 _("Geen besluiten aan zaak gekoppeld om brondatum uit af te leiden.")
             )
 
+        if (besluiten := _get_prefetched(zaak, "besluit_set")) is not None:
+            return max_with_none(*(besluit.ingangsdatum for besluit in besluiten))
+
         max_ingangsdatum = zaakbesluiten.aggregate(Max("ingangsdatum"))[
             "ingangsdatum__max"
         ]
@@ -244,6 +259,9 @@ def get_brondatum(
         if not zaakbesluiten.exists():
             return None
 
+        if (besluiten := _get_prefetched(zaak, "besluit_set")) is not None:
+            return max_with_none(*(besluit.vervaldatum for besluit in besluiten))
+
         max_vervaldatum = zaakbesluiten.aggregate(Max("vervaldatum"))[
             "vervaldatum__max"
         ]
@@ -255,5 +273,15 @@ def get_brondatum(
     raise ValueError(f'Onbekende "Afleidingswijze": {afleidingswijze}')
 
 
+def _get_prefetched(zaak: Zaak, name: str) -> list | None:
+    """
+    Return the related objects of the zaak if they were prefetched, see
+    :func:`openzaak.components.zaken.archiving.recalculate_archiving`.
+    """
+    if name not in getattr(zaak, "_prefetched_objects_cache", {}):
+        return None
+    return list(getattr(zaak, name).all())
+
+
 def max_with_none(*args):
     return max(filter(lambda x: x is not None, args)) if any(args) else None
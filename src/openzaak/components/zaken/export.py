@@ -0,0 +1,155 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+"""
+Stream (large amounts of) zaken as NDJSON or CSV.
+
+The zaken are read with a server-side cursor and only the exported columns are
+selected, so memory usage does not depend on the amount of zaken. The URLs of the
+related resources are built from the selected UUIDs instead of serializing the
+related objects.
+"""
+
+import csv
+import json
+from typing import Iterator, Optional
+from urllib.parse import urljoin
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import QuerySet
+from django.http import HttpRequest
+from django.urls import reverse
+
+from vng_api_common.utils import underscore_to_camel
+
+from openzaak.utils import build_absolute_url
+
+from .models import Zaak
+
+EXPORT_FIELDS = (
+    "url",
+    "uuid",
+    "identificatie",
+    "bronorganisatie",
+    "omschrijving",
+    "zaaktype",
+    "registratiedatum",
+    "verantwoordelijke_organisatie",
+    "startdatum",
+    "einddatum",
+    "einddatum_gepland",
+    "uiterlijke_einddatum_afdoening",
+    "publicatiedatum",
+    "vertrouwelijkheidaanduiding",
+    "status",
+    "archiefnominatie",
+    "archiefstatus",
+    "archiefactiedatum",
+)
+
+# columns that are exported as is
+_COLUMNS = [
+    field for field in EXPORT_FIELDS if field not in ("url", "zaaktype", "status")
+]
+
+_PLACEHOLDER = "00000000-0000-0000-0000-000000000000"
+
+
+class ExportFormats:
+    ndjson = "ndjson"
+    csv = "csv"
+
+
+def _get_url_template(viewname: str, request: Optional[HttpRequest]) -> str:
+    path = reverse(
+        viewname,
+        kwargs={
+            "version": settings.REST_FRAMEWORK["DEFAULT_VERSION"],
+            "uuid": _PLACEHOLDER,
+        },
+    )
+    return build_absolute_url(path, request)
+
+
+def iter_zaken(
+    queryset: QuerySet[Zaak], request: Optional[HttpRequest] = None
+) -> Iterator[dict]:
+    """
+    Yield the exported fields of the zaken, in the order of their primary key.
+    """
+    # ⚡️ reverse the URLs once instead of for every zaak
+    zaak_url = _get_url_template("zaak-detail", request)
+    zaaktype_url = _get_url_template("zaaktype-detail", request)
+    status_url = _get_url_template("status-detail", request)
+
+    rows = (
+        queryset.order_by("pk")
+        .values(
+            *_COLUMNS,
+            "_zaaktype__uuid",
+            "_zaaktype_base_url__api_root",
+            "_zaaktype_relative_url",
+            "_current_status__uuid",
+        )
+        .iterator(chunk_size=settings.ZAKEN_EXPORT_CHUNK_SIZE)
+    )
+    for row in rows:
+        zaaktype_uuid = row.pop("_zaaktype__uuid")
+        api_root = row.pop("_zaaktype_base_url__api_root")
+        relative_url = row.pop("_zaaktype_relative_url")
+        status_uuid = row.pop("_current_status__uuid")
+
+        if zaaktype_uuid:
+            zaaktype = zaaktype_url.replace(_PLACEHOLDER, str(zaaktype_uuid))
+        else:
+            zaaktype = urljoin(api_root, relative_url)
+
+        yield {
+            "url": zaak_url.replace(_PLACEHOLDER, str(row["uuid"])),
+            **row,
+            "zaaktype": zaaktype,
+            "status": (
+                status_url.replace(_PLACEHOLDER, str(status_uuid))
+                if status_uuid
+                else None
+            ),
+        }
+
+
+class _Echo:
+    """
+    File-like object that returns the written value instead of buffering it.
+    """
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def render_ndjson(zaken: Iterator[dict]) -> Iterator[str]:
+    keys = {field: underscore_to_camel(field) for field in EXPORT_FIELDS}
+    for zaak in zaken:
+        data = {keys[field]: zaak[field] for field in EXPORT_FIELDS}
+        yield json.dumps(data, cls=DjangoJSONEncoder) + "\n"
+
+
+def render_csv(zaken: Iterator[dict]) -> Iterator[str]:
+    writer = csv.writer(_Echo())
+    yield writer.writerow([underscore_to_camel(field) for field in EXPORT_FIELDS])
+    for zaak in zaken:
+        yield writer.writerow(
+            ["" if zaak[field] is None else zaak[field] for field in EXPORT_FIELDS]
+        )
+
+
+RENDERERS = {
+    ExportFormats.ndjson: render_ndjson,
+    ExportFormats.csv: render_csv,
+}
+
+
+def export_zaken(
+    queryset: QuerySet[Zaak],
+    export_format: str,
+    request: Optional[HttpRequest] = None,
+) -> Iterator[str]:
+    return RENDERERS[export_format](iter_zaken(queryset, request))
@@ -0,0 +1,36 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from django.core.management import BaseCommand
+
+from openzaak.components.zaken.export import ExportFormats, export_zaken
+from openzaak.components.zaken.models import Zaak
+
+
+class Command(BaseCommand):
+    help = (
+        "Export all zaken as NDJSON or CSV, for example for nightly dumps. The URLs "
+        "in the export are built with the configured ``SITE_DOMAIN``."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--format",
+            choices=[ExportFormats.ndjson, ExportFormats.csv],
+            default=ExportFormats.ndjson,
+            help="The format of the export.",
+        )
+        parser.add_argument(
+            "--output",
+            help="The file to write the export to. Defaults to stdout.",
+        )
+
+    def handle(self, *args, **options):
+        chunks = export_zaken(Zaak.objects.all(), options["format"])
+
+        if not options["output"]:
+            for chunk in chunks:
+                self.stdout.write(chunk, ending="")
+            return
+
+        with open(options["output"], "w", newline="", encoding="utf-8") as outfile:
+            outfile.writelines(chunks)
@@ -0,0 +1,75 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from django.core.management import BaseCommand
+
+from openzaak.components.zaken.archiving import recalculate_archiving
+from openzaak.components.zaken.models import Zaak
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalculate the archiefactiedatum, startdatum bewaartermijn and "
+        "archiefnominatie of closed zaken, for example after the archiving rules of "
+        "resultaattypen or the selectielijst procestermijn changed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--resultaattype",
+            dest="resultaattypen",
+            action="append",
+            metavar="UUID",
+            help=(
+                "Only recalculate the zaken with a resultaat of this resultaattype. "
+                "Can be given multiple times."
+            ),
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help=(
+                "Also recalculate the brondatum of zaken with a startdatum "
+                "bewaartermijn, e.g. after the afleidingswijze or procestermijn "
+                "changed."
+            ),
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report the changes, without saving them.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Number of zaken that are recalculated and updated at a time.",
+        )
+
+    def handle(self, *args, **options):
+        zaken = Zaak.objects.all()
+        if options["resultaattypen"]:
+            zaken = zaken.filter(
+                resultaat___resultaattype__uuid__in=options["resultaattypen"]
+            )
+
+        changes = recalculate_archiving(
+            zaken,
+            force=options["force"],
+            dry_run=options["dry_run"],
+            chunk_size=options["chunk_size"],
+        )
+
+        total = 0
+        for change in changes:
+            total += 1
+            diff = ", ".join(
+                f"{field}: {change.old[field]} -> {value}"
+                for field, value in change.new.items()
+                if change.old[field] != value
+            )
+            self.stdout.write(f"Zaak {change.zaak.uuid}: {diff}")
+
+        if options["dry_run"]:
+            self.stdout.write(f"{total} zaken would be updated.")
+        else:
+            self.stdout.write(f"Updated the archiving data of {total} zaken.")
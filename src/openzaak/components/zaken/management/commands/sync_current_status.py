@@ -0,0 +1,39 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from django.core.management import BaseCommand
+from django.db import transaction
+
+from openzaak.components.zaken.models import Zaak
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalculate the denormalized current status of zaken, for example after "
+        "statuses were changed without triggering the signals (bulk imports, raw SQL)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of zaken that are updated per transaction.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        pks = Zaak.objects.order_by("pk").values_list("pk", flat=True)
+
+        total, last_pk = 0, 0
+        while True:
+            batch = list(pks.filter(pk__gt=last_pk)[:batch_size])
+            if not batch:
+                break
+
+            with transaction.atomic():
+                total += Zaak.objects.filter(
+                    pk__gte=batch[0], pk__lte=batch[-1]
+                ).sync_current_status()
+            last_pk = batch[-1]
+
+        self.stdout.write(f"Updated the current status of {total} zaken.")
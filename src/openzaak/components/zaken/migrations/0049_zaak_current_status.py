@@ -0,0 +1,55 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+# Generated by Django 5.2.8 on 2026-10-18 11:03
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+BACKFILL_SQL = """
+UPDATE zaken_zaak AS zaak
+SET _current_status_id = status.id, _current_statustype_id = status._statustype_id
+FROM (
+    SELECT DISTINCT ON (zaak_id) id, zaak_id, _statustype_id
+    FROM zaken_status
+    ORDER BY zaak_id, datum_status_gezet DESC, id DESC
+) AS status
+WHERE status.zaak_id = zaak.identificatie_ptr_id
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("catalogi", "0025_alter_besluittype_options"),
+        ("zaken", "0048_zaakrelatie"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="zaak",
+            name="_current_status",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                help_text="The most recent STATUS of the ZAAK.",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="zaken.status",
+            ),
+        ),
+        migrations.AddField(
+            model_name="zaak",
+            name="_current_statustype",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                help_text="The (local) STATUSTYPE of the most recent STATUS of the ZAAK, used for filtering.",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="catalogi.statustype",
+            ),
+        ),
+        migrations.RunSQL(BACKFILL_SQL, reverse_sql=migrations.RunSQL.noop),
+    ]
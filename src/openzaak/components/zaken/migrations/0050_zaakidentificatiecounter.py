@@ -0,0 +1,74 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+# Generated by Django 5.2.8 on 2026-10-18 12:14
+
+from django.db import migrations, models
+
+import vng_api_common.fields
+
+SEED_SQL = """
+INSERT INTO zaken_zaakidentificatiecounter (bronorganisatie, jaar, last_number)
+SELECT
+    bronorganisatie,
+    substring(identificatie from 6 for 4)::smallint,
+    max(substring(identificatie from 11)::bigint)
+FROM zaken_zaakidentificatie
+WHERE identificatie ~ '^ZAAK-[0-9]{4}-[0-9]{1,18}$'
+GROUP BY 1, 2
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("zaken", "0049_zaak_current_status"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ZaakIdentificatieCounter",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "bronorganisatie",
+                    vng_api_common.fields.RSINField(
+                        help_text="Het RSIN van de organisatie waarvoor de nummers worden uitgegeven.",
+                        max_length=9,
+                    ),
+                ),
+                (
+                    "jaar",
+                    models.PositiveSmallIntegerField(
+                        help_text="Het jaar waarvoor de nummers worden uitgegeven.",
+                        verbose_name="year",
+                    ),
+                ),
+                (
+                    "last_number",
+                    models.PositiveBigIntegerField(
+                        help_text="Het laatst uitgegeven volgnummer.",
+                        verbose_name="last number",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "zaak identification counter",
+                "verbose_name_plural": "zaak identification counters",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("bronorganisatie", "jaar"),
+                        name="unique_bronorganisation_year",
+                    )
+                ],
+            },
+        ),
+        migrations.RunSQL(SEED_SQL, reverse_sql=migrations.RunSQL.noop),
+    ]
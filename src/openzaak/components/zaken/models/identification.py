@@ -2,84 +2,67 @@
 # Copyright (C) 2022 Open Zaak maintainers
 from datetime import date
 
-from django.db import models
+from django.db import IntegrityError, models, transaction
 from django.utils.translation import gettext_lazy as _
 
 from vng_api_common.fields import RSINField
-from vng_api_common.utils import generate_unique_identification
 
-from openzaak.utils.db import pg_advisory_lock
+from openzaak.utils.identification import (
+    IdentificatieCounter,
+    IdentificatieCounterManager,
+    format_identificatie,
+)
 
-LOCK_ID_IDENTIFICATION_GENERATION = "generate-zaak-identification"
+__all__ = [
+    "ZaakIdentificatie",
+    "ZaakIdentificatieCounter",
+]
 
 
 class ZaakIdentificatieManager(models.Manager):
     def generate(self, organisation: str, date: date):
         """
-        Generate an identification based on existing data.
-
-        This uses a PostgreSQL-specific advisory lock, meaning that only one
-        thread/process is able to generate a new identification at a time (other
-        threads will simply wait until they acquire the lock after the running call
-        releases it when the transaction exits).
-
-        Note that this does NOT prevent other records from being read or even written
-        to the involved table, so IntegrityError can still be raised if unique
-        constraints will be violated. However, this does allow for concurrent read
-        and writes with explicit identifications to different rows that don't affect
-        the ID generation and should be a better option for performance than pessimistic
-        locking where the entire table is locked even for reading (as otherwise the view
-        of the data inside by generate_unique_identification could be stale due to new
-        inserts).
+        Generate an identification for the organisation and the year of ``date``.
         """
-        with pg_advisory_lock(LOCK_ID_IDENTIFICATION_GENERATION):
-            instance = self.model()
-            instance.dummy_date = date
-            identification = generate_unique_identification(instance, "dummy_date")
-            return self.create(
-                identificatie=identification, bronorganisatie=organisation
-            )
+        return self.generate_bulk(organisation, date, 1)[0]
 
     def generate_bulk(self, organisation: str, date: date, amount: int):
         """
         Bulk generate multiple unique identificaties.
 
-        This method uses the same PostgreSQL advisory lock to avoid race conditions
-        and ensures identificaties are unique even when called concurrently.
+        The numbers are reserved as one consecutive range from the
+        :class:`ZaakIdentificatieCounter` of the organisation and year. If one of the
+        identifications was already taken (by a client supplied identification), the
+        counter is synchronized with the existing data and a new range is reserved.
 
         :param organisation: The organisation (bronorganisatie) to use.
         :param date: The date to include in the identificatie.
         :param amount: How many identificaties to generate.
         :return: List of created ZaakIdentificatie instances.
         """
-        with pg_advisory_lock(LOCK_ID_IDENTIFICATION_GENERATION):
-            prefix = f"ZAAK-{date.year}-"
-
-            last_instance = (
-                self.filter(
-                    identificatie__startswith=prefix,
-                    bronorganisatie=organisation,
-                )
-                .order_by("-identificatie")
-                .first()
+        year = date.year
+        with transaction.atomic(using=self.db):
+            try:
+                with transaction.atomic(using=self.db):
+                    return self._create_range(organisation, year, amount)
+            except IntegrityError:
+                ZaakIdentificatieCounter.objects.synchronize(organisation, year)
+                return self._create_range(organisation, year, amount)
+
+    def _create_range(self, organisation: str, year: int, amount: int):
+        last_number = ZaakIdentificatieCounter.objects.reserve(
+            organisation, year, amount
+        )
+        instances = [
+            self.model(
+                identificatie=format_identificatie(
+                    self.model.IDENTIFICATIE_PREFIX, year, number
+                ),
+                bronorganisatie=organisation,
             )
-
-            if last_instance:
-                last_number = int(last_instance.identificatie.split("-")[-1])
-            else:
-                last_number = 0
-
-            instances = []
-            for i in range(1, amount + 1):
-                new_number = last_number + i
-                identificatie = f"{prefix}{new_number:010d}"
-                instance = self.model(
-                    identificatie=identificatie,
-                    bronorganisatie=organisation,
-                )
-                instances.append(instance)
-
-            return self.bulk_create(instances)
+            for number in range(last_number - amount + 1, last_number + 1)
+        ]
+        return self.bulk_create(instances)
 
 
 class ZaakIdentificatie(models.Model):
@@ -111,8 +94,6 @@ class ZaakIdentificatie(models.Model):
     objects = ZaakIdentificatieManager()
     IDENTIFICATIE_PREFIX = "ZAAK"
 
-    dummy_date = None
-
     class Meta:
         verbose_name = _("zaak identification")
         verbose_name_plural = _("zaak identifications")
@@ -131,3 +112,18 @@ class ZaakIdentificatie(models.Model):
             identification=self.identificatie,
             organisation=self.bronorganisatie,
         )
+
+
+class ZaakIdentificatieCounter(IdentificatieCounter):
+    objects = IdentificatieCounterManager("zaken.ZaakIdentificatie")
+    IDENTIFICATIE_PREFIX = ZaakIdentificatie.IDENTIFICATIE_PREFIX
+
+    class Meta:
+        verbose_name = _("zaak identification counter")
+        verbose_name_plural = _("zaak identification counters")
+        constraints = [
+            models.UniqueConstraint(
+                fields=("bronorganisatie", "jaar"),
+                name="unique_bronorganisation_year",
+            ),
+        ]
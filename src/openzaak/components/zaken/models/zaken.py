@@ -464,6 +464,30 @@ class Zaak(ETagMixin, AuditTrailMixin, APIMixin, ZaakIdentificatie):
         auto_now_add=True,
     )
 
+    # ⚡️ denormalized from the statuses, maintained by the signal receivers in
+    # :mod:`openzaak.components.zaken.signals`
+    _current_status = models.ForeignKey(
+        "zaken.Status",
+        on_delete=models.SET_NULL,
+        related_name="+",
+        null=True,
+        blank=True,
+        editable=False,
+        help_text=_("The most recent STATUS of the ZAAK."),
+    )
+    _current_statustype = models.ForeignKey(
+        "catalogi.StatusType",
+        on_delete=models.SET_NULL,
+        related_name="+",
+        null=True,
+        blank=True,
+        editable=False,
+        help_text=_(
+            "The (local) STATUSTYPE of the most recent STATUS of the ZAAK, used for "
+            "filtering."
+        ),
+    )
+
     #
     # EXPERIMENTAL FIELDS
     #
@@ -524,21 +548,26 @@ class Zaak(ETagMixin, AuditTrailMixin, APIMixin, ZaakIdentificatie):
         if self.opschorting_indicatie:
             self.opschorting_eerdere_opschorting = True
 
+        # the current status is only written by the status signal receivers, so a
+        # stale instance can't overwrite it
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            excluded = {"_current_status", "_current_statustype"}
+            excluded.update(self.get_deferred_fields())
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.name not in excluded
+                and field.attname not in excluded
+            ]
+
         super().save(*args, **kwargs)
 
     @property
     def current_status_uuid(self):
-        # .first() is used instead of .last because:
-        #
-        # * the viewset prefetches the statuses for each zaak and orders them
-        #   descending on datum_status_gezet
-        # * using .last() calls .reverse, which invalidates the prefetch cache.
-        #
-        # The Status.Meta is also set to order by descending datum_status_gezet so that
-        # this code works correctly even when not doing prefetches.
         if hasattr(self, "_current_status_uuid"):
             return self._current_status_uuid
-        status = self.status_set.first()
+        status = self.current_status
         return status.uuid if status else None
 
     @current_status_uuid.setter
@@ -547,16 +576,8 @@ class Zaak(ETagMixin, AuditTrailMixin, APIMixin, ZaakIdentificatie):
 
     @property
     def current_status(self):
-        # The viewset prefetches the statuses and stores them on the instances,
-        # for performance reasons we simply grab the first status from there if possible
-        # instead of using `.first()`, because the latter constructs a queryset
-        # (which causes more overhead)
-        if hasattr(self, "prefetched_statuses"):
-            # Statuses were prefetched, but Zaak has no statuses yet
-            if not self.prefetched_statuses:
-                return None
-            return self.prefetched_statuses[0]
-        return self.status_set.first()
+        # ⚡️ the viewset prefetches the current status instead of all statuses
+        return self._current_status
 
     @property
     def is_closed(self) -> bool:
@@ -802,7 +823,7 @@ class Status(ETagMixin, APIMixin, models.Model):
         if hasattr(self, "max_datum_status_gezet"):
             return self.max_datum_status_gezet == self.datum_status_gezet
 
-        return self.zaak.current_status_uuid == self.uuid
+        return self.zaak._current_status_id == self.pk
 
 
 class SubStatus(models.Model):
@@ -2,6 +2,12 @@
 # Copyright (C) 2019 - 2020 Dimpact
 from typing import Dict, Tuple
 
+from django.contrib.gis.db.models.functions import (
+    ClosestPoint,
+    PointOnSurface,
+    SnapToGrid,
+)
+from django.contrib.gis.geos import Point, Polygon
 from django.db import models
 
 from django_loose_fk.virtual_models import ProxyMixin
@@ -41,7 +47,60 @@ class ZaakAuthorizationsFilterMixin(LooseFkAuthorizationsFilterMixin):
 
 
 class ZaakQuerySet(ZaakAuthorizationsFilterMixin, models.QuerySet):
-    pass
+    def sync_current_status(self) -> int:
+        """
+        Recalculate the denormalized current status (type) of the zaken.
+        """
+        Status = self.model._meta.get_field("_current_status").related_model
+        latest = Status.objects.filter(zaak=models.OuterRef("pk")).order_by(
+            "-datum_status_gezet", "-pk"
+        )
+        return self.update(
+            _current_status=models.Subquery(latest.values("pk")[:1]),
+            _current_statustype=models.Subquery(latest.values("_statustype")[:1]),
+        )
+
+    def clusters(self, bbox: Polygon, size: int) -> models.QuerySet:
+        """
+        Count the zaken per cell of a ``size`` x ``size`` grid over the bounding box.
+
+        Every zaak is counted in the cell containing a point on its ``zaakgeometrie``.
+        The cells are identified by their center (``punt``).
+        """
+        xmin, ymin, xmax, ymax = bbox.extent
+        width, height = (xmax - xmin) / size, (ymax - ymin) / size
+        # the centers of the outer cells: points on the edges of the bounding box are
+        # moved onto them, otherwise they could be snapped to a center outside of it
+        centers = (
+            Point(xmin + width / 2, ymin + height / 2)
+            if size == 1
+            else Polygon.from_bbox(
+                (
+                    xmin + width / 2,
+                    ymin + height / 2,
+                    xmax - width / 2,
+                    ymax - height / 2,
+                )
+            )
+        )
+        centers.srid = bbox.srid
+        return (
+            # ⚡️ the bounding box operator can be answered by the spatial index
+            self.filter(zaakgeometrie__bboverlaps=bbox)
+            .annotate(_point_on_surface=PointOnSurface("zaakgeometrie"))
+            .filter(_point_on_surface__intersects=bbox)
+            .order_by()
+            .values(
+                punt=SnapToGrid(
+                    ClosestPoint(models.Value(centers), "_point_on_surface"),
+                    width,
+                    height,
+                    xmin + width / 2,
+                    ymin + height / 2,
+                )
+            )
+            .annotate(aantal=models.Count("pk", distinct=True))
+        )
 
 
 class ZaakRelatedQuerySet(ZaakAuthorizationsFilterMixin, models.QuerySet):
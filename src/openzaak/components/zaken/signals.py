@@ -2,6 +2,7 @@
 # Copyright (C) 2019 - 2022 Dimpact
 import threading
 
+from django.db.models import QuerySet
 from django.db.models.base import ModelBase
 from django.db.models.signals import ModelSignal, post_delete, post_save
 from django.dispatch import receiver
@@ -10,7 +11,7 @@ import structlog
 
 from openzaak.components.besluiten.models import Besluit
 
-from .models import ZaakBesluit, ZaakRelatie
+from .models import Status, Zaak, ZaakBesluit, ZaakRelatie
 
 logger = structlog.stdlib.get_logger(__name__)
 _signal_local = threading.local()
@@ -106,3 +107,41 @@ def delete_reverse_zaakrelatie(sender, instance, **kwargs):
         finally:
             # Make sure the signal is fired again
             _signal_local.skip_reverse_delete = False
+
+
+@receiver(
+    [post_save, post_delete], sender=Status, dispatch_uid="zaken.sync_current_status"
+)
+def sync_current_status(
+    sender: ModelBase, signal: ModelSignal, instance: Status, **kwargs
+) -> None:
+    """
+    Keep the denormalized current status of the zaak up to date.
+
+    This runs in the transaction that creates or deletes the status.
+    """
+    if kwargs.get("raw"):
+        return
+
+    # the zaak itself is being deleted
+    origin = kwargs.get("origin")
+    if isinstance(origin, Zaak) or (
+        isinstance(origin, QuerySet) and origin.model is Zaak
+    ):
+        return
+
+    current_status = (
+        Status.objects.filter(zaak_id=instance.zaak_id)
+        .order_by("-datum_status_gezet", "-pk")
+        .first()
+    )
+    statustype_id = current_status._statustype_id if current_status else None
+    Zaak.objects.filter(pk=instance.zaak_id).update(
+        _current_status=current_status, _current_statustype_id=statustype_id
+    )
+
+    # keep the instance in memory in sync as well, it is typically used to build
+    # the response
+    if Status.zaak.is_cached(instance):
+        instance.zaak._current_status = current_status
+        instance.zaak._current_statustype_id = statustype_id
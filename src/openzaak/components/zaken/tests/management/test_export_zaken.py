@@ -0,0 +1,43 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+import csv
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from ..factories import ZaakFactory
+
+
+@override_settings(SITE_DOMAIN="openzaak.example.com", IS_HTTPS=True)
+class ExportZakenTests(TestCase):
+    def test_export_ndjson_to_stdout(self):
+        zaak = ZaakFactory.create()
+
+        stdout = StringIO()
+        call_command("export_zaken", stdout=stdout)
+
+        lines = stdout.getvalue().splitlines()
+        self.assertEqual(len(lines), 1)
+        data = json.loads(lines[0])
+        self.assertEqual(
+            data["url"],
+            f"https://openzaak.example.com/zaken/api/v1/zaken/{zaak.uuid}",
+        )
+        self.assertEqual(data["identificatie"], zaak.identificatie)
+
+    def test_export_csv_to_file(self):
+        ZaakFactory.create_batch(2)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output = Path(tmpdir) / "zaken.csv"
+            call_command("export_zaken", format="csv", output=str(output))
+
+            with output.open(newline="") as infile:
+                rows = list(csv.DictReader(infile))
+
+        self.assertEqual(len(rows), 2)
+        self.assertTrue(rows[0]["zaaktype"].startswith("https://openzaak.example.com"))
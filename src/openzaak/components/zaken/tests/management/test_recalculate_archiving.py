@@ -0,0 +1,130 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from datetime import date
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from dateutil.relativedelta import relativedelta
+from vng_api_common.constants import (
+    BrondatumArchiefprocedureAfleidingswijze as Afleidingswijze,
+)
+
+from openzaak.components.catalogi.models import ResultaatType
+
+from ...models import Zaak, ZaakEigenschap
+from ..factories import ResultaatFactory, ZaakEigenschapFactory, ZaakFactory
+
+
+class RecalculateArchivingTests(TestCase):
+    def _create_zaak(self, einddatum: date, **resultaattype_kwargs):
+        zaak = ZaakFactory.create(closed=True, einddatum=einddatum)
+        resultaat = ResultaatFactory.create(
+            zaak=zaak,
+            resultaattype__archiefactietermijn="P5Y",
+            **{f"resultaattype__{k}": v for k, v in resultaattype_kwargs.items()},
+        )
+        return zaak, resultaat.resultaattype
+
+    def test_recalculate_after_archiefactietermijn_changed(self):
+        zaak, resultaattype = self._create_zaak(
+            date(2024, 1, 1),
+            brondatum_archiefprocedure_afleidingswijze=Afleidingswijze.afgehandeld,
+        )
+        other_zaak, _ = self._create_zaak(
+            date(2024, 1, 1),
+            brondatum_archiefprocedure_afleidingswijze=Afleidingswijze.afgehandeld,
+        )
+        zaak.refresh_from_db()
+        self.assertEqual(zaak.archiefactiedatum, date(2029, 1, 1))
+
+        ResultaatType.objects.filter(pk=resultaattype.pk).update(
+            archiefactietermijn=relativedelta(years=10)
+        )
+
+        stdout = StringIO()
+        call_command("recalculate_archiving", chunk_size=1, stdout=stdout)
+
+        zaak.refresh_from_db()
+        self.assertEqual(zaak.archiefactiedatum, date(2034, 1, 1))
+        self.assertEqual(zaak.startdatum_bewaartermijn, date(2024, 1, 1))
+        other_zaak.refresh_from_db()
+        self.assertEqual(other_zaak.archiefactiedatum, date(2029, 1, 1))
+        self.assertEqual(
+            stdout.getvalue().splitlines(),
+            [
+                f"Zaak {zaak.uuid}: archiefactiedatum: 2029-01-01 -> 2034-01-01",
+                "Updated the archiving data of 1 zaken.",
+            ],
+        )
+
+    def test_dry_run(self):
+        zaak, resultaattype = self._create_zaak(
+            date(2024, 1, 1),
+            brondatum_archiefprocedure_afleidingswijze=Afleidingswijze.afgehandeld,
+        )
+        ResultaatType.objects.filter(pk=resultaattype.pk).update(
+            archiefactietermijn=relativedelta(years=10)
+        )
+
+        stdout = StringIO()
+        call_command("recalculate_archiving", dry_run=True, stdout=stdout)
+
+        zaak.refresh_from_db()
+        self.assertEqual(zaak.archiefactiedatum, date(2029, 1, 1))
+        self.assertEqual(
+            stdout.getvalue().splitlines(),
+            [
+                f"Zaak {zaak.uuid}: archiefactiedatum: 2029-01-01 -> 2034-01-01",
+                "1 zaken would be updated.",
+            ],
+        )
+
+    def test_force_recalculates_brondatum_from_prefetched_eigenschappen(self):
+        zaak = ZaakFactory.create(closed=True, einddatum=date(2024, 1, 1))
+        ZaakEigenschapFactory.create(zaak=zaak, _naam="datum", waarde="20240201")
+        ResultaatFactory.create(
+            zaak=zaak,
+            resultaattype__archiefactietermijn="P5Y",
+            resultaattype__brondatum_archiefprocedure_afleidingswijze=Afleidingswijze.eigenschap,
+            resultaattype__brondatum_archiefprocedure_datumkenmerk="datum",
+        )
+        zaak.refresh_from_db()
+        self.assertEqual(zaak.startdatum_bewaartermijn, date(2024, 2, 1))
+
+        # changed without triggering the recalculation
+        ZaakEigenschap.objects.filter(zaak=zaak).update(waarde="20250201")
+
+        call_command("recalculate_archiving", stdout=StringIO())
+        zaak.refresh_from_db()
+        self.assertEqual(zaak.startdatum_bewaartermijn, date(2024, 2, 1))
+
+        call_command("recalculate_archiving", force=True, stdout=StringIO())
+        zaak.refresh_from_db()
+        self.assertEqual(zaak.startdatum_bewaartermijn, date(2025, 2, 1))
+        self.assertEqual(zaak.archiefactiedatum, date(2030, 2, 1))
+
+    def test_filter_resultaattype(self):
+        zaak, resultaattype = self._create_zaak(
+            date(2024, 1, 1),
+            brondatum_archiefprocedure_afleidingswijze=Afleidingswijze.afgehandeld,
+        )
+        other_zaak, other_resultaattype = self._create_zaak(
+            date(2024, 1, 1),
+            brondatum_archiefprocedure_afleidingswijze=Afleidingswijze.afgehandeld,
+        )
+        ResultaatType.objects.update(archiefactietermijn=relativedelta(years=10))
+
+        call_command(
+            "recalculate_archiving",
+            resultaattypen=[str(resultaattype.uuid)],
+            stdout=StringIO(),
+        )
+
+        self.assertEqual(
+            Zaak.objects.get(pk=zaak.pk).archiefactiedatum, date(2034, 1, 1)
+        )
+        self.assertEqual(
+            Zaak.objects.get(pk=other_zaak.pk).archiefactiedatum, date(2029, 1, 1)
+        )
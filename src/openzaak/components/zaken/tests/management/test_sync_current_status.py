@@ -0,0 +1,25 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from ...models import Zaak
+from ..factories import StatusFactory, ZaakFactory
+
+
+class SyncCurrentStatusTests(TestCase):
+    def test_sync_current_status(self):
+        status = StatusFactory.create()
+        ZaakFactory.create()
+        # simulate changes that bypassed the signals
+        Zaak.objects.update(_current_status=None, _current_statustype=None)
+
+        stdout = StringIO()
+        call_command("sync_current_status", batch_size=1, stdout=stdout)
+
+        zaak_with_status = Zaak.objects.get(pk=status.zaak.pk)
+        self.assertEqual(zaak_with_status._current_status, status)
+        self.assertEqual(zaak_with_status._current_statustype_id, status._statustype_id)
+        self.assertIn("2 zaken", stdout.getvalue())
@@ -0,0 +1,62 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from datetime import datetime, timezone
+
+from django.test import TestCase
+
+from ...models import Status, Zaak
+from ..factories import StatusFactory, ZaakFactory
+
+
+class CurrentStatusTests(TestCase):
+    def test_create_status_updates_current_status(self):
+        zaak = ZaakFactory.create()
+        first = StatusFactory.create(
+            zaak=zaak, datum_status_gezet=datetime(2026, 1, 1, tzinfo=timezone.utc)
+        )
+        second = StatusFactory.create(
+            zaak=zaak, datum_status_gezet=datetime(2026, 2, 1, tzinfo=timezone.utc)
+        )
+
+        self.assertEqual(zaak.current_status, second)
+
+        zaak = Zaak.objects.get()
+        self.assertEqual(zaak._current_status, second)
+        self.assertEqual(zaak._current_statustype_id, second._statustype_id)
+
+        with self.subTest("older status"):
+            StatusFactory.create(
+                zaak=zaak,
+                datum_status_gezet=datetime(2025, 12, 1, tzinfo=timezone.utc),
+            )
+
+            zaak.refresh_from_db()
+            self.assertEqual(zaak._current_status, second)
+
+        with self.subTest("delete current status"):
+            second.delete()
+
+            zaak.refresh_from_db()
+            self.assertEqual(zaak._current_status, first)
+            self.assertEqual(zaak._current_statustype_id, first._statustype_id)
+
+    def test_stale_zaak_save_keeps_current_status(self):
+        zaak = ZaakFactory.create()
+        stale_zaak = Zaak.objects.get()
+        status = StatusFactory.create(zaak=zaak)
+
+        stale_zaak.toelichting = "changed"
+        stale_zaak.save()
+
+        zaak.refresh_from_db()
+        self.assertEqual(zaak.toelichting, "changed")
+        self.assertEqual(zaak._current_status, status)
+
+    def test_delete_zaak_with_statuses(self):
+        zaak = ZaakFactory.create()
+        StatusFactory.create_batch(2, zaak=zaak)
+
+        zaak.delete()
+
+        self.assertFalse(Zaak.objects.exists())
+        self.assertFalse(Status.objects.exists())
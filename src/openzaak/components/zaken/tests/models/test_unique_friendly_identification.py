@@ -3,6 +3,7 @@
 from freezegun import freeze_time
 from rest_framework.test import APITestCase
 
+from ...models import ZaakIdentificatie, ZaakIdentificatieCounter
 from ..factories import ZaakFactory
 
 
@@ -25,9 +26,50 @@ class UniqueFriendlyIdentificationTests(APITestCase):
 
     @freeze_time("2019-01-01")
     def test_delete_then_create_zaak_unique_id(self):
-        zaak1 = ZaakFactory.create()
-        ZaakFactory.create()
+        zaak1 = ZaakFactory.create(bronorganisatie="517439943")
+        ZaakFactory.create(bronorganisatie="517439943")
         zaak1.delete()
-        zaak3 = ZaakFactory.create()
+        zaak3 = ZaakFactory.create(bronorganisatie="517439943")
 
         self.assertEqual(zaak3.identificatie, "ZAAK-2019-0000000003")
+
+    @freeze_time("2019-01-01")
+    def test_create_zaak_unique_id_per_bronorganisatie(self):
+        zaak1 = ZaakFactory.create(bronorganisatie="517439943")
+        zaak2 = ZaakFactory.create(bronorganisatie="000000000")
+        zaak3 = ZaakFactory.create(bronorganisatie="517439943")
+
+        self.assertEqual(zaak1.identificatie, "ZAAK-2019-0000000001")
+        self.assertEqual(zaak2.identificatie, "ZAAK-2019-0000000001")
+        self.assertEqual(zaak3.identificatie, "ZAAK-2019-0000000002")
+        self.assertEqual(
+            ZaakIdentificatieCounter.objects.get(
+                bronorganisatie="517439943", jaar=2019
+            ).last_number,
+            2,
+        )
+
+    @freeze_time("2019-01-01")
+    def test_counter_seeded_from_existing_identificaties(self):
+        ZaakIdentificatie.objects.create(
+            identificatie="ZAAK-2019-0000000041", bronorganisatie="517439943"
+        )
+        # different format, ignored
+        ZaakIdentificatie.objects.create(
+            identificatie="ZAAK-2019-9999999999-A", bronorganisatie="517439943"
+        )
+
+        zaak = ZaakFactory.create(bronorganisatie="517439943")
+
+        self.assertEqual(zaak.identificatie, "ZAAK-2019-0000000042")
+
+    @freeze_time("2019-01-01")
+    def test_generate_skips_identificatie_supplied_by_client(self):
+        ZaakFactory.create(bronorganisatie="517439943")
+        ZaakFactory.create(
+            identificatie="ZAAK-2019-0000000002", bronorganisatie="517439943"
+        )
+
+        zaak = ZaakFactory.create(bronorganisatie="517439943")
+
+        self.assertEqual(zaak.identificatie, "ZAAK-2019-0000000003")
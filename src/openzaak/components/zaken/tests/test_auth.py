@@ -4,7 +4,11 @@
 Guarantee that the proper authorization machinery is in place.
 """
 
+from unittest.mock import patch
+
+from django.db import connection
 from django.test import override_settings, tag
+from django.test.utils import CaptureQueriesContext
 from django.utils.translation import gettext as _
 
 from rest_framework import status
@@ -18,6 +22,7 @@ from openzaak.components.autorisaties.tests.factories import (
     AutorisatieFactory,
     CatalogusAutorisatieFactory,
 )
+from openzaak.components.autorisaties.utils import send_applicatie_changed_notification
 from openzaak.components.besluiten.tests.factories import BesluitFactory
 from openzaak.components.catalogi.models import ZaakType
 from openzaak.components.catalogi.tests.factories import (
@@ -655,7 +660,7 @@ class ZaakListPerformanceTests(JWTAuthMixin, APITestCase):
         # queries because of the permission checks
         PERMISSION_CHECK_NUM_QUERIES = 6
         # queries because of the list endpoint itself
-        ENDPOINT_NUM_QUERIES = 13
+        ENDPOINT_NUM_QUERIES = 12
         TOTAL_EXPECTED_QUERIES = (
             BASE_NUM_QUERIES + PERMISSION_CHECK_NUM_QUERIES + ENDPOINT_NUM_QUERIES
         )
@@ -702,6 +707,119 @@ class ZaakListPerformanceTests(JWTAuthMixin, APITestCase):
                 self.assertEqual(response.data["count"], 1)
 
 
+class ZaakListAuthorizationsCacheTests(JWTAuthMixin, APITestCase):
+    scopes = [SCOPE_ZAKEN_ALLES_LEZEN]
+    max_vertrouwelijkheidaanduiding = VertrouwelijkheidsAanduiding.openbaar
+    component = ComponentTypes.zrc
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.zaaktype = ZaakTypeFactory.create()
+        super().setUpTestData()
+
+    def test_resolved_authorizations_are_reused(self):
+        ZaakFactory.create(
+            zaaktype=self.zaaktype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        url = reverse("zaak-list")
+
+        with CaptureQueriesContext(connection) as first:
+            response1 = self.client.get(url, **ZAAK_READ_KWARGS)
+        with CaptureQueriesContext(connection) as second:
+            response2 = self.client.get(url, **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response1.data["count"], 1)
+        self.assertEqual(response2.data["count"], 1)
+        self.assertLess(len(second), len(first))
+
+    def test_cache_invalidated_on_autorisatie_change(self):
+        zaaktype2 = ZaakTypeFactory.create()
+        ZaakFactory.create(
+            zaaktype=self.zaaktype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        ZaakFactory.create(
+            zaaktype=zaaktype2,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.geheim,
+        )
+        url = reverse("zaak-list")
+
+        response = self.client.get(url, **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.data["count"], 1)
+
+        with self.subTest("new autorisatie"):
+            AutorisatieFactory.create(
+                applicatie=self.applicatie,
+                component=ComponentTypes.zrc,
+                scopes=[SCOPE_ZAKEN_ALLES_LEZEN],
+                zaaktype=f"http://testserver{reverse(zaaktype2)}",
+                max_vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+            )
+
+            response = self.client.get(url, **ZAAK_READ_KWARGS)
+
+            self.assertEqual(response.data["count"], 1)
+
+        with self.subTest("changed vertrouwelijkheidaanduiding"):
+            autorisatie = Autorisatie.objects.get(
+                zaaktype=f"http://testserver{reverse(zaaktype2)}"
+            )
+            autorisatie.max_vertrouwelijkheidaanduiding = (
+                VertrouwelijkheidsAanduiding.geheim
+            )
+            autorisatie.save()
+
+            response = self.client.get(url, **ZAAK_READ_KWARGS)
+
+            self.assertEqual(response.data["count"], 2)
+
+        with self.subTest("deleted autorisatie"):
+            autorisatie.delete()
+
+            response = self.client.get(url, **ZAAK_READ_KWARGS)
+
+            self.assertEqual(response.data["count"], 1)
+
+    @patch("openzaak.components.autorisaties.utils.ApplicatieViewSet.notify")
+    def test_cache_invalidated_on_bulk_created_autorisaties(self, mock_notify):
+        zaaktype2 = ZaakTypeFactory.create()
+        ZaakFactory.create(
+            zaaktype=self.zaaktype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        ZaakFactory.create(
+            zaaktype=zaaktype2,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        url = reverse("zaak-list")
+
+        response = self.client.get(url, **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.data["count"], 1)
+
+        # like the admin, which doesn't trigger the model signals
+        Autorisatie.objects.bulk_create(
+            [
+                Autorisatie(
+                    applicatie=self.applicatie,
+                    component=ComponentTypes.zrc,
+                    scopes=[SCOPE_ZAKEN_ALLES_LEZEN.label],
+                    zaaktype=f"http://testserver{reverse(zaaktype2)}",
+                    max_vertrouwelijkheidaanduiding=(
+                        VertrouwelijkheidsAanduiding.openbaar
+                    ),
+                )
+            ]
+        )
+        send_applicatie_changed_notification(self.applicatie)
+
+        response = self.client.get(url, **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.data["count"], 2)
+
+
 class StatusTests(JWTAuthMixin, APITestCase):
     scopes = [SCOPE_ZAKEN_ALLES_LEZEN, SCOPE_ZAKEN_CREATE]
     max_vertrouwelijkheidaanduiding = VertrouwelijkheidsAanduiding.beperkt_openbaar
@@ -4,14 +4,19 @@
 Test that the caching mechanisms are in place.
 """
 
-from django.db import transaction
+from django.db import connection, transaction
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 
 from rest_framework import status
 from rest_framework.test import APITestCase
+from vng_api_common.constants import ComponentTypes, VertrouwelijkheidsAanduiding
 from vng_api_common.tests import CacheMixin, JWTAuthMixin, reverse
 
-from openzaak.tests.utils import get_spec
+from openzaak.components.catalogi.tests.factories import ZaakTypeFactory
+from openzaak.tests.utils import JWTAuthMixin as AutorisatieJWTAuthMixin, get_spec
 
+from ..api.scopes import SCOPE_ZAKEN_ALLES_LEZEN
 from .factories import (
     ResultaatFactory,
     RolFactory,
@@ -295,3 +300,68 @@ class ResultaatCacheTests(CacheMixin, JWTAuthMixin, APITestCase):
         )
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class ZaakConditionalFastPathTests(AutorisatieJWTAuthMixin, APITestCase):
+    scopes = [SCOPE_ZAKEN_ALLES_LEZEN]
+    max_vertrouwelijkheidaanduiding = VertrouwelijkheidsAanduiding.openbaar
+    component = ComponentTypes.zrc
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.zaaktype = ZaakTypeFactory.create()
+        super().setUpTestData()
+
+    def _get(self, zaak, etag, **extra):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(
+                reverse(zaak), HTTP_IF_NONE_MATCH=f'"{etag}"', **extra
+            )
+        return response, len(context.captured_queries)
+
+    def test_not_modified_without_loading_zaak(self):
+        zaak = ZaakFactory.create(
+            zaaktype=self.zaaktype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+            with_etag=True,
+        )
+
+        response, num_queries = self._get(zaak, zaak._etag, **ZAAK_READ_KWARGS)
+        with override_settings(CONDITIONAL_GET_FAST_PATH_ENABLED=False):
+            response_slow, num_queries_slow = self._get(
+                zaak, zaak._etag, **ZAAK_READ_KWARGS
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], f'"{zaak._etag}"')
+        self.assertEqual(response_slow.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertLess(num_queries, num_queries_slow)
+
+    def test_modified(self):
+        zaak = ZaakFactory.create(
+            zaaktype=self.zaaktype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+            with_etag=True,
+        )
+
+        response, _ = self._get(zaak, "not-an-md5", **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["uuid"], str(zaak.uuid))
+
+    def test_not_authorized(self):
+        for zaak in (
+            ZaakFactory.create(
+                zaaktype=self.zaaktype,
+                vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.geheim,
+                with_etag=True,
+            ),
+            ZaakFactory.create(
+                vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+                with_etag=True,
+            ),
+        ):
+            with self.subTest(zaak=zaak):
+                response, _ = self._get(zaak, zaak._etag, **ZAAK_READ_KWARGS)
+
+                self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
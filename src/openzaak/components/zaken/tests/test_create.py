@@ -540,23 +540,22 @@ class PerformanceTests(
             34:   select zaak relevantezaakrelatie (nested inline create, can't avoid this)
             35:   select zaak zaakrelatie (nested inline create, can't avoid this)
             36:   select zaak rollen
-            37:   select zaak status
-            38:   select zaak zaakinformatieobjecten
-            39:   select zaak zaakobjecten
-            40:   select zaak kenmerken (nested inline create, can't avoid this)
-            41:   insert audit trail
-         42-43:   notifications, select created zaak (?), notifs config
-            44:   release savepoint (from NotificationsCreateMixin)
-            45:   savepoint create transaction.on_commit ETag handler (start new transaction)
-            46:   update ETag column of zaak
-            47:   release savepoint (commit transaction)
+            37:   select zaak zaakinformatieobjecten
+            38:   select zaak zaakobjecten
+            39:   select zaak kenmerken (nested inline create, can't avoid this)
+            40:   insert audit trail
+         41-42:   notifications, select created zaak (?), notifs config
+            43:   release savepoint (from NotificationsCreateMixin)
+            44:   savepoint create transaction.on_commit ETag handler (start new transaction)
+            45:   update ETag column of zaak
+            46:   release savepoint (commit transaction)
 
         """
         # create a random zaak to get some other initial setup queries out of the way
         # (most notable figuring out the PG/postgres version)
         ZaakFactory.create()
 
-        EXPECTED_NUM_QUERIES = 47
+        EXPECTED_NUM_QUERIES = 46
 
         zaaktype_url = reverse(self.zaaktype)
         url = get_operation_url("zaak_create")
@@ -592,7 +591,7 @@ class PerformanceTests(
 
         # Two additional queries when there are any number of related zaken specified
         # and 9 per specified related zaak
-        EXPECTED_NUM_QUERIES = 47 + 2 + (9 * num_gerelateerde_zaken)
+        EXPECTED_NUM_QUERIES = 46 + 2 + (9 * num_gerelateerde_zaken)
 
         zaaktype_url = reverse(self.zaaktype)
         url = get_operation_url("zaak_create")
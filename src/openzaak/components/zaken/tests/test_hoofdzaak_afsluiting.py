@@ -598,7 +598,7 @@ class HoofdzaakAfsluitingTests(JWTAuthMixin, APITestCase):
             )
 
     def test_queries_with_no_deelzaken(self):
-        with self.assertNumQueries(67):
+        with self.assertNumQueries(68):
             response = self.client.post(
                 self.status_list_url,
                 {
@@ -613,16 +613,18 @@ class HoofdzaakAfsluitingTests(JWTAuthMixin, APITestCase):
         self._generate_deelzaken(1, True)
         """
         An Deelzaak with an external catalogi has 5 extra queries compared to no deelzaken.
+        The status insert is followed by the select and update of the
+        ``sync_current_status`` receiver (56-57), which shift the later queries.
 
         (1) 39: deelzaak reopen filter query
         (2) 40: deelzaak eindstatus filter query
         (3) 41: cursor from exist()
         (4) 54-55: savepoints transaction management
-        (5) 65: update the deelzaak
-        (6) 66: cursor from exist()
-        (7) 72: savepoint transaction management
+        (5) 67: update the deelzaak
+        (6) 68: cursor from exist()
+        (7) 73: savepoint transaction management
         """
-        with self.assertNumQueries(72):
+        with self.assertNumQueries(73):
             response = self.client.post(
                 self.status_list_url,
                 {
@@ -639,18 +641,21 @@ class HoofdzaakAfsluitingTests(JWTAuthMixin, APITestCase):
         """
         An Deelzaak with an external catalogi has 12 extra queries compared to a deelzaak with an internal catalogi.
 
+        The status insert is followed by the select and update of the
+        ``sync_current_status`` receiver (59-60), which shift the later queries.
+
         (1) 42: Lookup the current status
         (2-3) 43-44: select from zgw_consumers_service
         (4) 57-58: savepoints transaction management
-        (8) 70: lookup the deelzaak resultaat
-        (9-10) 71-72: select from zgw_consumers_service
-        (11) 73: update the deelzaak
-        (12) 79-80: savepoints transaction management
-        (13-17) 81-82 select related zaak data
+        (8) 72: lookup the deelzaak resultaat
+        (9-10) 73-74: select from zgw_consumers_service
+        (11) 75: update the deelzaak
+        (12) 81-82: savepoints transaction management
+        (13-17) 83-85 select related zaak data
 
         """
         self._generate_deelzaken(1, False)
-        with self.assertNumQueries(84):
+        with self.assertNumQueries(85):
             response = self.client.post(
                 self.status_list_url,
                 {
@@ -664,17 +669,19 @@ class HoofdzaakAfsluitingTests(JWTAuthMixin, APITestCase):
     def test_queries_with_many_deelzaken_with_internal_catalogi(self):
         """
         An Deelzaak with an external catalogi has 5 extra queries compared to no deelzaken.
+        The status insert is followed by the select and update of the
+        ``sync_current_status`` receiver (56-57), which shift the later queries.
 
         (1) 39: deelzaak reopen filter query
         (2) 40: deelzaak eindstatus filter query
         (3) 41: cursor from exist()
         (4) 54-55: savepoints transaction management
-        (5) 65: update the deelzaak
-        (6) 66: cursor from exist()
-        (7) 72: savepoint transaction management
+        (5) 67: update the deelzaak
+        (6) 68: cursor from exist()
+        (7) 73: savepoint transaction management
         """
         self._generate_deelzaken(10, True)
-        with self.assertNumQueries(72):
+        with self.assertNumQueries(73):
             response = self.client.post(
                 self.status_list_url,
                 {
@@ -690,10 +697,10 @@ class HoofdzaakAfsluitingTests(JWTAuthMixin, APITestCase):
     def test_queries_with_many_deelzaken_with_external_catalogi(self):
         """
         A single deelzaak with external catalogi has 12 extra queries over an internal catalogi.
-        72 + (10*12) = 192
+        73 + (10*12) = 193
         """
         self._generate_deelzaken(10, False)
-        with self.assertNumQueries(192):
+        with self.assertNumQueries(193):
             response = self.client.post(
                 self.status_list_url,
                 {
@@ -710,7 +717,7 @@ class HoofdzaakAfsluitingTests(JWTAuthMixin, APITestCase):
         self._generate_deelzaken(10, True)
         self._generate_deelzaken(10, False)
 
-        with self.assertNumQueries(192):
+        with self.assertNumQueries(193):
             response = self.client.post(
                 self.status_list_url,
                 {
@@ -1,8 +1,11 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2024 Dimpact
+from datetime import date
 from unittest.mock import patch
 
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 
 from rest_framework import status
 from rest_framework.test import APITestCase
@@ -139,3 +142,124 @@ class ZaakFuzzyPaginationTests(JWTAuthMixin, APITestCase):
             data["next"], f"http://testserver{self.list_url}?page=2&pageSize=5"
         )
         self.assertTrue(data["countExact"])
+
+
+class ZaakCursorPaginationTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+    list_url = reverse_lazy("zaak-list")
+
+    def _get_all_pages(self, params) -> list[str]:
+        identificaties = []
+        response = self.client.get(self.list_url, params, **ZAAK_READ_KWARGS)
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+            data = response.json()
+            self.assertIsNone(data["count"])
+            self.assertIsNone(data["previous"])
+            identificaties += [zaak["identificatie"] for zaak in data["results"]]
+
+            if not data["next"]:
+                return identificaties
+            response = self.client.get(data["next"], **ZAAK_READ_KWARGS)
+
+    def test_cursor_first_page(self):
+        ZaakFactory.create_batch(5)
+
+        response = self.client.get(
+            self.list_url, {"cursor": "", "pageSize": 2}, **ZAAK_READ_KWARGS
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.json()
+        self.assertIsNone(data["count"])
+        self.assertIsNone(data["previous"])
+        self.assertEqual(len(data["results"]), 2)
+        self.assertIn("cursor=", data["next"])
+        self.assertIn("pageSize=2", data["next"])
+
+    def test_cursor_walk_default_ordering(self):
+        zaken = ZaakFactory.create_batch(5)
+
+        identificaties = self._get_all_pages({"cursor": "", "pageSize": 2})
+
+        self.assertEqual(
+            identificaties, [zaak.identificatie for zaak in reversed(zaken)]
+        )
+
+    def test_cursor_walk_ordering_with_duplicates_and_nulls(self):
+        zaak1 = ZaakFactory.create(einddatum=date(2024, 1, 1))
+        zaak2 = ZaakFactory.create(einddatum=None)
+        zaak3 = ZaakFactory.create(einddatum=date(2024, 1, 1))
+        zaak4 = ZaakFactory.create(einddatum=None)
+        zaak5 = ZaakFactory.create(einddatum=date(2023, 1, 1))
+
+        with self.subTest("ascending"):
+            identificaties = self._get_all_pages(
+                {"cursor": "", "pageSize": 2, "ordering": "einddatum"}
+            )
+
+            self.assertEqual(
+                identificaties,
+                [
+                    zaak5.identificatie,
+                    zaak1.identificatie,
+                    zaak3.identificatie,
+                    zaak2.identificatie,
+                    zaak4.identificatie,
+                ],
+            )
+
+        with self.subTest("descending"):
+            identificaties = self._get_all_pages(
+                {"cursor": "", "pageSize": 2, "ordering": "-einddatum"}
+            )
+
+            self.assertEqual(
+                identificaties,
+                [
+                    zaak4.identificatie,
+                    zaak2.identificatie,
+                    zaak3.identificatie,
+                    zaak1.identificatie,
+                    zaak5.identificatie,
+                ],
+            )
+
+    def test_cursor_does_not_count(self):
+        ZaakFactory.create_batch(3)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                self.list_url, {"cursor": "", "pageSize": 2}, **ZAAK_READ_KWARGS
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(
+            any("COUNT(" in query["sql"].upper() for query in queries.captured_queries)
+        )
+
+    def test_invalid_cursor(self):
+        ZaakFactory.create_batch(3)
+
+        for cursor in ["invalid", "eyJvIjpbIi1pZCJdfQ"]:
+            with self.subTest(cursor=cursor):
+                response = self.client.get(
+                    self.list_url, {"cursor": cursor}, **ZAAK_READ_KWARGS
+                )
+
+                self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_cursor_for_other_ordering_is_invalid(self):
+        ZaakFactory.create_batch(3)
+        response = self.client.get(
+            self.list_url, {"cursor": "", "pageSize": 1}, **ZAAK_READ_KWARGS
+        )
+        next_link = response.json()["next"]
+
+        response = self.client.get(
+            f"{next_link}&ordering=startdatum", **ZAAK_READ_KWARGS
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,252 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from django.test import override_settings, tag
+from django.utils import timezone
+from django.utils.translation import gettext as _
+
+from freezegun import freeze_time
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.audittrails.models import AuditTrail
+from vng_api_common.constants import (
+    ComponentTypes,
+    RolTypes,
+    VertrouwelijkheidsAanduiding,
+    ZaakobjectTypes,
+)
+from vng_api_common.tests import get_validation_errors, reverse
+
+from openzaak.components.catalogi.tests.factories import (
+    EigenschapFactory,
+    RolTypeFactory,
+    StatusTypeFactory,
+    ZaakTypeFactory,
+)
+from openzaak.components.zaken.api.scopes import (
+    SCOPE_STATUSSEN_TOEVOEGEN,
+    SCOPE_ZAKEN_BIJWERKEN,
+)
+from openzaak.components.zaken.models import Rol, Status, ZaakEigenschap, ZaakObject
+from openzaak.components.zaken.tests.factories import ZaakFactory
+from openzaak.components.zaken.tests.test_rol import BETROKKENE
+from openzaak.tests.utils import JWTAuthMixin
+
+
+@tag("convenience-endpoints")
+@freeze_time("2025-01-01T12:00:00")
+@override_settings(
+    OPENZAAK_DOMAIN="testserver", LINK_FETCHER="vng_api_common.mocks.link_fetcher_200"
+)
+class ZaakAanvullenTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def setUp(self):
+        super().setUp()
+
+        self.zaaktype = ZaakTypeFactory.create(concept=False)
+        self.zaak = ZaakFactory.create(zaaktype=self.zaaktype)
+        self.url = reverse("zaakaanvullen", kwargs={"uuid": self.zaak.uuid})
+
+        self.roltype_url = self.check_for_instance(
+            RolTypeFactory.create(zaaktype=self.zaaktype)
+        )
+        self.statustype_url = self.check_for_instance(
+            StatusTypeFactory.create(zaaktype=self.zaaktype)
+        )
+        StatusTypeFactory.create(zaaktype=self.zaaktype)
+        self.eigenschap_url = self.check_for_instance(
+            EigenschapFactory.create(zaaktype=self.zaaktype)
+        )
+
+    def _rol(self, **kwargs):
+        return {
+            "betrokkene": BETROKKENE,
+            "betrokkeneType": RolTypes.natuurlijk_persoon,
+            "roltype": self.roltype_url,
+            "roltoelichting": "toelichting",
+            **kwargs,
+        }
+
+    def _zaakobject(self, **kwargs):
+        return {
+            "objectType": ZaakobjectTypes.overige,
+            "objectTypeOverige": "test",
+            "relatieomschrijving": "test",
+            "objectIdentificatie": {"overigeData": {"someField": "some value"}},
+            **kwargs,
+        }
+
+    def test_zaak_aanvullen(self):
+        content = {
+            "rollen": [self._rol(), self._rol(roltoelichting="andere")],
+            "zaakobjecten": [self._zaakobject(), self._zaakobject()],
+            "zaakeigenschappen": [
+                {"eigenschap": self.eigenschap_url, "waarde": "een"},
+                {"eigenschap": self.eigenschap_url, "waarde": "twee"},
+                {"eigenschap": self.eigenschap_url, "waarde": "drie"},
+            ],
+            "statussen": [
+                {
+                    "statustype": self.statustype_url,
+                    "datumStatusGezet": "2024-12-01T00:00:00",
+                }
+            ],
+        }
+
+        response = self.client.post(self.url, content)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+
+        data = response.json()
+        zaak_url = f"http://testserver{reverse(self.zaak)}"
+
+        self.assertEqual(len(data["rollen"]), 2)
+        self.assertEqual(len(data["zaakobjecten"]), 2)
+        self.assertEqual(len(data["zaakeigenschappen"]), 3)
+        self.assertEqual(len(data["statussen"]), 1)
+        self.assertEqual(data["zaakeigenschappen"][0]["zaak"], zaak_url)
+        self.assertEqual(data["zaakeigenschappen"][0]["waarde"], "een")
+
+        self.assertEqual(Rol.objects.filter(zaak=self.zaak).count(), 2)
+        self.assertEqual(ZaakObject.objects.filter(zaak=self.zaak).count(), 2)
+        self.assertEqual(
+            list(
+                ZaakEigenschap.objects.filter(zaak=self.zaak)
+                .order_by("pk")
+                .values_list("waarde", flat=True)
+            ),
+            ["een", "twee", "drie"],
+        )
+        self.assertEqual(Status.objects.filter(zaak=self.zaak).count(), 1)
+
+        audittrails = AuditTrail.objects.filter(hoofd_object=zaak_url)
+        self.assertEqual(audittrails.count(), 8)
+        self.assertEqual(
+            set(audittrails.values_list("resource", flat=True)),
+            {"rol", "zaakobject", "zaakeigenschap", "status"},
+        )
+
+    def test_zaak_aanvullen_only_zaakeigenschappen(self):
+        response = self.client.post(
+            self.url,
+            {"zaakeigenschappen": [{"eigenschap": self.eigenschap_url, "waarde": "a"}]},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        self.assertEqual(response.json()["rollen"], [])
+        self.assertEqual(ZaakEigenschap.objects.filter(zaak=self.zaak).count(), 1)
+
+    def test_empty_batch(self):
+        response = self.client.post(self.url, {"rollen": []})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "nonFieldErrors")
+        self.assertEqual(error["code"], "empty-batch")
+
+    def test_not_a_list(self):
+        response = self.client.post(self.url, {"rollen": self._rol()})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "rollen")
+        self.assertEqual(error["code"], "not_a_list")
+
+    def test_invalid_item_rolls_back_batch(self):
+        content = {
+            "rollen": [self._rol(), self._rol(roltype="http://testserver/foo")],
+            "zaakeigenschappen": [{"eigenschap": self.eigenschap_url, "waarde": "a"}],
+        }
+
+        response = self.client.post(self.url, content)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIsNotNone(get_validation_errors(response, "rollen.1.roltype"))
+        self.assertFalse(Rol.objects.exists())
+        self.assertFalse(ZaakEigenschap.objects.exists())
+        self.assertFalse(AuditTrail.objects.exists())
+
+    def test_closed_zaak(self):
+        self.zaak.einddatum = timezone.now()
+        self.zaak.save()
+
+        response = self.client.post(self.url, {"rollen": [self._rol()]})
+
+        # heeft_alle_autorisaties includes the geforceerd-bijwerken scope
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+
+
+@tag("convenience-endpoints")
+@override_settings(
+    OPENZAAK_DOMAIN="testserver", LINK_FETCHER="vng_api_common.mocks.link_fetcher_200"
+)
+class ZaakAanvullenAuthTests(JWTAuthMixin, APITestCase):
+    scopes = [SCOPE_ZAKEN_BIJWERKEN]
+    max_vertrouwelijkheidaanduiding = VertrouwelijkheidsAanduiding.zeer_geheim
+    component = ComponentTypes.zrc
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.zaaktype = ZaakTypeFactory.create(concept=False)
+        super().setUpTestData()
+
+    def setUp(self):
+        super().setUp()
+
+        self.zaak = ZaakFactory.create(zaaktype=self.zaaktype)
+        self.url = reverse("zaakaanvullen", kwargs={"uuid": self.zaak.uuid})
+        self.rol = {
+            "betrokkene": BETROKKENE,
+            "betrokkeneType": RolTypes.natuurlijk_persoon,
+            "roltype": self.check_for_instance(
+                RolTypeFactory.create(zaaktype=self.zaaktype)
+            ),
+            "roltoelichting": "toelichting",
+        }
+        self.status = {
+            "statustype": self.check_for_instance(
+                StatusTypeFactory.create(zaaktype=self.zaaktype)
+            ),
+            "datumStatusGezet": "2024-12-01T00:00:00",
+        }
+
+    def test_other_zaaktype(self):
+        zaak = ZaakFactory.create()
+
+        response = self.client.post(
+            reverse("zaakaanvullen", kwargs={"uuid": zaak.uuid}),
+            {"rollen": [self.rol]},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_closed_zaak_without_geforceerd_bijwerken_scope(self):
+        self.zaak.einddatum = timezone.now()
+        self.zaak.save()
+
+        response = self.client.post(self.url, {"rollen": [self.rol]})
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(
+            response.data["detail"],
+            _("Je mag geen gegevens aanpassen van een gesloten zaak."),
+        )
+        self.assertFalse(Rol.objects.exists())
+
+    def test_statussen_without_status_scope(self):
+        response = self.client.post(
+            self.url, {"rollen": [self.rol], "statussen": [self.status]}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(Rol.objects.exists())
+        self.assertFalse(Status.objects.exists())
+
+    def test_statussen_with_status_scope(self):
+        self.autorisatie.scopes = [SCOPE_ZAKEN_BIJWERKEN, SCOPE_STATUSSEN_TOEVOEGEN]
+        self.autorisatie.save()
+
+        response = self.client.post(
+            self.url, {"rollen": [self.rol], "statussen": [self.status]}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        self.assertEqual(Status.objects.filter(zaak=self.zaak).count(), 1)
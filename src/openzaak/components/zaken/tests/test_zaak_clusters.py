@@ -0,0 +1,156 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from django.contrib.gis.geos import LineString, Point
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.constants import ComponentTypes, VertrouwelijkheidsAanduiding
+from vng_api_common.tests import get_validation_errors
+
+from openzaak.components.catalogi.tests.factories import ZaakTypeFactory
+from openzaak.tests.utils import JWTAuthMixin
+
+from ..api.scopes import SCOPE_ZAKEN_ALLES_LEZEN
+from .factories import ZaakFactory
+from .utils import ZAAK_WRITE_KWARGS, get_operation_url
+
+BBOX = [4.0, 52.0, 5.0, 53.0]
+
+
+class ZaakClustersTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def setUp(self):
+        super().setUp()
+
+        self.url = get_operation_url("zaak__clusters")
+
+    def test_count_per_cell(self):
+        # south-west cell
+        ZaakFactory.create(zaakgeometrie=Point(4.1, 52.1))
+        ZaakFactory.create(zaakgeometrie=Point(4.2, 52.3))
+        # line in the north-east cell
+        ZaakFactory.create(zaakgeometrie=LineString((4.6, 52.6), (4.9, 52.9)))
+        # outside of the bbox
+        ZaakFactory.create(zaakgeometrie=Point(5.5, 52.5))
+        # no geo set
+        ZaakFactory.create()
+
+        response = self.client.post(
+            self.url, {"bbox": BBOX, "raster": 2}, **ZAAK_WRITE_KWARGS
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        clusters = sorted(response.json(), key=lambda cluster: cluster["aantal"])
+        self.assertEqual(
+            clusters,
+            [
+                {"punt": {"type": "Point", "coordinates": [4.75, 52.75]}, "aantal": 1},
+                {"punt": {"type": "Point", "coordinates": [4.25, 52.25]}, "aantal": 2},
+            ],
+        )
+
+    def test_filters(self):
+        zaak = ZaakFactory.create(zaakgeometrie=Point(4.1, 52.1))
+        ZaakFactory.create(zaakgeometrie=Point(4.1, 52.1))
+
+        response = self.client.post(
+            self.url,
+            {"bbox": BBOX, "identificatie": zaak.identificatie},
+            **ZAAK_WRITE_KWARGS,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()), 1)
+        self.assertEqual(response.json()[0]["aantal"], 1)
+
+    def test_points_on_the_edges(self):
+        ZaakFactory.create(zaakgeometrie=Point(4.0, 52.0))
+        ZaakFactory.create(zaakgeometrie=Point(5.0, 53.0))
+
+        response = self.client.post(
+            self.url, {"bbox": BBOX, "raster": 2}, **ZAAK_WRITE_KWARGS
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertCountEqual(
+            [cluster["punt"]["coordinates"] for cluster in response.json()],
+            [[4.25, 52.25], [4.75, 52.75]],
+        )
+
+    def test_search_filters(self):
+        zaak = ZaakFactory.create(zaakgeometrie=Point(4.1, 52.1))
+        ZaakFactory.create(zaakgeometrie=Point(4.1, 52.1))
+        ZaakFactory.create(zaakgeometrie=Point(4.9, 52.9))
+
+        response = self.client.post(
+            self.url,
+            {
+                "bbox": BBOX,
+                "zaakgeometrie": {
+                    "within": {
+                        "type": "Polygon",
+                        "coordinates": [
+                            [
+                                [4.0, 52.0],
+                                [4.0, 52.5],
+                                [4.5, 52.5],
+                                [4.5, 52.0],
+                                [4.0, 52.0],
+                            ]
+                        ],
+                    }
+                },
+                "uuid__in": [str(zaak.uuid)],
+            },
+            **ZAAK_WRITE_KWARGS,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()), 1)
+        self.assertEqual(response.json()[0]["aantal"], 1)
+
+    def test_invalid_bbox(self):
+        for bbox in ([5.0, 52.0, 4.0, 53.0], [4.0, 52.0, 5.0, 91.0], [4.0, 52.0, 5.0]):
+            with self.subTest(bbox=bbox):
+                response = self.client.post(
+                    self.url, {"bbox": bbox}, **ZAAK_WRITE_KWARGS
+                )
+
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertIsNotNone(get_validation_errors(response, "bbox"))
+
+
+class ZaakClustersAuthTests(JWTAuthMixin, APITestCase):
+    scopes = [SCOPE_ZAKEN_ALLES_LEZEN]
+    max_vertrouwelijkheidaanduiding = VertrouwelijkheidsAanduiding.openbaar
+    component = ComponentTypes.zrc
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.zaaktype = ZaakTypeFactory.create()
+        super().setUpTestData()
+
+    def test_only_authorized_zaken_are_counted(self):
+        ZaakFactory.create(
+            zaaktype=self.zaaktype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+            zaakgeometrie=Point(4.1, 52.1),
+        )
+        ZaakFactory.create(
+            zaaktype=self.zaaktype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.zeer_geheim,
+            zaakgeometrie=Point(4.1, 52.1),
+        )
+        ZaakFactory.create(
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+            zaakgeometrie=Point(4.1, 52.1),
+        )
+
+        response = self.client.post(
+            get_operation_url("zaak__clusters"), {"bbox": BBOX}, **ZAAK_WRITE_KWARGS
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()), 1)
+        self.assertEqual(response.json()[0]["aantal"], 1)
@@ -374,6 +374,59 @@ class ZakenExternalIncludeTests(JWTAuthMixin, APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(m.request_history), 1)
 
+    @override_settings(EXPAND_MAX_CONCURRENT_REQUESTS=2)
+    def test_zaak_list_include_multiple_external(self):
+        """
+        test that all external objects of an expansion level are fetched once each
+        """
+        catalogus = "https://externe.catalogus.nl/api/v1/catalogussen/1c8e36be-338c-4c07-ac5e-1adf55bec04a"
+        zaaktypen = [
+            f"https://externe.catalogus.nl/api/v1/zaaktypen/{uuid}"
+            for uuid in (
+                "b71f72ef-198d-44d8-af64-ae1932df830a",
+                "5d5e4f8b-3a5c-4a2b-8d5f-1f0e4c6d1a2b",
+                "0f4a4e2e-6d5b-4c5a-9f1e-2b3c4d5e6f70",
+            )
+        ]
+        resultaattype = "https://externe.catalogus.nl/api/v1/resultaattypen/9a784c52-456c-4864-8841-9b94e01e778f"
+        for zaaktype in zaaktypen:
+            zaak = ZaakFactory.create(zaaktype=zaaktype)
+            ResultaatFactory.create(zaak=zaak, resultaattype=resultaattype)
+        ZaakFactory.create(zaaktype=zaaktypen[0])
+
+        with requests_mock.Mocker() as m:
+            for zaaktype in zaaktypen:
+                m.get(zaaktype, json=get_zaaktype_response(catalogus, zaaktype))
+            m.get(
+                resultaattype,
+                json=get_resultaattype_response(resultaattype, zaaktypen[0]),
+            )
+
+            response = self.client.get(
+                self.url,
+                {"expand": "zaaktype,resultaat,resultaat.resultaattype"},
+                **ZAAK_READ_KWARGS,
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(m.request_history), 4)
+        self.assertEqual(
+            {request.url for request in m.request_history},
+            {*zaaktypen, resultaattype},
+        )
+
+        data = response.json()["results"]
+        self.assertEqual(len(data), 4)
+        for zaak_data in data:
+            with self.subTest(zaak=zaak_data["url"]):
+                expand = zaak_data["_expand"]
+                self.assertEqual(expand["zaaktype"]["url"], zaak_data["zaaktype"])
+                if zaak_data["resultaat"]:
+                    self.assertEqual(
+                        expand["resultaat"]["_expand"]["resultaattype"]["url"],
+                        resultaattype,
+                    )
+
     def test_connection_error(self):
         """
         test that connection errors for external urls don't crash the response
@@ -0,0 +1,164 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+import csv
+import io
+import json
+
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.constants import ComponentTypes, VertrouwelijkheidsAanduiding
+from vng_api_common.tests import get_validation_errors, reverse
+
+from openzaak.components.catalogi.tests.factories import ZaakTypeFactory
+from openzaak.tests.utils import JWTAuthMixin
+
+from ..api.scopes import SCOPE_ZAKEN_ALLES_LEZEN
+from .factories import StatusFactory, ZaakFactory
+from .utils import ZAAK_READ_KWARGS, get_operation_url
+
+
+def _content(response) -> str:
+    return b"".join(response.streaming_content).decode("utf-8")
+
+
+@override_settings(ZAKEN_EXPORT_CHUNK_SIZE=2)
+class ZaakExportTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def setUp(self):
+        super().setUp()
+
+        self.url = get_operation_url("zaak_export")
+
+    def test_export_ndjson(self):
+        zaak1, zaak2, zaak3 = ZaakFactory.create_batch(3)
+        status_ = StatusFactory.create(zaak=zaak2)
+
+        response = self.client.get(
+            self.url, HTTP_ACCEPT="application/x-ndjson", **ZAAK_READ_KWARGS
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response["Content-Type"], "application/x-ndjson; charset=utf-8"
+        )
+        lines = _content(response).splitlines()
+        self.assertEqual(len(lines), 3)
+
+        data = json.loads(lines[1])
+        self.assertEqual(data["url"], f"http://testserver{reverse(zaak2)}")
+        self.assertEqual(data["uuid"], str(zaak2.uuid))
+        self.assertEqual(data["identificatie"], zaak2.identificatie)
+        self.assertEqual(
+            data["zaaktype"], f"http://testserver{reverse(zaak2.zaaktype)}"
+        )
+        self.assertEqual(data["registratiedatum"], zaak2.registratiedatum.isoformat())
+        self.assertEqual(data["status"], f"http://testserver{reverse(status_)}")
+        self.assertIsNone(json.loads(lines[0])["status"])
+
+    def test_export_csv(self):
+        zaak = ZaakFactory.create()
+
+        response = self.client.get(self.url, HTTP_ACCEPT="text/csv", **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        rows = list(csv.DictReader(io.StringIO(_content(response))))
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["url"], f"http://testserver{reverse(zaak)}")
+        self.assertEqual(rows[0]["einddatum"], "")
+        self.assertEqual(
+            rows[0]["verantwoordelijkeOrganisatie"], zaak.verantwoordelijke_organisatie
+        )
+
+    def test_export_filters(self):
+        zaak = ZaakFactory.create()
+        ZaakFactory.create()
+
+        response = self.client.get(
+            self.url,
+            {"identificatie": zaak.identificatie},
+            HTTP_ACCEPT="application/x-ndjson",
+            **ZAAK_READ_KWARGS,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        lines = _content(response).splitlines()
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(json.loads(lines[0])["uuid"], str(zaak.uuid))
+
+    def test_export_query_is_not_distinct(self):
+        ZaakFactory.create()
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(
+                self.url, HTTP_ACCEPT="application/x-ndjson", **ZAAK_READ_KWARGS
+            )
+            _content(response)
+
+        zaak_queries = [
+            query["sql"]
+            for query in context.captured_queries
+            if 'FROM "zaken_zaak"' in query["sql"]
+        ]
+        self.assertTrue(zaak_queries)
+        for sql in zaak_queries:
+            self.assertNotIn("DISTINCT", sql)
+
+    def test_export_unknown_query_param(self):
+        response = self.client.get(
+            self.url,
+            {"foo": "bar"},
+            HTTP_ACCEPT="application/x-ndjson",
+            **ZAAK_READ_KWARGS,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "nonFieldErrors")
+        self.assertEqual(error["code"], "unknown-parameters")
+
+    def test_export_not_acceptable(self):
+        response = self.client.get(
+            self.url, HTTP_ACCEPT="application/xml", **ZAAK_READ_KWARGS
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_406_NOT_ACCEPTABLE)
+
+
+class ZaakExportAuthTests(JWTAuthMixin, APITestCase):
+    scopes = [SCOPE_ZAKEN_ALLES_LEZEN]
+    max_vertrouwelijkheidaanduiding = VertrouwelijkheidsAanduiding.openbaar
+    component = ComponentTypes.zrc
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.zaaktype = ZaakTypeFactory.create()
+        super().setUpTestData()
+
+    def test_only_authorized_zaken_are_exported(self):
+        zaak = ZaakFactory.create(
+            zaaktype=self.zaaktype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        ZaakFactory.create(
+            zaaktype=self.zaaktype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.zeer_geheim,
+        )
+        ZaakFactory.create(
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar
+        )
+
+        response = self.client.get(
+            get_operation_url("zaak_export"),
+            HTTP_ACCEPT="application/x-ndjson",
+            **ZAAK_READ_KWARGS,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        lines = _content(response).splitlines()
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(json.loads(lines[0])["uuid"], str(zaak.uuid))
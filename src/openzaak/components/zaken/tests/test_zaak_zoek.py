@@ -9,7 +9,7 @@ ref: https://github.com/VNG-Realisatie/gemma-zaken/issues/42
 
 from datetime import date
 
-from django.contrib.gis.geos import Point
+from django.contrib.gis.geos import LineString, Point
 from django.test import override_settings, tag
 
 import requests_mock
@@ -349,3 +349,39 @@ class ZaakZoekTests(JWTAuthMixin, TypeCheckMixin, APITestCase):
         self.assertEqual(len(data), 2)
         self.assertEqual(data[0]["url"], f"http://testserver.com{reverse(zaak4)}")
         self.assertEqual(data[1]["url"], f"http://testserver.com{reverse(zaak5)}")
+
+    def test_zoek_zoomniveau_simplifies_zaakgeometrie(self):
+        # a line with a detail that is smaller than a pixel at zoom level 10
+        line = LineString((4.88, 52.37), (4.89, 52.370001), (4.90, 52.37))
+        zaak = ZaakFactory.create(zaakgeometrie=line)
+        url = get_operation_url("zaak__zoek")
+        polygon = {"type": "Polygon", "coordinates": [POLYGON_AMSTERDAM_CENTRUM]}
+
+        with self.subTest("full geometry"):
+            response = self.client.post(
+                url, {"uuid__in": [zaak.uuid]}, **ZAAK_WRITE_KWARGS
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            geometry = response.json()["results"][0]["zaakgeometrie"]
+            self.assertEqual(len(geometry["coordinates"]), 3)
+
+        with self.subTest("simplified geometry"):
+            response = self.client.post(
+                url, {"uuid__in": [zaak.uuid], "zoomniveau": 10}, **ZAAK_WRITE_KWARGS
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            geometry = response.json()["results"][0]["zaakgeometrie"]
+            self.assertEqual(geometry["coordinates"], [[4.88, 52.37], [4.90, 52.37]])
+
+        with self.subTest("invalid zoomniveau"):
+            response = self.client.post(
+                url,
+                {"zaakgeometrie": {"within": polygon}, "zoomniveau": 25},
+                **ZAAK_WRITE_KWARGS,
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            error = get_validation_errors(response, "zoomniveau")
+            self.assertEqual(error["code"], "max_value")
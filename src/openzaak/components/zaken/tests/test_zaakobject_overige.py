@@ -1,6 +1,9 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2021 Dimpact
-from django.test import tag
+from unittest.mock import patch
+
+from django.core.cache import caches
+from django.test import override_settings, tag
 
 import requests_mock
 from rest_framework import status
@@ -9,6 +12,7 @@ from vng_api_common.constants import ZaakobjectTypes
 
 from openzaak.tests.utils import JWTAuthMixin
 
+from ..api.validators import object_type_schema_validators
 from ..models import ZaakObject
 from ..tests.factories import ZaakFactory
 from ..tests.utils import get_operation_url
@@ -180,3 +184,56 @@ class ZaakObjectObjectTypeOverigeDefinitie(JWTAuthMixin, APITestCase):
         self.assertEqual(
             response.status_code, status.HTTP_400_BAD_REQUEST, response.json()
         )
+
+    @requests_mock.Mocker()
+    @override_settings(REMOTE_OBJECTS_CACHE_ENABLED=True, REMOTE_OBJECTS_CACHE_TTL=60)
+    def test_create_zaakobjecten_reuses_object_type(self, m):
+        caches["remote_objects"].clear()
+        self.addCleanup(caches["remote_objects"].clear)
+        object_type_schema_validators.clear()
+
+        object_url = "https://objects.example.com/api/objects/1234"
+        m.get(
+            "https://objecttypes.example.com/api/objecttypes/foo", json=self.OBJECT_TYPE
+        )
+        m.get(
+            object_url,
+            json={
+                "url": object_url,
+                "type": "https://objecttypes.example.com/api/objecttypes/foo",
+                "record": {"data": {"name": "Asiel en Migratie"}},
+            },
+        )
+        zaak = ZaakFactory.create()
+        zaak_url = get_operation_url("zaak_read", uuid=zaak.uuid)
+        data = {
+            "zaak": f"http://testserver{zaak_url}",
+            "object": object_url,
+            "objectType": ZaakobjectTypes.overige,
+            "objectTypeOverigeDefinitie": {
+                "url": "https://objecttypes.example.com/api/objecttypes/foo",
+                "schema": ".jsonSchema",
+                "objectData": ".record.data",
+            },
+        }
+
+        with patch(
+            "jsonschema.validators.Draft7Validator.check_schema"
+        ) as mock_check_schema:
+            for _ in range(2):
+                response = self.client.post(
+                    get_operation_url("zaakobject_create"), data
+                )
+
+                self.assertEqual(
+                    response.status_code, status.HTTP_201_CREATED, response.json()
+                )
+
+        self.assertEqual(ZaakObject.objects.count(), 2)
+        object_type_requests = [
+            req
+            for req in m.request_history
+            if req.url == "https://objecttypes.example.com/api/objecttypes/foo"
+        ]
+        self.assertEqual(len(object_type_requests), 1)
+        mock_check_schema.assert_called_once()
@@ -45,6 +45,10 @@ CACHES = {
         "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
         "LOCATION": "import_requests",
     },
+    "remote_objects": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "remote_objects",
+    },
 }
 
 LOGGING = LOGGING_SETTINGS  # Minimally required logging is nice
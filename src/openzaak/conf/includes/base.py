@@ -71,6 +71,8 @@ CACHES["import_requests"] = {
     "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
     "LOCATION": "import_requests",
 }
+# shared between instances, see ``REMOTE_OBJECTS_CACHE_ENABLED``
+CACHES["remote_objects"] = {**CACHES["default"], "KEY_PREFIX": "remote_objects"}
 
 #
 # APPLICATIONS enabled for this project
@@ -316,6 +318,47 @@ LOOSE_FK_LOCAL_BASE_URLS = config(
         "http://api.example.nl/ozgv-t/catalogi/,http://api.example.nl/ozgv-t/autorisaties/``"
     ),
 )
+REMOTE_OBJECTS_CACHE_ENABLED = config(
+    "REMOTE_OBJECTS_CACHE_ENABLED",
+    default=False,
+    help_text=(
+        "if this variable is set to ``true``, ``yes`` or ``1``, objects fetched from "
+        "external APIs (for example zaaktypen in an external Catalogi API) are cached "
+        "in the ``remote_objects`` cache, which is shared between instances. Expired "
+        "objects are revalidated with their ``ETag`` and ``Cache-Control`` response "
+        "headers are respected."
+    ),
+)
+REMOTE_OBJECTS_CACHE_TTL = config(
+    "REMOTE_OBJECTS_CACHE_TTL",
+    default=300,
+    help_text=(
+        "the default number of seconds objects fetched from external APIs are cached "
+        "when ``REMOTE_OBJECTS_CACHE_ENABLED`` is set. This can be overridden per "
+        "service in the admin."
+    ),
+)
+CATALOGI_SNAPSHOT_ENABLED = config(
+    "CATALOGI_SNAPSHOT_ENABLED",
+    default=False,
+    help_text=(
+        "if this variable is set to ``true``, ``yes`` or ``1``, every process keeps the "
+        "published zaaktypen, informatieobjecttypen and their statustypen, roltypen, "
+        "resultaattypen and eigenschappen in memory, to validate and serialize zaken "
+        "and documenten without querying them. The objects are reloaded after a "
+        "change in the Catalogi API. Requires a ``default`` cache that is shared "
+        "between the processes, like Redis."
+    ),
+)
+EXPAND_MAX_CONCURRENT_REQUESTS = config(
+    "EXPAND_MAX_CONCURRENT_REQUESTS",
+    default=10,
+    help_text=(
+        "the maximum number of concurrent requests to external APIs when resolving "
+        "the external resources requested with the ``expand`` query parameter. "
+        "Set to ``1`` to fetch the external resources one by one."
+    ),
+)
 
 #
 # MAYKIN-2FA
@@ -374,7 +417,12 @@ CELERY_BEAT_SCHEDULE = {
     "daily-remove-imports": {
         "task": "openzaak.import_data.tasks.remove_imports",
         "schedule": crontab(hour="9"),
-    }
+    },
+    # picks up outbox messages that are due for a retry
+    "dispatch-notifications-outbox": {
+        "task": "openzaak.notifications.tasks.dispatch_outbox",
+        "schedule": crontab(),
+    },
 }
 CELERY_RESULT_EXPIRES = config(
     "CELERY_RESULT_EXPIRES",
@@ -467,6 +515,18 @@ TIME_LEEWAY = config(
         "not make this larger than a couple of minutes."
     ),
 )
+JWT_AUTH_CACHE_ENABLED = config(
+    "JWT_AUTH_CACHE_ENABLED",
+    default=False,
+    help_text=(
+        "if this variable is set to ``true``, ``yes`` or ``1``, every process keeps the "
+        "verified JWTs of recent requests in memory, together with the applicaties and "
+        "autorisaties of the client. A token is verified again after it expired, and "
+        "all tokens after a change of the applicaties, autorisaties or client "
+        "credentials. Requires a ``default`` cache that is shared between the "
+        "processes, like Redis."
+    ),
+)
 
 ZAAK_EIGENSCHAP_WAARDE_VALIDATION = config(
     "ZAAK_EIGENSCHAP_WAARDE_VALIDATION",
@@ -494,6 +554,24 @@ FUZZY_PAGINATION_COUNT_LIMIT = config(
         "count is calculated in pagination when ``FUZZY_PAGINATION`` is enabled"
     ),
 )
+CONDITIONAL_GET_FAST_PATH_ENABLED = config(
+    "CONDITIONAL_GET_FAST_PATH_ENABLED",
+    default=True,
+    help_text=(
+        "if this variable is set to ``true``, ``yes`` or ``1``, requests for a "
+        "single resource with an ``If-None-Match`` header are answered with "
+        "``304 Not Modified`` based on the stored ETag value, without loading the "
+        "resource."
+    ),
+)
+ZAKEN_EXPORT_CHUNK_SIZE = config(
+    "ZAKEN_EXPORT_CHUNK_SIZE",
+    default=2000,
+    help_text=(
+        "the number of zaken fetched from the database at a time when exporting "
+        "zaken. Higher values need fewer round trips at the cost of memory."
+    ),
+)
 
 # Import settings
 IMPORT_RETENTION_DAYS = config(
@@ -526,6 +604,15 @@ IMPORT_DOCUMENTEN_BATCH_SIZE = config(
     ),
     group="Documenten import",
 )
+IMPORT_DOCUMENTEN_MAX_WORKERS = config(
+    "IMPORT_DOCUMENTEN_MAX_WORKERS",
+    4,
+    help_text=(
+        "is the maximum number of files that are copied to the storage concurrently "
+        "while bulk importing ``EnkelvoudigInformatieObject``'s."
+    ),
+    group="Documenten import",
+)
 
 NOTIFICATIONS_API_GET_DOMAIN = "openzaak.utils.get_openzaak_domain"
 
@@ -542,6 +629,27 @@ NOTIFICATIONS_SOURCE = config(
     help_text="**EXPERIMENTAL**: the identifier of this application to use as the source in notifications and cloudevents",
 )
 
+NOTIFICATIONS_OUTBOX_ENABLED = config(
+    "NOTIFICATIONS_OUTBOX_ENABLED",
+    default=False,
+    cast=bool,
+    help_text=(
+        "**EXPERIMENTAL**: indicates whether notifications and cloud events are "
+        "stored in an outbox table in the same database transaction as the change "
+        "they describe, and delivered in batches by a single Celery task. "
+        "Messages with the same kanaal are delivered in order."
+    ),
+)
+
+NOTIFICATIONS_OUTBOX_BATCH_SIZE = config(
+    "NOTIFICATIONS_OUTBOX_BATCH_SIZE",
+    default=100,
+    help_text=(
+        "the number of outbox messages that are delivered per database transaction "
+        "when ``NOTIFICATIONS_OUTBOX_ENABLED`` is set."
+    ),
+)
+
 #
 # SECURITY settings
 #
@@ -567,6 +675,18 @@ DOCUMENTEN_API_BACKEND = config(
     ),
     group="Documenten API",
 )
+DOCUMENTEN_DOWNLOAD_REDIRECT = config(
+    "DOCUMENTEN_DOWNLOAD_REDIRECT",
+    default=False,
+    help_text=(
+        "**EXPERIMENTAL**: if this variable is set to ``true``, ``yes`` or ``1`` and "
+        "the S3 or Azure Blob Storage backend is used, downloads of document contents "
+        "redirect to a short-lived pre-signed URL (see ``S3_QUERYSTRING_EXPIRE`` and "
+        "``AZURE_URL_EXPIRATION_SECS``), so clients download the file directly from "
+        "the storage instead of through Open Zaak."
+    ),
+    group="Documenten API",
+)
 
 #
 # DOCUMENTEN API AZURE BLOB STORAGE INTEGRATION
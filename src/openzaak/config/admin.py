@@ -4,7 +4,7 @@ from django.contrib import admin
 
 from solo.admin import SingletonModelAdmin
 
-from .models import FeatureFlags, InternalService
+from .models import FeatureFlags, InternalService, ServiceCacheConfig
 
 
 @admin.register(InternalService)
@@ -18,3 +18,12 @@ class InternalServiceAdmin(admin.ModelAdmin):
 @admin.register(FeatureFlags)
 class FeatureFlagsAdmin(SingletonModelAdmin):
     list_display = ("allow_unpublished_typen",)
+
+
+@admin.register(ServiceCacheConfig)
+class ServiceCacheConfigAdmin(admin.ModelAdmin):
+    list_display = (
+        "service",
+        "ttl",
+    )
+    list_select_related = ("service",)
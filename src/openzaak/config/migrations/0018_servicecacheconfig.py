@@ -0,0 +1,51 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2025 Dimpact
+# Generated by Django 5.2.3 on 2025-10-20 09:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("config", "0017_delete_cloudeventconfig"),
+        ("zgw_consumers", "0027_service_oauth2_scope_service_oauth2_token_url_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ServiceCacheConfig",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "ttl",
+                    models.PositiveIntegerField(
+                        help_text="Number of seconds objects fetched from this service are cached, when caching of remote objects is enabled. Set to 0 to never cache objects of this service.",
+                        verbose_name="cache TTL",
+                    ),
+                ),
+                (
+                    "service",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="cache_config",
+                        to="zgw_consumers.service",
+                        verbose_name="service",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "service cache configuration",
+                "verbose_name_plural": "service cache configurations",
+            },
+        ),
+    ]
@@ -35,6 +35,30 @@ class InternalService(models.Model):
         raise ValueError(f"Unknown component for api_type '{self.api_type}'")
 
 
+class ServiceCacheConfig(models.Model):
+    service = models.OneToOneField(
+        "zgw_consumers.Service",
+        on_delete=models.CASCADE,
+        related_name="cache_config",
+        verbose_name=_("service"),
+    )
+    ttl = models.PositiveIntegerField(
+        _("cache TTL"),
+        help_text=_(
+            "Number of seconds objects fetched from this service are cached, when "
+            "caching of remote objects is enabled. Set to 0 to never cache objects of "
+            "this service."
+        ),
+    )
+
+    class Meta:
+        verbose_name = _("service cache configuration")
+        verbose_name_plural = _("service cache configurations")
+
+    def __str__(self):
+        return str(self.service)
+
+
 class FeatureFlags(SingletonModel):
     """
     Configure global feature flags for the system.
@@ -1,10 +1,48 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2024 Dimpact
-from django.contrib import admin
+from django.contrib import admin, messages
+from django.db.models import QuerySet
+from django.http import HttpRequest
+from django.utils.translation import gettext_lazy as _
 
+import structlog
 from privates.admin import PrivateMediaMixin
 
-from openzaak.import_data.models import Import
+from openzaak.import_data.models import (
+    Import,
+    ImportStatusChoices,
+    ImportTypeChoices,
+)
+
+logger = structlog.stdlib.get_logger(__name__)
+
+
+@admin.action(description=_("Hervat de geselecteerde imports"))
+def resume_imports(
+    modeladmin: admin.ModelAdmin, request: HttpRequest, queryset: QuerySet
+) -> None:
+    # the documenten tasks depend on this app
+    from openzaak.components.documenten.tasks import import_documents
+
+    request_headers = {
+        key: value
+        for key, value in request.META.items()
+        if isinstance(value, (str, int))
+    }
+
+    imports = queryset.filter(
+        import_type=ImportTypeChoices.documents,
+        status__in=(ImportStatusChoices.active, ImportStatusChoices.error),
+    )
+    for import_instance in imports:
+        logger.info("resuming_import", import_id=import_instance.pk)
+        import_documents.delay(import_instance.pk, request_headers)
+
+    modeladmin.message_user(
+        request,
+        _("{count} import(s) worden hervat.").format(count=len(imports)),
+        messages.SUCCESS,
+    )
 
 
 @admin.register(Import)
@@ -25,3 +63,4 @@ class ImportAdmin(PrivateMediaMixin, admin.ModelAdmin):
     )
 
     ordering = ("-created_on", "-finished_on")
+    actions = [resume_imports]
@@ -0,0 +1,24 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+# Generated by Django 5.2.8 on 2026-10-18 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("import_data", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="import",
+            name="last_processed_row",
+            field=models.PositiveIntegerField(
+                default=0,
+                help_text="Het regelnummer in het metadata bestand van de laatst verwerkte batch. Een onderbroken import wordt na deze regel hervat.",
+                verbose_name="Laatst verwerkte regel",
+            ),
+        ),
+    ]
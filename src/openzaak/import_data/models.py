@@ -101,6 +101,14 @@ class Import(models.Model):
     processed_invalid = models.PositiveIntegerField(
         verbose_name=_("Niet succesvol verwerkt"), default=0
     )
+    last_processed_row = models.PositiveIntegerField(
+        verbose_name=_("Laatst verwerkte regel"),
+        default=0,
+        help_text=_(
+            "Het regelnummer in het metadata bestand van de laatst verwerkte batch. "
+            "Een onderbroken import wordt na deze regel hervat."
+        ),
+    )
 
     def __str__(self):
         return str(self.uuid)
@@ -92,20 +92,37 @@ def finish_import(
         )
 
 
-def finish_batch(import_instance: Import, batch: list, headers: list) -> None:
-    batch_number = import_instance.get_batch_number(len(batch))
+def save_batch_progress(import_instance: Import, batch: list) -> None:
+    """
+    Checkpoint the statistics and the last row of the batch. When this is saved in the
+    same transaction as the imported rows, an interrupted import can be resumed after
+    the last committed batch.
+    """
     _processed, _fail_count, _success_count = get_batch_statistics(batch)
 
-    import_instance.processed = import_instance.processed + _processed
-    import_instance.processed_successfully = (
-        import_instance.processed_successfully + _success_count
-    )
-    import_instance.processed_invalid = import_instance.processed_invalid + _fail_count
+    progress = {
+        "processed": import_instance.processed + _processed,
+        "processed_successfully": (
+            import_instance.processed_successfully + _success_count
+        ),
+        "processed_invalid": import_instance.processed_invalid + _fail_count,
+        "last_processed_row": max(
+            (row.row_index for row in batch),
+            default=import_instance.last_processed_row,
+        ),
+    }
+
+    Import.objects.filter(pk=import_instance.pk).update(**progress)
+
+    for field, value in progress.items():
+        setattr(import_instance, field, value)
+
+
+def finish_batch(import_instance: Import, batch: list, headers: list) -> None:
+    batch_number = import_instance.get_batch_number(len(batch))
 
     try:
-        import_instance.save(
-            update_fields=["processed", "processed_successfully", "processed_invalid"]
-        )
+        save_batch_progress(import_instance, batch)
     except DatabaseError as e:
         logger.critical(
             "unable_to_save_batch_statistics_due_to_database_error",
@@ -113,6 +130,12 @@ def finish_batch(import_instance: Import, batch: list, headers: list) -> None:
             error=str(e),
         )
 
+    write_batch_report(import_instance, batch, headers)
+
+
+def write_batch_report(import_instance: Import, batch: list, headers: list) -> None:
+    batch_number = import_instance.get_batch_number(len(batch))
+
     logger.info(
         "writing_batch_to_report_file",
         batch_number=batch_number,
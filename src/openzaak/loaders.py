@@ -1,8 +1,11 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
 import json
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
 from inspect import getmembers
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Iterator, Optional, Union
 
 from django.db import models
 from django.db.models.base import ModelBase
@@ -11,9 +14,17 @@ import requests
 from django_loose_fk.loaders import BaseLoader, FetchError, FetchJsonError
 from django_loose_fk.virtual_models import virtual_model_factory
 from djangorestframework_camel_case.util import underscoreize
+from requests.adapters import HTTPAdapter
 from vng_api_common.descriptors import GegevensGroepType
 
 from openzaak.utils.auth import get_auth
+from openzaak.utils.cache import RemoteObjectsCache
+from openzaak.utils.metrics import remote_objects_cache_counter
+
+# responses of external objects fetched in advance, see :func:`prefetched_objects`
+_prefetched_objects: ContextVar[Optional[Dict[str, Union[dict, Exception]]]] = (
+    ContextVar("prefetched_objects", default=None)
+)
 
 
 class AuthorizedRequestsLoader(BaseLoader):
@@ -23,15 +34,48 @@ class AuthorizedRequestsLoader(BaseLoader):
 
     @staticmethod
     def fetch_object(url: str, do_underscoreize=True) -> dict:
+        prefetched = _prefetched_objects.get()
+        if prefetched is not None and url in prefetched:
+            data = prefetched[url]
+            if isinstance(data, Exception):
+                raise data
+        else:
+            data = AuthorizedRequestsLoader.request_object(
+                url, get_auth(url), cache=RemoteObjectsCache.for_url(url)
+            )
+
+        if not do_underscoreize:
+            return data
+
+        return underscoreize(data)
+
+    @staticmethod
+    def request_object(
+        url: str,
+        headers: dict,
+        session: Optional[requests.Session] = None,
+        cache: Optional[RemoteObjectsCache] = None,
+    ) -> Union[dict, list]:
+        cached = cache.get(url) if cache else None
+        if cached:
+            if cache.is_fresh(cached):
+                remote_objects_cache_counter.add(1, {"result": "hit"})
+                return cached["data"]
+            if cached["etag"]:
+                headers = {**headers, "If-None-Match": cached["etag"]}
+
         # TODO should we replace it with Service.get_client() and use it instead of requests?
         # but in this case we couldn't catch separate FetchJsonError
-        headers = get_auth(url)
-
         try:
-            response = requests.get(url, headers=headers)
+            response = (session or requests).get(url, headers=headers)
         except requests.exceptions.RequestException as exc:
             raise FetchError(exc.args[0]) from exc
 
+        if cached and response.status_code == 304:
+            remote_objects_cache_counter.add(1, {"result": "revalidated"})
+            cache.set(url, cached["data"], response)
+            return cached["data"]
+
         try:
             response.raise_for_status()
         except requests.HTTPError as exc:
@@ -42,10 +86,10 @@ class AuthorizedRequestsLoader(BaseLoader):
         except json.JSONDecodeError as exc:
             raise FetchJsonError(exc.args[0]) from exc
 
-        if not do_underscoreize:
-            return data
-
-        return underscoreize(data)
+        if cache:
+            remote_objects_cache_counter.add(1, {"result": "miss"})
+            cache.set(url, data, response)
+        return data
 
     def load(self, url: str, model: ModelBase) -> models.Model:
         if self.is_local_url(url):
@@ -57,6 +101,55 @@ class AuthorizedRequestsLoader(BaseLoader):
         return get_model_instance_with_gegevensgroeps(model, data, loader=self)
 
 
+@contextmanager
+def prefetched_objects(urls: Iterable[str], max_workers: int) -> Iterator[None]:
+    """
+    Fetch the external objects concurrently over a shared keep-alive session.
+
+    Within the context, :meth:`AuthorizedRequestsLoader.fetch_object` returns the
+    prefetched data (or raises the error that occurred) for these urls instead of
+    doing a request of its own.
+    """
+    # resolving the credentials and cache configuration requires the database, which
+    # is not shared with the worker threads
+    options = {
+        url: (get_auth(url), RemoteObjectsCache.for_url(url)) for url in set(urls)
+    }
+
+    results: Dict[str, Union[dict, Exception]] = {}
+    if options:
+        max_workers = max(max_workers, 1)
+        with (
+            requests.Session() as session,
+            ThreadPoolExecutor(max_workers=max_workers) as executor,
+        ):
+            adapter = HTTPAdapter(pool_maxsize=max_workers)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            futures = {
+                url: executor.submit(
+                    AuthorizedRequestsLoader.request_object,
+                    url,
+                    headers,
+                    session=session,
+                    cache=cache,
+                )
+                for url, (headers, cache) in options.items()
+            }
+            for url, future in futures.items():
+                try:
+                    results[url] = future.result()
+                except (FetchError, FetchJsonError) as exc:
+                    results[url] = exc
+
+    prefetched = _prefetched_objects.get()
+    token = _prefetched_objects.set({**(prefetched or {}), **results})
+    try:
+        yield
+    finally:
+        _prefetched_objects.reset(token)
+
+
 def get_model_instance_with_gegevensgroeps(
     model: ModelBase, data: Dict[str, Any], loader
 ) -> models.Model:
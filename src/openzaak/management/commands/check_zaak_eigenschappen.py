@@ -1,10 +1,133 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2024 Dimpact
-from django.core.management.base import BaseCommand
+import csv
+import json
+import os
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from operator import itemgetter
+from pathlib import Path
 
-from openzaak.components.zaken.api.validators import match_eigenschap_specificatie
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.db.models import Max, Min
+
+from openzaak.components.catalogi.models import EigenschapSpecificatie
+from openzaak.components.zaken.api.validators import compile_eigenschap_specificatie
 from openzaak.components.zaken.models import ZaakEigenschap
 
+FIELDS = ("zaak", "zaakeigenschap", "waarde", "specificatie")
+
+# compiled matchers per specificatie, built once per (worker) process
+_matchers: dict[int, tuple[str, Callable[[str], bool]]] = {}
+
+
+def get_queryset():
+    # check only resources with local eigenschap
+    return ZaakEigenschap.objects.filter(
+        _eigenschap__isnull=False,
+        _eigenschap__specificatie_van_eigenschap__isnull=False,
+    )
+
+
+def get_matcher(specificatie_id: int) -> tuple[str, Callable[[str], bool]]:
+    if specificatie_id not in _matchers:
+        specificatie = EigenschapSpecificatie.objects.get(pk=specificatie_id)
+        _matchers[specificatie_id] = (
+            str(specificatie),
+            compile_eigenschap_specificatie(specificatie),
+        )
+    return _matchers[specificatie_id]
+
+
+def check_chunk(start: int, end: int) -> tuple[int, int, list[tuple[tuple, dict]]]:
+    """
+    Validate the zaakeigenschappen with a primary key in ``[start, end)``.
+
+    The rows are streamed with a server-side cursor and only the required columns
+    are fetched, without building model instances. The invalid zaakeigenschappen are
+    returned with their key in the output order (zaak and naam).
+    """
+    rows = (
+        get_queryset()
+        .filter(pk__gte=start, pk__lt=end)
+        .order_by("pk")
+        .values_list(
+            "uuid",
+            "zaak_id",
+            "zaak__uuid",
+            "_naam",
+            "waarde",
+            "_eigenschap__specificatie_van_eigenschap_id",
+        )
+    )
+    checked, invalid = 0, []
+    for uuid, zaak_id, zaak_uuid, naam, waarde, specificatie_id in rows.iterator(
+        chunk_size=2000
+    ):
+        checked += 1
+        specificatie, matcher = get_matcher(specificatie_id)
+        if not matcher(waarde):
+            row = {
+                "zaak": str(zaak_uuid),
+                "zaakeigenschap": str(uuid),
+                "waarde": waarde,
+                "specificatie": specificatie,
+            }
+            invalid.append(((zaak_id, naam), row))
+    invalid.sort(key=itemgetter(0))
+    return start, checked, invalid
+
+
+def _init_worker():
+    # no-op for forked workers, required for spawned workers
+    django.setup()
+
+
+class State:
+    """
+    Progress of a run, stored in a JSON file so an interrupted run can be resumed.
+    """
+
+    def __init__(self, path: Path | None, chunk_size: int):
+        self.path = path
+        self.chunk_size = chunk_size
+        self.completed: set[int] = set()
+        self.checked = 0
+        self.invalid = 0
+
+        if path and path.exists():
+            data = json.loads(path.read_text())
+            if data["chunk_size"] != chunk_size:
+                raise CommandError(
+                    f"The state file was created with --chunk-size {data['chunk_size']}"
+                )
+            self.completed = set(data["completed"])
+            self.checked = data["checked"]
+            self.invalid = data["invalid"]
+
+    @property
+    def resumed(self) -> bool:
+        return bool(self.completed)
+
+    def complete(self, start: int, checked: int, invalid: int) -> None:
+        self.completed.add(start)
+        self.checked += checked
+        self.invalid += invalid
+        if not self.path:
+            return
+
+        data = {
+            "chunk_size": self.chunk_size,
+            "completed": sorted(self.completed),
+            "checked": self.checked,
+            "invalid": self.invalid,
+        }
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        tmp_path.write_text(json.dumps(data))
+        os.replace(tmp_path, self.path)
+
 
 class Command(BaseCommand):
     help = (
@@ -12,48 +135,161 @@ class Command(BaseCommand):
         "eigenschap.specificatie and display not compliant zaak-eigenschappen"
     )
 
-    def handle(self, **options):
-        # check only resources with local eigenschap
-        zaakeigenschappen = (
-            ZaakEigenschap.objects.select_related(
-                "zaak", "_eigenschap", "_eigenschap__specificatie_van_eigenschap"
-            )
-            .filter(
-                _eigenschap__isnull=False,
-                _eigenschap__specificatie_van_eigenschap__isnull=False,
-            )
-            .order_by("zaak", "_naam")
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--format",
+            choices=("text", "csv", "json"),
+            default="text",
+            help=(
+                "Output format of the not compliant zaak-eigenschappen. 'json' writes "
+                "one JSON object per line. For 'csv' and 'json' the progress "
+                "messages are written to stderr."
+            ),
+        )
+        parser.add_argument(
+            "--output",
+            type=Path,
+            help="File to write the not compliant zaak-eigenschappen to, instead of stdout",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of processes which validate the chunks in parallel",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=100000,
+            help="Size of the primary key ranges which are validated at a time",
+        )
+        parser.add_argument(
+            "--state-file",
+            type=Path,
+            help=(
+                "File to keep track of the validated chunks. If the file exists, "
+                "the run is resumed and the results are appended to --output. The "
+                "results are written per chunk, so they are only ordered by zaak "
+                "within a chunk."
+            ),
         )
 
+    def handle(self, **options):
+        output_format = options["format"]
+        output_path = options["output"]
+        workers = options["workers"]
+        chunk_size = options["chunk_size"]
+        if workers < 1 or chunk_size < 1:
+            raise CommandError("--workers and --chunk-size must be positive")
+
+        state = State(options["state_file"], chunk_size)
+        # the specificaties can be changed between runs
+        _matchers.clear()
+        # keep the output machine readable
+        messages = self.stdout if output_format == "text" else self.stderr
+
+        zaakeigenschappen = get_queryset()
         if not zaakeigenschappen.exists():
-            self.stdout.write("There are no zaak-eigenschappen to check")
+            messages.write("There are no zaak-eigenschappen to check")
             return
 
-        self.stdout.write(
+        messages.write(
             f"Starting validation of {zaakeigenschappen.count()} zaak-eigenschappen"
         )
-        total_invalid = 0
-        for zaakeigenschap in zaakeigenschappen:
-            specificatie = zaakeigenschap._eigenschap.specificatie_van_eigenschap
-            valid = match_eigenschap_specificatie(
-                specificatie,
-                zaakeigenschap.waarde,
+        if state.resumed:
+            messages.write(
+                f"Resuming after {len(state.completed)} chunks "
+                f"({state.checked} zaak-eigenschappen)"
             )
-            if not valid:
-                self.stdout.write(
-                    f"Zaak {zaakeigenschap.zaak.uuid} has Eigenschap {zaakeigenschap.uuid} "
-                    f"with waarde='{zaakeigenschap.waarde}' that does not match specificatie {specificatie}"
-                )
-                total_invalid += 1
 
-        if total_invalid:
-            self.stdout.write(
+        bounds = zaakeigenschappen.aggregate(first=Min("pk"), last=Max("pk"))
+        # aligned to the chunk size, so the chunks of a resumed run are the same
+        first = bounds["first"] - bounds["first"] % chunk_size
+        chunks = [
+            start
+            for start in range(first, bounds["last"] + 1, chunk_size)
+            if start not in state.completed
+        ]
+
+        if output_path:
+            append = state.resumed and output_path.exists()
+            out = output_path.open("a" if append else "w", newline="")
+        else:
+            append = False
+            out = self.stdout
+
+        # without a state file, the results of all chunks are sorted by zaak (and
+        # naam), with a state file they must be written before the chunk is completed
+        results = []
+        try:
+            write = self._get_writer(output_format, out, header=not append)
+            for done, (start, checked, invalid) in enumerate(
+                self._check_chunks(chunks, chunk_size, workers), start=1
+            ):
+                if state.path:
+                    for _, row in invalid:
+                        write(row)
+                    out.flush()
+                else:
+                    results.extend(invalid)
+                state.complete(start, checked, len(invalid))
+
+                if options["verbosity"] >= 2:
+                    self.stderr.write(f"Validated chunk {done}/{len(chunks)}")
+
+            for _, row in sorted(results, key=itemgetter(0)):
+                write(row)
+        finally:
+            if output_path:
+                out.close()
+
+        if state.invalid:
+            messages.write(
                 self.style.WARNING(
-                    f"There are {total_invalid} zaak-eigenschappen with invalid values"
+                    f"There are {state.invalid} zaak-eigenschappen with invalid values"
                 )
             )
 
         else:
-            self.stdout.write(
+            messages.write(
                 self.style.SUCCESS("All zaak-eigenschappen have valid values")
             )
+
+    def _check_chunks(
+        self, chunks: list[int], chunk_size: int, workers: int
+    ) -> Iterator[tuple[int, int, list[tuple[tuple, dict]]]]:
+        if workers == 1:
+            for start in chunks:
+                yield check_chunk(start, start + chunk_size)
+            return
+
+        # the workers open their own connections
+        connections.close_all()
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker
+        ) as executor:
+            futures = [
+                executor.submit(check_chunk, start, start + chunk_size)
+                for start in chunks
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def _get_writer(self, output_format: str, out, header: bool) -> Callable:
+        if output_format == "csv":
+            writer = csv.DictWriter(out, fieldnames=FIELDS, lineterminator="\n")
+            if header:
+                writer.writeheader()
+            return writer.writerow
+
+        if output_format == "json":
+            return lambda row: out.write(json.dumps(row) + "\n")
+
+        def write_text(row: dict) -> None:
+            out.write(
+                f"Zaak {row['zaak']} has Eigenschap {row['zaakeigenschap']} "
+                f"with waarde='{row['waarde']}' that does not match specificatie "
+                f"{row['specificatie']}\n"
+            )
+
+        return write_text
@@ -0,0 +1,66 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db.models.functions import Upper
+
+from openzaak.components.documenten.models import EnkelvoudigInformatieObject
+from openzaak.components.documenten.search import SEARCH_VECTOR
+from openzaak.components.zaken.models import Zaak
+
+
+def trigram_index(field: str, name: str) -> GinIndex:
+    # on the expression ``icontains`` compiles to (``UPPER(field::text) LIKE
+    # UPPER(...)``), so the filters can use the index as-is
+    return GinIndex(OpClass(Upper(field), name="gin_trgm_ops"), name=name)
+
+
+SEARCH_INDEXES = [
+    (EnkelvoudigInformatieObject, trigram_index("titel", "eio_titel_trgm_idx")),
+    (EnkelvoudigInformatieObject, trigram_index("auteur", "eio_auteur_trgm_idx")),
+    (
+        EnkelvoudigInformatieObject,
+        trigram_index("beschrijving", "eio_beschrijving_trgm_idx"),
+    ),
+    (EnkelvoudigInformatieObject, GinIndex(SEARCH_VECTOR, name="eio_search_idx")),
+    (Zaak, trigram_index("omschrijving", "zaak_omschrijving_trgm_idx")),
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Create the (optional) indexes for the partial text filters of documenten and "
+        "zaken and the full-text `search` filter of documenten. The indexes are "
+        "created concurrently, so the tables stay writable while they are built. "
+        "Note that every index makes writing documenten and zaken slower."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--drop",
+            action="store_true",
+            help="Drop the indexes instead of creating them.",
+        )
+
+    def handle(self, *args, **options):
+        drop = options["drop"]
+
+        with connection.cursor() as cursor:
+            if not drop:
+                cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+        # indexes can't be created concurrently inside a transaction
+        with connection.schema_editor(atomic=False) as schema_editor:
+            for model, index in SEARCH_INDEXES:
+                with connection.cursor() as cursor:
+                    existing = connection.introspection.get_constraints(
+                        cursor, model._meta.db_table
+                    )
+
+                if drop and index.name in existing:
+                    schema_editor.remove_index(model, index, concurrently=True)
+                    self.stdout.write(f"Dropped index {index.name}.")
+                elif not drop and index.name not in existing:
+                    schema_editor.add_index(model, index, concurrently=True)
+                    self.stdout.write(f"Created index {index.name}.")
@@ -481,6 +481,8 @@ class Command(BaseCommand):
             ]
         )
         self.bulk_create(Status, statussen_generator)
+        # bulk_create doesn't send the signals that maintain the current status
+        Zaak.objects.sync_current_status()
 
         # 1 mln resultaten
         resultaattypen = ResultaatType.objects.order_by("zaaktype", "id")
@@ -588,6 +590,9 @@ class Command(BaseCommand):
 
         documenten_generator = generate_enkelvoudiginformatieobjecten()
         self.bulk_create(EnkelvoudigInformatieObject, documenten_generator)
+        EnkelvoudigInformatieObjectCanonical.objects.filter(
+            latest_version__isnull=True
+        ).update_latest_version()
 
         self.stdout.write("Finished creating documenten")
 
@@ -2,15 +2,19 @@
 # Copyright (C) 2020 Dimpact
 import logging  # noqa
 
-from django.contrib import admin
+from django.conf import settings
+from django.contrib import admin, messages
 from django.db import transaction
 from django.db.models import QuerySet
 from django.http import HttpRequest
 from django.urls import reverse
+from django.utils import timezone
 from django.utils.html import format_html
 from django.utils.translation import gettext_lazy as _
 
-from .models import FailedNotification
+from .constants import OutboxMessageTypes
+from .models import FailedNotification, OutboxMessage
+from .outbox import enqueue, requeue
 from .resend import ResendFailure, resend_notification
 
 logger = logging.getLogger(__name__)
@@ -25,6 +29,17 @@ def resend_notifications(
             logger.info("Not resending already re-sent notification %d", failed.pk)
             continue
 
+        if settings.NOTIFICATIONS_OUTBOX_ENABLED:
+            with transaction.atomic():
+                enqueue(
+                    OutboxMessageTypes.notificatie,
+                    failed.message["kanaal"],
+                    failed.message,
+                )
+                failed.retried_at = timezone.now()
+                failed.save()
+            continue
+
         with transaction.atomic():
             try:
                 resend_notification(failed)
@@ -54,3 +69,45 @@ class FailedNotificationAdmin(admin.ModelAdmin):
             "admin:django_db_logger_statuslog_change", args=(obj.statuslog_ptr_id,)
         )
         return format_html('<a href="{href}">Log entry</a>', href=href)
+
+
+@admin.action(description=_("Requeue %(verbose_name_plural)s"))
+def requeue_outbox_messages(
+    modeladmin: admin.ModelAdmin, request: HttpRequest, queryset: QuerySet
+) -> None:
+    count = requeue(queryset)
+    modeladmin.message_user(
+        request,
+        _("{count} message(s) will be delivered again.").format(count=count),
+        messages.SUCCESS,
+    )
+
+
+@admin.register(OutboxMessage)
+class OutboxMessageAdmin(admin.ModelAdmin):
+    list_display = (
+        "id",
+        "type",
+        "kanaal",
+        "created_at",
+        "attempts",
+        "next_attempt_at",
+        "failed_at",
+    )
+    list_filter = ("type", ("failed_at", admin.EmptyFieldListFilter))
+    date_hierarchy = "created_at"
+    search_fields = ("kanaal",)
+    readonly_fields = (
+        "type",
+        "kanaal",
+        "message",
+        "created_at",
+        "attempts",
+        "next_attempt_at",
+        "failed_at",
+        "last_error",
+    )
+    actions = [requeue_outbox_messages]
+
+    def has_add_permission(self, request: HttpRequest) -> bool:
+        return False
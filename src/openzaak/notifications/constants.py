@@ -0,0 +1,9 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class OutboxMessageTypes(models.TextChoices):
+    notificatie = "notificatie", _("Notificatie")
+    cloudevent = "cloudevent", _("Cloud event")
@@ -2,6 +2,7 @@
 # Copyright (C) 2019 - 2025 Dimpact
 from typing import Dict, cast
 
+from django.core.exceptions import FieldDoesNotExist
 from django.db.models import Field, Model
 
 from glom import glom
@@ -9,6 +10,8 @@ from notifications_api_common.kanalen import Kanaal as _Kanaal
 from rest_framework.request import Request
 from vng_api_common.tests import reverse
 
+from openzaak.components.catalogi.snapshot import get_catalogi_snapshot
+
 
 class Kanaal(_Kanaal):
     @staticmethod
@@ -40,7 +43,7 @@ class Kanaal(_Kanaal):
         data = data or {}
         kenmerken = {}
         for kenmerk in self.kenmerken:
-            value = data.get(kenmerk, glom(obj, kenmerk, default=""))
+            value = data[kenmerk] if kenmerk in data else self.get_value(obj, kenmerk)
             if isinstance(value, Model):
                 if _loose_fk_data := getattr(value, "_loose_fk_data", None):
                     value = _loose_fk_data["url"]
@@ -50,3 +53,25 @@ class Kanaal(_Kanaal):
                         value = request.build_absolute_uri(value)
             kenmerken[kenmerk] = value
         return kenmerken
+
+    @staticmethod
+    def get_value(obj: Model, kenmerk: str):
+        # ⚡️ published catalogi objects (e.g. ``zaaktype`` and ``zaaktype.catalogus``)
+        # are taken from the snapshot instead of the database
+        name, _, path = kenmerk.partition(".")
+        if snapshot := get_catalogi_snapshot():
+            try:
+                field = obj._meta.get_field(name)
+            except FieldDoesNotExist:
+                field = None
+            if fk_field := getattr(field, "fk_field", None):
+                field = obj._meta.get_field(fk_field)
+            if field and field.many_to_one and not field.is_cached(obj):
+                pk = getattr(obj, field.attname)
+                related = (
+                    snapshot.get(field.related_model, pk=pk) if pk is not None else None
+                )
+                if related is not None:
+                    return glom(related, path, default="") if path else related
+
+        return glom(obj, kenmerk, default="")
@@ -0,0 +1,101 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+# Generated by Django 5.2.8 on 2026-10-18 10:12
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notifications_log", "0004_alter_failednotification_status_code"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OutboxMessage",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "type",
+                    models.CharField(
+                        choices=[
+                            ("notificatie", "Notificatie"),
+                            ("cloudevent", "Cloud event"),
+                        ],
+                        default="notificatie",
+                        max_length=20,
+                        verbose_name="type",
+                    ),
+                ),
+                (
+                    "kanaal",
+                    models.CharField(
+                        help_text="Messages with the same kanaal are delivered in the order they were created. For cloud events the event type is used.",
+                        max_length=200,
+                        verbose_name="kanaal",
+                    ),
+                ),
+                (
+                    "message",
+                    models.JSONField(
+                        help_text="Content of the message that will be sent.",
+                        verbose_name="message",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="created at"),
+                ),
+                (
+                    "attempts",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="Number of failed delivery attempts.",
+                        verbose_name="attempts",
+                    ),
+                ),
+                (
+                    "next_attempt_at",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now,
+                        help_text="The message is not delivered before this moment.",
+                        verbose_name="next attempt at",
+                    ),
+                ),
+                (
+                    "failed_at",
+                    models.DateTimeField(
+                        blank=True,
+                        help_text="Timestamp of the last delivery attempt, if the maximum number of retries was reached. Failed messages are only delivered after a requeue.",
+                        null=True,
+                        verbose_name="failed at",
+                    ),
+                ),
+                (
+                    "last_error",
+                    models.TextField(blank=True, verbose_name="last error"),
+                ),
+            ],
+            options={
+                "verbose_name": "outbox message",
+                "verbose_name_plural": "outbox messages",
+                "indexes": [
+                    models.Index(
+                        condition=models.Q(("failed_at__isnull", True)),
+                        fields=["id"],
+                        name="outboxmessage_pending_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -1,10 +1,13 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2020 Dimpact
 from django.db import models
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from django_db_logger.models import StatusLog
 
+from .constants import OutboxMessageTypes
+
 
 class FailedNotification(StatusLog):
     """
@@ -39,3 +42,75 @@ class FailedNotification(StatusLog):
     @property
     def retried(self) -> bool:
         return self.retried_at is not None
+
+
+class OutboxMessageQuerySet(models.QuerySet):
+    def pending(self):
+        return self.filter(failed_at__isnull=True)
+
+
+class OutboxMessage(models.Model):
+    """
+    A notification or cloud event waiting to be delivered to the Notifications API.
+
+    Messages are written in the same database transaction as the change they
+    describe and are delivered afterwards by the outbox dispatcher, see
+    :mod:`openzaak.notifications.outbox`. Delivered messages are removed from the
+    outbox.
+    """
+
+    type = models.CharField(
+        _("type"),
+        max_length=20,
+        choices=OutboxMessageTypes.choices,
+        default=OutboxMessageTypes.notificatie,
+    )
+    kanaal = models.CharField(
+        _("kanaal"),
+        max_length=200,
+        help_text=_(
+            "Messages with the same kanaal are delivered in the order they were "
+            "created. For cloud events the event type is used."
+        ),
+    )
+    message = models.JSONField(
+        _("message"),
+        help_text=_("Content of the message that will be sent."),
+    )
+    created_at = models.DateTimeField(_("created at"), auto_now_add=True)
+    attempts = models.PositiveIntegerField(
+        _("attempts"),
+        default=0,
+        help_text=_("Number of failed delivery attempts."),
+    )
+    next_attempt_at = models.DateTimeField(
+        _("next attempt at"),
+        default=timezone.now,
+        help_text=_("The message is not delivered before this moment."),
+    )
+    failed_at = models.DateTimeField(
+        _("failed at"),
+        null=True,
+        blank=True,
+        help_text=_(
+            "Timestamp of the last delivery attempt, if the maximum number of "
+            "retries was reached. Failed messages are only delivered after a requeue."
+        ),
+    )
+    last_error = models.TextField(_("last error"), blank=True)
+
+    objects = OutboxMessageQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = _("outbox message")
+        verbose_name_plural = _("outbox messages")
+        indexes = [
+            models.Index(
+                fields=["id"],
+                condition=models.Q(failed_at__isnull=True),
+                name="outboxmessage_pending_idx",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.get_type_display()} {self.kanaal} ({self.pk})"
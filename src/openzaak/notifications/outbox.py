@@ -0,0 +1,240 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+"""
+Transactional outbox for notifications and cloud events.
+
+When ``NOTIFICATIONS_OUTBOX_ENABLED`` is set, outgoing messages are stored as
+:class:`openzaak.notifications.models.OutboxMessage` in the same database transaction
+as the change they describe, instead of scheduling a Celery task per message on
+commit. A single dispatcher drains the outbox in batches, using one HTTP session for
+all messages of a run.
+
+Messages of the same kanaal are delivered in the order they were created: if
+delivery of a message fails, later messages of that kanaal wait until it is
+delivered. Failed messages are retried with the exponential backoff configured in
+:class:`notifications_api_common.models.NotificationsConfig`.
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+
+import structlog
+from notifications_api_common.cloudevents import construct_cloudevent
+from notifications_api_common.exponential_backoff import (
+    get_exponential_backoff_interval,
+)
+from notifications_api_common.models import NotificationsConfig
+from notifications_api_common.settings import get_setting
+from notifications_api_common.tasks import send_notification
+from requests.exceptions import RequestException
+
+from openzaak.utils.db import pg_try_advisory_lock
+
+from .constants import OutboxMessageTypes
+from .models import OutboxMessage
+
+logger = structlog.stdlib.get_logger(__name__)
+
+LOCK_ID_OUTBOX_DISPATCH = "dispatch-notifications-outbox"
+
+
+def send_notification_on_commit(message: dict) -> None:
+    """
+    Send the notification once the current transaction is committed.
+    """
+    if not settings.NOTIFICATIONS_OUTBOX_ENABLED:
+        transaction.on_commit(lambda: send_notification.delay(message))
+        return
+
+    enqueue(OutboxMessageTypes.notificatie, message["kanaal"], message)
+
+
+def send_notifications_on_commit(messages: list[dict]) -> None:
+    """
+    Send multiple notifications once the current transaction is committed.
+
+    The messages are scheduled with a single on-commit callback, or written to the
+    outbox with a single query.
+    """
+    if not messages:
+        return
+
+    if not settings.NOTIFICATIONS_OUTBOX_ENABLED:
+
+        def _send():
+            for message in messages:
+                send_notification.delay(message)
+
+        transaction.on_commit(_send)
+        return
+
+    OutboxMessage.objects.bulk_create(
+        OutboxMessage(
+            type=OutboxMessageTypes.notificatie,
+            kanaal=message["kanaal"],
+            message=message,
+        )
+        for message in messages
+    )
+    schedule_dispatch()
+
+
+def enqueue_cloudevent(
+    type: str,
+    subject: str | None = None,
+    dataref: str | None = None,
+    data: dict | None = None,
+) -> None:
+    if not get_setting("NOTIFICATIONS_SOURCE"):
+        logger.warning("cloudevent_not_sent", reason="no_notifications_source")
+        return
+
+    cloudevent = construct_cloudevent(type, subject, dataref, data)
+    enqueue(OutboxMessageTypes.cloudevent, type, cloudevent)
+
+
+def enqueue(type: str, kanaal: str, message: dict) -> OutboxMessage:
+    outbox_message = OutboxMessage.objects.create(
+        type=type, kanaal=kanaal, message=message
+    )
+    schedule_dispatch()
+    return outbox_message
+
+
+def _dispatch() -> None:
+    from .tasks import dispatch_outbox
+
+    dispatch_outbox.delay()
+
+
+def schedule_dispatch() -> None:
+    """
+    Start the dispatcher after the current transaction is committed.
+
+    The dispatcher is started once per transaction, no matter how many messages
+    were added to the outbox.
+    """
+    if any(func is _dispatch for _, func, _robust in connection.run_on_commit):
+        return
+    transaction.on_commit(_dispatch)
+
+
+def requeue(queryset: QuerySet[OutboxMessage]) -> int:
+    """
+    Make the (failed) outbox messages eligible for delivery again.
+    """
+    count = queryset.update(
+        attempts=0, next_attempt_at=timezone.now(), failed_at=None, last_error=""
+    )
+    if count:
+        schedule_dispatch()
+    return count
+
+
+def _deliver(client, outbox_message: OutboxMessage) -> None:
+    if outbox_message.type == OutboxMessageTypes.cloudevent:
+        response = client.post(
+            "cloudevents",
+            json=outbox_message.message,
+            headers={"Content-Type": "application/cloudevents+json"},
+        )
+    else:
+        response = client.post("notificaties", json=outbox_message.message)
+    response.raise_for_status()
+
+
+def _dispatch_batch(
+    client,
+    config: NotificationsConfig,
+    after: int,
+    blocked: set[str],
+    batch_size: int,
+) -> int | None:
+    """
+    Deliver the next batch of pending messages with an id larger than ``after``.
+
+    Returns the id of the last message of the batch, or ``None`` if there are no
+    pending messages left.
+    """
+    batch = list(
+        OutboxMessage.objects.pending().filter(pk__gt=after).order_by("pk")[:batch_size]
+    )
+    if not batch:
+        return None
+
+    now = timezone.now()
+    delivered, retried = [], []
+    for outbox_message in batch:
+        if outbox_message.kanaal in blocked:
+            continue
+        if outbox_message.next_attempt_at > now:
+            blocked.add(outbox_message.kanaal)
+            continue
+
+        try:
+            _deliver(client, outbox_message)
+        except RequestException as exc:
+            blocked.add(outbox_message.kanaal)
+            outbox_message.attempts += 1
+            outbox_message.last_error = str(exc)
+            if outbox_message.attempts > config.notification_delivery_max_retries:
+                outbox_message.failed_at = now
+            else:
+                countdown = get_exponential_backoff_interval(
+                    factor=config.notification_delivery_retry_backoff,
+                    retries=outbox_message.attempts - 1,
+                    maximum=config.notification_delivery_retry_backoff_max,
+                    base=config.notification_delivery_base_factor,
+                )
+                outbox_message.next_attempt_at = now + timedelta(seconds=countdown)
+
+            logger.warning(
+                "outbox_message_delivery_failed",
+                outbox_message_id=outbox_message.pk,
+                kanaal=outbox_message.kanaal,
+                attempts=outbox_message.attempts,
+                final_try=outbox_message.failed_at is not None,
+                exc_info=exc,
+            )
+            retried.append(outbox_message)
+        else:
+            delivered.append(outbox_message.pk)
+
+    OutboxMessage.objects.filter(pk__in=delivered).delete()
+    OutboxMessage.objects.bulk_update(
+        retried, ["attempts", "last_error", "next_attempt_at", "failed_at"]
+    )
+    logger.info(
+        "outbox_batch_dispatched",
+        delivered=len(delivered),
+        failed=len(retried),
+    )
+    return batch[-1].pk
+
+
+def dispatch(batch_size: int | None = None) -> None:
+    """
+    Deliver all pending outbox messages that are due.
+
+    Only one dispatcher runs at a time, which guarantees the per-kanaal ordering.
+    Every batch is processed in its own transaction.
+    """
+    batch_size = batch_size or settings.NOTIFICATIONS_OUTBOX_BATCH_SIZE
+    config = NotificationsConfig.get_solo()
+    client = NotificationsConfig.get_client()
+    if client is None:
+        logger.warning("outbox_dispatch_skipped", reason="no_client")
+        return
+
+    after, blocked = 0, set()
+    with client:
+        while after is not None:
+            with pg_try_advisory_lock(LOCK_ID_OUTBOX_DISPATCH) as acquired:
+                if not acquired:
+                    logger.debug("outbox_dispatch_skipped", reason="locked")
+                    return
+                after = _dispatch_batch(client, config, after, blocked, batch_size)
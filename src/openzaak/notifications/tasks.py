@@ -0,0 +1,15 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from django.conf import settings
+
+from openzaak import celery_app
+
+from .outbox import dispatch
+
+
+@celery_app.task()
+def dispatch_outbox():
+    if not settings.NOTIFICATIONS_OUTBOX_ENABLED:
+        return
+
+    dispatch()
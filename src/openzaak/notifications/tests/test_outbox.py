@@ -0,0 +1,262 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.db import transaction
+from django.test import TestCase, override_settings, tag
+from django.urls import reverse as django_reverse
+from django.utils import timezone
+
+import requests_mock
+from django_webtest import WebTest
+from freezegun import freeze_time
+from maykin_2fa.test import disable_admin_mfa
+from notifications_api_common.models import NotificationsConfig
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import reverse
+
+from openzaak.accounts.tests.factories import SuperUserFactory
+from openzaak.components.besluiten.tests.utils import get_operation_url
+from openzaak.components.catalogi.tests.factories import BesluitTypeFactory
+from openzaak.tests.utils import JWTAuthMixin
+
+from ..constants import OutboxMessageTypes
+from ..models import FailedNotification, OutboxMessage
+from ..outbox import dispatch, send_notification_on_commit
+from . import mock_notification_send, mock_nrc_oas_get
+from .factories import FailedNotificationFactory
+from .mixins import NotificationsConfigMixin
+
+NOTIFICATION = {
+    "kanaal": "zaken",
+    "hoofdObject": "http://testserver/foo",
+    "resource": "zaak",
+    "resourceUrl": "http://testserver/foo",
+    "actie": "create",
+    "aanmaakdatum": "2026-01-01T12:00:00Z",
+    "kenmerken": {},
+}
+
+
+def _notification(kanaal: str, resource_url: str) -> OutboxMessage:
+    return OutboxMessage.objects.create(
+        kanaal=kanaal,
+        message={**NOTIFICATION, "kanaal": kanaal, "resourceUrl": resource_url},
+    )
+
+
+@tag("notifications")
+@override_settings(NOTIFICATIONS_DISABLED=False, NOTIFICATIONS_OUTBOX_ENABLED=True)
+@patch("openzaak.notifications.tasks.dispatch_outbox.delay")
+@patch("notifications_api_common.viewsets.send_notification.delay")
+class OutboxEnqueueTests(NotificationsConfigMixin, JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    @freeze_time("2026-09-07T00:00:00Z")
+    def test_notification_is_written_to_outbox(self, mock_notif, mock_dispatch):
+        besluittype = BesluitTypeFactory.create(concept=False)
+        data = {
+            "verantwoordelijkeOrganisatie": "517439943",
+            "besluittype": f"http://testserver{reverse(besluittype)}",
+            "identificatie": "123123",
+            "datum": "2026-09-06",
+            "ingangsdatum": "2026-10-01",
+        }
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(get_operation_url("besluit_create"), data)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        mock_notif.assert_not_called()
+        mock_dispatch.assert_called_once_with()
+
+        outbox_message = OutboxMessage.objects.get()
+        self.assertEqual(outbox_message.type, OutboxMessageTypes.notificatie)
+        self.assertEqual(outbox_message.kanaal, "besluiten")
+        self.assertEqual(outbox_message.message["resourceUrl"], response.json()["url"])
+        self.assertEqual(outbox_message.message["actie"], "create")
+
+    def test_dispatch_scheduled_once_per_transaction(self, mock_notif, mock_dispatch):
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                send_notification_on_commit(NOTIFICATION)
+                send_notification_on_commit(NOTIFICATION)
+
+        self.assertEqual(OutboxMessage.objects.count(), 2)
+        mock_dispatch.assert_called_once_with()
+
+    def test_rollback_discards_outbox_message(self, mock_notif, mock_dispatch):
+        with self.captureOnCommitCallbacks(execute=True):
+            with self.assertRaises(ValueError), transaction.atomic():
+                send_notification_on_commit(NOTIFICATION)
+                raise ValueError
+
+        self.assertFalse(OutboxMessage.objects.exists())
+        mock_dispatch.assert_not_called()
+
+
+@tag("notifications")
+@requests_mock.Mocker()
+@freeze_time("2026-09-07T00:00:00Z")
+class OutboxDispatchTests(NotificationsConfigMixin, TestCase):
+    def test_messages_are_delivered_in_order(self, m):
+        mock_nrc_oas_get(m)
+        mock_notification_send(m)
+        messages = [
+            _notification("zaken", f"http://testserver/zaken/{i}") for i in range(3)
+        ]
+
+        dispatch(batch_size=2)
+
+        sent = [
+            req.json()["resourceUrl"]
+            for req in m.request_history
+            if req.method == "POST"
+        ]
+        self.assertEqual(sent, [message.message["resourceUrl"] for message in messages])
+        self.assertFalse(OutboxMessage.objects.exists())
+
+    def test_failure_blocks_kanaal(self, m):
+        config = NotificationsConfig.get_solo()
+        config.notification_delivery_max_retries = 3
+        config.save()
+
+        mock_nrc_oas_get(m)
+
+        def json_callback(request, context):
+            if request.json()["resourceUrl"] == "http://testserver/zaken/1":
+                context.status_code = 500
+            return {"dummy": "json"}
+
+        mock_notification_send(m, json=json_callback)
+        failing = _notification("zaken", "http://testserver/zaken/1")
+        other_kanaal = _notification("documenten", "http://testserver/documenten/1")
+        waiting = _notification("zaken", "http://testserver/zaken/2")
+
+        dispatch()
+
+        sent = [
+            req.json()["resourceUrl"]
+            for req in m.request_history
+            if req.method == "POST"
+        ]
+        self.assertEqual(
+            sent, ["http://testserver/zaken/1", "http://testserver/documenten/1"]
+        )
+        self.assertFalse(OutboxMessage.objects.filter(pk=other_kanaal.pk).exists())
+
+        failing.refresh_from_db()
+        self.assertEqual(failing.attempts, 1)
+        self.assertIsNone(failing.failed_at)
+        self.assertEqual(
+            failing.next_attempt_at, timezone.now() + timedelta(seconds=25)
+        )
+
+        waiting.refresh_from_db()
+        self.assertEqual(waiting.attempts, 0)
+
+        # not due yet, so the kanaal stays blocked
+        dispatch()
+
+        self.assertEqual(
+            len([req for req in m.request_history if req.method == "POST"]), 2
+        )
+
+    def test_max_retries_reached(self, m):
+        mock_nrc_oas_get(m)
+        mock_notification_send(m, status_code=403)
+        outbox_message = _notification("zaken", "http://testserver/zaken/1")
+
+        dispatch()
+
+        outbox_message.refresh_from_db()
+        self.assertEqual(outbox_message.attempts, 1)
+        self.assertIsNotNone(outbox_message.failed_at)
+        self.assertFalse(OutboxMessage.objects.pending().exists())
+
+    def test_cloudevent_is_delivered(self, m):
+        mock_nrc_oas_get(m)
+        m.post("https://notificaties-api.vng.cloud/api/v1/cloudevents", status_code=204)
+        OutboxMessage.objects.create(
+            type=OutboxMessageTypes.cloudevent,
+            kanaal="nl.overheid.zaken.zaak-gekoppeld",
+            message={"id": "1", "type": "nl.overheid.zaken.zaak-gekoppeld"},
+        )
+
+        dispatch()
+
+        request = m.last_request
+        self.assertEqual(request.url.rsplit("/", 1)[-1], "cloudevents")
+        self.assertEqual(
+            request.headers["Content-Type"], "application/cloudevents+json"
+        )
+        self.assertFalse(OutboxMessage.objects.exists())
+
+
+@tag("notifications")
+@disable_admin_mfa()
+@override_settings(NOTIFICATIONS_OUTBOX_ENABLED=True)
+@patch("openzaak.notifications.tasks.dispatch_outbox.delay")
+class OutboxAdminTests(NotificationsConfigMixin, WebTest):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.user = SuperUserFactory.create()
+
+    def setUp(self):
+        super().setUp()
+
+        self.app.set_user(self.user)
+
+    def _submit_action(self, url: str, action: str, pks: list[int]):
+        response = self.app.get(url)
+        form = response.forms["changelist-form"]
+        form["action"].select(action)
+        for i, pk in enumerate(pks):
+            form.set("_selected_action", index=i, value=pk)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = form.submit("index")
+
+        self.assertEqual(response.status_code, 302)
+
+    def test_requeue_failed_message(self, mock_dispatch):
+        outbox_message = OutboxMessage.objects.create(
+            kanaal="zaken",
+            message=NOTIFICATION,
+            attempts=3,
+            failed_at=timezone.now(),
+            last_error="500 Server Error",
+        )
+
+        self._submit_action(
+            django_reverse("admin:notifications_log_outboxmessage_changelist"),
+            "requeue_outbox_messages",
+            [outbox_message.pk],
+        )
+
+        outbox_message.refresh_from_db()
+        self.assertEqual(outbox_message.attempts, 0)
+        self.assertIsNone(outbox_message.failed_at)
+        self.assertEqual(outbox_message.last_error, "")
+        mock_dispatch.assert_called_once_with()
+
+    def test_resend_failed_notification_requeues(self, mock_dispatch):
+        failed = FailedNotificationFactory.create()
+
+        self._submit_action(
+            django_reverse("admin:notifications_log_failednotification_changelist"),
+            "resend_notifications",
+            [failed.pk],
+        )
+
+        failed.refresh_from_db()
+        self.assertIsNotNone(failed.retried_at)
+        outbox_message = OutboxMessage.objects.get()
+        self.assertEqual(outbox_message.message, failed.message)
+        self.assertEqual(outbox_message.kanaal, "zaken")
+        self.assertEqual(FailedNotification.objects.count(), 1)
+        mock_dispatch.assert_called_once_with()
@@ -2,13 +2,17 @@
 # Copyright (C) 2020 Dimpact
 from typing import Callable, Dict, List, Union
 
-from django.db import models, transaction
+from django.db import models
 
 import structlog
 from cloudevents.exceptions import GenericException
 from cloudevents.http import CloudEvent, from_http
-from notifications_api_common.tasks import send_notification
-from notifications_api_common.viewsets import NotificationMixin
+from notifications_api_common.viewsets import (
+    NotificationCreateMixin as _NotificationCreateMixin,
+    NotificationDestroyMixin as _NotificationDestroyMixin,
+    NotificationMixin as _NotificationMixin,
+    NotificationUpdateMixin as _NotificationUpdateMixin,
+)
 from rest_framework import status
 from rest_framework.exceptions import ValidationError
 from rest_framework.request import Request
@@ -19,11 +23,40 @@ from vng_api_common.constants import ComponentTypes
 
 from openzaak.utils.permissions import AuthScopesRequired
 
+from .outbox import send_notification_on_commit, send_notifications_on_commit
 from .scopes import SCOPE_CLOUDEVENTS_BEZORGEN
 
 logger = structlog.stdlib.get_logger(__name__)
 
 
+class NotificationMixin(_NotificationMixin):
+    """
+    Send the notifications through the outbox, if enabled.
+    """
+
+    def _message(self, data, instance=None):
+        message = self.construct_message(data, instance=instance)
+        send_notification_on_commit(message)
+
+
+class NotificationCreateMixin(NotificationMixin, _NotificationCreateMixin):
+    pass
+
+
+class NotificationUpdateMixin(NotificationMixin, _NotificationUpdateMixin):
+    pass
+
+
+class NotificationDestroyMixin(NotificationMixin, _NotificationDestroyMixin):
+    pass
+
+
+class NotificationViewSetMixin(
+    NotificationCreateMixin, NotificationUpdateMixin, NotificationDestroyMixin
+):
+    pass
+
+
 class MultipleNotificationMixin(NotificationMixin):
     notification_fields: dict[str, dict[str, str]]
 
@@ -37,6 +70,7 @@ class MultipleNotificationMixin(NotificationMixin):
         super().notify(status_code, data, instance)
 
     def _message(self, data, instance=None):
+        messages = []
         for field, config in self.notification_fields.items():
             field_data = data[field]
             notifications = field_data if isinstance(field_data, list) else [field_data]
@@ -50,8 +84,10 @@ class MultipleNotificationMixin(NotificationMixin):
                     model=config["model"],
                     action=config.get("action"),
                 )
+                messages.append(message)
 
-                transaction.on_commit(lambda msg=message: send_notification.delay(msg))
+        # ⚡️ flush all notifications of the request at once
+        send_notifications_on_commit(messages)
 
 
 type CloudEventHandler = Callable[[CloudEvent], None]
@@ -0,0 +1,52 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TransactionTestCase
+
+from openzaak.components.documenten.models import EnkelvoudigInformatieObject
+from openzaak.components.zaken.models import Zaak
+
+
+def get_index_names(model) -> set[str]:
+    with connection.cursor() as cursor:
+        return set(
+            connection.introspection.get_constraints(cursor, model._meta.db_table)
+        )
+
+
+class CreateSearchIndexesTests(TransactionTestCase):
+    def test_create_and_drop(self):
+        # indexes can't be created concurrently in the transaction of a TestCase
+        self.addCleanup(
+            call_command, "create_search_indexes", drop=True, stdout=StringIO()
+        )
+
+        self.assertNotIn("zaak_omschrijving_trgm_idx", get_index_names(Zaak))
+
+        call_command("create_search_indexes", stdout=StringIO())
+
+        self.assertIn("zaak_omschrijving_trgm_idx", get_index_names(Zaak))
+        self.assertLessEqual(
+            {
+                "eio_titel_trgm_idx",
+                "eio_auteur_trgm_idx",
+                "eio_beschrijving_trgm_idx",
+                "eio_search_idx",
+            },
+            get_index_names(EnkelvoudigInformatieObject),
+        )
+
+        with self.subTest("idempotent"):
+            stdout = StringIO()
+
+            call_command("create_search_indexes", stdout=stdout)
+
+            self.assertEqual(stdout.getvalue(), "")
+
+        call_command("create_search_indexes", drop=True, stdout=StringIO())
+
+        self.assertNotIn("zaak_omschrijving_trgm_idx", get_index_names(Zaak))
+        self.assertNotIn("eio_search_idx", get_index_names(EnkelvoudigInformatieObject))
@@ -170,6 +170,8 @@ class GenerateDataTests(SelectieLijstMixin, APITestCase):
                 )
                 self.assertIsNotNone(zaak.archiefactiedatum)
                 self.assertIsNotNone(zaak.zaakgeometrie)
+                self.assertIsNotNone(zaak._current_status_id)
+                self.assertIsNotNone(zaak._current_statustype_id)
 
         self.assertEqual(
             StatusType.objects.filter(statustype_omschrijving="").count(), 0
@@ -1,13 +1,20 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2024 Dimpact
+import csv
+import json
+import tempfile
 from io import StringIO
+from pathlib import Path
 
-from django.core.management import call_command
+from django.core.management import CommandError, call_command
 from django.test import TestCase
 
 from openzaak.components.catalogi.constants import FormaatChoices
 from openzaak.components.catalogi.tests.factories import EigenschapFactory
-from openzaak.components.zaken.tests.factories import ZaakEigenschapFactory
+from openzaak.components.zaken.tests.factories import (
+    ZaakEigenschapFactory,
+    ZaakFactory,
+)
 
 
 class ZaakEigenschapCommandTests(TestCase):
@@ -81,3 +88,151 @@ class ZaakEigenschapCommandTests(TestCase):
         command_output = stdout.getvalue().splitlines()
         expected_output = ["There are no zaak-eigenschappen to check"]
         self.assertEqual(command_output, expected_output)
+
+    def _create_data(self):
+        eigenschap = EigenschapFactory.create(
+            specificatie_van_eigenschap__formaat=FormaatChoices.getal,
+            specificatie_van_eigenschap__lengte="3,2",
+        )
+        ZaakEigenschapFactory.create_batch(
+            3, eigenschap=eigenschap, waarde="1,5", zaak__zaaktype=eigenschap.zaaktype
+        )
+        invalid = [
+            ZaakEigenschapFactory.create(
+                eigenschap=eigenschap, waarde=waarde, zaak__zaaktype=eigenschap.zaaktype
+            )
+            for waarde in ("1,234", "abc")
+        ]
+        return eigenschap, invalid
+
+    def test_csv(self):
+        stdout, stderr = StringIO(), StringIO()
+        eigenschap, invalid = self._create_data()
+
+        call_command(
+            "check_zaak_eigenschappen",
+            format="csv",
+            chunk_size=2,
+            stdout=stdout,
+            stderr=stderr,
+            no_color=True,
+        )
+
+        rows = list(csv.DictReader(StringIO(stdout.getvalue())))
+        self.assertEqual(
+            rows,
+            [
+                {
+                    "zaak": str(ze.zaak.uuid),
+                    "zaakeigenschap": str(ze.uuid),
+                    "waarde": ze.waarde,
+                    "specificatie": str(eigenschap.specificatie_van_eigenschap),
+                }
+                for ze in invalid
+            ],
+        )
+        self.assertEqual(
+            stderr.getvalue().splitlines(),
+            [
+                "Starting validation of 5 zaak-eigenschappen",
+                "There are 2 zaak-eigenschappen with invalid values",
+            ],
+        )
+
+    def test_sorted_by_zaak_and_naam(self):
+        stdout, stderr = StringIO(), StringIO()
+        eigenschap = EigenschapFactory.create(
+            specificatie_van_eigenschap__formaat=FormaatChoices.getal,
+            specificatie_van_eigenschap__lengte="3,2",
+        )
+        zaak1, zaak2 = ZaakFactory.create_batch(2, zaaktype=eigenschap.zaaktype)
+        invalid = [
+            ZaakEigenschapFactory.create(
+                eigenschap=eigenschap, zaak=zaak, _naam=naam, waarde="abc"
+            )
+            for zaak, naam in ((zaak2, "a"), (zaak1, "b"), (zaak1, "a"))
+        ]
+
+        call_command(
+            "check_zaak_eigenschappen",
+            format="json",
+            chunk_size=1,
+            stdout=stdout,
+            stderr=stderr,
+            no_color=True,
+        )
+
+        rows = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        self.assertEqual(
+            [row["zaakeigenschap"] for row in rows],
+            [str(invalid[2].uuid), str(invalid[1].uuid), str(invalid[0].uuid)],
+        )
+
+    def test_resume(self):
+        _, invalid = self._create_data()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output = Path(tmpdir) / "invalid.json"
+            state_file = Path(tmpdir) / "state.json"
+
+            call_command(
+                "check_zaak_eigenschappen",
+                format="json",
+                chunk_size=1,
+                output=output,
+                state_file=state_file,
+                stdout=StringIO(),
+                stderr=StringIO(),
+            )
+
+            state = json.loads(state_file.read_text())
+            self.assertEqual(state["checked"], 5)
+            self.assertEqual(state["invalid"], 2)
+
+            # the zaakeigenschap is added after the last completed chunk
+            ZaakEigenschapFactory.create(
+                eigenschap=invalid[0].eigenschap,
+                waarde="abcd",
+                zaak__zaaktype=invalid[0].eigenschap.zaaktype,
+            )
+            stderr = StringIO()
+
+            call_command(
+                "check_zaak_eigenschappen",
+                format="json",
+                chunk_size=1,
+                output=output,
+                state_file=state_file,
+                stdout=StringIO(),
+                stderr=stderr,
+            )
+
+            lines = output.read_text().splitlines()
+
+        self.assertEqual(
+            [json.loads(line)["waarde"] for line in lines], ["1,234", "abc", "abcd"]
+        )
+        self.assertIn("Resuming after 5 chunks", stderr.getvalue())
+        self.assertIn(
+            "There are 3 zaak-eigenschappen with invalid values", stderr.getvalue()
+        )
+
+    def test_state_file_with_other_chunk_size(self):
+        self._create_data()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_file = Path(tmpdir) / "state.json"
+            call_command(
+                "check_zaak_eigenschappen",
+                chunk_size=2,
+                state_file=state_file,
+                stdout=StringIO(),
+            )
+
+            with self.assertRaises(CommandError):
+                call_command(
+                    "check_zaak_eigenschappen",
+                    chunk_size=3,
+                    state_file=state_file,
+                    stdout=StringIO(),
+                )
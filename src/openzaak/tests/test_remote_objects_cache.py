@@ -0,0 +1,123 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2025 Dimpact
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+
+import requests_mock
+from django_loose_fk.loaders import FetchError
+from freezegun import freeze_time
+from zgw_consumers.test.factories import ServiceFactory
+
+from openzaak.config.models import ServiceCacheConfig
+from openzaak.loaders import AuthorizedRequestsLoader
+from openzaak.utils.metrics import remote_objects_cache_counter
+
+ZAAKTYPE = (
+    "https://externe.catalogus.nl/api/v1/zaaktypen/b71f72ef-198d-44d8-af64-ae1932df830a"
+)
+
+
+@override_settings(REMOTE_OBJECTS_CACHE_ENABLED=True, REMOTE_OBJECTS_CACHE_TTL=60)
+@freeze_time("2025-01-01T12:00:00")
+class RemoteObjectsCacheTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        caches["remote_objects"].clear()
+        self.addCleanup(caches["remote_objects"].clear)
+
+    @requests_mock.Mocker()
+    def test_cached_within_ttl(self, m):
+        m.get(ZAAKTYPE, json={"url": ZAAKTYPE, "omschrijving": "cached"})
+
+        data1 = AuthorizedRequestsLoader.fetch_object(ZAAKTYPE)
+        data2 = AuthorizedRequestsLoader.fetch_object(ZAAKTYPE)
+
+        self.assertEqual(data1, data2)
+        self.assertEqual(data1["omschrijving"], "cached")
+        self.assertEqual(len(m.request_history), 1)
+
+    @override_settings(REMOTE_OBJECTS_CACHE_ENABLED=False)
+    @requests_mock.Mocker()
+    def test_disabled(self, m):
+        m.get(ZAAKTYPE, json={"url": ZAAKTYPE})
+
+        AuthorizedRequestsLoader.fetch_object(ZAAKTYPE)
+        AuthorizedRequestsLoader.fetch_object(ZAAKTYPE)
+
+        self.assertEqual(len(m.request_history), 2)
+
+    @requests_mock.Mocker()
+    def test_revalidate_with_etag(self, m):
+        m.get(
+            ZAAKTYPE,
+            [
+                {"json": {"url": ZAAKTYPE}, "headers": {"ETag": '"abc"'}},
+                {"status_code": 304, "headers": {"ETag": '"abc"'}},
+            ],
+        )
+
+        with freeze_time("2025-01-01T12:00:00"):
+            AuthorizedRequestsLoader.fetch_object(ZAAKTYPE)
+        with freeze_time("2025-01-01T12:05:00"):
+            data = AuthorizedRequestsLoader.fetch_object(ZAAKTYPE)
+
+        self.assertEqual(data, {"url": ZAAKTYPE})
+        self.assertEqual(len(m.request_history), 2)
+        self.assertEqual(m.last_request.headers["If-None-Match"], '"abc"')
+
+    @requests_mock.Mocker()
+    def test_cache_control(self, m):
+        for cache_control in ("no-store", "no-cache", "max-age=0"):
+            with self.subTest(cache_control=cache_control):
+                caches["remote_objects"].clear()
+                m.reset_mock()
+                m.get(
+                    ZAAKTYPE,
+                    json={"url": ZAAKTYPE},
+                    headers={"Cache-Control": cache_control},
+                )
+
+                AuthorizedRequestsLoader.fetch_object(ZAAKTYPE)
+                AuthorizedRequestsLoader.fetch_object(ZAAKTYPE)
+
+                self.assertEqual(len(m.request_history), 2)
+
+    @requests_mock.Mocker()
+    def test_service_ttl(self, m):
+        service = ServiceFactory.create(api_root="https://externe.catalogus.nl/api/v1/")
+        ServiceCacheConfig.objects.create(service=service, ttl=0)
+        m.get(ZAAKTYPE, json={"url": ZAAKTYPE})
+
+        AuthorizedRequestsLoader.fetch_object(ZAAKTYPE)
+        AuthorizedRequestsLoader.fetch_object(ZAAKTYPE)
+
+        self.assertEqual(len(m.request_history), 2)
+
+    @requests_mock.Mocker()
+    def test_errors_are_not_cached(self, m):
+        m.get(ZAAKTYPE, [{"status_code": 500}, {"json": {"url": ZAAKTYPE}}])
+
+        with self.assertRaises(FetchError):
+            AuthorizedRequestsLoader.fetch_object(ZAAKTYPE)
+
+        data = AuthorizedRequestsLoader.fetch_object(ZAAKTYPE)
+
+        self.assertEqual(data, {"url": ZAAKTYPE})
+
+    @patch.object(
+        remote_objects_cache_counter, "add", wraps=remote_objects_cache_counter.add
+    )
+    @requests_mock.Mocker()
+    def test_metrics(self, mock_add: MagicMock, m):
+        m.get(ZAAKTYPE, json={"url": ZAAKTYPE})
+
+        AuthorizedRequestsLoader.fetch_object(ZAAKTYPE)
+        AuthorizedRequestsLoader.fetch_object(ZAAKTYPE)
+
+        self.assertEqual(
+            [call.args for call in mock_add.call_args_list],
+            [(1, {"result": "miss"}), (1, {"result": "hit"})],
+        )
@@ -1,29 +1,111 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
+import threading
+import time
+from typing import Dict, Iterable, Tuple
+
 import structlog
 from zgw_consumers.constants import AuthTypes
 
+from .cache import VersionedLocalCache
+
 logger = structlog.stdlib.get_logger(__name__)
 
+# a JWT is regenerated this many seconds before it expires
+JWT_REFRESH_MARGIN = 30
+# receivers check the ``iat`` claim against their own expiry (e.g. ``JWT_EXPIRY`` of
+# one hour in Open Zaak) instead of the ``exp`` claim, so a JWT is never reused for
+# longer than this number of seconds, whatever ``jwt_valid_for`` says
+JWT_MAX_REUSE = 5 * 60
 
-def get_auth(url: str) -> dict:
-    from zgw_consumers.client import ServiceConfigAdapter
+services_cache = VersionedLocalCache("services", maxsize=1)
+
+
+class ServiceIndex:
+    """
+    Look up the configured service of a URL by the longest matching API root.
+
+    The index also holds the auth headers built for the services, so that
+    rebuilding the index after a service changed discards those as well.
+    """
+
+    def __init__(self, services: Iterable):
+        self._services = {service.api_root: service for service in services}
+        # longest first, so the first match is the most specific API root
+        self._lengths = sorted({len(api_root) for api_root in self._services})[::-1]
+        self._auth_headers: Dict[int, Tuple[dict, float]] = {}
+        self._lock = threading.Lock()
+
+    def get_service(self, url: str):
+        for length in self._lengths:
+            if (service := self._services.get(url[:length])) is not None:
+                return service
+        return None
+
+    def get_auth_headers(self, service) -> dict:
+        with self._lock:
+            headers, valid_until = self._auth_headers.get(service.pk, ({}, 0))
+        if valid_until > time.time():
+            return headers
+
+        headers, valid_for = self._build_auth_headers(service)
+        if valid_for > 0:
+            with self._lock:
+                self._auth_headers[service.pk] = (headers, time.time() + valid_for)
+        return headers
+
+    @staticmethod
+    def _build_auth_headers(service) -> Tuple[dict, float]:
+        """
+        Return the auth headers and the number of seconds they can be reused.
+        """
+        from zgw_consumers.client import ServiceConfigAdapter
+
+        if service.auth_type == AuthTypes.zgw:
+            auth = ServiceConfigAdapter(service).get_client_session_kwargs()["auth"]
+            return (
+                {"Authorization": f"Bearer {auth._token}"},
+                min(service.jwt_valid_for, JWT_MAX_REUSE) - JWT_REFRESH_MARGIN,
+            )
+        elif service.auth_type == AuthTypes.api_key:
+            auth = ServiceConfigAdapter(service).get_client_session_kwargs()["auth"]
+            return {auth.header: auth.key}, float("inf")
+
+        logger.debug("no_auth_configured_for_service", url=service.api_root)
+
+        return {}, float("inf")
+
+
+def get_service_index() -> ServiceIndex:
     from zgw_consumers.models import Service
 
+    return services_cache.get_or_set(
+        "index",
+        lambda: ServiceIndex(Service.objects.select_related("cache_config")),
+    )
+
+
+def invalidate_service_index() -> None:
+    """
+    Discard the service index of all processes.
+    """
+    services_cache.invalidate()
+
+
+def get_service(url: str):
+    """
+    Return the configured service for the URL, like ``Service.get_service``.
+    """
+    return get_service_index().get_service(url)
+
+
+def get_auth(url: str) -> dict:
     logger.info("authenticating_for_url", url=url)
-    service = Service.get_service(url)
+    index = get_service_index()
+    service = index.get_service(url)
 
     if not service:
         logger.warning("no_service_found_for_url", url=url)
         return {}
 
-    if service.auth_type == AuthTypes.zgw:
-        auth = ServiceConfigAdapter(service).get_client_session_kwargs()["auth"]
-        return {"Authorization": f"Bearer {auth._token}"}
-    elif service.auth_type == AuthTypes.api_key:
-        auth = ServiceConfigAdapter(service).get_client_session_kwargs()["auth"]
-        return {auth.header: auth.key}
-
-    logger.debug("no_auth_configured_for_service", url=url)
-
-    return {}
+    return index.get_auth_headers(service)
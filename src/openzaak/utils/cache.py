@@ -1,15 +1,34 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2022 Dimpact
+import hashlib
+import threading
+import time
+import uuid
+from collections import OrderedDict
 from contextlib import contextmanager
-from typing import Iterable
+from functools import partial
+from typing import Callable, Hashable, Iterable, Optional, TypeVar, Union
 
+from django.conf import settings
 from django.core.cache import caches
+from django.db import transaction
 
+import requests
 import requests_cache
 from requests_cache import BaseCache, clear, install_cache, uninstall_cache
 from requests_cache.policy import CacheSettings
 from requests_cache.session import CachedSession
 
+from .metrics import local_cache_counter
+
+T = TypeVar("T")
+
+CACHE_VERSION_KEY = "openzaak:cache-version:{name}"
+
+REMOTE_OBJECTS_CACHE = "remote_objects"
+# expired objects with an ETag are kept around this long to revalidate them
+REMOTE_OBJECTS_STALE_TIMEOUT = 24 * 60 * 60
+
 
 class DjangoCacheStorage(requests_cache.BaseStorage):
     """
@@ -126,3 +145,223 @@ def requests_cache_enabled(*args, **kwargs):
         vng_api_common.client.Client = original_client
         clear()
         uninstall_cache()
+
+
+def get_cache_version(name: str) -> str:
+    """
+    Return the current version of a (per-process) cache, shared by all processes
+    through the default Django cache.
+    """
+    cache = caches["default"]
+    key = CACHE_VERSION_KEY.format(name=name)
+
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid.uuid4().hex, timeout=None)
+        version = cache.get(key)
+
+    # the default cache does not store anything (e.g. a dummy cache), so the
+    # version can't be shared and nothing may be cached
+    if version is None:
+        return uuid.uuid4().hex
+    return version
+
+
+def _set_cache_version(name: str) -> None:
+    key = CACHE_VERSION_KEY.format(name=name)
+    caches["default"].set(key, uuid.uuid4().hex, timeout=None)
+
+
+def invalidate_cache_version(name: str) -> None:
+    """
+    Invalidate the entries of a versioned cache in all processes.
+
+    The version is changed immediately and once more when the current transaction
+    is committed, to discard entries that other processes computed from the
+    uncommitted state in the meantime.
+    """
+    _set_cache_version(name)
+    transaction.on_commit(partial(_set_cache_version, name))
+
+
+class VersionedLocalCache:
+    """
+    Bounded per-process LRU cache, of which the entries are invalidated in all
+    processes at once with :func:`invalidate_cache_version`.
+
+    Every lookup costs one read from the default Django cache (to check the version),
+    which makes it suitable to replace expensive database work, not cheap lookups.
+    """
+
+    def __init__(self, name: str, maxsize: int = 1024):
+        self.name = name
+        self.maxsize = maxsize
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_set(self, key: Hashable, default: Callable[[], T]) -> T:
+        # read the version before computing the value, so that an invalidation while
+        # computing makes the entry stale immediately
+        version = get_cache_version(self.name)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+        value = default()
+
+        with self._lock:
+            self._entries[key] = (version, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+        return value
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate(self) -> None:
+        invalidate_cache_version(self.name)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class LocalLRUCache:
+    """
+    Bounded per-process LRU cache for values that are expensive to build, but never
+    go stale (e.g. compiled expressions).
+
+    Lookups are counted in the ``openzaak.local_cache.lookups`` metric, by cache name
+    and result (hit or miss).
+    """
+
+    def __init__(self, name: str, maxsize: int = 256):
+        self.name = name
+        self.maxsize = maxsize
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[T]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+
+        local_cache_counter.add(
+            1, {"cache": self.name, "result": "miss" if value is None else "hit"}
+        )
+        return value
+
+    def set(self, key: Hashable, value: T) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_set(self, key: Hashable, default: Callable[[], T]) -> T:
+        value = self.get(key)
+        if value is None:
+            value = default()
+            self.set(key, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class RemoteObjectsCache:
+    """
+    Cache the JSON data of objects fetched from external APIs.
+
+    The data is stored in the ``remote_objects`` Django cache, together with the
+    ``ETag`` of the response so that expired objects can be revalidated with a
+    conditional request. ``Cache-Control: no-store`` responses are not cached, and
+    ``no-cache`` and ``max-age`` shorten the TTL of the service.
+    """
+
+    def __init__(self, ttl: int):
+        self.ttl = ttl
+
+    @classmethod
+    def for_url(cls, url: str) -> Optional["RemoteObjectsCache"]:
+        """
+        Return the cache for the service of the url, if caching is enabled for it.
+        """
+        from .auth import get_service
+
+        if not settings.REMOTE_OBJECTS_CACHE_ENABLED:
+            return None
+
+        ttl = settings.REMOTE_OBJECTS_CACHE_TTL
+        service = get_service(url)
+        if service is not None:
+            cache_config = getattr(service, "cache_config", None)
+            if cache_config is not None:
+                ttl = cache_config.ttl
+
+        return cls(ttl) if ttl else None
+
+    @property
+    def cache(self):
+        return caches[REMOTE_OBJECTS_CACHE]
+
+    @staticmethod
+    def get_cache_key(url: str) -> str:
+        return f"openzaak:remote-object:{hashlib.sha256(url.encode()).hexdigest()}"
+
+    def get(self, url: str) -> Optional[dict]:
+        return self.cache.get(self.get_cache_key(url))
+
+    @staticmethod
+    def is_fresh(entry: dict) -> bool:
+        return entry["expires"] > time.time()
+
+    def set(
+        self, url: str, data: Union[dict, list], response: requests.Response
+    ) -> None:
+        directives = parse_cache_control(response.headers.get("Cache-Control", ""))
+        if "no-store" in directives:
+            return
+
+        ttl = self.ttl
+        if "no-cache" in directives:
+            ttl = 0
+        elif (max_age := directives.get("max-age")) is not None:
+            ttl = min(ttl, max_age)
+
+        etag = response.headers.get("ETag", "")
+        timeout = ttl + (REMOTE_OBJECTS_STALE_TIMEOUT if etag else 0)
+        if not timeout:
+            return
+
+        entry = {"data": data, "etag": etag, "expires": time.time() + ttl}
+        self.cache.set(self.get_cache_key(url), entry, timeout=timeout)
+
+
+def parse_cache_control(header: str) -> dict:
+    """
+    Parse the directives of a ``Cache-Control`` header, with the integer value of
+    ``max-age`` (if valid).
+    """
+    directives = {}
+    for directive in header.split(","):
+        name, _, value = directive.strip().partition("=")
+        if not name:
+            continue
+        name = name.lower()
+        if name == "max-age":
+            try:
+                directives[name] = max(int(value.strip('"')), 0)
+            except ValueError:
+                continue
+        else:
+            directives[name] = value
+    return directives
@@ -0,0 +1,163 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+"""
+Conditional retrieves with a fast path for ``If-None-Match`` requests.
+
+:func:`vng_api_common.caching.conditional_retrieve` determines the ETag of the
+resource by loading it through the viewset, and the handler loads the resource again
+if it was modified. Clients polling a resource with ``If-None-Match`` mostly get a
+``304 Not Modified`` though, for which only the stored ETag value is needed.
+
+The fast path looks up the stored ETag with a single query (and a cache lookup for
+the Documenten API) and applies the authorizations to the requested object in the
+same query. If the ETag
+matches, ``304 Not Modified`` is returned right away. In all other cases (modified,
+no stored ETag, not authorized, not found...) the regular handling is used, so the
+responses are the same as without the fast path.
+"""
+
+import functools
+import time
+from typing import Optional
+
+from django.conf import settings
+from django.db import models
+from django.http import HttpResponseNotModified
+from django.utils.http import parse_etags, quote_etag
+
+from rest_framework_condition.decorators import condition as drf_condition
+from vng_api_common.caching.etags import etag_func
+from vng_api_common.caching.registry import extract_dependencies
+from vng_api_common.permissions import bypass_permissions
+
+from .metrics import conditional_requests_counter, conditional_requests_duration
+from .permissions import AuthRequired, MultipleObjectsAuthRequired
+
+# query parameters which don't select another version of the resource
+IGNORED_QUERY_PARAMS = {"expand"}
+
+
+def _etag_matches(etag: str, if_none_match: str) -> bool:
+    etags = parse_etags(if_none_match)
+    if etags == ["*"]:
+        return True
+    # weak comparison, see django.utils.cache._if_none_match_passes
+    target = quote_etag(etag).removeprefix("W/")
+    return target in (value.removeprefix("W/") for value in etags)
+
+
+def filter_for_authorizations(view, queryset: models.QuerySet):
+    """
+    Apply the authorizations of the client to ``queryset``, similar to the list
+    endpoints.
+
+    Returns ``None`` if the object permissions of the view can't be expressed as a
+    filter.
+    """
+    request = view.request
+    if bypass_permissions(request):
+        return queryset
+
+    permissions = view.get_permissions()
+    if any(isinstance(perm, MultipleObjectsAuthRequired) for perm in permissions):
+        return None
+    if not all(isinstance(perm, AuthRequired) for perm in permissions):
+        return None
+
+    # the scopes are already checked by AuthRequired.has_permission
+    if not any(perm.permission_fields for perm in permissions):
+        return queryset
+
+    apps = request.jwt_auth.applicaties
+    if any(app.heeft_alle_autorisaties for app in apps):
+        return queryset
+
+    if not hasattr(queryset, "filter_for_authorizations"):
+        return None
+
+    component = view.queryset.model._meta.app_label
+    return queryset.filter_for_authorizations(
+        view.required_scopes[view.action],
+        request.jwt_auth.get_autorisaties(component),
+        request.jwt_auth.get_catalogus_autorisaties(component),
+        applicatie_ids=[app.id for app in apps],
+    )
+
+
+def get_stored_etag(view, etag_field: str) -> Optional[str]:
+    """
+    Return the stored ETag value of the requested resource, if the client is
+    authorized to retrieve it.
+    """
+    if set(view.request.query_params) - IGNORED_QUERY_PARAMS:
+        return None
+
+    lookup_url_kwarg = view.lookup_url_kwarg or view.lookup_field
+    queryset = view.get_queryset().prefetch_related(None)
+    # resolve the requested object (e.g. the latest version of a document) before
+    # the authorizations are applied, otherwise they could select another object
+    # that the client is allowed to retrieve
+    requested = queryset.filter(
+        **{view.lookup_field: view.kwargs[lookup_url_kwarg]}
+    ).values("pk")[:1]
+    queryset = filter_for_authorizations(view, queryset.filter(pk__in=requested))
+    if queryset is None:
+        return None
+
+    # ETags which are not stored in the database, see DocumentETagMixin
+    if hasattr(queryset.model, "get_stored_etag"):
+        return queryset.model.get_stored_etag(queryset)
+    return queryset.values_list(etag_field, flat=True).first()
+
+
+def conditional_retrieve(
+    action="retrieve",
+    etag_field="_etag",
+    extra_depends_on: Optional[set[str]] = None,
+):
+    """
+    Decorate a viewset to apply conditional GET requests.
+
+    Drop-in replacement of :func:`vng_api_common.caching.conditional_retrieve`,
+    which answers ``If-None-Match`` requests for unmodified resources without
+    loading them.
+    """
+
+    def decorator(viewset: type):
+        extract_dependencies(viewset, extra_depends_on or set())
+        condition = drf_condition(
+            etag_func=functools.partial(etag_func, etag_field=etag_field)
+        )
+        handler = condition(getattr(viewset, action))
+        resource = viewset.queryset.model._meta.model_name
+
+        @functools.wraps(handler)
+        def fast_path_handler(self, request, *args, **kwargs):
+            if_none_match = request.headers.get("If-None-Match")
+            if not if_none_match or not settings.CONDITIONAL_GET_FAST_PATH_ENABLED:
+                return handler(self, request, *args, **kwargs)
+
+            start = time.perf_counter()
+            etag = get_stored_etag(self, etag_field)
+            if etag and _etag_matches(etag, if_none_match):
+                response = HttpResponseNotModified()
+                response.headers["ETag"] = quote_etag(etag)
+                result = "hit"
+            else:
+                response = handler(self, request, *args, **kwargs)
+                result = "modified" if etag else "fallback"
+
+            attributes = {"resource": resource, "result": result}
+            conditional_requests_counter.add(1, attributes)
+            conditional_requests_duration.record(
+                (time.perf_counter() - start) * 1000, attributes
+            )
+            return response
+
+        setattr(viewset, action, fast_path_handler)
+        if not hasattr(viewset, "_conditional_retrieves"):
+            viewset._conditional_retrieves = []
+        viewset._conditional_retrieves.append(action)
+        return viewset
+
+    return decorator
@@ -7,6 +7,8 @@ from notifications_api_common.cloudevents import (
 )
 from vng_api_common.tests import reverse
 
+from openzaak.notifications.outbox import enqueue_cloudevent
+
 
 def process_cloudevent(
     type: str,
@@ -14,7 +16,12 @@ def process_cloudevent(
     dataref: str | None = None,
     data: dict | None = None,
 ):
-    if settings.ENABLE_CLOUD_EVENTS:
+    if not settings.ENABLE_CLOUD_EVENTS:
+        return
+
+    if settings.NOTIFICATIONS_OUTBOX_ENABLED:
+        enqueue_cloudevent(type, subject, dataref, data)
+    else:
         _process_cloudevent(type, subject, dataref, data)
 
 
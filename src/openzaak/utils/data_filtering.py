@@ -13,34 +13,47 @@ class ListFilterByAuthorizationsMixin:
     :class:`openzaak.utils.query.LooseFkAuthorizationsFilterMixin`
     """
 
+    # actions exposing (aggregated) data of multiple objects
+    filter_by_authorizations_actions = ("list",)
+
     def get_queryset(self):
         base = super().get_queryset()
 
-        # drf-yasg introspection - doesn't run the middleware, so this isn't set
-        if not hasattr(self.request, "jwt_auth"):
-            return base
-
         # we do not apply the filtering for update/partial_update/delete,
         # because the resource _does exist_, you just don't have permission
         # to do those operations. A 403 is semantically more correct than a
         # 404, which would be the result if the queryset is always filtered.
-        if self.action != "list":
+        if self.action not in self.filter_by_authorizations_actions:
             return base
 
+        return self.filter_by_authorizations(base)
+
+    def filter_by_authorizations(self, queryset):
+        """
+        Filter ``queryset`` by the authorizations of the client for the current
+        action.
+        """
+        # drf-yasg introspection - doesn't run the middleware, so this isn't set
+        if not hasattr(self.request, "jwt_auth"):
+            return queryset
+
         # get the auth apps that are relevant for this particular request
         apps = self.request.jwt_auth.applicaties
 
         # as soon as there's one matching app that gives you all permissions,
         # you're good - no further detailed data filtering is applied
         if any(app.heeft_alle_autorisaties for app in apps):
-            return base
+            return queryset
 
         scope_needed = self.required_scopes[self.action]
-        component = base.model._meta.app_label
+        component = queryset.model._meta.app_label
         authorizations = self.request.jwt_auth.get_autorisaties(component)
         catalogus_authorizations = self.request.jwt_auth.get_catalogus_autorisaties(
             component
         )
-        return base.filter_for_authorizations(
-            scope_needed, authorizations, catalogus_authorizations
+        return queryset.filter_for_authorizations(
+            scope_needed,
+            authorizations,
+            catalogus_authorizations,
+            applicatie_ids=[app.id for app in apps],
         )
@@ -15,3 +15,20 @@ def pg_advisory_lock(lock_id: str, using="default"):
             sql = f"SELECT pg_advisory_xact_lock({_lock_id})"
             cursor.execute(sql)
             yield
+
+
+@contextmanager
+def pg_try_advisory_lock(lock_id: str, using="default"):
+    """
+    Non-blocking variant of :func:`pg_advisory_lock`.
+
+    Yields whether the lock was acquired, the lock is released when the
+    transaction exits.
+    """
+    _lock_id = zlib.crc32(lock_id.encode("utf-8"))
+    with transaction.atomic(using=using):
+        connection = connections[using]
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT pg_try_advisory_xact_lock({_lock_id})")
+            (acquired,) = cursor.fetchone()
+            yield acquired
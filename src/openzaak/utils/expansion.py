@@ -1,12 +1,23 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2023 Dimpact
-from typing import Dict, Iterator, List, Optional, Tuple, Type, Union
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
+from django.conf import settings
 from django.db import models
 from django.utils.module_loading import import_string
 
 import structlog
-from django_loose_fk.loaders import FetchError
+from django_loose_fk.loaders import FetchError, default_loader
 from django_loose_fk.virtual_models import ProxyMixin
 from djangorestframework_camel_case.render import CamelCaseJSONRenderer
 from rest_framework.request import Request
@@ -18,6 +29,7 @@ from rest_framework_inclusions.renderer import (
     should_skip_inclusions,
 )
 
+from openzaak.loaders import prefetched_objects
 from openzaak.utils.serializer_fields import FKOrServiceUrlField
 
 logger = structlog.stdlib.get_logger(__name__)
@@ -26,11 +38,23 @@ EXPAND_KEY = "_expand"
 EXPAND_QUERY_PARAM = "expand"
 
 
+class DeferredExternal(NamedTuple):
+    """
+    external loose-fk object, which is resolved after the current expansion level
+    """
+
+    url: str
+    field: Field
+    instance: models.Model
+
+
 class InclusionNode:
     """
     very simple implementation of the tree to display inclusions
     """
 
+    __slots__ = ("id", "value", "label", "many", "parent", "_children", "_child_ids")
+
     def __init__(
         self,
         id: str,
@@ -44,7 +68,8 @@ class InclusionNode:
         self.label = label
         self.many = many
         self.parent = parent
-        self._children = []
+        self._children: List["InclusionNode"] = []
+        self._child_ids: Set[str] = set()
 
         if self.parent:
             self.parent.add_child(self)
@@ -54,6 +79,7 @@ class InclusionNode:
 
     def add_child(self, node: "InclusionNode"):
         self._children.append(node)
+        self._child_ids.add(node.id)
 
     def display_children(self) -> dict:
         """
@@ -69,44 +95,48 @@ class InclusionNode:
         return results
 
     def display(self) -> dict:
-        data = self.value.copy()
-        if self._children:
-            data[EXPAND_KEY] = self.display_children()
-        return data
+        # the value can be shared between nodes of the same object, so it's only
+        # copied when the expanded children need to be added
+        if not self._children:
+            return self.value
+        return {**self.value, EXPAND_KEY: self.display_children()}
 
     def has_child(self, id) -> bool:
-        return any(child.id == id for child in self._children)
+        return id in self._child_ids
 
 
 class InclusionTree:
     """
     strictly speaking it's not a tree but a collection of nodes
     It's a little helper class to display nested inclusions
+
+    The same object can be included in multiple places, so there can be multiple
+    nodes with the same id.
     """
 
     def __init__(self):
-        self._nodes = []
+        self._root_nodes: List[InclusionNode] = []
+        self._nodes_by_id: Dict[str, List[InclusionNode]] = {}
 
     def add_node(
         self, id: str, value: dict, label: str, many: bool, parent_id: str = None
     ) -> None:
         if not parent_id:
             node = InclusionNode(id, value, label, many)
-            self._nodes.append(node)
+            self._root_nodes.append(node)
+            self._nodes_by_id.setdefault(id, []).append(node)
             return
 
         parent_nodes = [
-            n for n in self._nodes if n.id == parent_id and not n.has_child(id)
+            n for n in self._nodes_by_id.get(parent_id, []) if not n.has_child(id)
         ]
         for parent_node in parent_nodes:
             node = InclusionNode(id, value, label, many, parent=parent_node)
-            self._nodes.append(node)
+            self._nodes_by_id.setdefault(id, []).append(node)
 
     def display_tree(self) -> dict:
         result = {}
-        root_nodes = [n for n in self._nodes if n.parent is None]
-
-        for node in root_nodes:
+        for node in self._root_nodes:
             result[node.id] = node.display_children()
         return result
 
@@ -125,6 +155,7 @@ class ExpandLoader(InclusionLoader):
         super().__init__(*args, **kwargs)
 
         self._seen_external: Dict[str, ProxyMixin] = {}
+        self._deferred: List[tuple] = []
 
     def inclusions_dict(self, serializer: Serializer) -> dict:
         """
@@ -164,7 +195,11 @@ class ExpandLoader(InclusionLoader):
                 many=False,
             )
 
-        entries = self._inclusions((), serializer, serializer.instance)
+        entries = list(self._inclusions((), serializer, serializer.instance))
+        # external objects are collected per expansion level and fetched in one go
+        while self._deferred:
+            deferred, self._deferred = self._deferred, []
+            entries += self._deferred_inclusions(deferred)
 
         for obj, inclusion_serializer, parent, path, many in entries:
             data = (
@@ -233,6 +268,11 @@ class ExpandLoader(InclusionLoader):
         for obj in self._some_related_field_inclusions(
             new_path, field, instance, inclusion_serializer
         ):
+            if isinstance(obj, DeferredExternal):
+                entry = (obj, inclusion_serializer, instance, new_path, many)
+                self._deferred.append((*entry, inclusion_serializers))
+                continue
+
             yield obj, inclusion_serializer, instance, new_path, many
             # when we do inclusions in inclusions, we base path off our
             # parent object path, not the sub-field
@@ -286,21 +326,57 @@ class ExpandLoader(InclusionLoader):
             # check in cache
             if obj in self._seen_external:
                 yield self._seen_external[obj]
-
             else:
-                try:
-                    # model field descriptor uses loader for external urls
-                    instance = getattr(instance, field.field_name)
-                except FetchError:
-                    return
-                else:
-                    self._seen_external[obj] = instance
-                    yield instance
+                yield DeferredExternal(url=obj, field=field, instance=instance)
 
         # local
         else:
             yield obj
 
+    def _deferred_inclusions(self, deferred: List[tuple]) -> List[tuple]:
+        """
+        fetch the external objects of one expansion level concurrently, and continue
+        with the inclusions of these objects
+        """
+        urls = {
+            external.url
+            for external, *_ in deferred
+            if external.url not in self._seen_external
+            and not default_loader.is_local_url(external.url)
+        }
+
+        entries = []
+        with prefetched_objects(
+            urls, max_workers=settings.EXPAND_MAX_CONCURRENT_REQUESTS
+        ):
+            for item in deferred:
+                external, inclusion_serializer, parent, path, many, serializers = item
+                obj = self._resolve_external(external)
+                if obj is None:
+                    continue
+
+                entries.append((obj, inclusion_serializer, parent, path, many))
+                entries += self._instance_inclusions(
+                    path,
+                    inclusion_serializer(instance=object),
+                    obj,
+                    serializers,
+                )
+        return entries
+
+    def _resolve_external(self, external: DeferredExternal) -> Optional[models.Model]:
+        if external.url in self._seen_external:
+            return self._seen_external[external.url]
+
+        try:
+            # model field descriptor uses loader for external urls
+            obj = getattr(external.instance, external.field.field_name)
+        except FetchError:
+            return None
+
+        self._seen_external[external.url] = obj
+        return obj
+
     def _has_been_seen(self, obj: models.Model) -> bool:
         """
         we don't deduplicate objects here
@@ -8,6 +8,7 @@ from rest_framework.exceptions import ParseError
 from vng_api_common.constants import VertrouwelijkheidsAanduiding
 
 from .expansion import get_expand_options_for_serializer
+from .help_text import mark_experimental
 
 
 class CharArrayFilter(filters.BaseInFilter, filters.CharFilter):
@@ -53,6 +54,27 @@ class ExpandFilter(filters.BaseInFilter, filters.ChoiceFilter):
         return qs
 
 
+class CursorFilter(filters.CharFilter):
+    """
+    Documents the ``cursor`` query parameter. The pagination itself is done by
+    :class:`openzaak.utils.pagination.CursorPaginationMixin`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault(
+            "help_text",
+            mark_experimental(
+                "Schakelt cursor-paginatie in. Geef een lege waarde op voor de eerste "
+                "pagina en volg daarna de `next` link. In deze modus wordt `count` "
+                "niet berekend en is `previous` altijd leeg."
+            ),
+        )
+        super().__init__(*args, **kwargs)
+
+    def filter(self, qs, value):
+        return qs
+
+
 class KeyValueFilter(filters.CharFilter):
     def __init__(self, key_field_name, value_field_name, *args, **kwargs):
         validators = kwargs.get("validators", [])
@@ -0,0 +1,49 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from django.contrib.gis.db.models.functions import GeomOutputGeoFunc
+from django.db.models import QuerySet
+
+# size (in pixels) of the (web mercator) tiles used by map viewers
+TILE_SIZE = 256
+
+MAX_ZOOM_LEVEL = 24
+
+
+class SimplifyPreserveTopology(GeomOutputGeoFunc):
+    """
+    Simplify the geometry with the Douglas-Peucker algorithm, without producing
+    invalid geometries.
+    """
+
+    arity = 2
+
+
+def get_simplify_tolerance(zoom_level: int) -> float:
+    """
+    Return the size of a pixel (in degrees) at the given zoom level.
+
+    Details smaller than a pixel are invisible on the map, so this is the tolerance
+    to simplify geometries (in EPSG:4326) with.
+    """
+    return 360 / (TILE_SIZE * 2**zoom_level)
+
+
+def get_simplified_attname(field_name: str) -> str:
+    return f"_{field_name}_simplified"
+
+
+def simplify(queryset: QuerySet, field_name: str, zoom_level: int) -> QuerySet:
+    """
+    Select the simplified geometry instead of the full geometry of ``field_name``.
+
+    The simplified geometry is output by
+    :class:`openzaak.utils.serializer_fields.SimplifiedGeometryField`.
+    """
+    tolerance = get_simplify_tolerance(zoom_level)
+    return queryset.defer(field_name).annotate(
+        **{
+            get_simplified_attname(field_name): SimplifyPreserveTopology(
+                field_name, tolerance
+            )
+        }
+    )
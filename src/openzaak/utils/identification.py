@@ -0,0 +1,211 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+"""
+Counters to generate human readable identifications (``<PREFIX>-<year>-<number>``)
+per organisation and year.
+"""
+
+from collections.abc import Iterable
+
+from django.apps import apps
+from django.db import connections, models
+from django.db.models.functions import Cast, Substr
+from django.utils.translation import gettext_lazy as _
+
+from vng_api_common.fields import RSINField
+
+
+def get_identificatie_prefix(model_name: str, year: int) -> str:
+    return f"{model_name}-{year}-"
+
+
+def format_identificatie(model_name: str, year: int, number: int) -> str:
+    return f"{get_identificatie_prefix(model_name, year)}{number:010d}"
+
+
+def parse_identificatie(model_name: str, identificatie: str) -> tuple[int, int] | None:
+    """
+    Return the year and number of an identification in the generated format.
+    """
+    parts = identificatie.split("-")
+    if len(parts) != 3 or parts[0] != model_name:
+        return None
+    year, number = parts[1:]
+    if not (len(year) == 4 and year.isdigit() and number.isdigit()):
+        return None
+    if len(number) > 18:
+        return None
+    return int(year), int(number)
+
+
+def get_max_number(queryset: models.QuerySet, prefix: str) -> int:
+    """
+    Return the highest number of the identifications in ``queryset`` which start
+    with ``prefix``.
+    """
+    result = (
+        queryset.filter(identificatie__regex=rf"^{prefix}[0-9]{{1,18}}$")
+        .annotate(
+            _number=Cast(
+                Substr("identificatie", len(prefix) + 1), models.BigIntegerField()
+            )
+        )
+        .aggregate(max_number=models.Max("_number"))
+    )
+    return result["max_number"] or 0
+
+
+class IdentificatieCounterManager(models.Manager):
+    """
+    :param identificatie_models: the labels (``app_label.ModelName``) of the models
+      which store the identifications handed out by the counters.
+    """
+
+    def __init__(self, *identificatie_models: str):
+        super().__init__()
+        self.identificatie_models = identificatie_models
+
+    def get_last_used_number(self, organisation: str, year: int) -> int:
+        """
+        Determine the highest number in use for the organisation and year, based on
+        the existing identifications.
+        """
+        prefix = get_identificatie_prefix(self.model.IDENTIFICATIE_PREFIX, year)
+        return max(
+            (
+                get_max_number(
+                    apps.get_model(label)._default_manager.filter(
+                        bronorganisatie=organisation
+                    ),
+                    prefix,
+                )
+                for label in self.identificatie_models
+            ),
+            default=0,
+        )
+
+    def reserve(self, organisation: str, year: int, amount: int = 1) -> int:
+        """
+        Reserve ``amount`` consecutive numbers and return the last one.
+
+        The counter row is incremented atomically with ``UPDATE ... RETURNING``. The
+        row lock is held until the transaction exits, so concurrent reservations for
+        the same organisation and year wait for each other, but reservations for other
+        organisations or years are not affected.
+
+        If there is no counter yet, it is seeded from the existing identifications.
+        Concurrent seeding is resolved by the unique constraint: the losing
+        transaction increments the counter created by the winning transaction.
+        """
+        table = self.model._meta.db_table
+        with connections[self.db].cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {table} SET last_number = last_number + %s "
+                "WHERE bronorganisatie = %s AND jaar = %s RETURNING last_number",
+                [amount, organisation, year],
+            )
+            row = cursor.fetchone()
+            if row is not None:
+                return row[0]
+
+            seed = self.get_last_used_number(organisation, year)
+            cursor.execute(
+                f"INSERT INTO {table} (bronorganisatie, jaar, last_number) "
+                "VALUES (%s, %s, %s) "
+                "ON CONFLICT (bronorganisatie, jaar) DO UPDATE "
+                f"SET last_number = {table}.last_number + %s "
+                "RETURNING last_number",
+                [organisation, year, seed + amount, amount],
+            )
+            return cursor.fetchone()[0]
+
+    def synchronize(self, organisation: str, year: int, number: int = None) -> None:
+        """
+        Move the counter past identifications that were not generated through it.
+
+        Clients are allowed to supply their own identification, which can be in the
+        same format as the generated ones. If ``number`` is not given, it is
+        determined from the existing identifications.
+
+        The counter is created if it doesn't exist yet, so that the row is locked
+        until the transaction exits: a concurrent reservation waits for the
+        identification to be committed and continues after it. A counter that is
+        past the number already is not locked.
+        """
+        if number is None:
+            number = self.get_last_used_number(organisation, year)
+
+        table = self.model._meta.db_table
+        with connections[self.db].cursor() as cursor:
+            # don't lock the counter if it is past the number already
+            cursor.execute(
+                f"SELECT last_number FROM {table} "
+                "WHERE bronorganisatie = %s AND jaar = %s",
+                [organisation, year],
+            )
+            row = cursor.fetchone()
+            if row is not None and row[0] >= number:
+                return
+
+            cursor.execute(
+                f"UPDATE {table} SET last_number = GREATEST(last_number, %s) "
+                "WHERE bronorganisatie = %s AND jaar = %s",
+                [number, organisation, year],
+            )
+            if cursor.rowcount:
+                return
+
+            seed = max(number, self.get_last_used_number(organisation, year))
+            cursor.execute(
+                f"INSERT INTO {table} (bronorganisatie, jaar, last_number) "
+                "VALUES (%s, %s, %s) "
+                "ON CONFLICT (bronorganisatie, jaar) DO UPDATE "
+                f"SET last_number = GREATEST({table}.last_number, %s)",
+                [organisation, year, seed, seed],
+            )
+
+    def register(self, identificaties: Iterable[tuple[str, str]]) -> None:
+        """
+        Synchronize the counters with the given (bronorganisatie, identificatie)
+        pairs, which were supplied by clients or assigned outside of the counters.
+        """
+        last_numbers: dict[tuple[str, int], int] = {}
+        for organisation, identificatie in identificaties:
+            parsed = parse_identificatie(self.model.IDENTIFICATIE_PREFIX, identificatie)
+            if parsed is None:
+                continue
+            year, number = parsed
+            key = (organisation, year)
+            last_numbers[key] = max(number, last_numbers.get(key, 0))
+
+        for (organisation, year), number in last_numbers.items():
+            self.synchronize(organisation, year, number)
+
+
+class IdentificatieCounter(models.Model):
+    """
+    Keep track of the last generated identification number per organisation and year.
+
+    Generating identifications only locks the counter of the organisation and year
+    instead of scanning the existing identifications under a global lock.
+    """
+
+    bronorganisatie = RSINField(
+        help_text=_(
+            "Het RSIN van de organisatie waarvoor de nummers worden uitgegeven."
+        )
+    )
+    jaar = models.PositiveSmallIntegerField(
+        _("year"), help_text=_("Het jaar waarvoor de nummers worden uitgegeven.")
+    )
+    last_number = models.PositiveBigIntegerField(
+        _("last number"), help_text=_("Het laatst uitgegeven volgnummer.")
+    )
+
+    IDENTIFICATIE_PREFIX: str
+
+    class Meta:
+        abstract = True
+
+    def __str__(self):
+        return f"{self.bronorganisatie} - {self.jaar}: {self.last_number}"
@@ -3,6 +3,7 @@
 from typing import Tuple
 
 from django.core.exceptions import EmptyResultSet
+from django.db.models import Field, Lookup
 from django.db.models.lookups import Exact as _Exact, In as _In
 
 from django_loose_fk.lookups import get_normalized_value
@@ -276,3 +277,28 @@ class NotIn(In):
         sql, params = super().as_sql(compiler, connection)
         sql = "NOT {}".format(sql)
         return sql, params
+
+
+@Field.register_lookup
+class Any(Lookup):
+    """
+    ``field = ANY(%s)`` lookup with all the values in a single array parameter.
+
+    Compared to ``__in``, this keeps the SQL and the number of query parameters the
+    same regardless of the amount of values.
+    """
+
+    lookup_name = "any"
+
+    def get_prep_lookup(self) -> list:
+        output_field = self.lhs.output_field
+        return [output_field.get_prep_value(value) for value in self.rhs]
+
+    def as_sql(self, compiler, connection):
+        lhs_sql, lhs_params = self.process_lhs(compiler, connection)
+        output_field = self.lhs.output_field
+        values = [
+            output_field.get_db_prep_value(value, connection, prepared=True)
+            for value in self.rhs
+        ]
+        return f"{lhs_sql} = ANY(%s)", (*lhs_params, values)
@@ -0,0 +1,41 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2025 Dimpact
+from opentelemetry import metrics
+
+meter = metrics.get_meter("openzaak.utils")
+
+remote_objects_cache_counter = meter.create_counter(
+    "openzaak.remote_objects.cache_lookups",
+    description=(
+        "Amount of lookups in the cache of objects fetched from external APIs, by "
+        "result (hit, miss or revalidated)."
+    ),
+    unit="1",
+)
+
+local_cache_counter = meter.create_counter(
+    "openzaak.local_cache.lookups",
+    description=(
+        "Amount of lookups in the per-process caches of compiled expressions and "
+        "validators, by cache name and result (hit or miss)."
+    ),
+    unit="1",
+)
+
+conditional_requests_counter = meter.create_counter(
+    "openzaak.conditional_requests",
+    description=(
+        "Amount of detail requests with an If-None-Match header, by resource and "
+        "result (hit, modified or fallback)."
+    ),
+    unit="1",
+)
+
+conditional_requests_duration = meter.create_histogram(
+    "openzaak.conditional_requests.duration",
+    description=(
+        "Duration of detail requests with an If-None-Match header, by resource and "
+        "result (hit, modified or fallback)."
+    ),
+    unit="ms",
+)
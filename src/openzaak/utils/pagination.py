@@ -1,13 +1,24 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2023 Dimpact
+import binascii
+import json
+import operator
+from base64 import urlsafe_b64decode, urlsafe_b64encode
 from collections import OrderedDict
+from functools import reduce
 
 from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured, ValidationError
 from django.core.paginator import Paginator as DjangoPaginator
+from django.db.models import Q
+from django.db.models.constants import LOOKUP_SEP
 from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
 
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import PageNumberPagination, _positive_int
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 from vng_api_common.pagination import DynamicPageSizeMixin
 
 from .help_text import mark_experimental
@@ -74,4 +85,206 @@ class FuzzyPagination(DynamicPageSizeMixin, PageNumberPagination):
         return paginated_schema
 
 
+class CursorPaginationMixin:
+    """
+    Opt-in keyset (cursor) pagination on top of page number pagination.
+
+    As soon as the ``cursor`` query parameter is present (an empty value requests
+    the first page), the page is selected with a ``WHERE (ordering key, pk) > cursor``
+    condition instead of an ``OFFSET`` and no ``COUNT`` query is done, which makes
+    the response time independent of the depth of the page. The cursor is an opaque
+    value which clients obtain from the ``next`` link.
+
+    The ordering of the (filtered) queryset is respected, as long as it consists of
+    concrete fields of the model itself. The primary key is appended as tie-breaker
+    to make the ordering total, except for ``DISTINCT ON`` querysets, where the
+    distinct fields already identify a single row.
+    """
+
+    cursor_query_param = "cursor"
+    invalid_cursor_message = _("Ongeldige cursor.")
+
+    cursor_mode = False
+    next_cursor = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_mode = self.cursor_query_param in request.query_params
+        if not self.cursor_mode:
+            return super().paginate_queryset(queryset, request, view=view)
+
+        self.request = request
+        self.page_size = self.get_page_size(request)
+
+        ordering, keyset = self.get_keyset_ordering(queryset)
+        position = self.decode_cursor(request, keyset)
+        if position is not None:
+            queryset = queryset.filter(self.get_keyset_filter(keyset, position))
+
+        # ⚡ fetch one extra record to determine if there is a next page, rather
+        # than counting the whole result set
+        results = list(queryset.order_by(*ordering)[: self.page_size + 1])
+        self.next_cursor = None
+        if len(results) > self.page_size:
+            results = results[: self.page_size]
+            self.next_cursor = self.encode_cursor(results[-1], keyset)
+
+        return results
+
+    def get_keyset_ordering(self, queryset):
+        """
+        Return the ordering to apply and the (field, descending) keys of the keyset.
+        """
+        model = queryset.model
+        query = queryset.query
+        ordering = list(query.order_by)
+        if not ordering and query.default_ordering:
+            ordering = list(model._meta.ordering)
+
+        keys = []
+        for item in ordering:
+            if not isinstance(item, str) or item == "?":
+                raise ImproperlyConfigured(
+                    f"Cursor pagination does not support ordering by {item!r}"
+                )
+
+            descending = item.startswith("-")
+            name = item.lstrip("-")
+            if name == "pk":
+                name = model._meta.pk.name
+            if LOOKUP_SEP in name:
+                raise ImproperlyConfigured(
+                    f"Cursor pagination does not support ordering on related field {name!r}"
+                )
+
+            keys.append((model._meta.get_field(name), descending))
+
+        if query.distinct_fields:
+            # DISTINCT ON requires the ordering to start with the distinct fields, which
+            # are unique within the result set
+            return ordering, keys[: len(query.distinct_fields)]
+
+        if model._meta.pk not in [field for field, _descending in keys]:
+            descending = keys[-1][1] if keys else False
+            ordering.append("-pk" if descending else "pk")
+            keys.append((model._meta.pk, descending))
+
+        return ordering, keys
+
+    def get_keyset_filter(self, keyset, position) -> Q:
+        """
+        Build the ``(k1, k2, ...) > (v1, v2, ...)`` condition for the keyset.
+
+        Postgres sorts NULL values last in ascending order and first in descending
+        order, which is taken into account for nullable ordering fields.
+        """
+        conditions = []
+        preceding = Q()
+        for (field, descending), value in zip(keyset, position):
+            name = field.name
+            if value is None:
+                if descending:
+                    conditions.append(preceding & Q(**{f"{name}__isnull": False}))
+                preceding &= Q(**{f"{name}__isnull": True})
+                continue
+
+            after = Q(**{f"{name}__lt" if descending else f"{name}__gt": value})
+            if field.null and not descending:
+                after |= Q(**{f"{name}__isnull": True})
+            conditions.append(preceding & after)
+            preceding &= Q(**{name: value})
+
+        if not conditions:
+            return Q(pk__in=[])
+        return reduce(operator.or_, conditions)
+
+    def encode_cursor(self, instance, keyset) -> str:
+        payload = {
+            "o": [
+                ("-" if descending else "") + field.name for field, descending in keyset
+            ],
+            "v": [getattr(instance, field.attname) for field, _descending in keyset],
+        }
+        # ``str`` keeps the full precision of dates, datetimes and UUIDs, which
+        # ``Field.to_python`` parses again when decoding
+        data = json.dumps(payload, default=str, separators=(",", ":"))
+        return urlsafe_b64encode(data.encode("utf-8")).decode("ascii").rstrip("=")
+
+    def decode_cursor(self, request, keyset):
+        encoded = request.query_params[self.cursor_query_param]
+        if not encoded:
+            return None
+
+        try:
+            padding = "=" * (-len(encoded) % 4)
+            payload = json.loads(urlsafe_b64decode(encoded + padding))
+            ordering = [
+                ("-" if descending else "") + field.name for field, descending in keyset
+            ]
+            # a cursor is only valid for the ordering it was created with
+            if payload["o"] != ordering or len(payload["v"]) != len(keyset):
+                raise NotFound(self.invalid_cursor_message)
+
+            return [
+                None if value is None else field.to_python(value)
+                for (field, _descending), value in zip(keyset, payload["v"])
+            ]
+        except (
+            binascii.Error,
+            UnicodeDecodeError,
+            ValueError,
+            TypeError,
+            KeyError,
+            ValidationError,
+        ):
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_paginated_response(self, data):
+        if not self.cursor_mode:
+            return super().get_paginated_response(data)
+
+        return Response(
+            OrderedDict(
+                [
+                    ("count", None),
+                    ("next", self.get_next_link()),
+                    ("previous", None),
+                    ("results", data),
+                ]
+            )
+        )
+
+    def get_paginated_response_schema(self, schema):
+        paginated_schema = super().get_paginated_response_schema(schema)
+        paginated_schema["properties"]["count"]["nullable"] = True
+        return paginated_schema
+
+    def get_next_link(self):
+        if not self.cursor_mode:
+            return super().get_next_link()
+
+        if self.next_cursor is None:
+            return None
+
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, self.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_previous_link(self):
+        if not self.cursor_mode:
+            return super().get_previous_link()
+
+        return None
+
+
+class ExactCursorPagination(CursorPaginationMixin, ExactPagination):
+    pass
+
+
+class FuzzyCursorPagination(CursorPaginationMixin, FuzzyPagination):
+    pass
+
+
 OptimizedPagination = FuzzyPagination if settings.FUZZY_PAGINATION else ExactPagination
+OptimizedCursorPagination = (
+    FuzzyCursorPagination if settings.FUZZY_PAGINATION else ExactCursorPagination
+)
@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
 from collections import defaultdict
+from typing import Dict, Iterable, Optional, Union
 from urllib.parse import urlparse
 
 from django.conf import settings
@@ -12,6 +13,11 @@ from vng_api_common.constants import VertrouwelijkheidsAanduiding
 from vng_api_common.scopes import Scope
 from vng_api_common.utils import get_resources_for_paths
 
+from .cache import VersionedLocalCache
+
+# resolved authorizations per (model, loose-fk field, scope, applicaties)
+authorizations_filter_cache = VersionedLocalCache("authorizations-filter")
+
 
 class QueryBlocked(Exception):
     pass
@@ -68,31 +74,26 @@ class LooseFkAuthorizationsFilterMixin:
             queryset = self.filter(local_filters | external_filters)
         return queryset
 
-    def get_filters(
+    def resolve_authorizations(
         self,
-        scope,
         authorizations,
         catalogus_authorizations=None,
         local=True,
-        use_va=True,
-    ) -> Q:
-        prefix = self.prefix
-        loose_fk_field = (
-            f"_{self.loose_fk_field}" if local else f"_{self.loose_fk_field}_url"
-        )
-
+    ) -> Dict[Union[int, str], Optional[int]]:
+        """
+        Map the allowed loose-fk objects to the highest vertrouwelijkheidaanduiding
+        order they may be read with.
+
+        Local objects are identified by their primary key, external objects by their
+        URL. Objects that are only authorized without a
+        ``max_vertrouwelijkheidaanduiding`` map to ``None``.
+        """
         # resource URLs to either use as-is or resolve to database records
         resource_urls = [
             getattr(authorization, self.loose_fk_field)
             for authorization in authorizations
         ]
 
-        # keep a list of allowed loose-fk objects
-        loose_fk_objecten = []
-        # build the case/when to map the max_vertrouwelijkheidaanduiding based
-        # on the ``zaaktype``
-        va_mapping = defaultdict(list)
-
         if not local:
             loose_fk_object_map = dict(zip(resource_urls, resource_urls))
         else:
@@ -107,19 +108,36 @@ class LooseFkAuthorizationsFilterMixin:
                 sorted_objects = sorted(
                     loose_fk_objects, key=lambda o: o.get_absolute_api_url()
                 )
-                loose_fk_object_map = dict(zip(sorted(resource_urls), sorted_objects))
+                loose_fk_object_map = {
+                    url: loose_fk_object.pk
+                    for url, loose_fk_object in zip(
+                        sorted(resource_urls), sorted_objects
+                    )
+                }
 
-        for authorization in authorizations:
-            resource_url = getattr(authorization, self.loose_fk_field)
-            loose_fk_object = loose_fk_object_map[resource_url]
-            loose_fk_objecten.append(loose_fk_object)
+        allowed = {}
 
+        def _allow(key, max_vertrouwelijkheidaanduiding: str):
             # extract the order and map it to the database value
-            if authorization.max_vertrouwelijkheidaanduiding:
-                choice_item_order = VertrouwelijkheidsAanduiding.get_choice_order(
-                    authorization.max_vertrouwelijkheidaanduiding
+            order = (
+                VertrouwelijkheidsAanduiding.get_choice_order(
+                    max_vertrouwelijkheidaanduiding
                 )
-                va_mapping[choice_item_order].append(loose_fk_object)
+                if max_vertrouwelijkheidaanduiding
+                else None
+            )
+            # being allowed up to the highest level means being allowed for every
+            # lower level as well, so only the highest level is relevant
+            current = allowed.get(key)
+            if current is None or (order is not None and order > current):
+                allowed[key] = order
+
+        for authorization in authorizations:
+            resource_url = getattr(authorization, self.loose_fk_field)
+            _allow(
+                loose_fk_object_map[resource_url],
+                authorization.max_vertrouwelijkheidaanduiding,
+            )
 
         if catalogus_authorizations:
             for catalogus_authorisation in catalogus_authorizations:
@@ -128,30 +146,58 @@ class LooseFkAuthorizationsFilterMixin:
                 ).all()
 
                 for instance in resources:
-                    loose_fk_objecten.append(instance)
+                    _allow(
+                        instance.pk,
+                        catalogus_authorisation.max_vertrouwelijkheidaanduiding,
+                    )
+
+        return allowed
 
-                    # extract the order and map it to the database value
-                    if catalogus_authorisation.max_vertrouwelijkheidaanduiding:
-                        choice_item_order = (
-                            VertrouwelijkheidsAanduiding.get_choice_order(
-                                catalogus_authorisation.max_vertrouwelijkheidaanduiding
-                            )
-                        )
-                        va_mapping[choice_item_order].append(instance)
+    def build_filters(
+        self,
+        allowed: Dict[Union[int, str], Optional[int]],
+        local=True,
+        use_va=True,
+    ) -> Q:
+        prefix = self.prefix
+        loose_fk_field = (
+            f"_{self.loose_fk_field}" if local else f"_{self.loose_fk_field}_url"
+        )
+        # ⚡ local objects are filtered on their primary keys with a single array
+        # parameter, which keeps the query compact for hundreds of loose-fk objects
+        lookup = f"{prefix}{loose_fk_field}__{'any' if local else 'in'}"
 
         if not use_va:
-            return Q(**{f"{prefix}{loose_fk_field}__in": loose_fk_objecten})
+            return Q(**{lookup: list(allowed)})
 
         # Combine the filters: group the minimum required confidentiality with
         # the instances (zaaktypen/informatieobjecttypen) for which this constraint
         # applies
+        va_mapping = defaultdict(list)
+        for key, max_va in allowed.items():
+            if max_va is not None:
+                va_mapping[max_va].append(key)
+
         filters = Q()
-        for max_va, instances in va_mapping.items():
-            filters |= Q(_va_order__lte=max_va) & Q(
-                **{f"{prefix}{loose_fk_field}__in": instances}
-            )
+        for max_va, keys in sorted(va_mapping.items()):
+            filters |= Q(_va_order__lte=max_va) & Q(**{lookup: keys})
         return filters
 
+    def get_filters(
+        self,
+        scope,
+        authorizations,
+        catalogus_authorizations=None,
+        local=True,
+        use_va=True,
+    ) -> Q:
+        allowed = self.resolve_authorizations(
+            authorizations,
+            catalogus_authorizations=catalogus_authorizations,
+            local=local,
+        )
+        return self.build_filters(allowed, local=local, use_va=use_va)
+
     def get_authorizations(self, scope: Scope, authorizations: models.QuerySet):
         authorizations_local = []
         authorizations_external = []
@@ -175,24 +221,60 @@ class LooseFkAuthorizationsFilterMixin:
         scope: Scope,
         authorizations: models.QuerySet,
         catalogus_authorizations: models.QuerySet,
+        applicatie_ids: Optional[Iterable[int]] = None,
     ) -> models.QuerySet:
+        """
+        Filter the queryset on the objects the authorizations give access to.
+
+        If the ``applicatie_ids`` the authorizations belong to are provided, the
+        resolved authorizations are cached per process, see
+        :func:`invalidate_authorizations_filter_cache`.
+        """
         # todo implement error if no loose-fk field
 
-        authorizations_local, authorizations_external = self.get_authorizations(
-            scope, authorizations
-        )
+        def _resolve():
+            authorizations_local, authorizations_external = self.get_authorizations(
+                scope, authorizations
+            )
+            allowed_local = self.resolve_authorizations(
+                authorizations_local,
+                catalogus_authorizations=catalogus_authorizations,
+                local=True,
+            )
+            allowed_external = self.resolve_authorizations(
+                authorizations_external, local=False
+            )
+            return allowed_local, allowed_external
 
-        local_filters = self.get_filters(
-            scope,
-            authorizations_local,
-            catalogus_authorizations=catalogus_authorizations,
-            local=True,
-            use_va=self.vertrouwelijkheidaanduiding_use,
+        if applicatie_ids is None:
+            allowed_local, allowed_external = _resolve()
+        else:
+            cache_key = (
+                self.model._meta.label,
+                self.loose_fk_field,
+                scope.label,
+                tuple(sorted(applicatie_ids)),
+                # determines which authorizations are local
+                tuple(settings.ALLOWED_HOSTS),
+            )
+            allowed_local, allowed_external = authorizations_filter_cache.get_or_set(
+                cache_key, _resolve
+            )
+
+        local_filters = self.build_filters(
+            allowed_local, local=True, use_va=self.vertrouwelijkheidaanduiding_use
         )
-        external_filters = self.get_filters(
-            scope,
-            authorizations_external,
-            local=False,
-            use_va=self.vertrouwelijkheidaanduiding_use,
+        external_filters = self.build_filters(
+            allowed_external, local=False, use_va=self.vertrouwelijkheidaanduiding_use
         )
         return self.build_queryset(local_filters, external_filters)
+
+
+def invalidate_authorizations_filter_cache() -> None:
+    """
+    Discard the resolved authorizations of all processes.
+
+    Must be called whenever authorizations change, or when the loose-fk objects they
+    refer to are created or removed.
+    """
+    authorizations_filter_cache.invalidate()
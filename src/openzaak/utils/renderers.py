@@ -6,3 +6,27 @@ from vng_api_common.views import ERROR_CONTENT_TYPE
 
 class ProblemJSONRenderer(CamelCaseJSONRenderer):
     media_type = ERROR_CONTENT_TYPE
+
+
+class NDJSONRenderer(CamelCaseJSONRenderer):
+    """
+    Content negotiation for streamed NDJSON responses.
+
+    The streamed content is produced by the view itself, (error) responses with
+    data are rendered as JSON.
+    """
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+
+
+class CSVRenderer(CamelCaseJSONRenderer):
+    """
+    Content negotiation for streamed CSV responses.
+
+    The streamed content is produced by the view itself, (error) responses with
+    data are rendered as JSON.
+    """
+
+    media_type = "text/csv"
+    format = "csv"
@@ -209,7 +209,7 @@ class AutoSchema(_AutoSchema):
             return request_serializer
 
         filter_params = self._get_filter_parameters()
-        search_input_serializer = self.view.search_input_serializer_class
+        search_input_serializer = self.view.get_search_input_serializer_class()
         schema = self._map_serializer(search_input_serializer, "request")
         # add query params to request body schema
         for filter_param in filter_params:
@@ -1,12 +1,19 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
+from urllib.parse import ParseResult, urlparse
+
+from django.db import models
 from django.utils.translation import gettext_lazy as _
 
-from django_loose_fk.drf import FKOrURLField, FKOrURLValidator
+from django_loose_fk.drf import FKOrURLField, FKOrURLValidator, Resolver
+from django_loose_fk.utils import is_local
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
+from rest_framework_gis.fields import GeometryField
 from vng_api_common.validators import URLValidator
 
+from .gis import get_simplified_attname
+
 
 class LengthValidationMixin:
     default_error_messages = {
@@ -52,6 +59,25 @@ class LengthHyperlinkedRelatedField(
     pass
 
 
+def get_from_catalogi_snapshot(path: str) -> models.Model | None:
+    from openzaak.components.catalogi.snapshot import get_catalogi_snapshot
+
+    if not (snapshot := get_catalogi_snapshot()):
+        return None
+    return snapshot.get_for_path(path)
+
+
+class SnapshotResolver(Resolver):
+    """
+    Resolve the local URLs of published catalogi objects without querying them.
+    """
+
+    def resolve_local(self, parsed: ParseResult) -> models.Model:
+        if (instance := get_from_catalogi_snapshot(parsed.path)) is not None:
+            return instance
+        return super().resolve_local(parsed)
+
+
 class FKOrServiceUrlValidator(FKOrURLValidator):
     # TODO: move this to validators.py
     RESOLVED_INSTANCE_CONTEXT_KEY = "_resolved_instance"
@@ -65,6 +91,17 @@ class FKOrServiceUrlValidator(FKOrURLValidator):
         if serializer_field.context.get(context_key) is not None:
             return
 
+        # ⚡️ published catalogi objects are taken from the in-memory snapshot
+        host = serializer_field.context["request"].get_host()
+        if isinstance(url, str) and is_local(host, url):
+            instance = get_from_catalogi_snapshot(urlparse(url).path)
+            if instance is not None:
+                serializer_field.context["resolver"] = SnapshotResolver(
+                    *serializer_field._get_model_and_field()
+                )
+                serializer_field.context[context_key] = instance
+                return
+
         try:
             super().__call__(url, serializer_field)
         except ValueError as exc:
@@ -76,7 +113,6 @@ class FKOrServiceUrlValidator(FKOrURLValidator):
         # to the serializer context - we can use this to resolve the object and cache
         # it for other validators to skip some DB queries
         resolver = serializer_field.context["resolver"]
-        host = serializer_field.context["request"].get_host()
         resolved_instance = resolver.resolve(host, url)
         serializer_field.context[context_key] = resolved_instance
 
@@ -116,3 +152,17 @@ class FKOrServiceUrlField(FKOrURLField):
         source = source.split("__")[0]
         model_field = model_class._meta.get_field(source)
         return model_class, model_field
+
+
+class SimplifiedGeometryField(GeometryField):
+    """
+    Output the simplified geometry if the queryset selected it.
+
+    See :func:`openzaak.utils.gis.simplify`.
+    """
+
+    def get_attribute(self, instance):
+        attname = get_simplified_attname(self.source)
+        if hasattr(instance, attname):
+            return getattr(instance, attname)
+        return super().get_attribute(instance)
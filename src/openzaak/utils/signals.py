@@ -5,8 +5,13 @@ from io import StringIO
 from django.apps import apps
 from django.contrib.contenttypes.management import create_contenttypes
 from django.core.management import call_command
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 from django_admin_index.models import AppGroup
+from zgw_consumers.models import Service
+
+from .auth import invalidate_service_index
 
 
 def update_admin_index(sender, **kwargs):
@@ -20,3 +25,17 @@ def update_admin_index(sender, **kwargs):
             create_contenttypes(app_config, verbosity=0)
 
     call_command("loaddata", "default_admin_index", verbosity=0, stdout=StringIO())
+
+
+@receiver(
+    [post_save, post_delete],
+    sender=Service,
+    dispatch_uid="utils.invalidate_service_index_service",
+)
+@receiver(
+    [post_save, post_delete],
+    sender="config.ServiceCacheConfig",
+    dispatch_uid="utils.invalidate_service_index_servicecacheconfig",
+)
+def invalidate_services(sender, **kwargs) -> None:
+    invalidate_service_index()
@@ -0,0 +1,108 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2025 Dimpact
+from django.test import TestCase
+
+from freezegun import freeze_time
+from zgw_consumers.constants import AuthTypes
+from zgw_consumers.test.factories import ServiceFactory
+
+from openzaak.utils.auth import get_auth, get_service, invalidate_service_index
+
+
+class GetServiceTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        # the index outlives the rolled back services of other tests
+        invalidate_service_index()
+
+    def test_longest_api_root_matches(self):
+        ServiceFactory.create(api_root="https://example.com/")
+        service = ServiceFactory.create(api_root="https://example.com/catalogi/api/v1/")
+        ServiceFactory.create(api_root="https://example.com/catalogi/api/v2/")
+
+        self.assertEqual(
+            get_service("https://example.com/catalogi/api/v1/zaaktypen/1"), service
+        )
+        self.assertIsNone(get_service("https://other.example.com/catalogi/api/v1/"))
+
+    def test_no_queries_in_steady_state(self):
+        ServiceFactory.create(api_root="https://example.com/")
+        get_service("https://example.com/zaaktypen/1")
+
+        with self.assertNumQueries(0):
+            get_service("https://example.com/zaaktypen/2")
+
+    def test_invalidated_on_service_change(self):
+        service = ServiceFactory.create(api_root="https://example.com/")
+        self.assertEqual(get_service("https://example.com/zaaktypen/1"), service)
+
+        service.api_root = "https://other.example.com/"
+        service.save()
+
+        self.assertIsNone(get_service("https://example.com/zaaktypen/1"))
+
+        service.delete()
+
+        self.assertIsNone(get_service("https://other.example.com/zaaktypen/1"))
+
+
+class GetAuthTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        # the index outlives the rolled back services of other tests
+        invalidate_service_index()
+
+    def test_api_key(self):
+        ServiceFactory.create(
+            api_root="https://example.com/",
+            auth_type=AuthTypes.api_key,
+            header_key="X-Api-Key",
+            header_value="secret",
+        )
+
+        self.assertEqual(
+            get_auth("https://example.com/zaaktypen/1"), {"X-Api-Key": "secret"}
+        )
+
+    def test_jwt_reused_until_shortly_before_expiry(self):
+        ServiceFactory.create(
+            api_root="https://example.com/",
+            auth_type=AuthTypes.zgw,
+            client_id="openzaak",
+            secret="secret",
+            jwt_valid_for=300,
+        )
+
+        with freeze_time("2025-01-01T12:00:00"):
+            headers1 = get_auth("https://example.com/zaaktypen/1")
+        with freeze_time("2025-01-01T12:04:00"):
+            headers2 = get_auth("https://example.com/zaaktypen/2")
+        with freeze_time("2025-01-01T12:04:45"):
+            headers3 = get_auth("https://example.com/zaaktypen/3")
+
+        self.assertIn("Authorization", headers1)
+        self.assertEqual(headers1, headers2)
+        self.assertNotEqual(headers1, headers3)
+
+    def test_jwt_with_long_validity_reused_briefly(self):
+        # the default ``jwt_valid_for`` is much longer than receivers accept a JWT
+        service = ServiceFactory.create(
+            api_root="https://example.com/",
+            auth_type=AuthTypes.zgw,
+            client_id="openzaak",
+            secret="secret",
+        )
+        self.assertGreater(service.jwt_valid_for, 60 * 60)
+
+        with freeze_time("2025-01-01T12:00:00"):
+            headers1 = get_auth("https://example.com/zaaktypen/1")
+        with freeze_time("2025-01-01T12:04:00"):
+            headers2 = get_auth("https://example.com/zaaktypen/2")
+        with freeze_time("2025-01-01T12:05:00"):
+            headers3 = get_auth("https://example.com/zaaktypen/3")
+
+        self.assertEqual(headers1, headers2)
+        self.assertNotEqual(headers1, headers3)
+
+    def test_no_service(self):
+        self.assertEqual(get_auth("https://example.com/zaaktypen/1"), {})
@@ -1,12 +1,18 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2022 Dimpact
 
+from django.test import SimpleTestCase
+
 from rest_framework.test import APITestCase
 from vng_api_common.client import get_client
 from zgw_consumers.test.factories import ServiceFactory
 
 from openzaak.components.catalogi.tests.factories import ZaakTypeFactory
-from openzaak.utils.cache import DjangoRequestsCache, requests_cache_enabled
+from openzaak.utils.cache import (
+    DjangoRequestsCache,
+    VersionedLocalCache,
+    requests_cache_enabled,
+)
 
 
 class DjangoRequestsCacheTests(APITestCase):
@@ -23,3 +29,37 @@ class DjangoRequestsCacheTests(APITestCase):
             )
             backend = getattr(self.client, "cache", None)
             assert isinstance(backend, DjangoRequestsCache)
+
+
+class VersionedLocalCacheTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.cache = VersionedLocalCache("test-versioned-local-cache", maxsize=2)
+        self.cache.invalidate()
+        self.calls = 0
+
+    def _compute(self):
+        self.calls += 1
+        return self.calls
+
+    def test_value_is_reused(self):
+        self.assertEqual(self.cache.get_or_set("a", self._compute), 1)
+        self.assertEqual(self.cache.get_or_set("a", self._compute), 1)
+        self.assertEqual(self.calls, 1)
+
+    def test_invalidate(self):
+        self.cache.get_or_set("a", self._compute)
+
+        # another instance (i.e. another process) sharing the same name
+        VersionedLocalCache("test-versioned-local-cache").invalidate()
+
+        self.assertEqual(self.cache.get_or_set("a", self._compute), 2)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        self.cache.get_or_set("a", self._compute)
+        self.cache.get_or_set("b", self._compute)
+        self.cache.get_or_set("a", self._compute)
+        self.cache.get_or_set("c", self._compute)
+
+        self.assertEqual(self.cache.get_or_set("a", self._compute), 1)
+        self.assertEqual(self.cache.get_or_set("b", self._compute), 4)
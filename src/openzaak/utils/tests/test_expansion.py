@@ -0,0 +1,73 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2025 Dimpact
+from django.test import SimpleTestCase
+
+from openzaak.utils.expansion import EXPAND_KEY, InclusionTree
+
+
+class InclusionTreeTests(SimpleTestCase):
+    def test_display_tree(self):
+        statustype = {"url": "statustype"}
+        tree = InclusionTree()
+        tree.add_node(id="zaak1", value={}, label="", many=False)
+        tree.add_node(id="zaak2", value={}, label="", many=False)
+        # the same status type included for statussen of both zaken
+        for zaak, status in (("zaak1", "status1"), ("zaak2", "status2")):
+            tree.add_node(
+                id=status,
+                value={"url": status},
+                label="status",
+                many=False,
+                parent_id=zaak,
+            )
+            tree.add_node(
+                id="statustype",
+                value=statustype,
+                label="statustype",
+                many=False,
+                parent_id=status,
+            )
+        for rol in ("rol1", "rol2"):
+            tree.add_node(
+                id=rol, value={"url": rol}, label="rollen", many=True, parent_id="zaak1"
+            )
+        # duplicates are ignored
+        tree.add_node(
+            id="rol1",
+            value={"url": "rol1"},
+            label="rollen",
+            many=True,
+            parent_id="zaak1",
+        )
+
+        result = tree.display_tree()
+
+        self.assertEqual(
+            result,
+            {
+                "zaak1": {
+                    "status": {
+                        "url": "status1",
+                        EXPAND_KEY: {"statustype": statustype},
+                    },
+                    "rollen": [{"url": "rol1"}, {"url": "rol2"}],
+                },
+                "zaak2": {
+                    "status": {
+                        "url": "status2",
+                        EXPAND_KEY: {"statustype": statustype},
+                    },
+                },
+            },
+        )
+        # leaf values are not copied
+        self.assertIs(result["zaak1"]["status"][EXPAND_KEY]["statustype"], statustype)
+
+    def test_unknown_parent(self):
+        tree = InclusionTree()
+        tree.add_node(id="zaak1", value={}, label="", many=False)
+        tree.add_node(
+            id="status1", value={}, label="status", many=False, parent_id="zaak2"
+        )
+
+        self.assertEqual(tree.display_tree(), {"zaak1": {}})
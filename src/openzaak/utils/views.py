@@ -10,7 +10,13 @@ from azure.core.exceptions import AzureError
 from rest_framework import exceptions, exceptions as drf_exceptions, status, viewsets
 from rest_framework.response import Response
 from rest_framework.views import APIView, exception_handler as drf_exception_handler
-from vng_api_common.audittrails.viewsets import AuditTrailViewSet as _AuditTrailViewSet
+from vng_api_common.audittrails.models import AuditTrail
+from vng_api_common.audittrails.viewsets import (
+    AuditTrailMixin,
+    AuditTrailViewSet as _AuditTrailViewSet,
+)
+from vng_api_common.compat import get_header
+from vng_api_common.constants import CommonResourceAction
 from vng_api_common.exception_handling import HandledException
 from vng_api_common.views import (
     ERROR_CONTENT_TYPE,
@@ -54,6 +60,66 @@ class AuditTrailViewSet(_AuditTrailViewSet):
         )
 
 
+class BulkAuditTrailMixin(AuditTrailMixin):
+    """
+    Create the audit trails of many resources of the same request with one query.
+    """
+
+    def create_audittrails(
+        self,
+        status_code: int,
+        action: str,
+        versions: list[tuple[dict | None, dict | None, str]],
+        audit,
+        basename: str,
+        main_object: str,
+    ) -> list[AuditTrail]:
+        """
+        Create the audit trails for the given versions, which are tuples of
+        (version before edit, version after edit, unique representation).
+
+        The audit trails are the same as those of
+        :meth:`vng_api_common.audittrails.viewsets.AuditTrailMixin.create_audittrail`,
+        but the data of the request is only determined once.
+        """
+        jwt_auth = self.request.jwt_auth
+        if applications := jwt_auth.applicaties:
+            app_id, app_presentation = str(applications[0].uuid), applications[0].label
+        else:
+            app_id = get_header(self.request, "X-NLX-Request-Application-Id")
+            app_presentation = app_id
+
+        action_labels = dict(
+            zip(CommonResourceAction.names, CommonResourceAction.labels)
+        )
+        common = {
+            "bron": audit.component_name,
+            "logrecord_id": get_header(self.request, "X-NLX-Logrecord-ID") or "",
+            "applicatie_id": app_id,
+            "applicatie_weergave": app_presentation,
+            "actie": action,
+            "actie_weergave": action_labels.get(action, ""),
+            "gebruikers_id": jwt_auth.payload.get("user_id") or "",
+            "gebruikers_weergave": jwt_auth.payload.get("user_representation") or "",
+            "resultaat": status_code,
+            "hoofd_object": main_object,
+            "resource": basename,
+            "toelichting": get_header(self.request, "X-Audit-Toelichting") or "",
+        }
+
+        trails = [
+            AuditTrail(
+                **common,
+                resource_url=(after or before)["url"],
+                resource_weergave=unique_representation,
+                oud=before,
+                nieuw=after,
+            )
+            for before, after, unique_representation in versions
+        ]
+        return AuditTrail.objects.bulk_create(trails)
+
+
 # TODO allow defining an error-response mapping and bring this back to the lib
 def exception_handler(exc, context):
     """